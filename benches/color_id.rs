@@ -0,0 +1,427 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Color ID microbenchmarks (no Blender required)
+//!
+//! Runs every stage of the color ID pipeline and the full bake on generated
+//! meshes and reports throughput in faces per second.
+//!
+//! Usage:
+//!     cargo bench --bench color_id              # 10k .. 10M faces
+//!     cargo bench --bench color_id -- 1000000   # cap the mesh size
+
+use nt_rust_core::algorithm::align::{AlignMethod, island_rotations};
+use nt_rust_core::algorithm::color_id::{
+    bake_color_id_all, bake_color_id_layers, build_adjacency_graph, build_edge_map, color_graph,
+    detect_uv_islands, generate_result_colors, index_islands,
+};
+use nt_rust_core::algorithm::distortion::compute_distortion;
+use nt_rust_core::algorithm::fingerprint::fingerprint_mesh;
+use nt_rust_core::algorithm::mesh_io::{parse_obj, parse_ply};
+use nt_rust_core::algorithm::overlap::detect_overlaps;
+use nt_rust_core::algorithm::raster::rasterize_color_id;
+use nt_rust_core::algorithm::relax::{RelaxMesh, RelaxMethod};
+use nt_rust_core::algorithm::seams::{SideTable, next_loops};
+use nt_rust_core::algorithm::stack::{group_duplicates, island_signatures};
+use nt_rust_core::algorithm::uv_stats::uv_stats;
+use nt_rust_core::algorithm::weld::weld_uv_coords;
+use nt_rust_core::mesh_gen::{self, SyntheticMesh};
+use std::collections::HashMap;
+use std::hint::black_box;
+use std::io::Write;
+use std::time::{Duration, Instant};
+
+const FACE_COUNTS: [usize; 4] = [10_000, 100_000, 1_000_000, 10_000_000];
+const SEAM_DENSITY: f32 = 0.02;
+const SEED: u64 = 0;
+/// Keep repeating a measurement until this much time has been spent on it
+const TARGET_TIME: Duration = Duration::from_millis(500);
+const MAX_ITERATIONS: usize = 50;
+/// Side of the rasterized ID map (8K)
+const ID_MAP_SIZE: usize = 8192;
+const ID_MAP_PADDING: usize = 4;
+const RELAX_ITERATIONS: usize = 100;
+/// Side of the coverage raster of the live stats panel
+const UV_STATS_RASTER: usize = 512;
+
+/// Returns the best (minimum) wall time of `run`
+/// `setup` prepares the owned inputs outside of the timed region.
+fn measure<I, O>(
+    min_iterations: usize,
+    mut setup: impl FnMut() -> I,
+    mut run: impl FnMut(I) -> O,
+) -> Duration {
+    let mut best = Duration::MAX;
+    let mut spent = Duration::ZERO;
+    let mut iterations = 0;
+
+    while iterations < min_iterations || (spent < TARGET_TIME && iterations < MAX_ITERATIONS) {
+        let input = setup();
+        let start = Instant::now();
+        let output = run(black_box(input));
+        let elapsed = start.elapsed();
+        black_box(output);
+
+        best = best.min(elapsed);
+        spent += elapsed;
+        iterations += 1;
+    }
+    best
+}
+
+fn report(stage: &str, num_faces: usize, elapsed: Duration) {
+    let secs = elapsed.as_secs_f64();
+    println!(
+        "{:<24} {:>12} {:>12.3} {:>14.2}",
+        stage,
+        num_faces,
+        secs * 1000.0,
+        num_faces as f64 / secs / 1e6
+    );
+}
+
+/// Blender-style edge index of every loop (the edge to the next loop of its face)
+fn loop_edge_indices(mesh: &SyntheticMesh) -> (Vec<u32>, usize) {
+    let verts = &mesh.loop_vert_indices;
+    let next = next_loops(&mesh.poly_loop_starts, &mesh.poly_loop_totals, verts.len());
+    let mut edges = HashMap::with_capacity(verts.len() / 2);
+    let loop_edges = (0..verts.len())
+        .map(|l| {
+            let (a, b) = (verts[l], verts[next[l] as usize]);
+            let num_edges = edges.len() as u32;
+            *edges.entry((a.min(b), a.max(b))).or_insert(num_edges)
+        })
+        .collect();
+    (loop_edges, edges.len())
+}
+
+/// The mesh as OBJ text, with one `vt` per loop
+fn obj_bytes(mesh: &SyntheticMesh) -> Vec<u8> {
+    let mut out = Vec::new();
+    for p in mesh.positions.chunks_exact(3) {
+        writeln!(out, "v {} {} {}", p[0], p[1], p[2]).unwrap();
+    }
+    for uv in mesh.uv_coords.chunks_exact(2) {
+        writeln!(out, "vt {} {}", uv[0], uv[1]).unwrap();
+    }
+    for (&start, &total) in mesh.poly_loop_starts.iter().zip(&mesh.poly_loop_totals) {
+        out.extend_from_slice(b"f");
+        for l in start..start + total {
+            let v = mesh.loop_vert_indices[l as usize] + 1;
+            write!(out, " {}/{}", v, l + 1).unwrap();
+        }
+        out.push(b'\n');
+    }
+    out
+}
+
+/// The mesh as little-endian binary PLY, with per-corner UVs (`texcoord`)
+fn ply_bytes(mesh: &SyntheticMesh) -> Vec<u8> {
+    let mut out = Vec::new();
+    write!(
+        out,
+        "ply\nformat binary_little_endian 1.0\nelement vertex {}\nproperty float x\n\
+         property float y\nproperty float z\nelement face {}\n\
+         property list uchar int vertex_indices\nproperty list uchar float texcoord\n\
+         end_header\n",
+        mesh.num_verts(),
+        mesh.num_faces()
+    )
+    .unwrap();
+    for &value in &mesh.positions {
+        out.extend(value.to_le_bytes());
+    }
+    for (&start, &total) in mesh.poly_loop_starts.iter().zip(&mesh.poly_loop_totals) {
+        let loops = start as usize..(start + total) as usize;
+        out.push(total as u8);
+        for &v in &mesh.loop_vert_indices[loops.clone()] {
+            out.extend((v as i32).to_le_bytes());
+        }
+        out.push(total as u8 * 2);
+        for &value in &mesh.uv_coords[loops.start * 2..loops.end * 2] {
+            out.extend(value.to_le_bytes());
+        }
+    }
+    out
+}
+
+fn bench_mesh(mesh: &SyntheticMesh) {
+    let num_faces = mesh.num_faces();
+    // Large meshes take seconds per run, a single sample is representative enough
+    let min_iterations = if num_faces >= 1_000_000 { 1 } else { 3 };
+    let starts = &mesh.poly_loop_starts;
+    let totals = &mesh.poly_loop_totals;
+    let verts = &mesh.loop_vert_indices;
+    let uvs = &mesh.uv_coords;
+
+    let edge_map = build_edge_map(num_faces, starts, totals, verts);
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| build_edge_map(num_faces, starts, totals, verts),
+    );
+    report("build_edge_map", num_faces, elapsed);
+
+    let (dsu, island_connections) = detect_uv_islands(num_faces, &edge_map, verts, uvs);
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| detect_uv_islands(num_faces, &edge_map, verts, uvs),
+    );
+    report("detect_uv_islands", num_faces, elapsed);
+
+    let (adjacency, all_islands) =
+        build_adjacency_graph(num_faces, &mut dsu.clone(), island_connections.clone());
+    let elapsed = measure(
+        min_iterations,
+        || (dsu.clone(), island_connections.clone()),
+        |(mut dsu, connections)| build_adjacency_graph(num_faces, &mut dsu, connections),
+    );
+    report("build_adjacency_graph", num_faces, elapsed);
+
+    let island_color_indices = color_graph(&adjacency, all_islands.clone());
+    let elapsed = measure(
+        min_iterations,
+        || all_islands.clone(),
+        |islands| color_graph(&adjacency, islands),
+    );
+    report("color_graph", num_faces, elapsed);
+
+    let coloring = index_islands(num_faces, &mut dsu.clone(), &island_color_indices);
+    let elapsed = measure(
+        min_iterations,
+        || dsu.clone(),
+        |mut dsu| index_islands(num_faces, &mut dsu, &island_color_indices),
+    );
+    report("index_islands", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || vec![0.0f32; verts.len() * 4],
+        |mut colors| {
+            generate_result_colors(
+                num_faces,
+                starts,
+                totals,
+                &coloring.face_colors,
+                &mut colors,
+            );
+            colors
+        },
+    );
+    report("generate_result_colors", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| bake_color_id_all(num_faces, starts, totals, verts, uvs),
+    );
+    report("full pipeline", num_faces, elapsed);
+
+    // Three UV layers: shared edge map and parallel layers vs. three separate bakes
+    let layers: [&[f32]; 3] = [uvs, uvs, uvs];
+    let elapsed = measure(
+        min_iterations,
+        || vec![vec![0.0f32; verts.len() * 4]; 3],
+        |mut colors| {
+            let mut outputs: Vec<&mut [f32]> =
+                colors.iter_mut().map(|c| c.as_mut_slice()).collect();
+            bake_color_id_layers(num_faces, starts, totals, verts, &layers, &mut outputs);
+            colors
+        },
+    );
+    report("3 layers, one pass", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| layers.map(|layer_uvs| bake_color_id_all(num_faces, starts, totals, verts, layer_uvs)),
+    );
+    report("3 layers, separate", num_faces, elapsed);
+
+    let mut rgba = vec![0.0f32; ID_MAP_SIZE * ID_MAP_SIZE * 4];
+    let elapsed = measure(
+        1,
+        || (),
+        |_| {
+            rasterize_color_id(
+                ID_MAP_SIZE,
+                ID_MAP_SIZE,
+                starts,
+                totals,
+                uvs,
+                &coloring.face_colors,
+                ID_MAP_PADDING,
+                &mut rgba,
+            )
+        },
+    );
+    report("rasterize_color_id 8K", num_faces, elapsed);
+    drop(rgba);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| detect_overlaps(starts, totals, uvs, &coloring.face_islands),
+    );
+    report("detect_overlaps", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| {
+            compute_distortion(
+                starts,
+                totals,
+                verts,
+                &mesh.positions,
+                uvs,
+                &coloring.face_islands,
+                coloring.num_islands,
+            )
+        },
+    );
+    report("compute_distortion", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| weld_uv_coords(verts, uvs, None, 1e-3),
+    );
+    report("weld_uv_coords", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| {
+            let signatures = island_signatures(
+                starts,
+                totals,
+                verts,
+                &mesh.positions,
+                &coloring.face_islands,
+                coloring.num_islands,
+            );
+            group_duplicates(&signatures, 1e-4)
+        },
+    );
+    report("find_duplicate_islands", num_faces, elapsed);
+
+    let (loop_edges, num_edges) = loop_edge_indices(mesh);
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| SideTable::new(starts, totals, verts, &loop_edges, uvs, num_edges).seam_mask(),
+    );
+    report("seams_from_islands", num_faces, elapsed);
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| {
+            uv_stats(
+                starts,
+                totals,
+                verts,
+                &loop_edges,
+                uvs,
+                num_edges,
+                UV_STATS_RASTER,
+            )
+        },
+    );
+    report("uv_stats", num_faces, elapsed);
+
+    for (method, stage) in [
+        (AlignMethod::Pca, "align islands (pca)"),
+        (AlignMethod::BoundingBox, "align islands (bbox)"),
+    ] {
+        let elapsed = measure(
+            min_iterations,
+            || (),
+            |_| {
+                island_rotations(
+                    starts,
+                    totals,
+                    uvs,
+                    &coloring.face_islands,
+                    coloring.num_islands,
+                    None,
+                    method,
+                    true,
+                )
+            },
+        );
+        report(stage, num_faces, elapsed);
+    }
+
+    let face_select = vec![true; num_faces];
+    let loop_pins = vec![false; verts.len()];
+    for (method, setup_stage, relax_stage) in [
+        (
+            RelaxMethod::Laplacian,
+            "relax setup (laplacian)",
+            "relax x100 (laplacian)",
+        ),
+        (RelaxMethod::Arap, "relax setup (arap)", "relax x100 (arap)"),
+    ] {
+        let new_mesh = || {
+            RelaxMesh::new(
+                starts,
+                totals,
+                verts,
+                &mesh.positions,
+                uvs,
+                &face_select,
+                &loop_pins,
+                method,
+            )
+        };
+        let elapsed = measure(min_iterations, || (), |_| new_mesh());
+        report(setup_stage, num_faces, elapsed);
+        let elapsed = measure(1, new_mesh, |mut relax_mesh| {
+            relax_mesh.relax(RELAX_ITERATIONS, 0.5)
+        });
+        report(relax_stage, num_faces, elapsed);
+    }
+
+    let elapsed = measure(
+        min_iterations,
+        || (),
+        |_| fingerprint_mesh(starts, totals, verts, uvs),
+    );
+    report("fingerprint_mesh", num_faces, elapsed);
+
+    let obj = obj_bytes(mesh);
+    let elapsed = measure(min_iterations, || (), |_| parse_obj(&obj).unwrap());
+    report("parse_obj", num_faces, elapsed);
+
+    let ply = ply_bytes(mesh);
+    let elapsed = measure(min_iterations, || (), |_| parse_ply(&ply).unwrap());
+    report("parse_ply (binary)", num_faces, elapsed);
+}
+
+fn main() {
+    // cargo passes `--bench`; the first positional argument caps the mesh size
+    let max_faces = std::env::args()
+        .skip(1)
+        .find(|arg| !arg.starts_with("--"))
+        .and_then(|arg| arg.replace('_', "").parse::<usize>().ok())
+        .unwrap_or(usize::MAX);
+
+    println!(
+        "{:<24} {:>12} {:>12} {:>14}",
+        "stage", "faces", "time [ms]", "Mfaces/s"
+    );
+    for target in FACE_COUNTS.into_iter().filter(|&n| n <= max_faces) {
+        let side = (target as f64).sqrt().ceil() as usize;
+        let mesh = mesh_gen::grid(side, side, SEAM_DENSITY, SEED);
+        println!(
+            "--- grid {}x{}: {} faces, {} islands ---",
+            side,
+            side,
+            mesh.num_faces(),
+            mesh.num_islands
+        );
+        bench_mesh(&mesh);
+    }
+}
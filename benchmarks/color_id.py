@@ -15,42 +15,47 @@ import time
 
 import bpy
 from nextools.logic import color_id
+from nextools.logic.mesh_buffers import read_mesh_buffers, read_mesh_buffers_in_place
+from nextools.utils import mesh_gen
 
 
-def setup_test_scene(target_faces=100_000):
+def setup_test_scene(target_faces=100_000, kind="TORUS", seam_density=0.01, seed=0):
     if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
     bpy.ops.object.select_all(action="SELECT")
     bpy.ops.object.delete()
 
-    print(f"\n--- Generating Test Mesh (Target: {target_faces} faces) ---")
+    print(f"\n--- Generating Test Mesh ({kind}, Target: {target_faces} faces) ---")
 
-    subdiv_level = 0
-    base_faces = 576
-    while base_faces * (4**subdiv_level) < target_faces:
-        subdiv_level += 1
+    start_time = time.perf_counter()
+    data = mesh_gen.generate_for_face_count(kind, target_faces, seam_density, seed)
+    obj = mesh_gen.create_mesh_object(data)
+    elapsed = time.perf_counter() - start_time
 
-    bpy.ops.mesh.primitive_torus_add(
-        major_segments=48, minor_segments=12, major_radius=1, minor_radius=0.25
+    print(
+        f"Mesh Generated: {len(obj.data.polygons):,} faces, "
+        f"{data.num_islands:,} islands in {elapsed:.4f} sec"
     )
-    obj = bpy.context.active_object
 
-    if subdiv_level > 0:
-        mod = obj.modifiers.new(name="Subsurf", type="SUBSURF")
-        mod.levels = subdiv_level
-        mod.render_levels = subdiv_level
-        bpy.ops.object.modifier_apply(modifier="Subsurf")
+    return obj
 
-    current_faces = len(obj.data.polygons)
-    print(f"Mesh Generated: {current_faces:,} faces")
 
-    print("Unwrapping UVs (Smart Project)... This may take a moment.")
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.mesh.select_all(action="SELECT")
-    bpy.ops.uv.smart_project(angle_limit=66.0, island_margin=0.0)
-    bpy.ops.object.mode_set(mode="OBJECT")
+def measure_extraction(obj):
+    mesh = obj.data
 
-    return obj
+    start_time = time.perf_counter()
+    read_mesh_buffers(mesh)
+    copy_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    in_place = read_mesh_buffers_in_place(mesh)
+    in_place_time = time.perf_counter() - start_time
+
+    print(f"[Extract] foreach_get copy: {copy_time * 1000:.2f} ms")
+    if in_place is None:
+        print("[Extract] in-place views: unsupported layout, copying route is used")
+    else:
+        print(f"[Extract] in-place views:   {in_place_time * 1000:.2f} ms")
 
 
 def run_benchmark():
@@ -62,6 +67,8 @@ def run_benchmark():
     print(f"START BENCHMARK: Color ID Baking on {len(obj.data.polygons):,} faces")
     print("=" * 60 + "\n")
 
+    measure_extraction(obj)
+
     pr = cProfile.Profile()
     pr.enable()
 
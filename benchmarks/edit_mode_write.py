@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent
+dev_root = project_root.parent
+
+if str(dev_root) not in sys.path:
+    sys.path.append(str(dev_root))
+
+import time
+
+import bmesh
+import bpy
+from nextools.logic.mesh_buffers import float_buffer, write_corner_colors
+from nextools.utils import mesh_gen
+
+LAYER_NAME = "Color_ID"
+
+
+def setup_test_scene(target_faces=2_000_000):
+    if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.ops.object.select_all(action="SELECT")
+    bpy.ops.object.delete()
+
+    data = mesh_gen.generate_for_face_count("GRID", target_faces)
+    obj = mesh_gen.create_mesh_object(data)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode="EDIT")
+    return obj
+
+
+def write_per_loop(obj, colors):
+    """The former Edit Mode path: every loop set through the edit BMesh in Python."""
+    bm = bmesh.from_edit_mesh(obj.data)
+    layer = bm.loops.layers.color.get(LAYER_NAME) or bm.loops.layers.color.new(LAYER_NAME)
+    offset = 0
+    for face in bm.faces:
+        for loop in face.loops:
+            loop[layer] = colors[offset : offset + 4]
+            offset += 4
+    bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+
+
+def run_benchmark():
+    obj = setup_test_scene()
+    mesh = obj.data
+    obj.update_from_editmode()
+    colors = float_buffer(len(mesh.loops) * 4)
+
+    print("\n" + "=" * 60)
+    print(f"START BENCHMARK: Edit Mode corner color write on {len(mesh.polygons):,} faces")
+    print("=" * 60 + "\n")
+
+    start_time = time.perf_counter()
+    write_per_loop(obj, colors)
+    print(f"[Result] per-loop BMesh write:     {time.perf_counter() - start_time:.4f} sec")
+
+    start_time = time.perf_counter()
+    write_corner_colors(obj, LAYER_NAME, colors)
+    print(f"[Result] flushed copy + foreach:    {time.perf_counter() - start_time:.4f} sec")
+
+
+if __name__ == "__main__":
+    run_benchmark()
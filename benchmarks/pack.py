@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent
+dev_root = project_root.parent
+
+if str(dev_root) not in sys.path:
+    sys.path.append(str(dev_root))
+
+import time
+
+import bpy
+from nextools.logic import pack
+from nextools.utils import mesh_gen
+
+
+def setup_test_scene(target_faces=200_000, seed=0):
+    if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.ops.object.select_all(action="SELECT")
+    bpy.ops.object.delete()
+
+    data = mesh_gen.generate_for_face_count("SCATTER", target_faces, seed=seed)
+    obj = mesh_gen.create_mesh_object(data)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    print(f"\n--- Test Mesh: {len(obj.data.polygons):,} faces, {data.num_islands:,} islands ---")
+    return obj
+
+
+def measure_nextools(obj):
+    start_time = time.perf_counter()
+    result = pack.pack_uv_islands(obj, margin=0.001)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"[NexTools] pack_uv_islands: {elapsed:.4f} sec, fill {result.fill * 100:.1f}%")
+
+
+def measure_builtin(obj):
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.uv.select_all(action="SELECT")
+
+    start_time = time.perf_counter()
+    bpy.ops.uv.pack_islands(shape_method="AABB", rotate=True, margin=0.001)
+    elapsed = time.perf_counter() - start_time
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    print(f"[Blender]  uv.pack_islands:  {elapsed:.4f} sec")
+
+
+def run_benchmark():
+    TARGET_FACES = 320_000  # 20k islands of 4x4 quads
+
+    print("\n" + "=" * 60)
+    print("START BENCHMARK: UV island packing")
+    print("=" * 60)
+
+    measure_nextools(setup_test_scene(TARGET_FACES))
+    measure_builtin(setup_test_scene(TARGET_FACES))
+
+
+if __name__ == "__main__":
+    run_benchmark()
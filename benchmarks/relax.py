@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent
+dev_root = project_root.parent
+
+if str(dev_root) not in sys.path:
+    sys.path.append(str(dev_root))
+
+import time
+
+import bpy
+from nextools.logic.mesh_buffers import mesh_data, read_mesh_buffers_to_edit, write_uv_coords
+from nextools.logic.uv.relax import relax_uvs
+from nextools.utils import mesh_gen
+
+ITERATIONS = 100
+
+
+def setup_test_scene(target_faces=500_000):
+    if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    bpy.ops.object.select_all(action="SELECT")
+    bpy.ops.object.delete()
+
+    data = mesh_gen.generate_for_face_count("TORUS", target_faces)
+    obj = mesh_gen.create_mesh_object(data)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.uv.select_all(action="SELECT")
+    return obj
+
+
+def measure_nextools(obj, method):
+    start_time = time.perf_counter()
+    moved = relax_uvs(obj, method=method, iterations=ITERATIONS)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"[NexTools] relax_uvs {method:<9}: {elapsed:.4f} sec, {moved:,} UV vertices moved")
+
+
+def measure_read_write(obj):
+    """The Edit Mode I/O alone: flush and copy, bulk reads, foreach_set and BMesh reload."""
+    start_time = time.perf_counter()
+    with mesh_data(obj) as data:
+        uv_coords = read_mesh_buffers_to_edit(data).uv_coords
+        write_uv_coords(obj, uv_coords)
+    print(f"[NexTools] read + write:        {time.perf_counter() - start_time:.4f} sec")
+
+
+def measure_builtin(obj):
+    start_time = time.perf_counter()
+    bpy.ops.uv.minimize_stretch(iterations=ITERATIONS)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"[Blender]  uv.minimize_stretch: {elapsed:.4f} sec")
+
+
+def run_benchmark():
+    TARGET_FACES = 500_000
+
+    obj = setup_test_scene(TARGET_FACES)
+
+    print("\n" + "=" * 60)
+    print(f"START BENCHMARK: Edit Mode UV relax on {len(obj.data.polygons):,} faces")
+    print("=" * 60 + "\n")
+
+    measure_read_write(obj)
+    for method in ("LAPLACIAN", "ARAP"):
+        measure_nextools(obj, method)
+    measure_builtin(obj)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent
+dev_root = project_root.parent
+
+if str(dev_root) not in sys.path:
+    sys.path.append(str(dev_root))
+
+import importlib
+import time
+
+import bpy
+
+
+def _logic_modules():
+    """Every module of nextools.logic, found on disk so the package is not imported."""
+    logic_root = dev_root / "nextools" / "logic"
+    for path in sorted(logic_root.rglob("*.py")):
+        if path.stem != "__init__":
+            parts = path.relative_to(dev_root).with_suffix("").parts
+            yield ".".join(parts)
+
+
+# Modules that must only be loaded by the first operator execution
+DEFERRED_MODULES = ("bmesh", "nextools.nt_rust_core", *_logic_modules())
+
+
+def measure_registration():
+    preloaded = set(sys.modules)
+
+    start_time = time.perf_counter()
+    nextools = importlib.import_module("nextools")
+    import_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    nextools.register()
+    register_time = time.perf_counter() - start_time
+
+    loaded = [m for m in DEFERRED_MODULES if m in sys.modules and m not in preloaded]
+    return nextools, import_time, register_time, loaded
+
+
+def measure_first_execute():
+    bpy.ops.mesh.primitive_plane_add()
+
+    start_time = time.perf_counter()
+    bpy.ops.uv.nextools_bake_color_id(auto_switch_view=False)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark():
+    print("\n" + "=" * 60)
+    print("START BENCHMARK: Add-on startup")
+    print("=" * 60 + "\n")
+
+    nextools, import_time, register_time, loaded = measure_registration()
+
+    print(f"[Result] import nextools:   {import_time * 1000:.2f} ms")
+    print(f"[Result] register():        {register_time * 1000:.2f} ms")
+    print(f"[Result] first bake (cold): {measure_first_execute() * 1000:.2f} ms")
+
+    nextools.unregister()
+
+    if loaded:
+        print(f"ERROR: Heavy modules loaded at registration: {', '.join(loaded)}")
+        sys.exit(1)
+    print("OK: Rust core and logic modules are deferred until the first execute.")
+
+
+if __name__ == "__main__":
+    run_benchmark()
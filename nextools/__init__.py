@@ -1,38 +1,60 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from .ops import uv
-from .ops import color_id
-from .ops import uv_morph
-from .ui import panel
-import bpy
-
-
-class NextoolsSettings(bpy.types.PropertyGroup):
-    rectify_keep_bounds: bpy.props.BoolProperty(
-        name="Keep Bounds",
-        description="Scale the rectified UV island to match its original bounding box",
-        default=True,
-    )
-
-
-_classes = [
-    NextoolsSettings,
-    uv.UV_OT_nextools_lite_rectify,
-    uv.UV_OT_nextools_straight,
-    uv_morph.UV_OT_nextools_uv_morph,
-    color_id.UV_OT_nextools_bake_color_id,
-    panel.UV_PT_nextools_panel,
-]
+# The Blender side is only imported by register(), so that the Rust core and
+# nextools.analyze also work in a plain Python without bpy.
+
+
+def _classes() -> list:
+    from .ops import uv
+    from .ops import color_id
+    from .ops import uv_morph
+    from .ops import overlap
+    from .ops import distortion
+    from .ops import texel_density
+    from .ops import pack
+    from .ops import align
+    from .ops import seams
+    from .ops import stack
+    from .ui import panel
+    from .settings import NextoolsSettings
+
+    return [
+        NextoolsSettings,
+        uv.UV_OT_nextools_lite_rectify,
+        uv.UV_OT_nextools_straight,
+        uv.UV_OT_nextools_relax,
+        uv.UV_OT_nextools_weld,
+        uv_morph.UV_OT_nextools_uv_morph,
+        color_id.UV_OT_nextools_bake_color_id,
+        color_id.UV_OT_nextools_bake_color_id_image,
+        overlap.UV_OT_nextools_find_overlaps,
+        distortion.UV_OT_nextools_bake_stretch,
+        texel_density.UV_OT_nextools_normalize_texel_density,
+        pack.UV_OT_nextools_pack_islands,
+        align.UV_OT_nextools_align_islands,
+        seams.UV_OT_nextools_seams_from_islands,
+        stack.UV_OT_nextools_stack_duplicates,
+        panel.UV_PT_nextools_panel,
+    ]
 
 
 def register():
-    for cls in _classes:
+    import bpy
+    from . import handlers
+    from .settings import NextoolsSettings
+
+    for cls in _classes():
         bpy.utils.register_class(cls)
     bpy.types.Scene.nextools_settings = bpy.props.PointerProperty(type=NextoolsSettings)
+    handlers.register()
 
 
 def unregister():
+    import bpy
+    from . import handlers
+
+    handlers.unregister()
     if hasattr(bpy.types.Scene, "nextools_settings"):
         del bpy.types.Scene.nextools_settings
-    for cls in reversed(_classes):
+    for cls in reversed(_classes()):
         bpy.utils.unregister_class(cls)
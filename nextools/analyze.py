@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+UV island stats of OBJ and PLY files, without Blender.
+
+The Rust core memory-maps the file, parses it on all cores and runs the island detection
+and coloring of the Color ID bake and the seam detection of Seams from Islands on it. OBJ faces need `vt` indices; PLY files (ASCII or
+binary) need per-vertex UVs or per-corner `texcoord` lists.
+
+Usage:
+    python -m nextools.analyze scan.ply assets/*.obj --json island_stats.json
+"""
+
+import argparse
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import NamedTuple
+
+from . import rust_bridge
+
+MESH_FILE_EXTENSIONS = (".obj", ".ply")
+# float32 values per island in island_stats: 3D area, UV area, UV units per 3D unit
+ISLAND_STATS = 3
+
+
+class IslandStats(NamedTuple):
+    faces: int
+    seams: int
+    area_3d: float
+    area_uv: float
+    density: float
+
+
+class MeshFileStats(NamedTuple):
+    """Islands of a mesh file, with int32 / float32 arrays like the Blender-side tools."""
+
+    path: Path
+    num_verts: int
+    num_faces: int
+    num_loops: int
+    num_islands: int
+    # Edges whose UVs are split between their faces
+    num_seams: int
+    face_islands: array
+    face_colors: array
+    island_faces: array
+    island_seams: array
+    island_stats: array
+
+    def island(self, index: int) -> IslandStats:
+        stats = self.island_stats[index * ISLAND_STATS : (index + 1) * ISLAND_STATS]
+        return IslandStats(self.island_faces[index], self.island_seams[index], *stats)
+
+    def summary(self) -> dict:
+        return {
+            "file": str(self.path),
+            "vertices": self.num_verts,
+            "faces": self.num_faces,
+            "loops": self.num_loops,
+            "islands": self.num_islands,
+            "seams": self.num_seams,
+        }
+
+
+def analyze(path: str | Path) -> MeshFileStats:
+    """
+    Detects and colors the UV islands and seams of an OBJ or PLY file.
+    Raises ValueError for unsupported or malformed files and OSError if it cannot be read.
+    """
+    path = Path(path)
+    if path.suffix.lower() not in MESH_FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported mesh file '{path}'. Expected one of {MESH_FILE_EXTENSIONS}.")
+
+    result = rust_bridge.analyze_mesh_file(str(path))
+    num_verts, num_faces, num_loops, num_islands, num_seams, *buffers = result
+    face_islands, face_colors, island_faces, island_seams, island_stats = buffers
+    return MeshFileStats(
+        path,
+        num_verts,
+        num_faces,
+        num_loops,
+        num_islands,
+        num_seams,
+        array("i", face_islands),
+        array("i", face_colors),
+        array("i", island_faces),
+        array("i", island_seams),
+        array("f", island_stats),
+    )
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Print UV island stats of OBJ and PLY files.")
+    parser.add_argument("files", type=Path, nargs="+", help="OBJ or PLY files")
+    parser.add_argument("--json", type=Path, help="Write the stats of every island here")
+    parser.add_argument(
+        "--face-ids", type=Path, help="Write the island of every face (int32) to DIR/NAME.islands"
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = 0
+    for file in args.files:
+        try:
+            stats = analyze(file)
+        except (OSError, ValueError) as e:
+            print(f"[failed] {file}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+
+        print(
+            f"{file}: {stats.num_faces} faces, {stats.num_verts} vertices, "
+            f"{stats.num_islands} islands, {stats.num_seams} seams"
+        )
+        if args.face_ids:
+            args.face_ids.mkdir(parents=True, exist_ok=True)
+            with (args.face_ids / f"{file.name}.islands").open("wb") as f:
+                stats.face_islands.tofile(f)
+        if args.json:
+            result = stats.summary()
+            result["island_stats"] = [stats.island(i)._asdict() for i in range(stats.num_islands)]
+            results.append(result)
+
+    if args.json:
+        with args.json.open("w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
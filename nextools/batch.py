@@ -0,0 +1,332 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Headless batch Color ID bake for folders of .blend files.
+
+The controller runs on any Python 3.11 and spreads the files over a pool of background
+Blender processes. Every worker stays alive and bakes one file after the other, so
+Blender starts once per worker instead of once per file. Results are written to a JSON
+report after every file; running again with the same report skips the files that were
+baked and have not changed since.
+
+Usage:
+    python nextools/batch.py ASSET_DIR --workers 8 --report color_id_report.json
+"""
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Marks the worker's result lines among Blender's own output
+RESULT_PREFIX = "NT_BATCH_RESULT "
+REPORT_VERSION = 1
+
+
+class WorkerCrashed(RuntimeError):
+    pass
+
+
+class Report:
+    """
+    Results per file, saved atomically after every update.
+    A file counts as done when it was baked and its mtime still matches.
+    """
+
+    def __init__(self, path: Path, restart: bool = False):
+        self.path = path
+        self.results: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if path.exists() and not restart:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == REPORT_VERSION:
+                self.results = data.get("files", {})
+
+    def is_done(self, file: Path) -> bool:
+        result = self.results.get(str(file))
+        if not result or result.get("status") != "ok":
+            return False
+        try:
+            return result.get("mtime") == os.path.getmtime(file)
+        except OSError:
+            return False
+
+    def record(self, result: dict) -> None:
+        with self._lock:
+            self.results[result["file"]] = result
+            self._save()
+
+    def summary(self) -> dict:
+        results = self.results.values()
+        return {
+            "files": len(self.results),
+            "ok": sum(1 for r in results if r["status"] == "ok"),
+            "failed": sum(1 for r in results if r["status"] != "ok"),
+            "meshes": sum(r.get("meshes", 0) for r in results),
+            "faces": sum(r.get("faces", 0) for r in results),
+            "seconds": round(sum(r.get("seconds", 0.0) for r in results), 3),
+        }
+
+    def _save(self) -> None:
+        data = {"version": REPORT_VERSION, "summary": self.summary(), "files": self.results}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class _Worker:
+    """A background Blender process reading one job per line from stdin."""
+
+    def __init__(self, blender: str, force: bool, verbose: bool):
+        command = [
+            blender,
+            "--background",
+            "--factory-startup",
+            "--python",
+            str(Path(__file__).resolve()),
+            "--",
+            "--worker",
+        ]
+        if force:
+            command.append("--force")
+        self.verbose = verbose
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None if verbose else subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+
+    def bake(self, job: dict, timeout: float | None) -> dict:
+        # A hung file is killed; the worker then reads as crashed and is replaced
+        timer = threading.Timer(timeout, self.process.kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            for line in self.process.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    return json.loads(line[len(RESULT_PREFIX) :])
+                if self.verbose:
+                    sys.stdout.write(line)
+        except OSError as e:
+            raise WorkerCrashed(f"Worker pipe failed: {e}")
+        finally:
+            if timer:
+                timer.cancel()
+        self.process.wait()
+        raise WorkerCrashed(f"Worker exited with code {self.process.returncode}")
+
+    def close(self) -> None:
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+
+
+def find_blend_files(folder: Path) -> list[Path]:
+    """All .blend files below folder, sorted."""
+    return sorted(path.resolve() for path in folder.rglob("*.blend") if path.is_file())
+
+
+def run_batch(
+    files: list[Path],
+    report: Report,
+    blender: str = "blender",
+    workers: int = 1,
+    output_dir: Path | None = None,
+    root: Path | None = None,
+    force: bool = False,
+    timeout: float | None = None,
+    verbose: bool = False,
+) -> list[dict]:
+    """
+    Bakes Color IDs into every mesh of the files that the report does not list as done.
+
+    Args:
+        files: .blend files to process.
+        report: Receives the result of every file as soon as it is known.
+        blender: Blender executable.
+        workers: Number of Blender processes working in parallel.
+        output_dir: Save baked copies here (keeping the path relative to root)
+            instead of overwriting the files.
+        root: Folder the files are relative to, for output_dir.
+        force: Bake meshes whose topology and UVs match their last bake, too.
+        timeout: Seconds per file before its worker is killed.
+        verbose: Pass Blender's output through.
+
+    Returns:
+        The results of this run, in completion order.
+    """
+    jobs: queue.Queue[dict] = queue.Queue()
+    for file in files:
+        if report.is_done(file):
+            continue
+        job = {"file": str(file)}
+        if output_dir is not None:
+            relative = file.relative_to(root) if root else Path(file.name)
+            job["output"] = str(output_dir / relative)
+        jobs.put(job)
+
+    results = []
+    results_lock = threading.Lock()
+
+    def drain():
+        worker = None
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                break
+            start = time.perf_counter()
+            try:
+                if worker is None:
+                    worker = _Worker(blender, force, verbose)
+                result = worker.bake(job, timeout)
+            except (OSError, WorkerCrashed) as e:
+                if worker is not None:
+                    worker.kill()
+                worker = None
+                result = {
+                    "file": job["file"],
+                    "status": "failed",
+                    "error": str(e),
+                    "seconds": round(time.perf_counter() - start, 3),
+                }
+            report.record(result)
+            with results_lock:
+                results.append(result)
+            if not verbose:
+                print(f"[{result['status']}] {result['file']} ({result['seconds']:.2f} s)")
+        if worker is not None:
+            worker.close()
+
+    threads = [threading.Thread(target=drain) for _ in range(max(1, min(workers, jobs.qsize())))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def bake_file(path: str, output: str | None = None, force: bool = False) -> dict:
+    """
+    Opens a .blend file in the running Blender, bakes Color IDs into all its local meshes
+    with an active UV layer and saves it (to output if given) when anything was baked.
+    Failures are returned as a failed result instead of raised.
+    """
+    import bpy
+    from nextools.logic.color_id import apply_color_id_to_mesh
+
+    start = time.perf_counter()
+    result = {"file": path, "status": "ok", "meshes": 0, "skipped": 0, "faces": 0}
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        seen_meshes = set()
+        for obj in bpy.data.objects:
+            if obj.type != "MESH" or obj.data.library or not obj.data.uv_layers.active:
+                continue
+            # Objects sharing a mesh are baked once
+            if obj.data.session_uid in seen_meshes:
+                continue
+            seen_meshes.add(obj.data.session_uid)
+
+            num_faces = apply_color_id_to_mesh(obj, force=force)
+            if num_faces:
+                result["meshes"] += 1
+                result["faces"] += num_faces
+            else:
+                result["skipped"] += 1
+
+        if output:
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            bpy.ops.wm.save_as_mainfile(filepath=output, copy=True)
+        elif result["meshes"]:
+            bpy.ops.wm.save_mainfile()
+        result["mtime"] = os.path.getmtime(path)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def run_worker(force: bool) -> None:
+    """Bakes the jobs read from stdin until it closes, printing one result line per job."""
+    project_root = str(Path(__file__).resolve().parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        result = bake_file(job["file"], job.get("output"), force)
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Bake Color IDs into folders of .blend files.")
+    parser.add_argument("folder", type=Path, nargs="?", help="Folder searched for .blend files")
+    parser.add_argument(
+        "--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--report", type=Path, default=Path("color_id_report.json"))
+    parser.add_argument("--output-dir", type=Path, help="Save baked copies here")
+    parser.add_argument("--restart", action="store_true", help="Ignore the existing report")
+    parser.add_argument("--force", action="store_true", help="Rebake up-to-date meshes")
+    parser.add_argument("--timeout", type=float, help="Seconds per file")
+    parser.add_argument("--verbose", action="store_true", help="Show Blender's output")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.force)
+        return 0
+    if args.folder is None or not args.folder.is_dir():
+        parser.error("folder must be an existing directory")
+
+    root = args.folder.resolve()
+    report = Report(args.report, restart=args.restart)
+    run_batch(
+        find_blend_files(root),
+        report,
+        blender=args.blender,
+        workers=args.workers,
+        output_dir=args.output_dir.resolve() if args.output_dir else None,
+        root=root,
+        force=args.force,
+        timeout=args.timeout,
+        verbose=args.verbose,
+    )
+
+    summary = report.summary()
+    print(
+        f"{summary['ok']} of {summary['files']} files baked, {summary['failed']} failed, "
+        f"{summary['faces']} faces. Report: {args.report}"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    # Inside Blender, the script's own arguments follow "--"
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# App handlers of the background features (island precomputation, live UV stats).
+# They are registered with the add-on, but the feature modules, and with them the
+# Rust core and the mesh buffer helpers, are only imported once a feature is enabled.
+
+import sys
+
+import bpy
+from bpy.app.handlers import persistent
+
+FEATURE_MODULES = ("precompute", "uv_stats")
+
+# Meshes whose next geometry update comes from a feature flushing their edit BMesh:
+# Object.update_from_editmode() tags the geometry, which must not count as an edit.
+_self_updates: set[int] = set()
+
+
+def _loaded_features() -> list:
+    """The feature modules that were imported so far."""
+    modules = (sys.modules.get(f"{__package__}.logic.{name}") for name in FEATURE_MODULES)
+    return [module for module in modules if module is not None]
+
+
+def ignore_next_update(mesh: bpy.types.Mesh) -> None:
+    """
+    Called by a feature right before it flushes the edit BMesh of mesh, so that the
+    resulting geometry update does not schedule the features again.
+    """
+    _self_updates.add(mesh.session_uid)
+
+
+def _edited_meshes(depsgraph) -> set[int]:
+    """Session UIDs of the meshes with geometry updates, except the features' own flushes."""
+    keys = set()
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            keys.add(data.session_uid)
+    edited = keys - _self_updates
+    _self_updates.clear()
+    return edited
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    edited = _edited_meshes(depsgraph)
+    settings = getattr(scene, "nextools_settings", None)
+    if not edited or settings is None:
+        return
+
+    if settings.precompute_islands:
+        from .logic import precompute
+
+        precompute.on_mesh_edit(edited)
+    if settings.show_uv_stats:
+        from .logic import uv_stats
+
+        uv_stats.on_mesh_edit(edited)
+
+
+@persistent
+def _on_load_pre(*_args):
+    for module in _loaded_features():
+        module.clear()
+
+
+def register() -> None:
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_pre.append(_on_load_pre)
+
+
+def unregister() -> None:
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_pre in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_on_load_pre)
+    for module in _loaded_features():
+        module.unregister()
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands, selected_island_mask
+from .mesh_buffers import (
+    fingerprint_buffers,
+    mesh_data,
+    read_face_selection,
+    read_mesh_buffers_to_edit,
+    write_uv_coords,
+)
+
+ALIGN_METHODS = ("PCA", "BOUNDING_BOX")
+
+
+class AlignResult(NamedTuple):
+    num_islands: int
+    num_rotated: int
+
+
+def align_uv_islands(
+    objects: list[bpy.types.Object],
+    method: str = "PCA",
+    snap: bool = True,
+    selected_only: bool = False,
+) -> AlignResult:
+    """
+    Rotates every island of the objects' active UV layers about its UV centroid,
+    so that its main axis lies on U.
+
+    Args:
+        objects: Mesh objects with an active UV layer.
+        method: PCA uses the principal axis of the island's UVs; BOUNDING_BOX the long
+            side of its minimal bounding rectangle, which also aligns squares.
+        snap: Turn by at most 45 degrees, onto the nearer of U and V.
+        selected_only: Only align islands with a selected face.
+
+    Raises:
+        ValueError: If an object or the method is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if method not in ALIGN_METHODS:
+        raise ValueError(f"Unknown align method: {method}")
+
+    num_islands = num_rotated = 0
+    seen_meshes = set()
+    for obj in objects:
+        if not obj or obj.type != "MESH":
+            raise ValueError("Target object must be a MESH.")
+        mesh = obj.data
+        if not mesh.uv_layers.active:
+            raise ValueError(f"Active UV layer is required ({obj.name}).")
+        # Objects sharing a mesh are aligned once
+        if mesh.session_uid in seen_meshes:
+            continue
+        seen_meshes.add(mesh.session_uid)
+
+        # The UVs are read and written in one mesh_data() block, so Edit Mode is flushed once
+        with mesh_data(obj) as data:
+            # The UVs are rotated in place and written back
+            buffers = read_mesh_buffers_to_edit(data)
+            islands = get_islands(mesh, buffers, fingerprint_buffers(buffers))
+
+            if selected_only:
+                face_select = read_face_selection(data)
+                island_mask = selected_island_mask(
+                    face_select, islands.face_islands, islands.num_islands
+                )
+            else:
+                island_mask = array("i", [1]) * islands.num_islands
+
+            try:
+                rotated = rust_bridge.align_uv_islands(
+                    buffers.poly_loop_starts,
+                    buffers.poly_loop_totals,
+                    buffers.uv_coords,
+                    islands.face_islands,
+                    island_mask,
+                    method,
+                    snap,
+                )
+            except Exception as e:
+                raise RuntimeError(f"Rust core calculation failed: {e}")
+
+            num_islands += sum(island_mask)
+            num_rotated += rotated
+            if rotated == 0:
+                continue
+            try:
+                write_uv_coords(obj, buffers.uv_coords)
+            except Exception as e:
+                raise RuntimeError(f"Failed to write UVs: {e}")
+
+    return AlignResult(num_islands, num_rotated)
@@ -1,19 +1,41 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from array import array
+
 import bpy
 from .. import rust_bridge
+from ..utils.cache import OperatorCache
+from . import precompute
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    float_buffer,
+    int_buffer,
+    mesh_data,
+    read_face_selection,
+    read_mesh_buffers,
+    read_mesh_buffers_in_place,
+    write_corner_color_layers,
+    write_corner_colors,
+)
+
+COLOR_LAYER_NAME = "Color_ID"
+# Mesh ID property holding the fingerprint of the buffers the Color_ID layer was baked from
+FINGERPRINT_PROP = "nt_color_id_fingerprint"
+
+_island_cache = OperatorCache()
 
 
-# TODO: Using NumPy and minimal-copy would allow for further optimization.
-def apply_color_id_to_mesh(obj: bpy.types.Object) -> int:
+def apply_color_id_to_mesh(obj: bpy.types.Object, force: bool = True) -> int:
     """
     Bakes Color IDs onto the specified object's mesh using the Rust backend.
 
     Args:
         obj: The target object (must be of type MESH).
+        force: Bake even if the topology and UVs match the last bake.
 
     Returns:
-        int: The number of processed faces.
+        int: The number of processed faces, 0 if the bake was skipped as up to date.
 
     Raises:
         ValueError: If the provided object is invalid.
@@ -27,45 +49,248 @@ def apply_color_id_to_mesh(obj: bpy.types.Object) -> int:
     if not mesh.uv_layers.active:
         raise ValueError("Active UV layer is required.")
 
-    num_faces = len(mesh.polygons)
-    num_loops = len(mesh.loops)
+    # Edit Mode is handled without leaving it (see mesh_data())
+    with mesh_data(obj) as data:
+        # Zero-copy views of the mesh arrays, valid until the colors are written
+        buffers = read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+        num_faces = buffers.num_faces
+
+        fingerprint = fingerprint_buffers(buffers)
+        if not force and _is_up_to_date(mesh, fingerprint):
+            return 0
 
-    poly_loop_starts = [0] * num_faces
-    poly_loop_totals = [0] * num_faces
-    loop_vert_indices = [0] * num_loops
+        rgba_colors = float_buffer(buffers.num_loops * 4)
 
-    mesh.polygons.foreach_get("loop_start", poly_loop_starts)
-    mesh.polygons.foreach_get("loop_total", poly_loop_totals)
-    mesh.loops.foreach_get("vertex_index", loop_vert_indices)
+        try:
+            islands = get_islands(mesh, buffers, fingerprint)
+            rust_bridge.fill_face_colors(
+                buffers.poly_loop_starts, buffers.poly_loop_totals, islands.face_colors, rgba_colors
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
 
-    uv_coords = [0.0] * (num_loops * 2)
-    mesh.uv_layers.active.data.foreach_get("uv", uv_coords)
+        try:
+            write_corner_colors(obj, COLOR_LAYER_NAME, rgba_colors)
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply color data to mesh: {e}")
+
+    mesh[FINGERPRINT_PROP] = fingerprint
+    return num_faces
+
+
+def apply_color_id_to_layers(obj: bpy.types.Object, uv_layer_names: list[str] | None = None) -> int:
+    """
+    Bakes one Color ID attribute per UV layer in a single pass, named Color_ID_<uvname>.
+    The topology is read and analyzed once; the layers are baked in parallel.
 
-    try:
-        rgba_colors = rust_bridge.bake_color_id_all(
-            num_faces, poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords
-        )
-    except Exception as e:
-        raise RuntimeError(f"Rust core calculation failed: {e}")
+    Args:
+        obj: The target object (must be of type MESH).
+        uv_layer_names: UV layers to bake, all of them if None.
+
+    Returns:
+        int: The number of processed faces.
+
+    Raises:
+        ValueError: If the provided object is invalid or has no matching UV layer.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
 
-    color_layer_name = "Color_ID"
+    mesh = obj.data
+    if uv_layer_names is None:
+        uv_layer_names = [uv_layer.name for uv_layer in mesh.uv_layers]
+    if not uv_layer_names:
+        raise ValueError("At least one UV layer is required.")
+    for name in uv_layer_names:
+        if name not in mesh.uv_layers:
+            raise ValueError(f"UV layer '{name}' not found.")
 
-    if color_layer_name in mesh.color_attributes:
-        vcol_layer = mesh.color_attributes[color_layer_name]
-    else:
-        vcol_layer = mesh.color_attributes.new(
-            name=color_layer_name, type="BYTE_COLOR", domain="CORNER"
-        )
+    with mesh_data(obj) as data:
+        buffers = read_mesh_buffers(data, uv_layer_names[0])
+        num_faces = buffers.num_faces
 
-    try:
-        vcol_layer.data.foreach_set("color", rgba_colors)
-    except Exception as e:
-        raise RuntimeError(f"Failed to apply color data to mesh: {e}")
+        uv_layers = [buffers.uv_coords]
+        for name in uv_layer_names[1:]:
+            uv_coords = float_buffer(buffers.num_loops * 2)
+            data.uv_layers[name].data.foreach_get("uv", uv_coords)
+            uv_layers.append(uv_coords)
+        out_colors = [float_buffer(buffers.num_loops * 4) for _ in uv_layer_names]
 
-    mesh.update()
+        try:
+            rust_bridge.bake_color_id_layers(
+                num_faces,
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.loop_vert_indices,
+                uv_layers,
+                out_colors,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
 
-    attr_index = mesh.color_attributes.find(color_layer_name)
-    if attr_index != -1:
-        mesh.color_attributes.active_color_index = attr_index
+        # All layers in one write
+        layers = {
+            f"{COLOR_LAYER_NAME}_{name}": colors for name, colors in zip(uv_layer_names, out_colors)
+        }
+        try:
+            write_corner_color_layers(obj, layers)
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply color data to mesh: {e}")
 
     return num_faces
+
+
+def apply_color_id_to_selection(obj: bpy.types.Object) -> int:
+    """
+    Bakes Color IDs of the selected faces only, keeping the rest of the Color_ID layer.
+    Seams on the selection border are detected from the faces around the selection.
+
+    Returns:
+        int: The number of processed (selected) faces.
+
+    Raises:
+        ValueError: If the provided object is invalid or no face is selected.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+
+    mesh = obj.data
+
+    if not mesh.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+    with mesh_data(obj) as data:
+        buffers = read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+
+        face_select = read_face_selection(data)
+
+        # Only the loops of the selected faces are filled and written back
+        rgba_colors = float_buffer(buffers.num_loops * 4)
+
+        try:
+            selected_faces = rust_bridge.bake_color_id_region(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.loop_vert_indices,
+                buffers.uv_coords,
+                face_select,
+                rgba_colors,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        if not selected_faces:
+            raise ValueError("No faces selected.")
+
+        try:
+            write_corner_colors(obj, COLOR_LAYER_NAME, rgba_colors, face_indices=selected_faces)
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply color data to mesh: {e}")
+
+    # The layer no longer matches a full bake of any fingerprint
+    mesh.pop(FINGERPRINT_PROP, None)
+    return len(selected_faces)
+
+
+def bake_color_id_image(
+    obj: bpy.types.Object,
+    image_name: str = COLOR_LAYER_NAME,
+    size: int = 4096,
+    padding: int = 4,
+) -> bpy.types.Image:
+    """
+    Rasterizes the Color ID of the active UV layer into an image texture.
+    Islands are grown by `padding` pixels so that mipmaps do not bleed the background in.
+    The colors are linear, like the Color_ID attribute, so the image is a float image in
+    the scene linear color space; it is converted to sRGB like the attribute when saved.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        image_name: Image to create, or to overwrite if it exists.
+        size: Width and height of the image in pixels.
+        padding: Dilation of the islands in pixels.
+
+    Returns:
+        bpy.types.Image: The baked image.
+
+    Raises:
+        ValueError: If the provided object or size is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if size <= 0:
+        raise ValueError("Image size must be positive.")
+
+    mesh = obj.data
+
+    if not mesh.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+    pixels = float_buffer(size * size * 4)
+    with mesh_data(obj) as data:
+        buffers = read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+        fingerprint = fingerprint_buffers(buffers)
+
+        try:
+            islands = get_islands(mesh, buffers, fingerprint)
+            rust_bridge.rasterize_color_id(
+                size,
+                size,
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.uv_coords,
+                islands.face_colors,
+                padding,
+                pixels,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+    image = bpy.data.images.get(image_name)
+    if image is not None and not image.is_float:
+        # A byte image would read the linear pixels as sRGB: replace it, keeping its users
+        replacement = bpy.data.images.new(image_name, size, size, alpha=True, float_buffer=True)
+        image.user_remap(replacement)
+        bpy.data.images.remove(image)
+        replacement.name = image_name
+        image = replacement
+    if image is None:
+        image = bpy.data.images.new(image_name, size, size, alpha=True, float_buffer=True)
+    elif tuple(image.size) != (size, size):
+        image.scale(size, size)
+    image.pixels.foreach_set(pixels)
+    image.update()
+    return image
+
+
+def get_islands(
+    mesh: bpy.types.Mesh, buffers: MeshBuffers, fingerprint: str
+) -> precompute.IslandResult:
+    """
+    Island coloring of the buffers, reused from redo-panel re-executions or the
+    background precomputation when the fingerprint matches.
+    """
+    islands = _island_cache.get(mesh, fingerprint) or precompute.get_island_result(
+        mesh, fingerprint
+    )
+    if islands is None:
+        islands = precompute.compute_island_result(buffers, fingerprint)
+    _island_cache.set(mesh, fingerprint, islands)
+    return islands
+
+
+def selected_island_mask(face_select: array, face_islands: array, num_islands: int) -> array:
+    """
+    Mask (int32, one per island) of the islands with a face selected in face_select
+    (int32, 0 or 1 per face, see read_face_selection()).
+    """
+    island_mask = int_buffer(num_islands)
+    rust_bridge.selected_island_mask(face_islands, face_select, island_mask)
+    return island_mask
+
+
+def _is_up_to_date(mesh: bpy.types.Mesh, fingerprint: str) -> bool:
+    return mesh.get(FINGERPRINT_PROP) == fingerprint and COLOR_LAYER_NAME in mesh.color_attributes
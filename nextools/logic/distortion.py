@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    float_buffer,
+    mesh_data,
+    read_mesh_buffers,
+    read_mesh_buffers_in_place,
+    read_vertex_positions,
+    write_corner_colors,
+)
+
+STRETCH_LAYER_NAME = "UV_Stretch"
+DISTORTION_MODES = ("AREA", "ANGLE")
+
+
+class IslandDistortion(NamedTuple):
+    """Distortion summary of one island; means are weighted by 3D area."""
+
+    island: int
+    area_3d: float
+    area_uv: float
+    mean_area: float
+    mean_angle: float
+    max_area: float
+    max_angle: float
+
+
+class DistortionResult(NamedTuple):
+    """
+    Per-face area and angle distortion in [0, 1] (0 is undistorted) and island summaries.
+    Area distortion is relative to the island's own 3D / UV scale.
+    """
+
+    face_area: array
+    face_angle: array
+    islands: list[IslandDistortion]
+
+    def mean(self, mode: str = "AREA") -> float:
+        """Mean distortion of the whole mesh, weighted by 3D area."""
+        total_area = sum(island.area_3d for island in self.islands)
+        if total_area <= 0.0:
+            return 0.0
+        key = "mean_area" if mode == "AREA" else "mean_angle"
+        return sum(getattr(island, key) * island.area_3d for island in self.islands) / total_area
+
+    def worst_island(self, mode: str = "AREA") -> IslandDistortion | None:
+        """Island with the highest mean distortion, None for an empty mesh."""
+        key = "mean_area" if mode == "AREA" else "mean_angle"
+        return max(self.islands, key=lambda island: getattr(island, key), default=None)
+
+
+def compute_uv_distortion(obj: bpy.types.Object) -> DistortionResult:
+    """
+    Computes the distortion between the 3D faces and the active UV layer.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    _validate(obj)
+    with mesh_data(obj) as data:
+        return _compute(obj, data, _read_buffers(data))
+
+
+def bake_uv_distortion(obj: bpy.types.Object, mode: str = "AREA") -> DistortionResult:
+    """
+    Bakes a blue (undistorted) to red heatmap of the area or angle distortion
+    into the UV_Stretch corner color attribute.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        mode: "AREA" or "ANGLE".
+
+    Raises:
+        ValueError: If the provided object or mode is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if mode not in DISTORTION_MODES:
+        raise ValueError(f"Unknown distortion mode '{mode}'. Expected one of {DISTORTION_MODES}.")
+
+    _validate(obj)
+    with mesh_data(obj) as data:
+        buffers = _read_buffers(data)
+        result = _compute(obj, data, buffers)
+        rgba_colors = float_buffer(buffers.num_loops * 4)
+
+        try:
+            rust_bridge.fill_heatmap_colors(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                result.face_area if mode == "AREA" else result.face_angle,
+                rgba_colors,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        try:
+            write_corner_colors(obj, STRETCH_LAYER_NAME, rgba_colors)
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply color data to mesh: {e}")
+    return result
+
+
+def _validate(obj: bpy.types.Object) -> None:
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+
+def _read_buffers(data: bpy.types.Mesh) -> MeshBuffers:
+    # Views into the mesh of a mesh_data() block, only valid inside it
+    return read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+
+
+def _compute(obj: bpy.types.Object, data: bpy.types.Mesh, buffers: MeshBuffers) -> DistortionResult:
+    positions = read_vertex_positions(data)
+    face_area = float_buffer(buffers.num_faces)
+    face_angle = float_buffer(buffers.num_faces)
+
+    try:
+        # Island caches stay keyed by the object's own mesh
+        islands = get_islands(obj.data, buffers, fingerprint_buffers(buffers))
+        stats = float_buffer(islands.num_islands * 6)
+        rust_bridge.compute_uv_distortion(
+            buffers.poly_loop_starts,
+            buffers.poly_loop_totals,
+            buffers.loop_vert_indices,
+            positions,
+            buffers.uv_coords,
+            islands.face_islands,
+            face_area,
+            face_angle,
+            stats,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Rust core calculation failed: {e}")
+
+    island_stats = [
+        IslandDistortion(i, *stats[i * 6 : i * 6 + 6]) for i in range(islands.num_islands)
+    ]
+    return DistortionResult(face_area, face_angle, island_stats)
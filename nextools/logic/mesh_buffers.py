@@ -0,0 +1,406 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import ctypes
+import hashlib
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+
+# Mesh storage the in-place views rely on: contiguous int32 corner verts and face offsets
+# (faces + 1) behind MeshLoop / MeshPolygon, and float2 UV attributes behind MeshUVLoop.
+IN_PLACE_VERSIONS = ((4, 0, 0), (6, 0, 0))
+
+# Edit Mode copies of the open mesh_data() blocks, keyed by Mesh.session_uid
+_edit_copies: dict[int, bpy.types.Mesh] = {}
+
+
+class MeshBuffers(NamedTuple):
+    """
+    Flat topology and UV buffers of a mesh, as consumed by the Rust core.
+
+    Index buffers are int32 and UVs are float32, so they are passed to the core
+    as buffers without conversion. Buffers are arrays, or read-only memoryviews
+    of Blender's own arrays (see read_mesh_buffers_in_place()).
+    """
+
+    poly_loop_starts: array | memoryview
+    poly_loop_totals: array | memoryview
+    loop_vert_indices: array | memoryview
+    uv_coords: array | memoryview
+
+    @property
+    def num_faces(self) -> int:
+        return len(self.poly_loop_starts)
+
+    @property
+    def num_loops(self) -> int:
+        return len(self.loop_vert_indices)
+
+
+def int_buffer(size: int) -> array:
+    return array("i", [0]) * size
+
+
+def float_buffer(size: int) -> array:
+    return array("f", [0.0]) * size
+
+
+def read_mesh_buffers(mesh: bpy.types.Mesh, uv_layer_name: str | None = None) -> MeshBuffers:
+    """
+    Reads topology and UVs of the given (or active) UV layer with foreach_get.
+
+    Raises:
+        ValueError: If the mesh has no matching UV layer.
+    """
+    uv_layer = mesh.uv_layers.get(uv_layer_name) if uv_layer_name else mesh.uv_layers.active
+    if not uv_layer:
+        raise ValueError("Active UV layer is required.")
+
+    num_faces = len(mesh.polygons)
+    num_loops = len(mesh.loops)
+
+    poly_loop_starts = int_buffer(num_faces)
+    poly_loop_totals = int_buffer(num_faces)
+    loop_vert_indices = int_buffer(num_loops)
+    uv_coords = float_buffer(num_loops * 2)
+
+    mesh.polygons.foreach_get("loop_start", poly_loop_starts)
+    mesh.polygons.foreach_get("loop_total", poly_loop_totals)
+    mesh.loops.foreach_get("vertex_index", loop_vert_indices)
+    uv_layer.data.foreach_get("uv", uv_coords)
+
+    return MeshBuffers(poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords)
+
+
+def read_vertex_positions(mesh: bpy.types.Mesh) -> array:
+    """
+    Reads vertex coordinates as a flat float32 buffer (vertices * 3).
+    """
+    positions = float_buffer(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", positions)
+    return positions
+
+
+def read_face_selection(mesh: bpy.types.Mesh) -> array:
+    """
+    Reads the face selection as a flat int32 buffer (0 or 1 per face).
+    """
+    face_select = int_buffer(len(mesh.polygons))
+    mesh.polygons.foreach_get("select", face_select)
+    return face_select
+
+
+def read_mesh_buffers_in_place(
+    mesh: bpy.types.Mesh, uv_layer_name: str | None = None
+) -> MeshBuffers | None:
+    """
+    Zero-copy variant of read_mesh_buffers(): loop vertex indices, loop starts and UVs
+    are read-only views of Blender's attribute arrays, only the loop totals are copied.
+
+    The views are only valid until the mesh is modified, so they must not outlive
+    the calling operation or be handed to another thread.
+
+    Returns:
+        MeshBuffers, or None if the Blender version or the memory layout is not
+        the expected one; use read_mesh_buffers() then.
+
+    Raises:
+        ValueError: If the mesh has no matching UV layer.
+    """
+    uv_layer = mesh.uv_layers.get(uv_layer_name) if uv_layer_name else mesh.uv_layers.active
+    if not uv_layer:
+        raise ValueError("Active UV layer is required.")
+
+    min_version, max_version = IN_PLACE_VERSIONS
+    if not min_version <= bpy.app.version < max_version:
+        return None
+
+    loops, polygons, uvs = mesh.loops, mesh.polygons, uv_layer.data
+    num_faces = len(polygons)
+    num_loops = len(loops)
+    if num_faces == 0 or num_loops == 0:
+        return None
+    if not (_is_contiguous(loops, 4) and _is_contiguous(polygons, 4) and _is_contiguous(uvs, 8)):
+        return None
+
+    loop_vert_indices = _view(loops[0].as_pointer(), ctypes.c_int32, "i", num_loops)
+    offsets = _view(polygons[0].as_pointer(), ctypes.c_int32, "i", num_faces + 1)
+    uv_coords = _view(uvs[0].as_pointer(), ctypes.c_float, "f", num_loops * 2)
+
+    # Spot-check the views against the RNA values before trusting them
+    last_face = polygons[-1]
+    if (
+        loop_vert_indices[0] != loops[0].vertex_index
+        or loop_vert_indices[-1] != loops[-1].vertex_index
+        or offsets[0] != 0
+        or offsets[num_faces - 1] != last_face.loop_start
+        or offsets[num_faces] != num_loops
+        or tuple(uv_coords[-2:]) != tuple(uvs[-1].uv)
+    ):
+        return None
+
+    poly_loop_totals = int_buffer(num_faces)
+    polygons.foreach_get("loop_total", poly_loop_totals)
+
+    return MeshBuffers(offsets[:num_faces], poly_loop_totals, loop_vert_indices, uv_coords)
+
+
+def read_mesh_buffers_to_edit(
+    mesh: bpy.types.Mesh, uv_layer_name: str | None = None
+) -> MeshBuffers:
+    """
+    read_mesh_buffers_in_place() for callers that change the UVs in place and write them
+    back: the UVs are a writable copy, made with one memcpy instead of a foreach_get.
+    The topology views have the same lifetime as with read_mesh_buffers_in_place().
+    Falls back to read_mesh_buffers().
+
+    Raises:
+        ValueError: If the mesh has no matching UV layer.
+    """
+    buffers = read_mesh_buffers_in_place(mesh, uv_layer_name)
+    if buffers is None:
+        return read_mesh_buffers(mesh, uv_layer_name)
+    uv_coords = array("f")
+    uv_coords.frombytes(buffers.uv_coords.cast("B"))
+    return buffers._replace(uv_coords=uv_coords)
+
+
+def _is_contiguous(collection, stride: int) -> bool:
+    span = collection[-1].as_pointer() - collection[0].as_pointer()
+    return span == stride * (len(collection) - 1)
+
+
+def _view(address: int, ctype, typecode: str, count: int) -> memoryview:
+    # ctypes exports "<i" / "<f"; recast to the native format so the view is indexable
+    data = (ctype * count).from_address(address)
+    return memoryview(data).cast("B").cast(typecode).toreadonly()
+
+
+def fingerprint_buffers(buffers: MeshBuffers) -> str:
+    """
+    Returns the 64-bit fingerprint of the buffers as a hex string
+    (ID properties cannot hold unsigned 64-bit integers).
+    """
+    fingerprint = rust_bridge.fingerprint_mesh(
+        buffers.poly_loop_starts,
+        buffers.poly_loop_totals,
+        buffers.loop_vert_indices,
+        buffers.uv_coords,
+    )
+    return f"{fingerprint:016x}"
+
+
+def sync_from_edit_mode(obj: bpy.types.Object) -> bool:
+    """
+    Flushes the edit BMesh into obj.data (one way, the BMesh stays alive),
+    so that foreach_get reads current data without a mode round trip.
+
+    Returns:
+        bool: True if the object is in Edit Mode.
+    """
+    if obj.mode != "EDIT":
+        return False
+    obj.update_from_editmode()
+    return True
+
+
+def fingerprint_selection(
+    obj: bpy.types.Object, uv_layer_name: str, uv_select: bool = False
+) -> str | None:
+    """
+    Fingerprint of the topology, UVs, vertex positions, selection and active face of obj,
+    read with foreach_get from mesh_data() instead of walking the BMesh in Python.
+    With uv_select, the UV vertex and edge selection is included as well.
+
+    Returns:
+        The fingerprint, or None if the mesh has no such UV layer.
+    """
+    with mesh_data(obj) as mesh:
+        uv_layer = mesh.uv_layers.get(uv_layer_name)
+        if uv_layer is None:
+            return None
+
+        arrays = [read_vertex_positions(mesh), array("i", [mesh.polygons.active])]
+        for collection in (mesh.vertices, mesh.edges, mesh.polygons):
+            select = int_buffer(len(collection))
+            collection.foreach_get("select", select)
+            arrays.append(select)
+        if uv_select:
+            for name in (".uv_select_vert", ".uv_select_edge"):
+                # A missing attribute means nothing is selected
+                select = int_buffer(len(mesh.loops))
+                attribute = mesh.attributes.get(name)
+                if attribute is not None:
+                    attribute.data.foreach_get("value", select)
+                arrays.append(select)
+
+        buffers = read_mesh_buffers_in_place(mesh, uv_layer_name) or read_mesh_buffers(
+            mesh, uv_layer_name
+        )
+        digest = hashlib.blake2b(fingerprint_buffers(buffers).encode())
+    for values in arrays:
+        digest.update(values)
+    return digest.hexdigest()
+
+
+@contextmanager
+def mesh_data(obj: bpy.types.Object) -> Iterator[bpy.types.Mesh]:
+    """
+    Yields a mesh with the current data of obj whose UV and attribute arrays foreach_get
+    and foreach_set can access, without leaving Edit Mode.
+
+    In Object Mode this is obj.data. In Edit Mode these arrays are empty to RNA, so the
+    edit BMesh is flushed into obj.data and a copy of it is yielded instead. The copy
+    shares the arrays of obj.data until they are written and is removed on exit, so
+    buffers read from it in place must not outlive the block. Writes inside the block
+    (see write_mesh_data()) go to the same copy. Caches and ID properties stay keyed
+    by obj.data.
+    """
+    mesh = obj.data
+    key = mesh.session_uid
+    if key in _edit_copies:
+        yield _edit_copies[key]
+        return
+    if not sync_from_edit_mode(obj):
+        yield mesh
+        return
+
+    data = mesh.copy()
+    _edit_copies[key] = data
+    try:
+        yield data
+    finally:
+        del _edit_copies[key]
+        bpy.data.meshes.remove(data)
+
+
+def write_mesh_data(obj: bpy.types.Object, write: Callable[[bpy.types.Mesh], None]) -> None:
+    """
+    Calls write(mesh) on the mesh of mesh_data(obj), where foreach_set can write whole
+    UV and attribute arrays, then hands the result to obj.
+
+    In Object Mode the mesh is tagged for update. In Edit Mode the edit BMesh is reloaded
+    from the written copy in C, instead of a mode round trip or setting every element
+    through BMesh in Python.
+    """
+    with mesh_data(obj) as data:
+        write(data)
+        if obj.mode != "EDIT":
+            data.update_tag()
+            return
+
+        import bmesh
+
+        mesh = obj.data
+        bm = bmesh.from_edit_mesh(mesh)
+        bm.clear()
+        # The edit coordinates are those of the active shape key
+        bm.from_mesh(
+            data,
+            use_shape_key=data.shape_keys is not None,
+            shape_key_index=obj.active_shape_key_index,
+        )
+        # The element pointers changed, so loop triangles are rebuilt as well
+        bmesh.update_edit_mesh(mesh)
+
+
+def write_corner_colors(
+    obj: bpy.types.Object,
+    layer_name: str,
+    colors: array,
+    face_indices: Sequence[int] | None = None,
+) -> None:
+    """
+    Writes flat RGBA corner colors into a BYTE_COLOR CORNER attribute and makes it the
+    active color attribute.
+
+    The whole layer is written with one foreach_set (see write_mesh_data()).
+    If face_indices is given, only the loops of those faces are written, element by
+    element, so the Python cost scales with the selection.
+    """
+    if face_indices is None:
+        write_corner_color_layers(obj, {layer_name: colors})
+        return
+
+    def write(mesh):
+        layer_data = _corner_color_layer(mesh, layer_name).data
+        polygons = mesh.polygons
+        for f_idx in face_indices:
+            for loop_index in polygons[f_idx].loop_indices:
+                layer_data[loop_index].color = colors[4 * loop_index : 4 * loop_index + 4]
+
+    write_mesh_data(obj, write)
+    _set_active_color(obj.data, layer_name)
+
+
+def write_corner_color_layers(obj: bpy.types.Object, layers: Mapping[str, array]) -> None:
+    """
+    Writes several corner color layers, given by name, with one foreach_set each and a
+    single write_mesh_data(); the last one becomes the active color attribute.
+    """
+
+    def write(mesh):
+        for layer_name, colors in layers.items():
+            _corner_color_layer(mesh, layer_name).data.foreach_set("color", colors)
+
+    write_mesh_data(obj, write)
+    for layer_name in layers:
+        _set_active_color(obj.data, layer_name)
+
+
+def _corner_color_layer(mesh: bpy.types.Mesh, layer_name: str):
+    vcol_layer = mesh.color_attributes.get(layer_name)
+    if vcol_layer is None:
+        vcol_layer = mesh.color_attributes.new(name=layer_name, type="BYTE_COLOR", domain="CORNER")
+    return vcol_layer
+
+
+def _set_active_color(mesh: bpy.types.Mesh, layer_name: str) -> None:
+    # Set on obj.data: an Edit Mode copy does not carry it back
+    attr_index = mesh.color_attributes.find(layer_name)
+    if attr_index != -1:
+        mesh.color_attributes.active_color_index = attr_index
+
+
+def write_uv_coords(obj: bpy.types.Object, uv_coords: array) -> None:
+    """
+    Writes flat UVs (float32, loops * 2) into the active UV layer with one foreach_set
+    (see write_mesh_data()). Loops that were not changed are written back unchanged.
+    """
+
+    def write(mesh):
+        mesh.uv_layers.active.data.foreach_set("uv", uv_coords)
+
+    write_mesh_data(obj, write)
+
+
+def write_face_selection(
+    obj: bpy.types.Object, face_select: array, vert_select: array, edge_select: array
+) -> None:
+    """
+    Writes the selection masks (int32, 0 or 1) of faces, vertices and edges with one
+    foreach_set each (see write_mesh_data()).
+    """
+
+    def write(mesh):
+        mesh.vertices.foreach_set("select", vert_select)
+        mesh.edges.foreach_set("select", edge_select)
+        mesh.polygons.foreach_set("select", face_select)
+
+    write_mesh_data(obj, write)
+
+
+def write_edge_seams(obj: bpy.types.Object, edge_mask: array) -> None:
+    """
+    Marks exactly the edges with a non-zero edge_mask entry as seams with one
+    foreach_set (see write_mesh_data()).
+    """
+
+    def write(mesh):
+        mesh.edges.foreach_set("use_seam", edge_mask)
+
+    write_mesh_data(obj, write)
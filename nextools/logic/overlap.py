@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    float_buffer,
+    int_buffer,
+    mesh_data,
+    read_mesh_buffers,
+    read_mesh_buffers_in_place,
+    write_corner_colors,
+    write_face_selection,
+)
+
+OVERLAP_LAYER_NAME = "UV_Overlap"
+
+
+class OverlapResult(NamedTuple):
+    """
+    Overlap groups of a mesh. Islands connected by overlaps form one group, so islands
+    stacked on purpose show up as a single group. Entries are -1 without overlaps.
+    """
+
+    face_groups: array
+    island_groups: array
+    num_groups: int
+
+    @property
+    def num_faces(self) -> int:
+        """Number of overlapping faces."""
+        return sum(1 for group in self.face_groups if group >= 0)
+
+
+def find_uv_overlaps(obj: bpy.types.Object) -> OverlapResult:
+    """
+    Finds overlapping faces in the active UV layer.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    _validate(obj)
+    with mesh_data(obj) as data:
+        return _detect(obj.data, _read_buffers(data))
+
+
+def select_uv_overlaps(obj: bpy.types.Object) -> OverlapResult:
+    """
+    Selects the overlapping faces (and only them) in the active UV layer.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation or the selection fails.
+    """
+    _validate(obj)
+    with mesh_data(obj) as data:
+        buffers = _read_buffers(data)
+        result = _detect(obj.data, buffers)
+
+        loop_edge_indices = int_buffer(buffers.num_loops)
+        data.loops.foreach_get("edge_index", loop_edge_indices)
+        face_select = int_buffer(buffers.num_faces)
+        vert_select = int_buffer(len(data.vertices))
+        edge_select = int_buffer(len(data.edges))
+        try:
+            rust_bridge.select_uv_overlaps(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.loop_vert_indices,
+                loop_edge_indices,
+                result.face_groups,
+                face_select,
+                vert_select,
+                edge_select,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        try:
+            write_face_selection(obj, face_select, vert_select, edge_select)
+        except Exception as e:
+            raise RuntimeError(f"Failed to select faces: {e}")
+    return result
+
+
+def bake_uv_overlaps(obj: bpy.types.Object) -> OverlapResult:
+    """
+    Bakes the overlap groups into the UV_Overlap corner color attribute.
+    Overlapping faces get the color of their group, all other faces a dark color.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    _validate(obj)
+    with mesh_data(obj) as data:
+        buffers = _read_buffers(data)
+        rgba_colors = float_buffer(buffers.num_loops * 4)
+        result = _detect(obj.data, buffers, rgba_colors)
+
+        try:
+            write_corner_colors(obj, OVERLAP_LAYER_NAME, rgba_colors)
+        except Exception as e:
+            raise RuntimeError(f"Failed to apply color data to mesh: {e}")
+    return result
+
+
+def _validate(obj: bpy.types.Object) -> None:
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+
+def _read_buffers(data: bpy.types.Mesh) -> MeshBuffers:
+    # Views into the mesh of a mesh_data() block, only valid inside it
+    return read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+
+
+def _detect(
+    mesh: bpy.types.Mesh, buffers: MeshBuffers, rgba_colors: array | None = None
+) -> OverlapResult:
+    try:
+        # Island labels come from the Color ID core, reused from its caches when current
+        islands = get_islands(mesh, buffers, fingerprint_buffers(buffers))
+        face_groups = int_buffer(buffers.num_faces)
+        island_groups = int_buffer(islands.num_islands)
+        num_groups = rust_bridge.detect_uv_overlaps(
+            buffers.poly_loop_starts,
+            buffers.poly_loop_totals,
+            buffers.uv_coords,
+            islands.face_islands,
+            face_groups,
+            island_groups,
+            rgba_colors,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Rust core calculation failed: {e}")
+
+    return OverlapResult(face_groups, island_groups, num_groups)
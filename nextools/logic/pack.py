@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands
+from .mesh_buffers import (
+    fingerprint_buffers,
+    mesh_data,
+    read_mesh_buffers_to_edit,
+    write_uv_coords,
+)
+
+
+class PackResult(NamedTuple):
+    num_islands: int
+    # Fraction of the unit square covered by the island bounds
+    fill: float
+
+
+def pack_uv_islands(
+    obj: bpy.types.Object, margin: float = 0.005, target_fill: float = 0.8, rotate: bool = True
+) -> PackResult:
+    """
+    Packs all islands of the active UV layer into the unit square using their bounds.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        margin: Gap between islands in UV units, met to within a few percent.
+        target_fill: Expected packing density (0..1] used to size the candidate layouts.
+        rotate: Allow 90 degree rotations.
+
+    Raises:
+        ValueError: If the provided object or an argument is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not 0.0 < target_fill <= 1.0:
+        raise ValueError("Target fill must be in (0, 1].")
+    if not 0.0 <= margin < 0.5:
+        raise ValueError("Margin must be in [0, 0.5).")
+
+    mesh = obj.data
+    if not mesh.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+    with mesh_data(obj) as data:
+        # The UVs are packed in place and written back in one call
+        buffers = read_mesh_buffers_to_edit(data)
+
+        try:
+            islands = get_islands(mesh, buffers, fingerprint_buffers(buffers))
+            fill = rust_bridge.pack_uv_islands(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.uv_coords,
+                islands.face_islands,
+                islands.num_islands,
+                margin,
+                target_fill,
+                rotate,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        try:
+            write_uv_coords(obj, buffers.uv_coords)
+        except Exception as e:
+            raise RuntimeError(f"Failed to write UVs: {e}")
+
+    return PackResult(islands.num_islands, fill)
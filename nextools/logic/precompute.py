@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+import time
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import handlers, rust_bridge
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    int_buffer,
+    mesh_data,
+    read_mesh_buffers,
+)
+
+DEBOUNCE_SECONDS = 0.3
+
+
+class IslandResult(NamedTuple):
+    """Per-face island and color indices, tagged with the fingerprint of their input."""
+
+    fingerprint: str
+    face_islands: array
+    face_colors: array
+    num_islands: int
+
+
+class _Job(NamedTuple):
+    key: int
+    generation: int
+    buffers: MeshBuffers
+    fingerprint: str
+
+
+# Geometry updates of the active mesh are debounced with a timer, the buffers are
+# snapshotted on the main thread and islands are computed on a worker thread
+# (the Rust core releases the GIL). Results are only reused for the same fingerprint.
+_lock = threading.Lock()
+# All keyed by Mesh.session_uid and guarded by _lock
+_results: dict[int, IslandResult] = {}
+_generations: dict[int, int] = {}
+_submitted: dict[int, str] = {}
+_queued: dict[int, _Job] = {}
+_running: set[int] = set()
+# The last failure per mesh, shown in the panel until a computation succeeds
+_errors: dict[int, str] = {}
+
+# Main thread only
+_pending_object: str | None = None
+_last_change = 0.0
+
+
+def compute_island_result(buffers: MeshBuffers, fingerprint: str) -> IslandResult:
+    """
+    Computes islands and coloring of the buffers synchronously.
+    """
+    face_islands = int_buffer(buffers.num_faces)
+    face_colors = int_buffer(buffers.num_faces)
+    num_islands = rust_bridge.compute_island_coloring(
+        buffers.poly_loop_starts,
+        buffers.poly_loop_totals,
+        buffers.loop_vert_indices,
+        buffers.uv_coords,
+        face_islands,
+        face_colors,
+    )
+    return IslandResult(fingerprint, face_islands, face_colors, num_islands)
+
+
+def get_island_result(mesh: bpy.types.Mesh, fingerprint: str) -> IslandResult | None:
+    """
+    Returns the precomputed result for the mesh if it was computed from buffers
+    with the given fingerprint, else None.
+    """
+    with _lock:
+        result = _results.get(mesh.session_uid)
+    if result is None or result.fingerprint != fingerprint:
+        return None
+    return result
+
+
+def get_error(mesh: bpy.types.Mesh) -> str | None:
+    """
+    Returns the message of the last failed precomputation of the mesh, or None.
+    Only reads the cache, so it is safe to call from draw().
+    """
+    with _lock:
+        return _errors.get(mesh.session_uid)
+
+
+def submit(obj: bpy.types.Object) -> threading.Thread | None:
+    """
+    Snapshots the mesh buffers of obj and computes its islands on a worker thread.
+
+    Snapshots equal to the last submitted one are ignored. If a computation for the
+    mesh is still running, the snapshot is queued and replaces any older queued one;
+    the running result is then stale and dropped when it finishes.
+
+    Returns:
+        The started worker thread, or None if nothing was started.
+    """
+    if not obj or obj.type != "MESH" or not obj.data.uv_layers.active:
+        return None
+
+    _evict_deleted_meshes()
+    mesh = obj.data
+    if obj.mode == "EDIT":
+        handlers.ignore_next_update(mesh)
+    # Copied buffers: the worker thread outlives the mesh_data() block
+    with mesh_data(obj) as data:
+        buffers = read_mesh_buffers(data)
+    fingerprint = fingerprint_buffers(buffers)
+    key = mesh.session_uid
+
+    with _lock:
+        warm = _results.get(key)
+        if warm and warm.fingerprint == fingerprint:
+            _errors.pop(key, None)
+            return None
+        if _submitted.get(key) == fingerprint:
+            return None
+        generation = _generations.get(key, 0) + 1
+        _generations[key] = generation
+        _submitted[key] = fingerprint
+        job = _Job(key, generation, buffers, fingerprint)
+
+        if key in _running:
+            _queued[key] = job
+            return None
+        _running.add(key)
+
+    thread = threading.Thread(target=_run_jobs, args=(job,), name="NexTools-Islands", daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_jobs(job: _Job) -> None:
+    key = job.key
+    while job is not None:
+        error = None
+        try:
+            result = compute_island_result(job.buffers, job.fingerprint)
+        except Exception as e:
+            error = f"Island precomputation failed: {e}"
+            result = None
+
+        with _lock:
+            if _generations.get(key) == job.generation:
+                if result is not None:
+                    _results[key] = result
+                    _errors.pop(key, None)
+                else:
+                    _errors[key] = error
+            job = _queued.pop(key, None)
+            if job is None:
+                _running.discard(key)
+
+
+def _evict_deleted_meshes() -> None:
+    alive = {mesh.session_uid for mesh in bpy.data.meshes}
+    with _lock:
+        for table in (_results, _submitted, _queued, _generations, _errors):
+            for key in [key for key in table if key not in alive]:
+                # A running job of a dropped generation discards its result
+                del table[key]
+
+
+def clear() -> None:
+    """
+    Drops all precomputed results. Running computations finish but are discarded.
+    """
+    global _pending_object
+    _pending_object = None
+    with _lock:
+        for key in _generations:
+            _generations[key] += 1
+        _results.clear()
+        _submitted.clear()
+        _queued.clear()
+        _errors.clear()
+
+
+def _on_debounce_timer():
+    global _pending_object
+    remaining = _last_change + DEBOUNCE_SECONDS - time.monotonic()
+    if remaining > 0:
+        return remaining
+
+    obj = bpy.data.objects.get(_pending_object) if _pending_object else None
+    _pending_object = None
+    try:
+        submit(obj)
+    except Exception as e:
+        with _lock:
+            _errors[obj.data.session_uid] = f"Island precomputation failed: {e}"
+    return None
+
+
+def _schedule(obj: bpy.types.Object) -> None:
+    global _pending_object, _last_change
+    _pending_object = obj.name
+    _last_change = time.monotonic()
+    if not bpy.app.timers.is_registered(_on_debounce_timer):
+        bpy.app.timers.register(_on_debounce_timer, first_interval=DEBOUNCE_SECONDS)
+
+
+def on_mesh_edit(mesh_keys: set[int]) -> None:
+    """
+    Called by the add-on's depsgraph handler with the session UIDs of edited meshes
+    while the feature is enabled.
+    """
+    obj = bpy.context.view_layer.objects.active
+    if obj is not None and obj.type == "MESH" and obj.data.session_uid in mesh_keys:
+        _schedule(obj)
+
+
+def on_setting_update(settings, context) -> None:
+    """
+    Update callback of the precompute_islands setting: warms up the active
+    object right away when enabled and frees the results when disabled.
+    """
+    if settings.precompute_islands:
+        if context.active_object:
+            _schedule(context.active_object)
+    else:
+        clear()
+
+
+def unregister() -> None:
+    """
+    Stops the timer and frees the results; the handlers belong to nextools.handlers.
+    """
+    if bpy.app.timers.is_registered(_on_debounce_timer):
+        bpy.app.timers.unregister(_on_debounce_timer)
+    clear()
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands
+from .mesh_buffers import (
+    fingerprint_buffers,
+    int_buffer,
+    mesh_data,
+    read_mesh_buffers,
+    read_mesh_buffers_in_place,
+    write_edge_seams,
+)
+
+
+class IslandBoundary(NamedTuple):
+    """
+    Boundary polyline of a UV island. Every loop stands for the face side from its
+    vertex to the next corner of its face, so the loops' UVs trace the boundary.
+    """
+
+    island: int
+    loops: list[int]
+    closed: bool
+
+
+class SeamResult(NamedTuple):
+    """
+    Per-edge seam mask (int32, 1 for split UVs, and for kept seams with keep_existing);
+    num_seams counts the split edges. boundaries is None unless requested.
+    """
+
+    edge_seams: array
+    num_seams: int
+    boundaries: list[IslandBoundary] | None
+
+
+def find_seams(
+    obj: bpy.types.Object, with_boundaries: bool = False, keep_existing: bool = False
+) -> SeamResult:
+    """
+    Finds the edges whose UVs are split in the active UV layer, with the same UV test
+    the island detection uses. Boundary edges of the mesh are not seams.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        with_boundaries: Also chain the boundary of every island into polylines.
+        keep_existing: Also set the mask on edges that are marked as seams already.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    _validate(obj)
+    with mesh_data(obj) as data:
+        # Views into the mesh_data() copy, only valid inside the block
+        buffers = read_mesh_buffers_in_place(data) or read_mesh_buffers(data)
+        loop_edge_indices = int_buffer(buffers.num_loops)
+        data.loops.foreach_get("edge_index", loop_edge_indices)
+        face_islands = None
+        if with_boundaries:
+            face_islands = get_islands(obj.data, buffers, fingerprint_buffers(buffers)).face_islands
+
+        edge_seams = int_buffer(len(data.edges))
+        if keep_existing:
+            data.edges.foreach_get("use_seam", edge_seams)
+        try:
+            num_seams, polylines = rust_bridge.seams_from_islands(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.loop_vert_indices,
+                loop_edge_indices,
+                buffers.uv_coords,
+                edge_seams,
+                face_islands,
+                keep_existing,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+    boundaries = None
+    if polylines is not None:
+        offsets, loops, islands, closed = polylines
+        boundaries = [
+            IslandBoundary(islands[i], loops[offsets[i] : offsets[i + 1]], closed[i])
+            for i in range(len(islands))
+        ]
+    return SeamResult(edge_seams, num_seams, boundaries)
+
+
+def mark_seams_from_islands(
+    obj: bpy.types.Object, clear_existing: bool = True, with_boundaries: bool = False
+) -> SeamResult:
+    """
+    Marks the edges whose UVs are split as seams, in one bulk write.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        clear_existing: Clear seams on edges whose UVs are continuous.
+        with_boundaries: Also chain the boundary of every island into polylines.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    _validate(obj)
+    # find_seams() reuses this block's copy, so Edit Mode is flushed once
+    with mesh_data(obj):
+        result = find_seams(obj, with_boundaries, keep_existing=not clear_existing)
+
+        try:
+            write_edge_seams(obj, result.edge_seams)
+        except Exception as e:
+            raise RuntimeError(f"Failed to mark seams: {e}")
+    return result
+
+
+def _validate(obj: bpy.types.Object) -> None:
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    int_buffer,
+    mesh_data,
+    read_mesh_buffers_to_edit,
+    read_vertex_positions,
+    write_uv_coords,
+)
+
+
+class DuplicateResult(NamedTuple):
+    """
+    Groups of identical islands: same topology and 3D edge lengths.
+    Entries of island_groups are -1 for islands without a duplicate.
+    """
+
+    island_groups: array
+    num_groups: int
+
+    @property
+    def num_islands(self) -> int:
+        """Number of islands that belong to a group."""
+        return sum(1 for group in self.island_groups if group >= 0)
+
+
+class _Islands(NamedTuple):
+    buffers: MeshBuffers
+    face_islands: array
+    result: DuplicateResult
+
+
+def find_duplicate_islands(obj: bpy.types.Object, tolerance: float = 1e-4) -> DuplicateResult:
+    """
+    Finds groups of identical islands in the active UV layer.
+
+    Args:
+        obj: Mesh object with an active UV layer.
+        tolerance: Largest difference of a 3D edge length, in object units.
+
+    Raises:
+        ValueError: If the provided object or tolerance is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    _validate(obj, tolerance)
+    with mesh_data(obj) as data:
+        return _find(obj, data, tolerance).result
+
+
+def stack_duplicate_islands(obj: bpy.types.Object, tolerance: float = 1e-4) -> DuplicateResult:
+    """
+    Stacks every group of identical islands onto its first island: the UV centroid,
+    orientation and size of the others are matched to it.
+
+    Raises:
+        ValueError: If the provided object or tolerance is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    _validate(obj, tolerance)
+    with mesh_data(obj) as data:
+        islands = _find(obj, data, tolerance)
+        if islands.result.num_groups == 0:
+            return islands.result
+
+        buffers = islands.buffers
+        try:
+            rust_bridge.stack_islands(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.uv_coords,
+                islands.face_islands,
+                islands.result.island_groups,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        try:
+            write_uv_coords(obj, buffers.uv_coords)
+        except Exception as e:
+            raise RuntimeError(f"Failed to write UVs: {e}")
+    return islands.result
+
+
+def _validate(obj: bpy.types.Object, tolerance: float) -> None:
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+    if tolerance < 0.0:
+        raise ValueError("Tolerance must not be negative.")
+
+
+def _find(obj: bpy.types.Object, data: bpy.types.Mesh, tolerance: float) -> _Islands:
+    # The UVs are moved in place and written back; the topology views are only valid
+    # inside the caller's mesh_data() block
+    buffers = read_mesh_buffers_to_edit(data)
+    islands = get_islands(obj.data, buffers, fingerprint_buffers(buffers))
+    island_groups = int_buffer(islands.num_islands)
+    try:
+        num_groups = rust_bridge.find_duplicate_islands(
+            buffers.poly_loop_starts,
+            buffers.poly_loop_totals,
+            buffers.loop_vert_indices,
+            read_vertex_positions(data),
+            islands.face_islands,
+            tolerance,
+            island_groups,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Rust core calculation failed: {e}")
+    return _Islands(buffers, islands.face_islands, DuplicateResult(island_groups, num_groups))
@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+from array import array
+from contextlib import ExitStack
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+from .color_id import get_islands, selected_island_mask
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    float_buffer,
+    mesh_data,
+    read_face_selection,
+    read_mesh_buffers,
+    read_vertex_positions,
+    write_uv_coords,
+)
+
+# Values per island returned by rust_bridge.compute_texel_density()
+_ISLAND_STATS = 3
+
+
+class IslandTexelDensity(NamedTuple):
+    """Texel density of one island in pixels per world unit, with its world-space area."""
+
+    island: int
+    area_3d: float
+    area_uv: float
+    density: float
+
+
+class DensityStats(NamedTuple):
+    """Spread of island densities; the mean is weighted by 3D area."""
+
+    min: float
+    max: float
+    mean: float
+
+    @property
+    def spread(self) -> float:
+        """max / min, 1.0 when all islands share one density."""
+        return self.max / self.min if self.min > 0.0 else math.inf
+
+
+class NormalizeResult(NamedTuple):
+    target: float
+    before: DensityStats
+    after: DensityStats
+    num_islands: int
+
+
+class _MeshInput(NamedTuple):
+    obj: bpy.types.Object
+    buffers: MeshBuffers
+    positions: array
+    face_select: array
+    face_islands: array
+    num_islands: int
+    world_scale: float
+
+
+def island_texel_densities(
+    obj: bpy.types.Object, texture_size: int = 1024
+) -> list[IslandTexelDensity]:
+    """
+    Texel density of every island of the active UV layer, in pixels per world unit.
+    Non-uniform object scale is approximated by its mean scale.
+
+    Raises:
+        ValueError: If the provided object is invalid.
+        RuntimeError: If the calculation fails.
+    """
+    return _island_densities(_read_input(obj), texture_size)
+
+
+def density_stats(islands: list[IslandTexelDensity]) -> DensityStats:
+    """Min, max and area-weighted mean density of islands with a 3D area."""
+    islands = [island for island in islands if island.area_3d > 0.0]
+    if not islands:
+        return DensityStats(0.0, 0.0, 0.0)
+    area_3d = sum(island.area_3d for island in islands)
+    # Same weighting as the Rust core: sqrt of total UV area over total 3D area
+    mean = sum(island.density**2 * island.area_3d for island in islands) / area_3d
+    return DensityStats(
+        min(island.density for island in islands),
+        max(island.density for island in islands),
+        math.sqrt(mean),
+    )
+
+
+def normalize_texel_density(
+    objects: list[bpy.types.Object],
+    target: float | None = None,
+    texture_size: int = 1024,
+    selected_only: bool = False,
+) -> NormalizeResult:
+    """
+    Scales every island of the objects about its UV centroid to one texel density.
+
+    Args:
+        objects: Mesh objects with an active UV layer.
+        target: Pixels per world unit; the area-weighted mean of all islands if None.
+        texture_size: Texture resolution the densities refer to.
+        selected_only: Only scale islands with a selected face; the mean target still
+            covers all islands.
+
+    Raises:
+        ValueError: If an object is invalid or the target is not positive.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if target is not None and target <= 0.0:
+        raise ValueError("Target density must be positive.")
+    if texture_size <= 0:
+        raise ValueError("Texture size must be positive.")
+
+    # Edit Mode meshes stay open until their UVs are written, so each is flushed once
+    with ExitStack() as sessions:
+        inputs = []
+        seen_meshes = set()
+        for obj in objects:
+            # Objects sharing a mesh are normalized once
+            if obj and obj.type == "MESH":
+                if obj.data.session_uid in seen_meshes:
+                    continue
+                seen_meshes.add(obj.data.session_uid)
+                sessions.enter_context(mesh_data(obj))
+            inputs.append(_read_input(obj))
+        before = [_island_densities(mesh_input, texture_size) for mesh_input in inputs]
+        before_stats = density_stats([island for islands in before for island in islands])
+        if target is None:
+            target = before_stats.mean
+        if target <= 0.0:
+            raise ValueError("No islands with UV and 3D area to normalize.")
+
+        after = []
+        num_islands = 0
+        for mesh_input in inputs:
+            buffers = mesh_input.buffers
+            if selected_only:
+                island_mask = selected_island_mask(
+                    mesh_input.face_select, mesh_input.face_islands, mesh_input.num_islands
+                )
+            else:
+                island_mask = array("i", [1]) * mesh_input.num_islands
+            num_islands += sum(island_mask)
+            try:
+                rust_bridge.normalize_texel_density(
+                    buffers.poly_loop_starts,
+                    buffers.poly_loop_totals,
+                    buffers.loop_vert_indices,
+                    mesh_input.positions,
+                    buffers.uv_coords,
+                    mesh_input.face_islands,
+                    island_mask,
+                    target / texture_size * mesh_input.world_scale,
+                )
+            except Exception as e:
+                raise RuntimeError(f"Rust core calculation failed: {e}")
+
+            try:
+                write_uv_coords(mesh_input.obj, buffers.uv_coords)
+            except Exception as e:
+                raise RuntimeError(f"Failed to write UVs: {e}")
+            after.extend(_island_densities(mesh_input, texture_size))
+
+    return NormalizeResult(
+        target,
+        before_stats,
+        density_stats(after),
+        num_islands,
+    )
+
+
+def _read_input(obj: bpy.types.Object) -> _MeshInput:
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    mesh = obj.data
+    if not mesh.uv_layers.active:
+        raise ValueError(f"Active UV layer is required ({obj.name}).")
+
+    with mesh_data(obj) as data:
+        # Copied buffers: the UVs are scaled in place and written back
+        buffers = read_mesh_buffers(data)
+        positions = read_vertex_positions(data)
+        face_select = read_face_selection(data)
+    islands = get_islands(mesh, buffers, fingerprint_buffers(buffers))
+    world_scale = abs(obj.matrix_world.to_3x3().determinant()) ** (1.0 / 3.0) or 1.0
+    return _MeshInput(
+        obj,
+        buffers,
+        positions,
+        face_select,
+        islands.face_islands,
+        islands.num_islands,
+        world_scale,
+    )
+
+
+def _island_densities(mesh_input: _MeshInput, texture_size: int) -> list[IslandTexelDensity]:
+    buffers = mesh_input.buffers
+    stats = float_buffer(mesh_input.num_islands * _ISLAND_STATS)
+    try:
+        rust_bridge.compute_texel_density(
+            buffers.poly_loop_starts,
+            buffers.poly_loop_totals,
+            buffers.loop_vert_indices,
+            mesh_input.positions,
+            buffers.uv_coords,
+            mesh_input.face_islands,
+            stats,
+        )
+    except Exception as e:
+        raise RuntimeError(f"Rust core calculation failed: {e}")
+
+    scale = mesh_input.world_scale
+    return [
+        IslandTexelDensity(
+            i,
+            stats[i * _ISLAND_STATS] * scale * scale,
+            stats[i * _ISLAND_STATS + 1],
+            stats[i * _ISLAND_STATS + 2] / scale * texture_size,
+        )
+        for i in range(mesh_input.num_islands)
+    ]
@@ -4,6 +4,12 @@ import bmesh
 import bpy
 from bmesh.types import BMesh
 from bpy.types import Object
+from ...utils.cache import OperatorCache
+from ..mesh_buffers import fingerprint_selection
+
+# Results of follow_active_quads for the last selections, by face index, reused when the
+# redo panel re-runs the operator (e.g. to toggle keep_bounds) on the same input
+_rectify_cache = OperatorCache()
 
 
 def align_uv_rectify(obj: Object, bm: BMesh, uv_layer_name: str, keep_bounds: bool = False):
@@ -12,6 +18,7 @@ def align_uv_rectify(obj: Object, bm: BMesh, uv_layer_name: str, keep_bounds: bo
 
     NOTE: Only processes Quads. Triangles and N-gons are explicitly excluded
     to prevent UV layout distortion during normalization.
+    A redo on the same input reuses the cached unwrap instead of running it again.
     """
     mesh_data = obj.data
     uv_layer = bm.loops.layers.uv.get(uv_layer_name)
@@ -19,13 +26,27 @@ def align_uv_rectify(obj: Object, bm: BMesh, uv_layer_name: str, keep_bounds: bo
         print(f"Error: UV layer '{uv_layer_name}' not found.")
         return False
 
+    fingerprint = fingerprint_selection(obj, uv_layer_name)
+    cached = _rectify_cache.get(mesh_data, fingerprint) if fingerprint else None
+    if cached is not None:
+        face_indices, face_uvs, orig_bounds, current_bounds = cached
+        bm.faces.ensure_lookup_table()
+        selected_faces = [bm.faces[i] for i in face_indices]
+        for face, uvs in zip(selected_faces, face_uvs, strict=True):
+            for loop, uv in zip(face.loops, uvs, strict=True):
+                loop[uv_layer].uv = uv
+        _apply_uv_remap(
+            selected_faces, uv_layer, current_bounds, orig_bounds if keep_bounds else None
+        )
+        return True
+
     all_selected = [f for f in bm.faces if f.select]
     target_faces = [f for f in all_selected if len(f.verts) == 4]
 
     if not target_faces:
         return False
 
-    orig_bounds = _get_uv_bounds(target_faces, uv_layer) if keep_bounds else None
+    orig_bounds = _get_uv_bounds(target_faces, uv_layer)
 
     active_face = bm.faces.active
     if not active_face or active_face not in target_faces:
@@ -45,14 +66,28 @@ def align_uv_rectify(obj: Object, bm: BMesh, uv_layer_name: str, keep_bounds: bo
 
     returned_bmesh: BMesh = bmesh.from_edit_mesh(mesh_data)
     uv_layer = returned_bmesh.loops.layers.uv.get(uv_layer_name)
-    selected_faces = [f for f in returned_bmesh.faces if f.select and len(f.verts) == 4]
+    selected = [
+        (i, f) for i, f in enumerate(returned_bmesh.faces) if f.select and len(f.verts) == 4
+    ]
+    selected_faces = [f for _, f in selected]
 
     if not selected_faces:
         return True
 
     current_bounds = _get_uv_bounds(selected_faces, uv_layer)
     if current_bounds:
-        _apply_uv_remap(selected_faces, uv_layer, current_bounds, orig_bounds)
+        if fingerprint:
+            face_uvs = [
+                [loop[uv_layer].uv.copy() for loop in face.loops] for face in selected_faces
+            ]
+            _rectify_cache.set(
+                mesh_data,
+                fingerprint,
+                ([i for i, _ in selected], face_uvs, orig_bounds, current_bounds),
+            )
+        _apply_uv_remap(
+            selected_faces, uv_layer, current_bounds, orig_bounds if keep_bounds else None
+        )
 
     return True
 
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ... import rust_bridge
+from ..mesh_buffers import (
+    int_buffer,
+    mesh_data,
+    read_face_selection,
+    read_mesh_buffers_to_edit,
+    read_vertex_positions,
+    write_uv_coords,
+)
+
+RELAX_METHODS = ("LAPLACIAN", "ARAP")
+
+
+def relax_uvs(
+    obj: bpy.types.Object, method: str = "LAPLACIAN", iterations: int = 100, strength: float = 0.5
+) -> int:
+    """
+    Relaxes the UVs of the selected faces in the active UV layer.
+    Island boundaries, pinned UVs and the border of the selection stay fixed.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        method: LAPLACIAN moves every UV vertex towards the mean of its neighbors;
+            ARAP towards its faces' 3D shapes, rotated to fit the current UVs.
+        iterations: Number of smoothing steps.
+        strength: Fraction of the way (0, 1] towards the target per step.
+
+    Returns:
+        int: The number of moved UV vertices.
+
+    Raises:
+        ValueError: If the provided object or an argument is invalid, or no face is selected.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if method not in RELAX_METHODS:
+        raise ValueError(f"Unknown relax method '{method}'. Expected one of {RELAX_METHODS}.")
+    if not 0.0 < strength <= 1.0:
+        raise ValueError("Strength must be in (0, 1].")
+
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+    # The UVs are read and written in one mesh_data() block, so Edit Mode is flushed once
+    with mesh_data(obj) as data:
+        # The UVs are relaxed in place and written back
+        buffers = read_mesh_buffers_to_edit(data)
+        positions = read_vertex_positions(data)
+
+        face_select = read_face_selection(data)
+        if not any(face_select):
+            raise ValueError("No faces selected.")
+
+        # The pin layer only exists once a UV has been pinned
+        uv_layer = data.uv_layers.active
+        loop_pins = int_buffer(buffers.num_loops)
+        if len(uv_layer.pin) == buffers.num_loops:
+            uv_layer.pin.foreach_get("value", loop_pins)
+
+        try:
+            moved = rust_bridge.relax_uvs(
+                buffers.poly_loop_starts,
+                buffers.poly_loop_totals,
+                buffers.loop_vert_indices,
+                positions,
+                buffers.uv_coords,
+                face_select,
+                loop_pins,
+                method,
+                iterations,
+                strength,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        try:
+            write_uv_coords(obj, buffers.uv_coords)
+        except Exception as e:
+            raise RuntimeError(f"Failed to write UVs: {e}")
+
+    return moved
@@ -1,151 +1,261 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import math
+from itertools import pairwise
 from typing import NamedTuple
 
+import bpy
 from bmesh.types import BMLoop, BMesh
 from mathutils import Vector
+from ...utils.cache import OperatorCache
+from ..mesh_buffers import fingerprint_selection
 
 UVKey = tuple[float, float, int]  # (x, y, vert_index)
 AdjacencyGraph = dict[UVKey, set[UVKey]]
+# (a, key, b): the edges key-a and key-b are consecutive sides of a selected face
+Turns = set[tuple[UVKey, UVKey, UVKey]]
+
+# Node data and chains of the last selections, reused when the redo panel re-runs the
+# operator on the same input; they hold element indices, as the BMesh does not survive undo
+_chain_cache = OperatorCache()
 
 
 class UVNodeData(NamedTuple):
     """Immutable data container for UV node information."""
 
     uv: Vector
+    co: Vector
     vert_index: int
-    loops: list[BMLoop]
+    # (face index, corner) of every loop at this UV
+    corners: list[tuple[int, int]]
+
+
+class UVChain(NamedTuple):
+    """Ordered keys of a selected edge path; a closed loop does not repeat its first key."""
+
+    keys: list[UVKey]
+    closed: bool
+
 
+class StraightChain(NamedTuple):
+    """An open chain straightened on its own, along U (axis 0) or V (axis 1)."""
 
-def align_uv_straight(bm: BMesh, uv_layer_name: str, mode="GEOMETRY", keep_length=True) -> bool:
+    keys: list[UVKey]
+    axis: int
+    positions: dict[UVKey, Vector]
+
+
+def align_uv_straight(
+    bm: BMesh,
+    uv_layer_name: str,
+    mode="GEOMETRY",
+    keep_length=True,
+    loop_shape="RECTANGLE",
+    obj: bpy.types.Object | None = None,
+) -> bool:
     """
     Straighten selected UV edges.
+    Open chains become horizontal or vertical lines; chains that share vertices (edge
+    rings of a selected grid, branches) are solved together so their lines meet.
+    Closed loops are fitted to a rectangle or a circle (loop_shape).
+    If obj (the owner of bm) is given, the chains are cached by a fingerprint of its
+    buffers, so a redo skips walking the BMesh.
     """
     uv_layer = bm.loops.layers.uv.get(uv_layer_name)
     if not uv_layer:
         return False
 
-    node_data, graph = _build_uv_graph(bm, uv_layer)
-
-    if not graph:
-        return False
-
-    chains = _find_chains(graph)
+    node_data, chains = _find_chains_cached(bm, uv_layer, obj)
     if not chains:
         return False
 
-    updates: dict[UVKey, Vector] = {}
+    straight_chains: list[StraightChain] = []
+    loop_updates: dict[UVKey, Vector] = {}
     for chain in chains:
-        chain_updates = _calculate_straight_chain(chain, node_data, mode, keep_length)
-        updates.update(chain_updates)
+        if chain.closed:
+            loop_updates.update(
+                _calculate_loop(chain.keys, node_data, mode, keep_length, loop_shape)
+            )
+            continue
+        positions = _calculate_straight_chain(chain.keys, node_data, mode, keep_length)
+        if positions:
+            axis = _chain_axis(chain.keys, node_data)
+            straight_chains.append(StraightChain(chain.keys, axis, positions))
+
+    updates = _join_chains(straight_chains)
+    # Loops are fitted on their own and win over chains branching off them
+    updates.update(loop_updates)
 
-    _apply_updates(uv_layer, node_data, updates)
+    _apply_updates(bm, uv_layer, node_data, updates)
 
     return True
 
 
-def _build_uv_graph(bm, uv_layer) -> tuple[dict[UVKey, UVNodeData], AdjacencyGraph]:
+def _uv_key(loop: BMLoop, uv_layer) -> UVKey:
+    uv = loop[uv_layer].uv
+    return (round(uv.x, 6), round(uv.y, 6), loop.vert.index)
+
+
+def _build_uv_graph(bm, uv_layer) -> tuple[dict[UVKey, UVNodeData], AdjacencyGraph, Turns]:
     """
     Extracts UV selection into a graph representation and node data map.
-    Returns: (node_data, adjacency_graph)
+    Faces with all edges selected are grid cells: their corners are recorded as turns,
+    so chains run straight through a selected grid instead of around its cells.
+    Returns: (node_data, adjacency_graph, turns)
     """
     node_data: dict[UVKey, UVNodeData] = {}
     graph: AdjacencyGraph = {}
+    turns: Turns = set()
+    key_loops: dict[UVKey, list[BMLoop]] = {}
 
-    for face in bm.faces:
-        for loop in face.loops:
+    for face_index, face in enumerate(bm.faces):
+        for corner, loop in enumerate(face.loops):
             if loop.uv_select_vert:
-                uv = loop[uv_layer].uv
-                key = (round(uv.x, 6), round(uv.y, 6), loop.vert.index)
+                key = _uv_key(loop, uv_layer)
 
                 if key not in node_data:
-                    node_data[key] = UVNodeData(uv=uv.copy(), vert_index=loop.vert.index, loops=[])
+                    node_data[key] = UVNodeData(
+                        uv=loop[uv_layer].uv.copy(),
+                        co=loop.vert.co.copy(),
+                        vert_index=loop.vert.index,
+                        corners=[],
+                    )
                     graph[key] = set()
+                    key_loops[key] = []
 
-                node_data[key].loops.append(loop)
+                node_data[key].corners.append((face_index, corner))
+                key_loops[key].append(loop)
+
+        if all(loop.uv_select_edge for loop in face.loops):
+            keys = [_uv_key(loop, uv_layer) for loop in face.loops]
+            for i, key in enumerate(keys):
+                prev_key, next_key = keys[i - 1], keys[(i + 1) % len(keys)]
+                turns.add((prev_key, key, next_key))
+                turns.add((next_key, key, prev_key))
 
     # Scan loops again to build edges
-    # iterate over the collected node_data to avoid re-scanning all faces
-    for key, data in node_data.items():
-        for loop in data.loops:
+    # iterate over the collected loops to avoid re-scanning all faces
+    for key, loops in key_loops.items():
+        for loop in loops:
             if not loop.uv_select_edge:
                 continue
 
             next_loop = loop.link_loop_next
             if next_loop.uv_select_vert:
-                next_uv = next_loop[uv_layer].uv
-                next_key = (round(next_uv.x, 6), round(next_uv.y, 6), next_loop.vert.index)
+                next_key = _uv_key(next_loop, uv_layer)
 
                 if next_key in graph:
                     graph[key].add(next_key)
                     graph[next_key].add(key)
 
-    return node_data, graph
-
-
-def _find_chains(graph: AdjacencyGraph) -> list[list[UVKey]]:
-    """
-    Traverses the graph to find connected components and orders them into chains.
-    """
-    visited = set()
-    chains = []
-
-    sorted_keys = sorted(graph.keys())
+    return node_data, graph, turns
 
-    for start_key in sorted_keys:
-        if start_key in visited:
-            continue
 
-        # DFS to find component
-        component = []
-        stack = [start_key]
-        visited.add(start_key)
+def _find_chains_cached(
+    bm: BMesh, uv_layer, obj: bpy.types.Object | None
+) -> tuple[dict[UVKey, UVNodeData], list[UVChain]]:
+    fingerprint = fingerprint_selection(obj, uv_layer.name, uv_select=True) if obj else None
+    if fingerprint is not None:
+        cached = _chain_cache.get(obj.data, fingerprint)
+        if cached is not None:
+            return cached
 
-        while stack:
-            curr = stack.pop()
-            component.append(curr)
-            for neighbor in graph[curr]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
+    node_data, graph, turns = _build_uv_graph(bm, uv_layer)
+    result = node_data, _find_chains(graph, turns)
+    if fingerprint is not None:
+        _chain_cache.set(obj.data, fingerprint, result)
+    return result
 
-        if len(component) > 1:
-            ordered = _order_component(component, graph)
-            if ordered:
-                chains.append(ordered)
 
-    return chains
+def _find_chains(graph: AdjacencyGraph, turns: Turns) -> list[UVChain]:
+    """
+    Splits the selected edges into chains, each edge in exactly one, in linear time.
+    A chain continues through a vertex with two edges unless they turn around a selected
+    cell, and through a junction only along a pair of edges that are opposite to each
+    other; every other branch becomes a chain of its own.
+    """
 
+    def follow(prev: UVKey, key: UVKey) -> UVKey | None:
+        """The key after prev -> key, or None if the chain ends at key."""
+        ahead = [n for n in graph[key] if n != prev and (prev, key, n) not in turns]
+        if len(ahead) != 1:
+            return None
+        if len(graph[key]) > 2:
+            behind = [n for n in graph[key] if n != ahead[0] and (ahead[0], key, n) not in turns]
+            if behind != [prev]:
+                return None
+        return ahead[0]
+
+    visited: set[tuple[UVKey, UVKey]] = set()
+
+    def walk(start: UVKey, key: UVKey) -> list[UVKey]:
+        keys = [start]
+        prev = start
+        while True:
+            visited.add((prev, key))
+            visited.add((key, prev))
+            keys.append(key)
+            next_key = follow(prev, key)
+            if next_key is None or (key, next_key) in visited:
+                return keys
+            prev, key = key, next_key
 
-def _order_component(component: list[UVKey], graph: AdjacencyGraph) -> list[UVKey]:
+    chains = []
+    # Open chains start at keys the chain cannot be followed back through
+    for key, neighbors in graph.items():
+        for neighbor in neighbors:
+            if (key, neighbor) not in visited and follow(neighbor, key) is None:
+                chains.append(walk(key, neighbor))
+    # The remaining edges form loops without ends
+    for key, neighbors in graph.items():
+        for neighbor in neighbors:
+            if (key, neighbor) not in visited:
+                chains.append(walk(key, neighbor))
+
+    return [
+        UVChain(keys[:-1], True) if len(keys) > 3 and keys[0] == keys[-1] else UVChain(keys, False)
+        for keys in chains
+    ]
+
+
+def _chain_axis(chain: list[UVKey], node_data: dict[UVKey, UVNodeData]) -> int:
+    """0 if the chain runs along U, 1 if along V."""
+    direction = node_data[chain[-1]].uv - node_data[chain[0]].uv
+    return 0 if abs(direction.x) > abs(direction.y) else 1
+
+
+def _spacing(
+    keys: list[UVKey], node_data: dict[UVKey, UVNodeData], mode: str, closed=False
+) -> list[float]:
     """
-    Orders a set of connected keys into a linear chain.
+    Normalized positions (0.0 to 1.0) of the keys along the chain. A closed chain also
+    gets the position of its closing edge's end, 1.0.
     """
-    endpoints = [k for k in component if len(graph[k]) == 1]
+    count = len(keys) + closed - 1
 
-    start_node = endpoints[0] if endpoints else min(component)
+    # to access 3D coordinate
+    def get_co(the_key):
+        return node_data[the_key].co
+
+    dists = [0.0]
+    total_dist = 0.0
 
-    ordered = [start_node]
-    visited_in_chain = {start_node}
-    curr = start_node
+    if mode == "GEOMETRY":
+        for i in range(count):
+            d = (get_co(keys[(i + 1) % len(keys)]) - get_co(keys[i])).length
+            total_dist += d
+            dists.append(total_dist)
 
-    # Traverse
-    for _ in range(len(component) - 1):
-        neighbors = sorted(list(graph[curr]))
-        next_node = None
-        for n in neighbors:
-            if n not in visited_in_chain:
-                next_node = n
-                break
+        if total_dist <= 0:
+            mode = "EVEN"
 
-        if next_node:
-            ordered.append(next_node)
-            visited_in_chain.add(next_node)
-            curr = next_node
-        else:
-            break
+    if mode == "EVEN":
+        dists = [float(i) for i in range(count + 1)]
+        total_dist = float(count)
 
-    return ordered
+    if total_dist > 0:
+        return [d / total_dist for d in dists]
+    return [0.0] * (count + 1)
 
 
 def _calculate_straight_chain(
@@ -169,31 +279,8 @@ def _calculate_straight_chain(
     if direction.length < 1e-7:
         return {}
 
-    # to access 3D coordinate
-    def get_co(the_key):
-        return node_data[the_key].loops[0].vert.co
-
-    dists = [0.0]
-    total_dist = 0.0
-
-    if mode == "GEOMETRY":
-        for i in range(len(chain) - 1):
-            d = (get_co(chain[i + 1]) - get_co(chain[i])).length
-            total_dist += d
-            dists.append(total_dist)
-
-        if total_dist <= 0:
-            mode = "EVEN"
-
-    if mode == "EVEN":
-        dists = [float(i) for i in range(len(chain))]
-        total_dist = float(len(chain) - 1)
-
     # Normalize distances (t values 0.0 to 1.0)
-    if total_dist > 0:
-        t_values = [d / total_dist for d in dists]
-    else:
-        t_values = [0.0] * len(chain)
+    t_values = _spacing(chain, node_data, mode)
 
     final_direction = direction
     if keep_length:
@@ -217,11 +304,205 @@ def _calculate_straight_chain(
     return new_positions
 
 
-def _apply_updates(uv_layer, node_data: dict[UVKey, UVNodeData], updates: dict[UVKey, Vector]):
+def _calculate_loop(
+    loop: list[UVKey],
+    node_data: dict[UVKey, UVNodeData],
+    mode: str,
+    keep_length: bool,
+    shape: str,
+) -> dict[UVKey, Vector]:
+    """
+    Calculates new UV coordinates for a closed loop, keeping its center and winding.
+    """
+    n = len(loop)
+    if n < 3:
+        return {}
+
+    uvs = [node_data[k].uv for k in loop]
+    perimeter = sum((uvs[(i + 1) % n] - uvs[i]).length for i in range(n))
+    if perimeter <= 0:
+        return {}
+
+    t_values = _spacing(loop, node_data, mode, closed=True)
+    # Shoelace sign: counter-clockwise loops stay counter-clockwise
+    area = sum(uvs[i].x * uvs[(i + 1) % n].y - uvs[(i + 1) % n].x * uvs[i].y for i in range(n))
+    winding = 1.0 if area >= 0 else -1.0
+
+    if shape == "RECTANGLE" and n >= 4:
+        positions = _fit_rectangle(uvs, t_values, winding, perimeter if keep_length else None)
+        return dict(zip(loop, positions, strict=True)) if positions else {}
+
+    center = sum(uvs, Vector((0, 0))) / n
+    if keep_length:
+        radius = perimeter / (2 * math.pi)
+    else:
+        radius = sum((uv - center).length for uv in uvs) / n
+    start = uvs[0] - center
+    start_angle = math.atan2(start.y, start.x)
+
+    new_positions = {}
+    for key, t in zip(loop, t_values, strict=False):
+        angle = start_angle + winding * 2 * math.pi * t
+        new_positions[key] = center + Vector((math.cos(angle), math.sin(angle))) * radius
+    return new_positions
+
+
+def _fit_rectangle(
+    uvs: list[Vector], t_values: list[float], winding: float, perimeter: float | None
+) -> list[Vector] | None:
+    """
+    Puts the loop on its axis-aligned bounding rectangle, scaled around its center to the
+    given perimeter if any. The vertices closest to the corners become the corners.
+    """
+    n = len(uvs)
+    lo = Vector((min(uv.x for uv in uvs), min(uv.y for uv in uvs)))
+    hi = Vector((max(uv.x for uv in uvs), max(uv.y for uv in uvs)))
+    corners = [lo.copy(), Vector((hi.x, lo.y)), hi.copy(), Vector((lo.x, hi.y))]
+    if winding < 0:
+        corners.reverse()
+
+    first = min(range(n), key=lambda i: (uvs[i] - corners[0]).length_squared)
+    offsets = [
+        (min(range(n), key=lambda i, c=c: (uvs[i] - c).length_squared) - first) % n for c in corners
+    ]
+
+    # Position along the loop, continued past its end
+    def t_at(offset: int) -> float:
+        i = first + offset
+        return t_values[i] if i <= n else 1.0 + t_values[i - n]
+
+    if not offsets[0] < offsets[1] < offsets[2] < offsets[3]:
+        # The corners are not in loop order: cut the loop into quarters instead
+        offsets = [0]
+        for side in range(1, 4):
+            offset = offsets[-1] + 1
+            while offset < n - 4 + side and t_at(offset) - t_at(0) < side / 4:
+                offset += 1
+            offsets.append(offset)
+    offsets.append(n)
+
+    size = hi - lo
+    if perimeter is not None and size.x + size.y > 0:
+        center = (lo + hi) / 2
+        scale = perimeter / (2 * (size.x + size.y))
+        corners = [center + (c - center) * scale for c in corners]
+
+    positions: list[Vector | None] = [None] * n
+    for side in range(4):
+        a, b = offsets[side], offsets[side + 1]
+        span = t_at(b) - t_at(a)
+        for offset in range(a, b):
+            frac = (t_at(offset) - t_at(a)) / span if span > 0 else (offset - a) / (b - a)
+            positions[(first + offset) % n] = corners[side].lerp(corners[(side + 1) % 4], frac)
+    return positions
+
+
+def _join_chains(chains: list[StraightChain]) -> dict[UVKey, Vector]:
+    """
+    Merges chains straightened on their own into one layout where they share keys.
+    Chains along the same axis that touch share one line. Where a line is crossed by
+    chains along the other axis (the rings of a grid, a branch), it is placed where
+    those chains put the crossing keys; a shared key then sits where its lines cross,
+    and the other keys of a chain are re-spaced between its shared ones.
+    """
+    chains_at: dict[UVKey, list[int]] = {}
+    for c_idx, chain in enumerate(chains):
+        for key in chain.keys:
+            chains_at.setdefault(key, []).append(c_idx)
+    shared = {key: idxs for key, idxs in chains_at.items() if len(idxs) > 1}
+
+    # Group chains along the same axis that share keys into lines
+    parent = list(range(len(chains)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for idxs in shared.values():
+        for axis in (0, 1):
+            along = [i for i in idxs if chains[i].axis == axis]
+            for i in along[1:]:
+                parent[find(i)] = find(along[0])
+
+    # Line coordinate of each group: from crossing chains where there are any
+    own_sums: dict[int, list[float]] = {}
+    cross_sums: dict[int, list[float]] = {}
+    for c_idx, chain in enumerate(chains):
+        across = 1 - chain.axis
+        sums = own_sums.setdefault(find(c_idx), [0.0, 0])
+        sums[0] += chain.positions[chain.keys[0]][across] * len(chain.keys)
+        sums[1] += len(chain.keys)
+    for key, idxs in shared.items():
+        for i in idxs:
+            across = 1 - chains[i].axis
+            for j in idxs:
+                if chains[j].axis != chains[i].axis:
+                    sums = cross_sums.setdefault(find(i), [0.0, 0])
+                    sums[0] += chains[j].positions[key][across]
+                    sums[1] += 1
+    lines = {group: s / count for group, (s, count) in own_sums.items()}
+    lines.update({group: s / count for group, (s, count) in cross_sums.items()})
+
+    pinned: dict[UVKey, Vector] = {}
+    for key, idxs in shared.items():
+        uv = Vector((0, 0))
+        for coord in (0, 1):
+            fixed = [i for i in idxs if chains[i].axis != coord]
+            if fixed:
+                uv[coord] = lines[find(fixed[0])]
+            else:
+                uv[coord] = sum(chains[i].positions[key][coord] for i in idxs) / len(idxs)
+        pinned[key] = uv
+
+    updates: dict[UVKey, Vector] = {}
+    for c_idx, chain in enumerate(chains):
+        axis = chain.axis
+        line = lines[find(c_idx)]
+        old = [chain.positions[key][axis] for key in chain.keys]
+        anchors = [(i, pinned[key][axis]) for i, key in enumerate(chain.keys) if key in pinned]
+        for key, value in zip(chain.keys, _respace(old, anchors), strict=True):
+            uv = Vector((0, 0))
+            uv[axis] = value
+            uv[1 - axis] = line
+            updates[key] = uv
+    updates.update(pinned)
+    return updates
+
+
+def _respace(values: list[float], anchors: list[tuple[int, float]]) -> list[float]:
+    """
+    Moves values[i] to the new value of each anchor (i, new value) and maps the values
+    between two anchors linearly; values beyond the outer anchors are shifted with them.
+    """
+    if not anchors:
+        return values
+
+    result = list(values)
+    first, first_value = anchors[0]
+    for i in range(first):
+        result[i] = values[i] + first_value - values[first]
+    last, last_value = anchors[-1]
+    for i in range(last, len(values)):
+        result[i] = values[i] + last_value - values[last]
+
+    for (a, a_value), (b, b_value) in pairwise(anchors):
+        span = values[b] - values[a]
+        for i in range(a, b + 1):
+            t = (values[i] - values[a]) / span if abs(span) > 1e-12 else (i - a) / (b - a)
+            result[i] = a_value + (b_value - a_value) * t
+    return result
+
+
+def _apply_updates(
+    bm: BMesh, uv_layer, node_data: dict[UVKey, UVNodeData], updates: dict[UVKey, Vector]
+):
     """
     Applies the calculated UV updates to the BMesh loops.
     """
+    bm.faces.ensure_lookup_table()
     for key, new_uv in updates.items():
         if key in node_data:
-            for loop in node_data[key].loops:
-                loop[uv_layer].uv = new_uv
+            for face_index, corner in node_data[key].corners:
+                bm.faces[face_index].loops[corner][uv_layer].uv = new_uv
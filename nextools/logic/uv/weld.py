@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import NamedTuple
+
+import bpy
+from ... import rust_bridge
+from ..mesh_buffers import (
+    mesh_data,
+    read_face_selection,
+    read_mesh_buffers_to_edit,
+    write_uv_coords,
+)
+
+
+class WeldResult(NamedTuple):
+    welded_loops: int
+    islands_before: int
+    islands_after: int
+
+    @property
+    def merged_islands(self) -> int:
+        return self.islands_before - self.islands_after
+
+
+def weld_uvs(
+    obj: bpy.types.Object,
+    tolerance: float = 1e-3,
+    selected_only: bool = False,
+    dry_run: bool = False,
+) -> WeldResult:
+    """
+    Merges the UVs of each mesh vertex that lie within tolerance of each other
+    to their mean, in the active UV layer.
+
+    Args:
+        obj: The target object (must be of type MESH).
+        tolerance: Maximum distance per axis between UVs to merge, in UV units.
+        selected_only: Only weld the loops of selected faces.
+        dry_run: Only report what a weld would do, keep the UVs.
+
+    Raises:
+        ValueError: If the provided object or the tolerance is invalid.
+        RuntimeError: If the calculation or data writing fails.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Target object must be a MESH.")
+    if not tolerance > 0.0:
+        raise ValueError("Tolerance must be positive.")
+
+    if not obj.data.uv_layers.active:
+        raise ValueError("Active UV layer is required.")
+
+    # The UVs are read and written in one mesh_data() block, so Edit Mode is flushed once
+    with mesh_data(obj) as data:
+        # The UVs are welded in place and written back
+        buffers = read_mesh_buffers_to_edit(data)
+        face_select = read_face_selection(data) if selected_only else None
+
+        try:
+            result = WeldResult(
+                *rust_bridge.weld_uvs(
+                    buffers.poly_loop_starts,
+                    buffers.poly_loop_totals,
+                    buffers.loop_vert_indices,
+                    buffers.uv_coords,
+                    tolerance,
+                    face_select,
+                    dry_run,
+                )
+            )
+        except Exception as e:
+            raise RuntimeError(f"Rust core calculation failed: {e}")
+
+        if dry_run or result.welded_loops == 0:
+            return result
+
+        try:
+            write_uv_coords(obj, buffers.uv_coords)
+        except Exception as e:
+            raise RuntimeError(f"Failed to write UVs: {e}")
+
+    return result
+
+    try:
+        write_uv_coords(obj, buffers.uv_coords)
+    except Exception as e:
+        raise RuntimeError(f"Failed to write UVs: {e}")
+
+    return result
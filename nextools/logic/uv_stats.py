@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+import time
+from array import array
+from typing import NamedTuple
+
+import bpy
+from .. import handlers, rust_bridge
+from .mesh_buffers import (
+    MeshBuffers,
+    fingerprint_buffers,
+    int_buffer,
+    mesh_data,
+    read_mesh_buffers,
+)
+
+# At most one recomputation per interval, however often the mesh changes
+THROTTLE_SECONDS = 0.5
+# How often a running computation is checked for its result
+POLL_SECONDS = 0.1
+# Side of the raster coverage and overlap are sampled on
+RASTER_SIZE = 512
+
+
+class UVStats(NamedTuple):
+    """Summary of a UV map, tagged with the fingerprint of its input."""
+
+    fingerprint: str
+    num_faces: int
+    num_islands: int
+    num_colors: int
+    num_seams: int
+    # Fraction of the 0-1 tile covered by faces
+    coverage: float
+    # Fraction of the covered area where islands overlap
+    overlap: float
+
+
+# The panel only reads _results. Edits of the active mesh bump its edit count and a
+# throttled timer checks it on the main thread. Only if the cheap key (edit count,
+# element counts, UV layer) changed are the buffers snapshotted; if their fingerprint
+# differs from the cached one, the stats are computed on a worker thread (the Rust core
+# releases the GIL) and the UV editors are redrawn when they are ready.
+_lock = threading.Lock()
+# Keyed by Mesh.session_uid and guarded by _lock; _cheap_keys holds the cheap key
+# the result in _results was computed for
+_results: dict[int, UVStats] = {}
+_cheap_keys: dict[int, tuple] = {}
+# The last failure per mesh with the cheap key it happened at, shown in the panel;
+# the mesh is not retried until that key changes
+_errors: dict[int, tuple[tuple, str]] = {}
+
+# Main thread only
+_edit_counts: dict[int, int] = {}
+_pending_object: str | None = None
+_worker: threading.Thread | None = None
+_last_run = 0.0
+
+
+def compute_uv_stats(
+    buffers: MeshBuffers, loop_edge_indices: array, num_edges: int, fingerprint: str
+) -> UVStats:
+    """
+    Computes the stats of the buffers synchronously.
+    """
+    num_islands, num_colors, num_seams, coverage, overlap = rust_bridge.compute_uv_stats(
+        buffers.poly_loop_starts,
+        buffers.poly_loop_totals,
+        buffers.loop_vert_indices,
+        loop_edge_indices,
+        buffers.uv_coords,
+        num_edges,
+        RASTER_SIZE,
+    )
+    return UVStats(
+        fingerprint, buffers.num_faces, num_islands, num_colors, num_seams, coverage, overlap
+    )
+
+
+def get_stats(mesh: bpy.types.Mesh) -> UVStats | None:
+    """
+    Returns the last stats computed for the mesh, which may be outdated, or None.
+    Only reads the cache, so it is safe to call from draw().
+    """
+    with _lock:
+        return _results.get(mesh.session_uid)
+
+
+def get_error(mesh: bpy.types.Mesh) -> str | None:
+    """
+    Returns the message of the last failed computation for the mesh, or None.
+    Only reads the cache, so it is safe to call from draw().
+    """
+    with _lock:
+        error = _errors.get(mesh.session_uid)
+    return error[1] if error else None
+
+
+def is_outdated(mesh: bpy.types.Mesh) -> bool:
+    """True while the mesh changed since its stats were computed, or has none yet."""
+    key = mesh.session_uid
+    with _lock:
+        return key not in _results or _cheap_keys.get(key) != _cheap_key(mesh)
+
+
+def _cheap_key(mesh: bpy.types.Mesh) -> tuple:
+    """
+    Changes with every edit of the mesh and with its active UV layer, without reading
+    any buffer. In Edit Mode the element counts are those of the last sync.
+    """
+    uv_layer = mesh.uv_layers.active
+    return (
+        _edit_counts.get(mesh.session_uid, 0),
+        len(mesh.vertices),
+        len(mesh.edges),
+        len(mesh.loops),
+        len(mesh.polygons),
+        uv_layer.name if uv_layer else None,
+    )
+
+
+def request(obj: bpy.types.Object) -> None:
+    """
+    Schedules a recomputation for obj if its stats are missing or outdated.
+    Cheap enough for draw(): the work happens in the timer and on the worker thread.
+    """
+    if not obj or obj.type != "MESH" or not obj.data.uv_layers.active:
+        return
+    # A running computation redraws the panel when done, which requests again if needed
+    if _worker is None and _pending_object != obj.name and is_outdated(obj.data):
+        with _lock:
+            error = _errors.get(obj.data.session_uid)
+        if error is None or error[0] != _cheap_key(obj.data):
+            _schedule(obj)
+
+
+def submit(obj: bpy.types.Object) -> threading.Thread | None:
+    """
+    Snapshots the mesh buffers of obj and computes its stats on a worker thread,
+    unless the mesh was not edited since the cached stats or they were computed from
+    the same buffers.
+
+    Returns:
+        The started worker thread, or None if nothing was started.
+    """
+    global _last_run
+    if not obj or obj.type != "MESH" or not obj.data.uv_layers.active:
+        return None
+
+    mesh = obj.data
+    key = mesh.session_uid
+    _last_run = time.monotonic()
+    if not is_outdated(mesh):
+        return None
+
+    if obj.mode == "EDIT":
+        handlers.ignore_next_update(mesh)
+    # Copied buffers: the worker thread outlives the mesh_data() block
+    with mesh_data(obj) as data:
+        buffers = read_mesh_buffers(data)
+        loop_edge_indices = int_buffer(buffers.num_loops)
+        data.loops.foreach_get("edge_index", loop_edge_indices)
+        num_edges = len(data.edges)
+    fingerprint = fingerprint_buffers(buffers)
+    cheap_key = _cheap_key(mesh)
+
+    with _lock:
+        cached = _results.get(key)
+        if cached is not None and cached.fingerprint == fingerprint:
+            _cheap_keys[key] = cheap_key
+            _errors.pop(key, None)
+            return None
+
+    def run():
+        try:
+            stats = compute_uv_stats(buffers, loop_edge_indices, num_edges, fingerprint)
+        except Exception as e:
+            with _lock:
+                _errors[key] = (cheap_key, f"UV stats failed: {e}")
+            return
+        with _lock:
+            _results[key] = stats
+            _cheap_keys[key] = cheap_key
+            _errors.pop(key, None)
+
+    thread = threading.Thread(target=run, name="NexTools-UVStats", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear() -> None:
+    """
+    Drops all cached stats. A running computation still stores its result.
+    """
+    global _pending_object
+    _pending_object = None
+    _edit_counts.clear()
+    with _lock:
+        _results.clear()
+        _cheap_keys.clear()
+        _errors.clear()
+
+
+def _tag_redraw() -> None:
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "IMAGE_EDITOR":
+                area.tag_redraw()
+
+
+def _on_timer():
+    global _pending_object, _worker
+    if _worker is not None:
+        if _worker.is_alive():
+            return POLL_SECONDS
+        _worker = None
+        _tag_redraw()
+
+    if _pending_object is None:
+        return None
+    remaining = _last_run + THROTTLE_SECONDS - time.monotonic()
+    if remaining > 0:
+        return remaining
+
+    obj = bpy.data.objects.get(_pending_object)
+    _pending_object = None
+    try:
+        _worker = submit(obj)
+    except Exception as e:
+        with _lock:
+            _errors[obj.data.session_uid] = (_cheap_key(obj.data), f"UV stats failed: {e}")
+    if _worker is None:
+        # Unchanged input: only the outdated hint goes away
+        _tag_redraw()
+        return None
+    return POLL_SECONDS
+
+
+def _schedule(obj: bpy.types.Object) -> None:
+    global _pending_object
+    _pending_object = obj.name
+    if not bpy.app.timers.is_registered(_on_timer):
+        first_interval = max(0.0, _last_run + THROTTLE_SECONDS - time.monotonic())
+        bpy.app.timers.register(_on_timer, first_interval=first_interval)
+
+
+def on_mesh_edit(mesh_keys: set[int]) -> None:
+    """
+    Called by the add-on's depsgraph handler with the session UIDs of edited meshes
+    while the feature is enabled.
+    """
+    for key in mesh_keys:
+        _edit_counts[key] = _edit_counts.get(key, 0) + 1
+    obj = bpy.context.view_layer.objects.active
+    if obj is not None and obj.type == "MESH" and obj.data.session_uid in mesh_keys:
+        _schedule(obj)
+
+
+def on_setting_update(settings, context) -> None:
+    """
+    Update callback of the show_uv_stats setting: frees the cache when disabled.
+    """
+    if not settings.show_uv_stats:
+        clear()
+
+
+def unregister() -> None:
+    """
+    Stops the timer and frees the results; the handlers belong to nextools.handlers.
+    """
+    if bpy.app.timers.is_registered(_on_timer):
+        bpy.app.timers.unregister(_on_timer)
+    clear()
@@ -1,9 +1,203 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from array import array
+
 def bake_color_id_all(
     num_faces: int,
-    poly_loop_starts: list[int],
-    poly_loop_totals: list[int],
-    loop_vert_indices: list[int],
-    uv_coords: list[float],
-) -> list[float]: ...
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    out_colors: array,
+) -> None: ...
+def bake_color_id_layers(
+    num_faces: int,
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_layers: list[array],
+    out_colors: list[array],
+) -> None: ...
+def bake_color_id_region(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    face_select: array,
+    out_colors: array,
+) -> list[int]: ...
+def compute_island_coloring(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    out_face_islands: array,
+    out_face_colors: array,
+) -> int: ...
+def compute_texel_density(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    out_island_stats: array,
+) -> None: ...
+def compute_uv_distortion(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    out_face_area: array,
+    out_face_angle: array,
+    out_island_stats: array,
+) -> None: ...
+def detect_uv_overlaps(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    out_face_groups: array,
+    out_island_groups: array,
+    out_colors: array | None = None,
+) -> int: ...
+def fill_face_colors(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    face_colors: array,
+    out_colors: array,
+) -> None: ...
+def fill_heatmap_colors(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    face_values: array,
+    out_colors: array,
+) -> None: ...
+def fingerprint_mesh(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+) -> int: ...
+def generate_mesh(
+    kind: str,
+    res_u: int,
+    res_v: int,
+    seam_density: float = 0.0,
+    seed: int = 0,
+) -> tuple[list[float], list[int], list[int], list[int], list[float], int]: ...
+def normalize_texel_density(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    island_mask: array,
+    target: float,
+) -> None: ...
+def pack_uv_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    num_islands: int,
+    margin: float = 0.005,
+    target_fill: float = 0.8,
+    rotate: bool = True,
+) -> float: ...
+def rasterize_color_id(
+    width: int,
+    height: int,
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_colors: array,
+    padding: int,
+    out_pixels: array,
+) -> None: ...
+def relax_uvs(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_select: array,
+    loop_pins: array,
+    method: str = "LAPLACIAN",
+    iterations: int = 100,
+    strength: float = 0.5,
+) -> int: ...
+def weld_uvs(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    tolerance: float,
+    face_select: array | None = None,
+    dry_run: bool = False,
+) -> tuple[int, int, int]: ...
+def find_duplicate_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    face_islands: array,
+    tolerance: float,
+    out_island_groups: array,
+) -> int: ...
+def stack_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    island_groups: array,
+) -> None: ...
+def align_uv_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    island_mask: array,
+    method: str = "PCA",
+    snap: bool = True,
+) -> int: ...
+def seams_from_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    uv_coords: array,
+    out_seams: array,
+    face_islands: array | None = None,
+    keep_existing: bool = False,
+) -> tuple[int, tuple[list[int], list[int], list[int], list[bool]] | None]: ...
+def analyze_mesh_file(
+    path: str,
+) -> tuple[int, int, int, int, int, bytes, bytes, bytes, bytes, bytes]: ...
+def compute_uv_stats(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    uv_coords: array,
+    num_edges: int,
+    raster_size: int = 512,
+) -> tuple[int, int, int, float, float]: ...
+def select_uv_overlaps(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    face_groups: array,
+    out_face_select: array,
+    out_vert_select: array,
+    out_edge_select: array,
+) -> int: ...
+def selected_island_mask(
+    face_islands: array,
+    face_select: array,
+    island_mask: array,
+) -> int: ...
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_align_islands(bpy.types.Operator):
+    """Rotate the UV islands of the selected objects onto the U and V axes"""
+
+    bl_idname = "uv.nextools_align_islands"
+    bl_label = "Align Islands"
+    bl_options = {"REGISTER", "UNDO"}
+
+    method: bpy.props.EnumProperty(
+        name="Method",
+        description="How the main axis of an island is found",
+        items=[
+            ("PCA", "Principal Axis", "Principal axis of the island's UVs"),
+            (
+                "BOUNDING_BOX",
+                "Bounding Box",
+                "Long side of the smallest rectangle around the island",
+            ),
+        ],
+        default="PCA",
+    )
+    snap: bpy.props.BoolProperty(
+        name="Snap 90",
+        description="Turn each island by at most 45 degrees, onto the nearer of U and V",
+        default=True,
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only align islands with a selected face",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(
+            obj.type == "MESH" and obj.data.uv_layers.active for obj in context.selected_objects
+        )
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import align as logic_align
+
+        objects = [
+            obj
+            for obj in context.selected_objects
+            if obj.type == "MESH" and obj.data.uv_layers.active
+        ]
+
+        try:
+            result = logic_align.align_uv_islands(
+                objects, method=self.method, snap=self.snap, selected_only=self.selected_only
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Aligned {result.num_rotated} of {result.num_islands} islands.")
+        return {"FINISHED"}
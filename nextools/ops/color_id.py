@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import bpy
-from ..logic import color_id as logic_color_id
 from ..utils.profiler import profile_execution
 
 
@@ -17,22 +16,61 @@ class UV_OT_nextools_bake_color_id(bpy.types.Operator):
         description="Automatically switch 3D viewport to show Color ID attribute",
         default=True,
     )
+    all_uv_layers: bpy.props.BoolProperty(
+        name="All UV Layers",
+        description="Bake a Color_ID_<uvname> attribute for every UV layer in one pass",
+        default=False,
+    )
+    selection_only: bpy.props.BoolProperty(
+        name="Selection Only",
+        description=(
+            "Bake only the selected faces and keep the rest of the Color ID layer "
+            "(not with All UV Layers)"
+        ),
+        default=False,
+    )
+    force: bpy.props.BoolProperty(
+        name="Force",
+        description="Bake even if the topology and UVs are unchanged since the last bake",
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context):
         obj = context.active_object
         return obj and obj.type == "MESH" and obj.data.uv_layers.active
 
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "auto_switch_view")
+        layout.prop(self, "all_uv_layers")
+        # Selection Only and Force only apply to the bake of the active UV layer
+        row = layout.row()
+        row.enabled = not self.all_uv_layers
+        row.prop(self, "selection_only")
+        row = layout.row()
+        row.enabled = not (self.all_uv_layers or self.selection_only)
+        row.prop(self, "force")
+
     @profile_execution
     def execute(self, context):
-        obj = context.active_object
-        original_mode = obj.mode
+        # Deferred: keeps add-on registration free of the Rust core and logic imports
+        from ..logic import color_id as logic_color_id
 
-        if original_mode != "OBJECT":
-            bpy.ops.object.mode_set(mode="OBJECT")
+        obj = context.active_object
 
         try:
-            processed_count = logic_color_id.apply_color_id_to_mesh(obj)
+            if self.all_uv_layers:
+                if self.selection_only:
+                    self.report({"WARNING"}, "Selection Only is ignored with All UV Layers.")
+                processed_count = logic_color_id.apply_color_id_to_layers(obj)
+            elif self.selection_only:
+                processed_count = logic_color_id.apply_color_id_to_selection(obj)
+            else:
+                processed_count = logic_color_id.apply_color_id_to_mesh(obj, force=self.force)
+                if processed_count == 0 and obj.data.polygons:
+                    self.report({"INFO"}, "Color ID is up to date.")
+                    return {"CANCELLED"}
 
             if self.auto_switch_view:
                 self._switch_viewport_shading(context)
@@ -48,15 +86,6 @@ class UV_OT_nextools_bake_color_id(bpy.types.Operator):
             self.report({"ERROR"}, str(e))
             return {"CANCELLED"}
 
-        finally:
-            if original_mode != "OBJECT" and obj:
-                try:
-                    bpy.ops.object.mode_set(mode=original_mode)
-                except RuntimeError as ex:
-                    self.report({"DEBUG"}, f"Mode restore blocked by context: {ex}")
-                except Exception as ex:
-                    self.report({"DEBUG"}, f"Unexpected error during mode restore: {ex}")
-
     @staticmethod
     def _switch_viewport_shading(context):
         if not context.screen:
@@ -69,3 +98,60 @@ class UV_OT_nextools_bake_color_id(bpy.types.Operator):
                         shading.type = "SOLID"
                         shading.color_type = "VERTEX"
                         area.tag_redraw()
+
+
+class UV_OT_nextools_bake_color_id_image(bpy.types.Operator):
+    """Bake the Color ID Map of the active UV layer into an image texture"""
+
+    bl_idname = "uv.nextools_bake_color_id_image"
+    bl_label = "Bake Color ID Image"
+    bl_options = {"REGISTER", "UNDO"}
+
+    size: bpy.props.EnumProperty(
+        name="Size",
+        items=[
+            ("1024", "1K", "1024 x 1024"),
+            ("2048", "2K", "2048 x 2048"),
+            ("4096", "4K", "4096 x 4096"),
+            ("8192", "8K", "8192 x 8192"),
+        ],
+        default="4096",
+    )
+    padding: bpy.props.IntProperty(
+        name="Padding",
+        description="Pixels to grow the islands by, to avoid background bleeding",
+        default=4,
+        min=0,
+        max=64,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import color_id as logic_color_id
+
+        obj = context.active_object
+
+        try:
+            image = logic_color_id.bake_color_id_image(
+                obj, size=int(self.size), padding=self.padding
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self._show_in_uv_editor(context, image)
+        self.report({"INFO"}, f"Color ID Image Baked: {image.name} ({self.size} px).")
+        return {"FINISHED"}
+
+    @staticmethod
+    def _show_in_uv_editor(context, image):
+        if context.space_data and context.space_data.type == "IMAGE_EDITOR":
+            context.space_data.image = image
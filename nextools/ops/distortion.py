@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_bake_stretch(bpy.types.Operator):
+    """Bake a UV stretch heatmap (area or angle distortion) into a color attribute"""
+
+    bl_idname = "uv.nextools_bake_stretch"
+    bl_label = "Bake UV Stretch"
+    bl_options = {"REGISTER", "UNDO"}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ("AREA", "Area", "Area distortion relative to the island's scale"),
+            ("ANGLE", "Angle", "Angle (shape) distortion"),
+        ],
+        default="AREA",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import distortion as logic_distortion
+
+        obj = context.active_object
+
+        try:
+            result = logic_distortion.bake_uv_distortion(obj, mode=self.mode)
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        worst = result.worst_island(self.mode)
+        if worst is None:
+            self.report({"INFO"}, "UV Stretch Baked: no faces.")
+        else:
+            worst_mean = worst.mean_area if self.mode == "AREA" else worst.mean_angle
+            self.report(
+                {"INFO"},
+                f"UV Stretch Baked: mean {result.mean(self.mode):.3f}, "
+                f"worst island {worst.island} ({worst_mean:.3f}).",
+            )
+        return {"FINISHED"}
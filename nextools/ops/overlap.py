@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_find_overlaps(bpy.types.Operator):
+    """Find overlapping UV faces and select them or bake them into a color attribute"""
+
+    bl_idname = "uv.nextools_find_overlaps"
+    bl_label = "Find UV Overlaps"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ("SELECT", "Select", "Select the overlapping faces"),
+            ("BAKE", "Bake", "Bake overlap groups into the UV_Overlap color attribute"),
+        ],
+        default="SELECT",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import overlap as logic_overlap
+
+        obj = context.active_object
+
+        try:
+            if self.action == "BAKE":
+                result = logic_overlap.bake_uv_overlaps(obj)
+            else:
+                result = logic_overlap.select_uv_overlaps(obj)
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if result.num_groups == 0:
+            self.report({"INFO"}, "No UV overlaps found.")
+        else:
+            self.report(
+                {"INFO"},
+                f"UV Overlaps: {result.num_faces} faces in {result.num_groups} groups.",
+            )
+        return {"FINISHED"}
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_pack_islands(bpy.types.Operator):
+    """Pack all UV islands into the unit square using all CPU cores"""
+
+    bl_idname = "uv.nextools_pack_islands"
+    bl_label = "Pack Islands"
+    bl_options = {"REGISTER", "UNDO"}
+
+    margin: bpy.props.FloatProperty(
+        name="Margin",
+        description="Gap between islands in UV units",
+        default=0.005,
+        min=0.0,
+        max=0.1,
+        precision=4,
+    )
+    target_fill: bpy.props.FloatProperty(
+        name="Target Fill",
+        description="Expected packing density, sizes the candidate layouts",
+        default=0.8,
+        min=0.1,
+        max=1.0,
+        subtype="FACTOR",
+    )
+    rotate: bpy.props.BoolProperty(
+        name="Rotate",
+        description="Allow rotating islands by 90 degrees",
+        default=True,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import pack as logic_pack
+
+        obj = context.active_object
+
+        try:
+            result = logic_pack.pack_uv_islands(
+                obj, margin=self.margin, target_fill=self.target_fill, rotate=self.rotate
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self.report(
+            {"INFO"}, f"Packed {result.num_islands} islands, {result.fill * 100:.1f}% filled."
+        )
+        return {"FINISHED"}
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_seams_from_islands(bpy.types.Operator):
+    """Mark the edges between UV islands as seams"""
+
+    bl_idname = "uv.nextools_seams_from_islands"
+    bl_label = "Seams from Islands"
+    bl_options = {"REGISTER", "UNDO"}
+
+    clear_existing: bpy.props.BoolProperty(
+        name="Clear Existing",
+        description="Clear seams on edges whose UVs are continuous",
+        default=True,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import seams as logic_seams
+
+        obj = context.active_object
+
+        try:
+            result = logic_seams.mark_seams_from_islands(obj, clear_existing=self.clear_existing)
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self.report({"INFO"}, f"Marked {result.num_seams} seams.")
+        return {"FINISHED"}
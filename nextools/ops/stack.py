@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_stack_duplicates(bpy.types.Operator):
+    """Stack UV islands with identical geometry onto each other"""
+
+    bl_idname = "uv.nextools_stack_duplicates"
+    bl_label = "Stack Duplicates"
+    bl_options = {"REGISTER", "UNDO"}
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest difference of a 3D edge length between duplicates",
+        default=1e-4,
+        min=0.0,
+        max=0.1,
+        precision=5,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == "MESH" and obj.data.uv_layers.active
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import stack as logic_stack
+
+        obj = context.active_object
+
+        try:
+            result = logic_stack.stack_duplicate_islands(obj, tolerance=self.tolerance)
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if result.num_groups == 0:
+            self.report({"INFO"}, "No duplicate islands found.")
+        else:
+            self.report(
+                {"INFO"},
+                f"Stacked {result.num_islands} islands in {result.num_groups} groups.",
+            )
+        return {"FINISHED"}
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+from ..utils.profiler import profile_execution
+
+
+class UV_OT_nextools_normalize_texel_density(bpy.types.Operator):
+    """Scale all UV islands of the selected objects to the same texel density"""
+
+    bl_idname = "uv.nextools_normalize_texel_density"
+    bl_label = "Normalize Texel Density"
+    bl_options = {"REGISTER", "UNDO"}
+
+    texture_size: bpy.props.EnumProperty(
+        name="Texture Size",
+        items=[
+            ("512", "512", "512 x 512"),
+            ("1024", "1K", "1024 x 1024"),
+            ("2048", "2K", "2048 x 2048"),
+            ("4096", "4K", "4096 x 4096"),
+            ("8192", "8K", "8192 x 8192"),
+        ],
+        default="1024",
+    )
+    use_custom_target: bpy.props.BoolProperty(
+        name="Custom Target",
+        description="Use the target density instead of the average of all islands",
+        default=False,
+    )
+    target: bpy.props.FloatProperty(
+        name="Target",
+        description="Texel density in pixels per unit",
+        default=512.0,
+        min=0.001,
+        soft_max=4096.0,
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only scale islands with a selected face",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(
+            obj.type == "MESH" and obj.data.uv_layers.active for obj in context.selected_objects
+        )
+
+    @profile_execution
+    def execute(self, context):
+        from ..logic import texel_density as logic_texel_density
+
+        objects = [
+            obj
+            for obj in context.selected_objects
+            if obj.type == "MESH" and obj.data.uv_layers.active
+        ]
+
+        try:
+            result = logic_texel_density.normalize_texel_density(
+                objects,
+                target=self.target if self.use_custom_target else None,
+                texture_size=int(self.texture_size),
+                selected_only=self.selected_only,
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        self.report(
+            {"INFO"},
+            f"Texel Density: {result.target:.1f} px/unit on {result.num_islands} islands, "
+            f"spread {result.before.spread:.2f}x -> {result.after.spread:.2f}x.",
+        )
+        return {"FINISHED"}
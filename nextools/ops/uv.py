@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import bmesh
 import bpy
-from nextools.logic.uv.rectify import align_uv_rectify
-from nextools.logic.uv.straight import align_uv_straight
+
+# bmesh and the UV logic modules are imported inside execute(),
+# so registering these operators does not load them.
 
 
 class NextoolsUVOperator:
@@ -16,6 +16,8 @@ class NextoolsUVOperator:
 
     @staticmethod
     def get_bmesh_and_uv(context):
+        import bmesh
+
         obj = context.active_object
         me = obj.data
         bm = bmesh.from_edit_mesh(me)
@@ -41,6 +43,9 @@ class UV_OT_nextools_lite_rectify(bpy.types.Operator, NextoolsUVOperator):
     )
 
     def execute(self, context):
+        import bmesh
+        from nextools.logic.uv.rectify import align_uv_rectify
+
         obj, me, bm, uv_layer_name = self.get_bmesh_and_uv(context)
         if not uv_layer_name:
             self.report({"ERROR"}, "No UV Map found")
@@ -73,7 +78,21 @@ class UV_OT_nextools_straight(bpy.types.Operator, NextoolsUVOperator):
     bl_label = "Straight"
     bl_options = {"REGISTER", "UNDO"}
 
+    loop_shape: bpy.props.EnumProperty(
+        name="Loop Shape",
+        description="Shape closed edge loops are fitted to",
+        items=[
+            ("RECTANGLE", "Rectangle", "Fit to the bounding rectangle of the loop"),
+            ("CIRCLE", "Circle", "Fit to a circle around the loop's center"),
+        ],
+        default="RECTANGLE",
+    )
+
     def execute(self, context):
+        import bmesh
+        from nextools.logic.uv.rectify import align_uv_rectify
+        from nextools.logic.uv.straight import align_uv_straight
+
         obj, me, bm, uv_layer_name = self.get_bmesh_and_uv(context)
         if not uv_layer_name:
             self.report({"ERROR"}, "No UV Map found")
@@ -87,10 +106,117 @@ class UV_OT_nextools_straight(bpy.types.Operator, NextoolsUVOperator):
                 self.report({"WARNING"}, "Rectify failed. Select connected Quad faces.")
                 return {"CANCELLED"}
         else:
-            success = align_uv_straight(bm, uv_layer_name)
+            success = align_uv_straight(bm, uv_layer_name, loop_shape=self.loop_shape, obj=obj)
             if not success:
                 self.report({"WARNING"}, "Straighten failed. Select UV edges.")
                 return {"CANCELLED"}
 
         bmesh.update_edit_mesh(me)
         return {"FINISHED"}
+
+
+class UV_OT_nextools_relax(bpy.types.Operator, NextoolsUVOperator):
+    """Relax: Smooth the UVs of the selected faces, keeping island borders and pins"""
+
+    bl_idname = "uv.nextools_relax"
+    bl_label = "Relax"
+    bl_options = {"REGISTER", "UNDO"}
+
+    method: bpy.props.EnumProperty(
+        name="Method",
+        description="How the relaxed position of a UV vertex is found",
+        items=[
+            ("LAPLACIAN", "Laplacian", "Move towards the mean of the neighboring UVs"),
+            ("ARAP", "As Rigid As Possible", "Move towards the 3D shape of the faces"),
+        ],
+        default="LAPLACIAN",
+    )
+    iterations: bpy.props.IntProperty(
+        name="Iterations",
+        description="Number of smoothing steps",
+        default=100,
+        min=1,
+        soft_max=1000,
+    )
+    strength: bpy.props.FloatProperty(
+        name="Strength",
+        description="Fraction of the way towards the relaxed position per step",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+        subtype="FACTOR",
+    )
+
+    def execute(self, context):
+        from nextools.logic.uv.relax import relax_uvs
+
+        try:
+            moved = relax_uvs(
+                context.active_object,
+                method=self.method,
+                iterations=self.iterations,
+                strength=self.strength,
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if moved == 0:
+            self.report({"WARNING"}, "Nothing to relax: all selected UVs are fixed.")
+            return {"CANCELLED"}
+        return {"FINISHED"}
+
+
+class UV_OT_nextools_weld(bpy.types.Operator, NextoolsUVOperator):
+    """Weld: Merge split UVs of the same vertex that lie within a tolerance"""
+
+    bl_idname = "uv.nextools_weld"
+    bl_label = "Weld"
+    bl_options = {"REGISTER", "UNDO"}
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Maximum distance between UVs to merge",
+        default=0.001,
+        min=1e-6,
+        soft_max=0.01,
+        precision=5,
+    )
+    selected_only: bpy.props.BoolProperty(
+        name="Selected Only",
+        description="Only weld the UVs of selected faces",
+        default=False,
+    )
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report how many islands would merge, keep the UVs",
+        default=False,
+    )
+
+    def execute(self, context):
+        from nextools.logic.uv.weld import weld_uvs
+
+        try:
+            result = weld_uvs(
+                context.active_object,
+                tolerance=self.tolerance,
+                selected_only=self.selected_only,
+                dry_run=self.dry_run,
+            )
+        except ValueError as e:
+            self.report({"WARNING"}, str(e))
+            return {"CANCELLED"}
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        verb = "Would merge" if self.dry_run else "Merged"
+        self.report(
+            {"INFO"},
+            f"{verb} {result.merged_islands} islands ({result.islands_before} -> "
+            f"{result.islands_after}), {result.welded_loops} UVs moved.",
+        )
+        return {"FINISHED"}
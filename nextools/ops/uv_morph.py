@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import bpy
-from nextools.logic import uv_morph as logic_uv_morph
 
 
 class UV_OT_nextools_uv_morph(bpy.types.Operator):
@@ -17,6 +16,8 @@ class UV_OT_nextools_uv_morph(bpy.types.Operator):
         return context.active_object is not None and context.active_object.type == "MESH"
 
     def execute(self, context):
+        from nextools.logic import uv_morph as logic_uv_morph
+
         obj = context.active_object
         mod_name = logic_uv_morph.MOD_NAME
 
@@ -1,19 +1,517 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-try:
-    from . import nt_rust_core
-except ImportError as e:
-    print(f"NexTools Critical Error: Rust core module not found. {e}")
-    raise e
+import functools
+from array import array
+
+
+@functools.cache
+def _core():
+    """
+    Loads the Rust extension on first use, so that registering the add-on stays cheap.
+    """
+    try:
+        from . import nt_rust_core
+    except ImportError as e:
+        print(f"NexTools Critical Error: Rust core module not found. {e}")
+        raise e
+    return nt_rust_core
 
 
 def bake_color_id_all(
     num_faces: int,
-    poly_loop_starts: list[int],
-    poly_loop_totals: list[int],
-    loop_vert_indices: list[int],
-    uv_coords: list[float],
-) -> list[float]:
-    return nt_rust_core.bake_color_id_all(
-        num_faces, poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    out_colors: array,
+) -> None:
+    """
+    Index buffers must be int32, uv_coords and out_colors float32 (array.array or numpy).
+    out_colors (total loops * 4) receives the RGBA corner colors.
+    """
+    _core().bake_color_id_all(
+        num_faces, poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords, out_colors
+    )
+
+
+def bake_color_id_layers(
+    num_faces: int,
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_layers: list[array],
+    out_colors: list[array],
+) -> None:
+    """
+    Bakes one color buffer per UV layer; out_colors[i] (total loops * 4) receives
+    the colors of uv_layers[i]. The topology is analyzed once for all layers.
+    """
+    _core().bake_color_id_layers(
+        num_faces, poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_layers, out_colors
+    )
+
+
+def bake_color_id_region(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    face_select: array,
+    out_colors: array,
+) -> list[int]:
+    """
+    Bakes the faces whose face_select entry (int32) is non-zero, using their one-ring
+    for seam detection. Other loops of out_colors keep their values.
+    Returns the indices of the selected faces.
+    """
+    return _core().bake_color_id_region(
+        poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords, face_select, out_colors
+    )
+
+
+def compute_island_coloring(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    out_face_islands: array,
+    out_face_colors: array,
+) -> int:
+    """
+    Fills the per-face island and color indices (int32, one per face) and returns
+    the island count. Releases the GIL, so it may run on a worker thread.
+    """
+    return _core().compute_island_coloring(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        uv_coords,
+        out_face_islands,
+        out_face_colors,
+    )
+
+
+def compute_texel_density(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    out_island_stats: array,
+) -> None:
+    """
+    Fills three float32 stats per island: 3D area, UV area and density
+    (UV units per 3D unit).
+    """
+    _core().compute_texel_density(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_islands,
+        out_island_stats,
+    )
+
+
+def compute_uv_distortion(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    out_face_area: array,
+    out_face_angle: array,
+    out_island_stats: array,
+) -> None:
+    """
+    Fills per-face area and angle distortion (float32, 0..1) and six float32 stats per
+    island (3D area, UV area, mean area, mean angle, max area, max angle distortion).
+    positions are float32 vertex coordinates (vertices * 3).
+    """
+    _core().compute_uv_distortion(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_islands,
+        out_face_area,
+        out_face_angle,
+        out_island_stats,
     )
+
+
+def detect_uv_overlaps(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    out_face_groups: array,
+    out_island_groups: array,
+    out_colors: array | None = None,
+) -> int:
+    """
+    Fills the overlap group of every face and island (int32, -1 without overlaps)
+    and returns the group count. Islands connected by overlaps share a group.
+    If out_colors (total loops * 4) is given, it receives the group colors.
+    """
+    return _core().detect_uv_overlaps(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        out_face_groups,
+        out_island_groups,
+        out_colors,
+    )
+
+
+def fill_face_colors(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    face_colors: array,
+    out_colors: array,
+) -> None:
+    """
+    Writes RGBA corner colors from per-face color indices of compute_island_coloring().
+    """
+    _core().fill_face_colors(poly_loop_starts, poly_loop_totals, face_colors, out_colors)
+
+
+def fill_heatmap_colors(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    face_values: array,
+    out_colors: array,
+) -> None:
+    """
+    Writes RGBA corner colors of a blue (0) to red (1) heatmap of per-face float32 values.
+    """
+    _core().fill_heatmap_colors(poly_loop_starts, poly_loop_totals, face_values, out_colors)
+
+
+def fingerprint_mesh(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+) -> int:
+    """
+    Returns a 64-bit non-cryptographic hash of the topology and UV buffers.
+    """
+    return _core().fingerprint_mesh(
+        poly_loop_starts, poly_loop_totals, loop_vert_indices, uv_coords
+    )
+
+
+def generate_mesh(
+    kind: str,
+    res_u: int,
+    res_v: int,
+    seam_density: float = 0.0,
+    seed: int = 0,
+) -> tuple[list[float], list[int], list[int], list[int], list[float], int]:
+    return _core().generate_mesh(kind, res_u, res_v, seam_density, seed)
+
+
+def normalize_texel_density(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_islands: array,
+    island_mask: array,
+    target: float,
+) -> None:
+    """
+    Scales the islands with a non-zero island_mask entry (int32, one per island) about
+    their UV centroid to target UV units per 3D unit. uv_coords is modified in place.
+    """
+    _core().normalize_texel_density(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_islands,
+        island_mask,
+        target,
+    )
+
+
+def pack_uv_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    num_islands: int,
+    margin: float = 0.005,
+    target_fill: float = 0.8,
+    rotate: bool = True,
+) -> float:
+    """
+    Packs the islands into the unit square, modifying uv_coords in place, and returns
+    the fraction of the square covered by island bounds.
+    """
+    return _core().pack_uv_islands(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        num_islands,
+        margin,
+        target_fill,
+        rotate,
+    )
+
+
+def rasterize_color_id(
+    width: int,
+    height: int,
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_colors: array,
+    padding: int,
+    out_pixels: array,
+) -> None:
+    """
+    Rasterizes per-face color indices into RGBA float pixels (width * height * 4),
+    growing islands by `padding` pixels. Uncovered pixels are transparent black.
+    """
+    _core().rasterize_color_id(
+        width,
+        height,
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_colors,
+        padding,
+        out_pixels,
+    )
+
+
+def relax_uvs(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    uv_coords: array,
+    face_select: array,
+    loop_pins: array,
+    method: str = "LAPLACIAN",
+    iterations: int = 100,
+    strength: float = 0.5,
+) -> int:
+    """
+    Relaxes the UVs of the selected faces, modifying uv_coords in place, and returns
+    the number of moved UV vertices. Island boundaries, pinned UVs and the selection
+    border stay fixed.
+    """
+    return _core().relax_uvs(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_select,
+        loop_pins,
+        method,
+        iterations,
+        strength,
+    )
+
+
+def weld_uvs(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    uv_coords: array,
+    tolerance: float,
+    face_select: array | None = None,
+    dry_run: bool = False,
+) -> tuple[int, int, int]:
+    """
+    Welds the UVs of each vertex that lie within tolerance of each other, modifying
+    uv_coords in place unless dry_run. Returns (moved loops, islands before, islands after).
+    """
+    return _core().weld_uvs(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        uv_coords,
+        tolerance,
+        face_select,
+        dry_run,
+    )
+
+
+def find_duplicate_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    positions: array,
+    face_islands: array,
+    tolerance: float,
+    out_island_groups: array,
+) -> int:
+    """
+    Fills the duplicate group of every island (int32, -1 without a duplicate) and returns
+    the group count. Duplicates share their topology and 3D edge lengths within tolerance.
+    """
+    return _core().find_duplicate_islands(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        face_islands,
+        tolerance,
+        out_island_groups,
+    )
+
+
+def stack_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    island_groups: array,
+) -> None:
+    """
+    Stacks the islands of every group of find_duplicate_islands() onto the group's first
+    island, modifying uv_coords in place.
+    """
+    _core().stack_islands(
+        poly_loop_starts, poly_loop_totals, uv_coords, face_islands, island_groups
+    )
+
+
+def align_uv_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    uv_coords: array,
+    face_islands: array,
+    island_mask: array,
+    method: str = "PCA",
+    snap: bool = True,
+) -> int:
+    """
+    Rotates the masked islands about their UV centroid so that their main axis lies on U,
+    modifying uv_coords in place, and returns the number of rotated islands.
+    method is "PCA" or "BOUNDING_BOX"; with snap, islands turn onto the nearer of U and V.
+    """
+    return _core().align_uv_islands(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        island_mask,
+        method,
+        snap,
+    )
+
+
+def seams_from_islands(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    uv_coords: array,
+    out_seams: array,
+    face_islands: array | None = None,
+    keep_existing: bool = False,
+) -> tuple[int, tuple[list[int], list[int], list[int], list[bool]] | None]:
+    """
+    Fills out_seams (int32, one per edge) with 1 for edges whose UVs are split and returns
+    their count. With keep_existing, out_seams holds the current seams and they are kept.
+    With face_islands, also returns the island boundary polylines as
+    (offsets, loops, island per polyline, closed per polyline), or None without.
+    """
+    return _core().seams_from_islands(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        loop_edge_indices,
+        uv_coords,
+        out_seams,
+        face_islands,
+        keep_existing,
+    )
+
+
+def analyze_mesh_file(
+    path: str,
+) -> tuple[int, int, int, int, int, bytes, bytes, bytes, bytes, bytes]:
+    """
+    Reads an OBJ or PLY file with UVs and detects and colors its UV islands.
+    Returns (vertices, faces, loops, islands, seam edges, face islands, face colors,
+    faces per island, seam edges per island, island stats), the last five as native-endian
+    bytes: int32, int32, int32, int32 and float32 (islands * 3: 3D area, UV area,
+    UV units per 3D unit). Seams are detected as in seams_from_islands.
+    """
+    return _core().analyze_mesh_file(path)
+
+
+def compute_uv_stats(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    uv_coords: array,
+    num_edges: int,
+    raster_size: int = 512,
+) -> tuple[int, int, int, float, float]:
+    """
+    Returns (islands, Color ID colors, seam edges, coverage, overlap) of the UV map.
+    loop_edge_indices are the edges of the loops (int32). Coverage is the covered fraction
+    of the 0-1 tile and overlap the fraction of the covered area where islands overlap,
+    both sampled on a raster_size² raster.
+    """
+    return _core().compute_uv_stats(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        loop_edge_indices,
+        uv_coords,
+        num_edges,
+        raster_size,
+    )
+
+
+def select_uv_overlaps(
+    poly_loop_starts: array,
+    poly_loop_totals: array,
+    loop_vert_indices: array,
+    loop_edge_indices: array,
+    face_groups: array,
+    out_face_select: array,
+    out_vert_select: array,
+    out_edge_select: array,
+) -> int:
+    """
+    Fills the face, vertex and edge selection masks (int32, 0 or 1) that select exactly
+    the faces with an overlap group (face_groups from detect_uv_overlaps), and returns
+    their count.
+    """
+    return _core().select_uv_overlaps(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        loop_edge_indices,
+        face_groups,
+        out_face_select,
+        out_vert_select,
+        out_edge_select,
+    )
+
+
+def selected_island_mask(face_islands: array, face_select: array, out_island_mask: array) -> int:
+    """
+    Sets the out_island_mask entry (int32, one per island) of every island with a selected
+    face (face_select, int32 0 or 1 per face) to 1, and returns how many it set.
+    """
+    return _core().selected_island_mask(face_islands, face_select, out_island_mask)
@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import bpy
+
+
+# Deferred: the feature modules load the Rust core and are only needed once enabled
+def _on_precompute_islands_update(settings, context):
+    from .logic import precompute
+
+    precompute.on_setting_update(settings, context)
+
+
+def _on_show_uv_stats_update(settings, context):
+    from .logic import uv_stats
+
+    uv_stats.on_setting_update(settings, context)
+
+
+class NextoolsSettings(bpy.types.PropertyGroup):
+    rectify_keep_bounds: bpy.props.BoolProperty(
+        name="Keep Bounds",
+        description="Scale the rectified UV island to match its original bounding box",
+        default=True,
+    )
+    precompute_islands: bpy.props.BoolProperty(
+        name="Precompute Islands",
+        description="Detect and color UV islands in the background after edits, "
+        "so that island tools like Color ID start warm",
+        default=False,
+        update=_on_precompute_islands_update,
+    )
+    show_uv_stats: bpy.props.BoolProperty(
+        name="Live Stats",
+        description="Show island, seam, color, overlap and coverage stats of the active mesh, "
+        "recomputed in the background after edits",
+        default=False,
+        update=_on_show_uv_stats_update,
+    )
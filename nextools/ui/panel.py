@@ -1,8 +1,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import bpy
-from nextools.ops.uv import UV_OT_nextools_lite_rectify, UV_OT_nextools_straight
-from nextools.ops.color_id import UV_OT_nextools_bake_color_id
+from nextools.ops.uv import (
+    UV_OT_nextools_lite_rectify,
+    UV_OT_nextools_relax,
+    UV_OT_nextools_straight,
+    UV_OT_nextools_weld,
+)
+from nextools.ops.align import UV_OT_nextools_align_islands
+from nextools.ops.color_id import (
+    UV_OT_nextools_bake_color_id,
+    UV_OT_nextools_bake_color_id_image,
+)
+from nextools.ops.distortion import UV_OT_nextools_bake_stretch
+from nextools.ops.overlap import UV_OT_nextools_find_overlaps
+from nextools.ops.pack import UV_OT_nextools_pack_islands
+from nextools.ops.seams import UV_OT_nextools_seams_from_islands
+from nextools.ops.stack import UV_OT_nextools_stack_duplicates
+from nextools.ops.texel_density import UV_OT_nextools_normalize_texel_density
 from nextools.ops.uv_morph import UV_OT_nextools_uv_morph
 
 
@@ -23,8 +38,102 @@ class UV_PT_nextools_panel(bpy.types.Panel):
         row.prop(
             context.scene.nextools_settings, "rectify_keep_bounds", text="", icon="PIVOT_BOUNDBOX"
         )
+        row = col.row(align=True)
+        row.operator(UV_OT_nextools_relax.bl_idname, text="Relax", icon="MOD_SMOOTH")
+        row.operator(UV_OT_nextools_weld.bl_idname, text="Weld", icon="AUTOMERGE_ON")
+        row.operator(UV_OT_nextools_pack_islands.bl_idname, text="Pack", icon="UV_ISLANDSEL")
+        row = col.row(align=True)
+        row.operator(UV_OT_nextools_align_islands.bl_idname, text="Align", icon="ORIENTATION_VIEW")
+        row.operator(
+            UV_OT_nextools_stack_duplicates.bl_idname, text="Stack Duplicates", icon="DUPLICATE"
+        )
+        col.operator(
+            UV_OT_nextools_seams_from_islands.bl_idname,
+            text="Seams from Islands",
+            icon="MOD_EDGESPLIT",
+        )
 
         col.separator()
         col.label(text="Baking")
-        col.operator(UV_OT_nextools_bake_color_id.bl_idname, text="Color ID", icon="GROUP_VCOL")
+        row = col.row(align=True)
+        row.operator(UV_OT_nextools_bake_color_id.bl_idname, text="Color ID", icon="GROUP_VCOL")
+        op = row.operator(
+            UV_OT_nextools_bake_color_id.bl_idname, text="", icon="RESTRICT_SELECT_OFF"
+        )
+        op.selection_only = True
+        col.operator(
+            UV_OT_nextools_bake_color_id_image.bl_idname, text="Color ID Image", icon="IMAGE_DATA"
+        )
+        col.prop(context.scene.nextools_settings, "precompute_islands")
+        if context.scene.nextools_settings.precompute_islands:
+            self._draw_precompute_error(col, context.active_object)
+
+        col.separator()
+        col.label(text="Analysis")
+        row = col.row(align=True)
+        op = row.operator(
+            UV_OT_nextools_find_overlaps.bl_idname, text="Overlaps", icon="SELECT_INTERSECT"
+        )
+        op.action = "SELECT"
+        op = row.operator(UV_OT_nextools_find_overlaps.bl_idname, text="", icon="GROUP_VCOL")
+        op.action = "BAKE"
+        row = col.row(align=True)
+        op = row.operator(
+            UV_OT_nextools_bake_stretch.bl_idname, text="Stretch Area", icon="FULLSCREEN_ENTER"
+        )
+        op.mode = "AREA"
+        op = row.operator(
+            UV_OT_nextools_bake_stretch.bl_idname, text="Angle", icon="DRIVER_ROTATIONAL_DIFFERENCE"
+        )
+        op.mode = "ANGLE"
+        col.operator(
+            UV_OT_nextools_normalize_texel_density.bl_idname, text="Texel Density", icon="TEXTURE"
+        )
         layout.operator(UV_OT_nextools_uv_morph.bl_idname, text="UV Morph", icon="PLAY")
+
+        settings = context.scene.nextools_settings
+        layout.prop(settings, "show_uv_stats")
+        if settings.show_uv_stats:
+            self._draw_stats(layout.box(), context.active_object)
+
+    def _draw_precompute_error(self, layout, obj):
+        """Shows why the background island computation of obj failed, if it did."""
+        # Deferred: loaded by the setting once the feature is enabled
+        from nextools.logic import precompute
+
+        if obj and obj.type == "MESH":
+            error = precompute.get_error(obj.data)
+            if error:
+                layout.label(text=error, icon="ERROR")
+
+    def _draw_stats(self, box, obj):
+        """Draws the cached stats; computing them is left to the uv_stats timer."""
+        # Deferred: only loaded once the stats are shown
+        from nextools.logic import uv_stats
+
+        if not obj or obj.type != "MESH" or not obj.data.uv_layers.active:
+            box.label(text="No active UV map", icon="INFO")
+            return
+
+        uv_stats.request(obj)
+        stats = uv_stats.get_stats(obj.data)
+        error = uv_stats.get_error(obj.data)
+        if stats is None:
+            box.label(text=error or "Computing...", icon="ERROR" if error else "TIME")
+            return
+
+        col = box.column(align=True)
+        for name, value in (
+            ("Islands", f"{stats.num_islands:,}"),
+            ("Seams", f"{stats.num_seams:,}"),
+            ("Colors", f"{stats.num_colors:,}"),
+            ("Overlap", f"{stats.overlap * 100:.1f} %"),
+            ("Coverage", f"{stats.coverage * 100:.1f} %"),
+        ):
+            row = col.row()
+            row.label(text=name)
+            row.label(text=value)
+        if error:
+            col.label(text=error, icon="ERROR")
+        elif uv_stats.is_outdated(obj.data):
+            col.label(text="Updating...", icon="TIME")
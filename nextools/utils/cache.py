@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import bpy
+
+
+class OperatorCache:
+    """
+    Small LRU cache for intermediate results of an operator.
+
+    Redo-panel tweaks undo and re-run execute() on the same input, so results that
+    are expensive to rebuild are kept here, keyed by mesh identity (session_uid,
+    which survives undo) and a fingerprint of the input the result was built from.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, Hashable], Any] = OrderedDict()
+
+    def get(self, mesh: bpy.types.Mesh, fingerprint: Hashable) -> Any | None:
+        key = (mesh.session_uid, fingerprint)
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, mesh: bpy.types.Mesh, fingerprint: Hashable, value: Any) -> None:
+        key = (mesh.session_uid, fingerprint)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+from typing import NamedTuple
+
+import bpy
+from .. import rust_bridge
+
+MESH_KINDS = ("GRID", "CHECKER", "TORUS", "FAN", "SCATTER")
+
+
+class SyntheticMesh(NamedTuple):
+    """Flat mesh buffers in Blender's foreach_get layout."""
+
+    positions: list[float]
+    poly_loop_starts: list[int]
+    poly_loop_totals: list[int]
+    loop_vert_indices: list[int]
+    uv_coords: list[float]
+    num_islands: int
+
+    @property
+    def num_faces(self) -> int:
+        return len(self.poly_loop_starts)
+
+
+def generate(
+    kind: str, res_u: int, res_v: int, seam_density: float = 0.0, seed: int = 0
+) -> SyntheticMesh:
+    """
+    Generates a deterministic synthetic mesh in the Rust core.
+
+    The meaning of res_u / res_v depends on the kind:
+    GRID, CHECKER: cells along X / Y; TORUS: major / minor segments;
+    FAN: fans / blades per fan; SCATTER: islands / quads per island side.
+    """
+    if kind not in MESH_KINDS:
+        raise ValueError(f"Unknown mesh kind '{kind}'. Expected one of {MESH_KINDS}.")
+    return SyntheticMesh(*rust_bridge.generate_mesh(kind, res_u, res_v, seam_density, seed))
+
+
+def generate_for_face_count(
+    kind: str, target_faces: int, seam_density: float = 0.0, seed: int = 0
+) -> SyntheticMesh:
+    """
+    Generates a mesh with roughly target_faces faces.
+    """
+    if kind == "TORUS":
+        minor = max(3, int(math.sqrt(target_faces / 4)))
+        return generate(kind, max(3, math.ceil(target_faces / minor)), minor, seam_density, seed)
+    if kind == "FAN":
+        blades = 8
+        return generate(kind, max(1, math.ceil(target_faces / blades)), blades, seam_density, seed)
+    if kind == "SCATTER":
+        res = 4
+        return generate(kind, max(1, math.ceil(target_faces / res**2)), res, seam_density, seed)
+
+    side = max(1, math.ceil(math.sqrt(target_faces)))
+    return generate(kind, side, side, seam_density, seed)
+
+
+def create_mesh_object(data: SyntheticMesh, name: str = "NT_Synthetic") -> bpy.types.Object:
+    """
+    Builds a Blender mesh from synthetic buffers with foreach_set and links it to the scene.
+    The new object becomes the active one.
+    """
+    mesh = bpy.data.meshes.new(name)
+
+    mesh.vertices.add(len(data.positions) // 3)
+    mesh.vertices.foreach_set("co", data.positions)
+
+    mesh.loops.add(len(data.loop_vert_indices))
+    mesh.loops.foreach_set("vertex_index", data.loop_vert_indices)
+
+    mesh.polygons.add(data.num_faces)
+    mesh.polygons.foreach_set("loop_start", data.poly_loop_starts)
+
+    mesh.update(calc_edges=True)
+
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", data.uv_coords)
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    return obj
@@ -1,4 +1,17 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 
+pub mod align;
 pub mod color_id;
-mod dsu;
+pub mod distortion;
+pub mod dsu;
+pub mod fingerprint;
+pub mod mesh_io;
+pub mod overlap;
+pub mod pack;
+pub mod raster;
+pub mod relax;
+pub mod seams;
+pub mod stack;
+pub mod texel_density;
+pub mod uv_stats;
+pub mod weld;
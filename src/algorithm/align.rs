@@ -0,0 +1,442 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Axis alignment of UV islands
+//!
+//! Every island is rotated about its UV centroid so that its main axis lies on U:
+//! - PCA: the principal axis of the covariance of its UV points.
+//! - Bounding box: the long side of its minimal-area bounding rectangle, found with
+//!   rotating calipers on the convex hull of its UV points.
+//!
+//! With `snap`, islands turn by at most 45 degrees, onto the nearer of U and V.
+
+use crate::algorithm::raster::worker_count;
+use crate::algorithm::stack::{FRAME_EPSILON, island_faces};
+use std::f64::consts::{FRAC_PI_2, PI};
+use std::thread;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum AlignMethod {
+    Pca,
+    BoundingBox,
+}
+
+impl AlignMethod {
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name.to_ascii_uppercase().as_str() {
+            "PCA" => Some(Self::Pca),
+            "BOUNDING_BOX" => Some(Self::BoundingBox),
+            _ => None,
+        }
+    }
+}
+
+/// Rotation of one island about its UV centroid
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct IslandRotation {
+    pub centroid: (f32, f32),
+    /// Counter-clockwise, in radians
+    pub angle: f32,
+}
+
+/// Rotation that aligns every island whose `island_mask` entry is true (all islands
+/// without a mask); 0 for the others. Islands are processed on all cores.
+#[allow(clippy::too_many_arguments)]
+pub fn island_rotations(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+    island_mask: Option<&[bool]>,
+    method: AlignMethod,
+    snap: bool,
+) -> Vec<IslandRotation> {
+    let (offsets, faces) = island_faces(face_islands, num_islands);
+    let mut rotations = vec![IslandRotation::default(); num_islands];
+    if num_islands == 0 {
+        return rotations;
+    }
+    let chunk_len = num_islands.div_ceil(worker_count());
+
+    thread::scope(|scope| {
+        for (c_idx, chunk) in rotations.chunks_mut(chunk_len).enumerate() {
+            let (offsets, faces) = (&offsets, &faces);
+            scope.spawn(move || {
+                let mut points = Vec::new();
+                for (i, rotation) in chunk.iter_mut().enumerate() {
+                    let island = c_idx * chunk_len + i;
+                    if island_mask.is_some_and(|mask| !mask[island]) {
+                        continue;
+                    }
+                    points.clear();
+                    for &f in &faces[offsets[island] as usize..offsets[island + 1] as usize] {
+                        let start = poly_loop_starts[f as usize] as usize;
+                        let end = start + poly_loop_totals[f as usize] as usize;
+                        points.extend(
+                            uv_coords[start * 2..end * 2]
+                                .chunks_exact(2)
+                                .map(|uv| (uv[0] as f64, uv[1] as f64)),
+                        );
+                    }
+                    *rotation = rotation_of(&mut points, method, snap);
+                }
+            });
+        }
+    });
+    rotations
+}
+
+/// Centers `points` on their centroid and returns the rotation that aligns them
+fn rotation_of(points: &mut Vec<(f64, f64)>, method: AlignMethod, snap: bool) -> IslandRotation {
+    if points.is_empty() {
+        return IslandRotation::default();
+    }
+    let n = points.len() as f64;
+    let (su, sv) = points
+        .iter()
+        .fold((0.0, 0.0), |(su, sv), p| (su + p.0, sv + p.1));
+    let (cu, cv) = (su / n, sv / n);
+    for p in points.iter_mut() {
+        *p = (p.0 - cu, p.1 - cv);
+    }
+
+    let axis = match method {
+        AlignMethod::Pca => principal_axis(points),
+        AlignMethod::BoundingBox => bounding_box_axis(&convex_hull(points)),
+    };
+    // Smallest turn that puts the axis on U (or V with snap); axes have no direction
+    let period = if snap { FRAC_PI_2 } else { PI };
+    let mut residual = axis.rem_euclid(period);
+    if residual > period / 2.0 {
+        residual -= period;
+    }
+    IslandRotation {
+        centroid: (cu as f32, cv as f32),
+        angle: -residual as f32,
+    }
+}
+
+/// Angle of the principal axis of centered points, 0 for isotropic point sets
+fn principal_axis(points: &[(f64, f64)]) -> f64 {
+    let (cuu, cvv, cuv) = points.iter().fold((0.0, 0.0, 0.0), |(uu, vv, uv), p| {
+        (uu + p.0 * p.0, vv + p.1 * p.1, uv + p.0 * p.1)
+    });
+    let anisotropy = ((cuu - cvv).powi(2) + 4.0 * cuv * cuv).sqrt();
+    if anisotropy > FRAME_EPSILON * (cuu + cvv) {
+        0.5 * (2.0 * cuv).atan2(cuu - cvv)
+    } else {
+        0.0
+    }
+}
+
+/// Counter-clockwise convex hull without collinear points (monotone chain)
+/// Points inside the octagon of the extreme points in eight directions are dropped
+/// before sorting (Akl-Toussaint), which leaves little more than the island boundary.
+fn convex_hull(points: &mut Vec<(f64, f64)>) -> Vec<(f64, f64)> {
+    // Directions in counter-clockwise order, so their extreme points are too
+    const DIRECTIONS: [(f64, f64); 8] = [
+        (0.0, -1.0),
+        (1.0, -1.0),
+        (1.0, 0.0),
+        (1.0, 1.0),
+        (0.0, 1.0),
+        (-1.0, 1.0),
+        (-1.0, 0.0),
+        (-1.0, -1.0),
+    ];
+    if let Some(&first) = points.first() {
+        let mut extremes = [first; 8];
+        for &p in points.iter() {
+            for (extreme, d) in extremes.iter_mut().zip(DIRECTIONS) {
+                if p.0 * d.0 + p.1 * d.1 > extreme.0 * d.0 + extreme.1 * d.1 {
+                    *extreme = p;
+                }
+            }
+        }
+        let mut octagon = extremes.to_vec();
+        octagon.dedup();
+        if octagon.len() > 1 && octagon.first() == octagon.last() {
+            octagon.pop();
+        }
+        if octagon.len() >= 3 {
+            let n = octagon.len();
+            points.retain(|&p| (0..n).any(|i| turn(octagon[i], octagon[(i + 1) % n], p) <= 0.0));
+        }
+    }
+    points.sort_unstable_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    let mut hull = Vec::with_capacity(points.len() + 1);
+    push_chain(&mut hull, points.iter());
+    push_chain(&mut hull, points.iter().rev());
+    hull.dedup();
+    hull
+}
+
+/// Appends one chain of the hull; its last point starts the next chain, so it is dropped
+fn push_chain<'a>(hull: &mut Vec<(f64, f64)>, points: impl Iterator<Item = &'a (f64, f64)>) {
+    let base = hull.len();
+    for &p in points {
+        while hull.len() >= base + 2 && turn(hull[hull.len() - 2], hull[hull.len() - 1], p) <= 0.0 {
+            hull.pop();
+        }
+        hull.push(p);
+    }
+    hull.pop();
+}
+
+/// Cross product of `o -> a` and `o -> b`: positive for a counter-clockwise turn
+fn turn(o: (f64, f64), a: (f64, f64), b: (f64, f64)) -> f64 {
+    (a.0 - o.0) * (b.1 - o.1) - (a.1 - o.1) * (b.0 - o.0)
+}
+
+/// Angle of the long side of the minimal-area bounding rectangle of a hull
+fn bounding_box_axis(hull: &[(f64, f64)]) -> f64 {
+    let h = hull.len();
+    if h < 2 {
+        return 0.0;
+    }
+    let edge = |i: usize| {
+        (
+            hull[(i + 1) % h].0 - hull[i].0,
+            hull[(i + 1) % h].1 - hull[i].1,
+        )
+    };
+    if h == 2 {
+        let (du, dv) = edge(0);
+        return dv.atan2(du);
+    }
+    let project = |i: usize, d: (f64, f64)| hull[i % h].0 * d.0 + hull[i % h].1 * d.1;
+
+    // Calipers advance monotonically around the hull, so all edges take O(h)
+    let (mut right, mut top, mut left) = (1, 1, 1);
+    let (mut best_area, mut best_axis) = (f64::MAX, 0.0);
+    for i in 0..h {
+        let (du, dv) = edge(i);
+        let len = du.hypot(dv);
+        if len == 0.0 {
+            continue;
+        }
+        let along = (du / len, dv / len);
+        // Inward normal of a counter-clockwise hull
+        let normal = (-along.1, along.0);
+
+        right = right.max(i + 1);
+        while project(right + 1, along) > project(right, along) {
+            right += 1;
+        }
+        top = top.max(right);
+        while project(top + 1, normal) > project(top, normal) {
+            top += 1;
+        }
+        left = left.max(top);
+        while project(left + 1, along) < project(left, along) {
+            left += 1;
+        }
+
+        let width = project(right, along) - project(left, along);
+        let height = project(top, normal) - project(i, normal);
+        if width * height < best_area {
+            best_area = width * height;
+            best_axis = if width >= height {
+                along.1.atan2(along.0)
+            } else {
+                normal.1.atan2(normal.0)
+            };
+        }
+    }
+    best_axis
+}
+
+/// Rotates every island of `uv_coords` by its rotation, in place
+pub fn rotate_islands(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &mut [f32],
+    face_islands: &[u32],
+    rotations: &[IslandRotation],
+) {
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        let rotation = rotations[island as usize];
+        if rotation.angle == 0.0 {
+            continue;
+        }
+        let (sin, cos) = rotation.angle.sin_cos();
+        let (cu, cv) = rotation.centroid;
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for uv in uv_coords[start * 2..end * 2].chunks_exact_mut(2) {
+            let (du, dv) = (uv[0] - cu, uv[1] - cv);
+            uv[0] = cu + du * cos - dv * sin;
+            uv[1] = cv + du * sin + dv * cos;
+        }
+    }
+}
+
+/// Aligns the islands in place and returns the number of rotated islands
+#[allow(clippy::too_many_arguments)]
+pub fn align_islands(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &mut [f32],
+    face_islands: &[u32],
+    num_islands: usize,
+    island_mask: Option<&[bool]>,
+    method: AlignMethod,
+    snap: bool,
+) -> usize {
+    let rotations = island_rotations(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        num_islands,
+        island_mask,
+        method,
+        snap,
+    );
+    rotate_islands(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        &rotations,
+    );
+    rotations.iter().filter(|r| r.angle != 0.0).count()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// UVs of `islands` separate quads, each a 0.4 x 0.1 rectangle rotated by
+    /// `angles[island]` degrees about (0.5, 0.5)
+    fn rectangles(angles: &[f64]) -> (Vec<u32>, Vec<u32>, Vec<f32>, Vec<u32>) {
+        let mut uvs = Vec::new();
+        for &angle in angles {
+            let (sin, cos) = angle.to_radians().sin_cos();
+            for (x, y) in [(-0.2, -0.05), (0.2, -0.05), (0.2, 0.05), (-0.2, 0.05)] {
+                uvs.push((0.5 + x * cos - y * sin) as f32);
+                uvs.push((0.5 + x * sin + y * cos) as f32);
+            }
+        }
+        let n = angles.len() as u32;
+        let starts = (0..n).map(|i| i * 4).collect();
+        let islands = (0..n).collect();
+        (starts, vec![4; n as usize], uvs, islands)
+    }
+
+    /// (width, height) of the UV bounds of an island
+    fn extent(uvs: &[f32], island: usize) -> (f32, f32) {
+        let chunk = &uvs[island * 8..island * 8 + 8];
+        let range = |values: Vec<f32>| {
+            let min = values.iter().fold(f32::MAX, |a, &b| a.min(b));
+            let max = values.iter().fold(f32::MIN, |a, &b| a.max(b));
+            max - min
+        };
+        (
+            range(chunk.iter().step_by(2).copied().collect()),
+            range(chunk.iter().skip(1).step_by(2).copied().collect()),
+        )
+    }
+
+    fn assert_extent(uvs: &[f32], island: usize, width: f32, height: f32) {
+        let (w, h) = extent(uvs, island);
+        assert!((w - width).abs() < 1e-5, "island {island}: width {w}");
+        assert!((h - height).abs() < 1e-5, "island {island}: height {h}");
+    }
+
+    #[test]
+    fn both_methods_align_the_long_side_to_u() {
+        for method in [AlignMethod::Pca, AlignMethod::BoundingBox] {
+            let (starts, totals, mut uvs, islands) = rectangles(&[30.0, -100.0, 0.0]);
+
+            let rotated =
+                align_islands(&starts, &totals, &mut uvs, &islands, 3, None, method, false);
+
+            assert_eq!(rotated, 2);
+            for island in 0..3 {
+                assert_extent(&uvs, island, 0.4, 0.1);
+            }
+            assert!((uvs[0] + uvs[2] + uvs[4] + uvs[6] - 2.0).abs() < 1e-5); // centroid kept
+        }
+    }
+
+    #[test]
+    fn snap_turns_onto_the_nearer_axis() {
+        let (starts, totals, mut uvs, islands) = rectangles(&[80.0, 10.0]);
+
+        align_islands(
+            &starts,
+            &totals,
+            &mut uvs,
+            &islands,
+            2,
+            None,
+            AlignMethod::Pca,
+            true,
+        );
+
+        assert_extent(&uvs, 0, 0.1, 0.4);
+        assert_extent(&uvs, 1, 0.4, 0.1);
+    }
+
+    #[test]
+    fn bounding_box_aligns_squares() {
+        // A rotated square has no principal axis, but a minimal bounding box
+        let uvs: Vec<f32> = [0.5, 0.0, 1.0, 0.5, 0.5, 1.0, 0.0, 0.5].to_vec();
+
+        let mut pca = uvs.clone();
+        let rotated = align_islands(&[0], &[4], &mut pca, &[0], 1, None, AlignMethod::Pca, true);
+        assert_eq!(rotated, 0);
+
+        let mut bbox = uvs.clone();
+        align_islands(
+            &[0],
+            &[4],
+            &mut bbox,
+            &[0],
+            1,
+            None,
+            AlignMethod::BoundingBox,
+            true,
+        );
+        let side = 0.5f32.hypot(0.5);
+        assert_extent(&bbox, 0, side, side);
+    }
+
+    #[test]
+    fn masked_islands_are_untouched() {
+        let (starts, totals, mut uvs, islands) = rectangles(&[30.0, 30.0]);
+        let original = uvs.clone();
+
+        let rotated = align_islands(
+            &starts,
+            &totals,
+            &mut uvs,
+            &islands,
+            2,
+            Some(&[false, true]),
+            AlignMethod::BoundingBox,
+            false,
+        );
+
+        assert_eq!(rotated, 1);
+        assert_eq!(uvs[..8], original[..8]);
+        assert_extent(&uvs, 1, 0.4, 0.1);
+    }
+
+    #[test]
+    fn hull_drops_inner_and_collinear_points() {
+        let mut points = vec![
+            (0.0, 0.0),
+            (1.0, 0.0),
+            (0.5, 0.0),
+            (0.5, 0.5),
+            (1.0, 1.0),
+            (0.0, 1.0),
+        ];
+
+        let hull = convex_hull(&mut points);
+
+        assert_eq!(hull, vec![(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]);
+    }
+}
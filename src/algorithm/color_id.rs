@@ -3,14 +3,17 @@
 use crate::algorithm::dsu::Dsu;
 use std::collections::{HashMap, HashSet};
 
+// All indices are stored as u32, matching Blender's 32-bit mesh indices.
+// This halves the memory traffic of the hot loops compared to usize.
+
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
-struct EdgeKey {
-    min: usize,
-    max: usize,
+pub struct EdgeKey {
+    min: u32,
+    max: u32,
 }
 
 impl EdgeKey {
-    fn new(v1: usize, v2: usize) -> Self {
+    fn new(v1: u32, v2: u32) -> Self {
         if v1 < v2 {
             Self { min: v1, max: v2 }
         } else {
@@ -21,15 +24,15 @@ impl EdgeKey {
 
 /// Information of a face sharing an edge
 #[derive(Debug, Clone, Copy)]
-struct FaceEdgeRef {
-    face_idx: usize,
-    loop_curr: usize,
-    loop_next: usize,
+pub struct FaceEdgeRef {
+    face_idx: u32,
+    loop_curr: u32,
+    loop_next: u32,
 }
 
 /// Key: EdgeKey (v_min, v_max)
 /// Value: List of faces sharing that edge
-type EdgeMap = HashMap<EdgeKey, Vec<FaceEdgeRef>>;
+pub type EdgeMap = HashMap<EdgeKey, Vec<FaceEdgeRef>>;
 
 /// Calculates Color ID based on mesh data passed from Blender
 ///
@@ -44,43 +47,185 @@ type EdgeMap = HashMap<EdgeKey, Vec<FaceEdgeRef>>;
 /// - Vec<f32>: Flat array of [r, g, b, a, r, g, b, a, ...] (for Vertex Color)
 pub fn bake_color_id_all(
     num_faces: usize,
-    poly_loop_starts: Vec<usize>,
-    poly_loop_totals: Vec<usize>,
-    loop_vert_indices: Vec<usize>,
-    uv_coords: Vec<f32>,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
 ) -> Vec<f32> {
+    let mut result_colors = vec![0.0f32; loop_vert_indices.len() * 4];
+    bake_color_id_into(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        uv_coords,
+        &mut result_colors,
+    );
+    result_colors
+}
+
+/// Same as `bake_color_id_all`, but writes into a caller-provided buffer
+/// (length: total loop count * 4)
+pub fn bake_color_id_into(
+    num_faces: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+    result_colors: &mut [f32],
+) {
+    let coloring = compute_island_coloring(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        uv_coords,
+    );
+
+    generate_result_colors(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        &coloring.face_colors,
+        result_colors,
+    );
+}
+
+/// Bakes Color IDs for several UV layers of the same topology
+///
+/// The edge map only depends on the topology, so it is built once and shared;
+/// island detection, coloring and color generation run on one thread per layer.
+/// `result_colors[i]` receives the colors of `uv_layers[i]`.
+pub fn bake_color_id_layers(
+    num_faces: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_layers: &[&[f32]],
+    result_colors: &mut [&mut [f32]],
+) {
     let edge_map: EdgeMap = build_edge_map(
         num_faces,
-        &poly_loop_starts,
-        &poly_loop_totals,
-        &loop_vert_indices,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+    );
+
+    let bake_layer = |uv_coords: &[f32], colors: &mut [f32]| {
+        let (mut dsu, island_connections) =
+            detect_uv_islands(num_faces, &edge_map, loop_vert_indices, uv_coords);
+        let (adjacency, all_islands) =
+            build_adjacency_graph(num_faces, &mut dsu, island_connections);
+        let island_color_indices = color_graph(&adjacency, all_islands);
+        let coloring = index_islands(num_faces, &mut dsu, &island_color_indices);
+        generate_result_colors(
+            num_faces,
+            poly_loop_starts,
+            poly_loop_totals,
+            &coloring.face_colors,
+            colors,
+        );
+    };
+
+    std::thread::scope(|scope| {
+        for (uv_coords, colors) in uv_layers.iter().zip(result_colors.iter_mut()) {
+            scope.spawn(|| bake_layer(uv_coords, colors));
+        }
+    });
+}
+
+/// Island index and color index of every face
+/// This is the expensive part of the bake; turning it into corner colors is a single pass.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct IslandColoring {
+    /// Island of each face, numbered 0..num_islands in order of their first face
+    pub face_islands: Vec<u32>,
+    /// Color index of each face (same for all faces of an island)
+    pub face_colors: Vec<u32>,
+    pub num_islands: usize,
+}
+
+/// Runs island detection and graph coloring without generating colors
+pub fn compute_island_coloring(
+    num_faces: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+) -> IslandColoring {
+    let edge_map: EdgeMap = build_edge_map(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
     );
 
     let (mut dsu, island_connections) =
-        detect_uv_islands(num_faces, &edge_map, &loop_vert_indices, &uv_coords);
+        detect_uv_islands(num_faces, &edge_map, loop_vert_indices, uv_coords);
 
     let (adjacency, all_islands) = build_adjacency_graph(num_faces, &mut dsu, island_connections);
 
     let island_color_indices = color_graph(&adjacency, all_islands);
 
-    generate_result_colors(
-        num_faces,
-        loop_vert_indices.len(),
-        &poly_loop_starts,
-        &poly_loop_totals,
-        &mut dsu,
-        &island_color_indices,
-    )
+    index_islands(num_faces, &mut dsu, &island_color_indices)
+}
+
+/// Resolves every face to a compact island index and its island's color
+pub fn index_islands(
+    num_faces: usize,
+    dsu: &mut Dsu,
+    island_color_indices: &HashMap<u32, u32>,
+) -> IslandColoring {
+    const UNASSIGNED: u32 = u32::MAX;
+    // Leader face -> compact island index
+    let mut leader_islands = vec![UNASSIGNED; num_faces];
+    let mut face_islands = Vec::with_capacity(num_faces);
+    let mut face_colors = Vec::with_capacity(num_faces);
+    let mut num_islands = 0u32;
+
+    for f_idx in 0..num_faces {
+        let leader = dsu.leader(f_idx);
+        if leader_islands[leader] == UNASSIGNED {
+            leader_islands[leader] = num_islands;
+            num_islands += 1;
+        }
+        face_islands.push(leader_islands[leader]);
+        face_colors.push(*island_color_indices.get(&(leader as u32)).unwrap_or(&0));
+    }
+
+    IslandColoring {
+        face_islands,
+        face_colors,
+        num_islands: num_islands as usize,
+    }
+}
+
+/// Sets the mask entry (one per island) of every island with a selected face to 1,
+/// leaving the others untouched, and returns the number of islands it set
+pub fn selected_island_mask(
+    face_islands: &[u32],
+    face_select: &[i32],
+    island_mask: &mut [i32],
+) -> usize {
+    let mut num_selected = 0;
+    for (&island, &selected) in face_islands.iter().zip(face_select) {
+        let entry = &mut island_mask[island as usize];
+        if selected != 0 && *entry != 1 {
+            *entry = 1;
+            num_selected += 1;
+        }
+    }
+    num_selected
 }
 
 #[inline]
-fn is_uv_equal(u1: f32, v1: f32, u2: f32, v2: f32) -> bool {
+pub(crate) fn is_uv_equal(u1: f32, v1: f32, u2: f32, v2: f32) -> bool {
     const EPSILON: f32 = 1e-4;
     (u1 - u2).abs() < EPSILON && (v1 - v2).abs() < EPSILON
 }
 
 /// h: 0.0 - 1.0, s: 0.0 - 1.0, v: 0.0 - 1.0
-fn hsv_to_rgb(h: f32, s: f32, v: f32) -> (f32, f32, f32) {
+pub(crate) fn hsv_to_rgb(h: f32, s: f32, v: f32) -> (f32, f32, f32) {
     let h_i = (h * 6.0) as i32;
     let f = h * 6.0 - h_i as f32;
     let p = v * (1.0 - s);
@@ -99,7 +244,7 @@ fn hsv_to_rgb(h: f32, s: f32, v: f32) -> (f32, f32, f32) {
 
 /// Generates a highly visible color from an index using the Golden Angle
 /// Inverse Golden Ratio Conjugate ≒ 0.618034
-fn get_golden_ratio_color(index: usize) -> (f32, f32, f32, f32) {
+pub(crate) fn get_golden_ratio_color(index: usize) -> (f32, f32, f32, f32) {
     let h = (index as f32 * 0.618_034) % 1.0;
     let (r, g, b) = hsv_to_rgb(h, 0.85, 0.95);
     (r, g, b, 1.0) // Alpha = 1.0
@@ -108,11 +253,11 @@ fn get_golden_ratio_color(index: usize) -> (f32, f32, f32, f32) {
 /// Topology Analysis (Build Edge Map)
 /// (min_vert_idx, max_vert_idx) -> List of (FaceIndex, LoopIndexA, LoopIndexB)
 /// Collects information of faces sharing edges
-fn build_edge_map(
+pub fn build_edge_map(
     num_faces: usize,
-    poly_loop_starts: &[usize],
-    poly_loop_totals: &[usize],
-    loop_vert_indices: &[usize],
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
 ) -> EdgeMap {
     let mut edge_map: EdgeMap = HashMap::with_capacity(num_faces * 3);
 
@@ -124,13 +269,13 @@ fn build_edge_map(
             let loop_curr = start + i;
             let loop_next = start + (i + 1) % total;
 
-            let v1 = loop_vert_indices[loop_curr];
-            let v2 = loop_vert_indices[loop_next];
+            let v1 = loop_vert_indices[loop_curr as usize];
+            let v2 = loop_vert_indices[loop_next as usize];
 
             let key = EdgeKey::new(v1, v2);
 
             edge_map.entry(key).or_default().push(FaceEdgeRef {
-                face_idx: f_idx,
+                face_idx: f_idx as u32,
                 loop_curr,
                 loop_next,
             });
@@ -139,12 +284,13 @@ fn build_edge_map(
     edge_map
 }
 
-fn get_sorted_uvs(
-    loop_curr: usize,
-    loop_next: usize,
-    loop_vert_indices: &[usize],
+pub(crate) fn get_sorted_uvs(
+    loop_curr: u32,
+    loop_next: u32,
+    loop_vert_indices: &[u32],
     uv_coords: &[f32],
 ) -> ((f32, f32), (f32, f32)) {
+    let (loop_curr, loop_next) = (loop_curr as usize, loop_next as usize);
     if loop_vert_indices[loop_curr] < loop_vert_indices[loop_next] {
         (
             (uv_coords[loop_curr * 2], uv_coords[loop_curr * 2 + 1]),
@@ -161,15 +307,15 @@ fn get_sorted_uvs(
 /// Detect UV Islands (Union-Find)
 /// Initially assume all faces are separate islands
 /// Returns: (Dsu, island_connections)
-fn detect_uv_islands(
+pub fn detect_uv_islands(
     num_faces: usize,
     edge_map: &EdgeMap,
-    loop_vert_indices: &[usize],
+    loop_vert_indices: &[u32],
     uv_coords: &[f32],
-) -> (Dsu, Vec<(usize, usize)>) {
+) -> (Dsu, Vec<(u32, u32)>) {
     let mut dsu = Dsu::new(num_faces);
     // Connections between islands (Geometrically connected but UVs are split)
-    let mut island_connections: Vec<(usize, usize)> = Vec::new();
+    let mut island_connections: Vec<(u32, u32)> = Vec::new();
 
     for (_, entries) in edge_map.iter() {
         // If Manifold, entries.len() == 2
@@ -189,7 +335,7 @@ fn detect_uv_islands(
                     && is_uv_equal(uv1_max.0, uv1_max.1, uv2_max.0, uv2_max.1);
 
                 if connected_uv {
-                    dsu.merge(ref1.face_idx, ref2.face_idx);
+                    dsu.merge(ref1.face_idx as usize, ref2.face_idx as usize);
                 } else {
                     island_connections.push((ref1.face_idx, ref2.face_idx));
                 }
@@ -201,21 +347,21 @@ fn detect_uv_islands(
 
 /// Build Island Adjacency Graph
 /// IslandID (Representative Face ID) -> Set of Neighbor IslandIDs
-fn build_adjacency_graph(
+pub fn build_adjacency_graph(
     num_faces: usize,
     dsu: &mut Dsu,
-    island_connections: Vec<(usize, usize)>,
-) -> (HashMap<usize, HashSet<usize>>, HashSet<usize>) {
-    let mut adjacency: HashMap<usize, HashSet<usize>> = HashMap::new();
-    let mut all_islands: HashSet<usize> = HashSet::new();
+    island_connections: Vec<(u32, u32)>,
+) -> (HashMap<u32, HashSet<u32>>, HashSet<u32>) {
+    let mut adjacency: HashMap<u32, HashSet<u32>> = HashMap::new();
+    let mut all_islands: HashSet<u32> = HashSet::new();
 
     for f in 0..num_faces {
-        all_islands.insert(dsu.leader(f));
+        all_islands.insert(dsu.leader(f) as u32);
     }
 
     for (f1, f2) in island_connections {
-        let root1 = dsu.leader(f1);
-        let root2 = dsu.leader(f2);
+        let root1 = dsu.leader(f1 as usize) as u32;
+        let root2 = dsu.leader(f2 as usize) as u32;
 
         if root1 != root2 {
             adjacency.entry(root1).or_default().insert(root2);
@@ -226,13 +372,13 @@ fn build_adjacency_graph(
 }
 
 /// Graph Coloring (Greedy Coloring / Welsh-Powell)
-fn color_graph(
-    adjacency: &HashMap<usize, HashSet<usize>>,
-    all_islands: HashSet<usize>,
-) -> HashMap<usize, i32> {
-    let mut island_color_indices: HashMap<usize, i32> = HashMap::new();
+pub fn color_graph(
+    adjacency: &HashMap<u32, HashSet<u32>>,
+    all_islands: HashSet<u32>,
+) -> HashMap<u32, u32> {
+    let mut island_color_indices: HashMap<u32, u32> = HashMap::new();
 
-    let mut islands_by_degree: Vec<(usize, usize)> = all_islands
+    let mut islands_by_degree: Vec<(usize, u32)> = all_islands
         .into_iter()
         .map(|island| {
             let deg = adjacency.get(&island).map(|s| s.len()).unwrap_or(0);
@@ -264,36 +410,128 @@ fn color_graph(
 /// Generate Result Data
 /// Blender's Vertex Color (Byte Color / Attribute) holds data per loop
 /// Flat List: [r, g, b, a, r, g, b, a, ...]
-fn generate_result_colors(
+pub fn generate_result_colors(
     num_faces: usize,
-    total_loop_count: usize,
-    poly_loop_starts: &[usize],
-    poly_loop_totals: &[usize],
-    dsu: &mut Dsu,
-    island_color_indices: &HashMap<usize, i32>,
-) -> Vec<f32> {
-    let mut result_colors = vec![0.0f32; total_loop_count * 4];
-
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    face_colors: &[u32],
+    result_colors: &mut [f32],
+) {
     for f_idx in 0..num_faces {
-        let island_id = dsu.leader(f_idx);
-        let c_idx = *island_color_indices.get(&island_id).unwrap_or(&0);
+        write_face_color(
+            result_colors,
+            poly_loop_starts[f_idx],
+            poly_loop_totals[f_idx],
+            face_colors[f_idx],
+        );
+    }
+}
 
-        let (r, g, b, a) = get_golden_ratio_color(c_idx as usize);
+#[inline]
+fn write_face_color(result_colors: &mut [f32], start: u32, total: u32, color_idx: u32) {
+    let (r, g, b, a) = get_golden_ratio_color(color_idx as usize);
+    let start = start as usize;
 
-        let start = poly_loop_starts[f_idx];
-        let total = poly_loop_totals[f_idx];
+    for loop_idx in start..start + total as usize {
+        let offset = loop_idx * 4;
 
-        for i in 0..total {
-            let loop_idx = start + i;
-            let offset = loop_idx * 4;
+        result_colors[offset] = r;
+        result_colors[offset + 1] = g;
+        result_colors[offset + 2] = b;
+        result_colors[offset + 3] = a;
+    }
+}
 
-            result_colors[offset] = r;
-            result_colors[offset + 1] = g;
-            result_colors[offset + 2] = b;
-            result_colors[offset + 3] = a;
+/// Bakes Color IDs of the selected faces only
+///
+/// Islands and coloring are computed on the selected faces plus their one-ring
+/// (faces sharing a vertex), so seams on the selection border are detected.
+/// Only the loops of the selected faces are written; the rest of `result_colors`
+/// is left untouched. Apart from a linear scan for the ring, the cost scales
+/// with the selection size.
+pub fn bake_color_id_region(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+    selected_faces: &[u32],
+    result_colors: &mut [f32],
+) {
+    let region = region_faces(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        selected_faces,
+    );
+
+    // Compact sub-mesh of the region, selected faces first
+    let mut sub_starts = Vec::with_capacity(region.len());
+    let mut sub_totals = Vec::with_capacity(region.len());
+    let mut sub_verts = Vec::new();
+    let mut sub_uvs = Vec::new();
+    for &f_idx in &region {
+        let start = poly_loop_starts[f_idx as usize] as usize;
+        let total = poly_loop_totals[f_idx as usize];
+        sub_starts.push(sub_verts.len() as u32);
+        sub_totals.push(total);
+        sub_verts.extend_from_slice(&loop_vert_indices[start..start + total as usize]);
+        sub_uvs.extend_from_slice(&uv_coords[start * 2..(start + total as usize) * 2]);
+    }
+
+    let coloring =
+        compute_island_coloring(region.len(), &sub_starts, &sub_totals, &sub_verts, &sub_uvs);
+
+    for (i, &f_idx) in selected_faces.iter().enumerate() {
+        write_face_color(
+            result_colors,
+            poly_loop_starts[f_idx as usize],
+            poly_loop_totals[f_idx as usize],
+            coloring.face_colors[i],
+        );
+    }
+}
+
+/// Selected faces (in the given order) followed by the faces sharing a vertex with them
+pub fn region_faces(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    selected_faces: &[u32],
+) -> Vec<u32> {
+    let face_loops = |f_idx: usize| {
+        let start = poly_loop_starts[f_idx] as usize;
+        &loop_vert_indices[start..start + poly_loop_totals[f_idx] as usize]
+    };
+
+    let mut is_selected = vec![false; poly_loop_starts.len()];
+    let mut max_vert = 0;
+    for &f_idx in selected_faces {
+        is_selected[f_idx as usize] = true;
+        for &v in face_loops(f_idx as usize) {
+            max_vert = max_vert.max(v);
         }
     }
-    result_colors
+
+    let mut is_region_vert = vec![false; max_vert as usize + 1];
+    for &f_idx in selected_faces {
+        for &v in face_loops(f_idx as usize) {
+            is_region_vert[v as usize] = true;
+        }
+    }
+
+    let mut region = selected_faces.to_vec();
+    for (f_idx, &selected) in is_selected.iter().enumerate() {
+        if selected {
+            continue;
+        }
+        let touches = face_loops(f_idx)
+            .iter()
+            .any(|&v| is_region_vert.get(v as usize).copied().unwrap_or(false));
+        if touches {
+            region.push(f_idx as u32);
+        }
+    }
+    region
 }
 
 #[cfg(test)]
@@ -304,9 +542,9 @@ mod tests {
     fn get_face_color(
         colors: &[f32],
         face_idx: usize,
-        poly_loop_starts: &[usize],
+        poly_loop_starts: &[u32],
     ) -> (f32, f32, f32) {
-        let start = poly_loop_starts[face_idx];
+        let start = poly_loop_starts[face_idx] as usize;
         let offset = start * 4;
         (colors[offset], colors[offset + 1], colors[offset + 2])
     }
@@ -323,10 +561,10 @@ mod tests {
 
         let colors = bake_color_id_all(
             num_faces,
-            poly_loop_starts,
-            poly_loop_totals,
-            loop_vert_indices,
-            uv_coords,
+            &poly_loop_starts,
+            &poly_loop_totals,
+            &loop_vert_indices,
+            &uv_coords,
         );
 
         // Verify: Data length is Loop count (3) * 4 (RGBA) = 12
@@ -358,10 +596,10 @@ mod tests {
 
         let colors = bake_color_id_all(
             num_faces,
-            poly_loop_starts.clone(),
-            poly_loop_totals,
-            loop_vert_indices,
-            uv_coords,
+            &poly_loop_starts,
+            &poly_loop_totals,
+            &loop_vert_indices,
+            &uv_coords,
         );
 
         // Verify: UVs are connected, so same island = same color
@@ -393,10 +631,10 @@ mod tests {
 
         let colors = bake_color_id_all(
             num_faces,
-            poly_loop_starts.clone(),
-            poly_loop_totals,
-            loop_vert_indices,
-            uv_coords,
+            &poly_loop_starts,
+            &poly_loop_totals,
+            &loop_vert_indices,
+            &uv_coords,
         );
 
         // Verify:
@@ -411,6 +649,186 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_island_count_matches_generated_meshes() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        for (kind, seed) in [
+            (MeshKind::Grid, 3),
+            (MeshKind::Checker, 0),
+            (MeshKind::Torus, 5),
+            (MeshKind::Fan, 11),
+            (MeshKind::Scatter, 13),
+        ] {
+            let mesh = generate(kind, 24, 9, 0.25, seed);
+            let edge_map = build_edge_map(
+                mesh.num_faces(),
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &mesh.loop_vert_indices,
+            );
+            let (mut dsu, _) = detect_uv_islands(
+                mesh.num_faces(),
+                &edge_map,
+                &mesh.loop_vert_indices,
+                &mesh.uv_coords,
+            );
+            assert_eq!(
+                dsu.groups().len(),
+                mesh.num_islands,
+                "island count mismatch for {:?}",
+                kind
+            );
+        }
+    }
+
+    #[test]
+    fn test_island_coloring_drives_result_colors() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        let mesh = generate(MeshKind::Checker, 5, 4, 0.0, 0);
+        let num_faces = mesh.num_faces();
+        let coloring = compute_island_coloring(
+            num_faces,
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.loop_vert_indices,
+            &mesh.uv_coords,
+        );
+
+        assert_eq!(coloring.num_islands, mesh.num_islands);
+        assert_eq!(coloring.face_islands.len(), num_faces);
+        // Compact numbering in order of first appearance
+        assert_eq!(coloring.face_islands[0], 0);
+        assert!(
+            coloring
+                .face_islands
+                .iter()
+                .all(|&i| (i as usize) < coloring.num_islands)
+        );
+
+        let mut colors = vec![0.0f32; mesh.num_loops() * 4];
+        generate_result_colors(
+            num_faces,
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &coloring.face_colors,
+            &mut colors,
+        );
+        // Faces of one island share a color, and the corners carry the face color
+        let mut island_colors = HashMap::new();
+        for f_idx in 0..num_faces {
+            let color = coloring.face_colors[f_idx];
+            let island = coloring.face_islands[f_idx];
+            assert_eq!(*island_colors.entry(island).or_insert(color), color);
+
+            let (r, g, b) = get_face_color(&colors, f_idx, &mesh.poly_loop_starts);
+            let expected = get_golden_ratio_color(color as usize);
+            assert_eq!((r, g, b), (expected.0, expected.1, expected.2));
+        }
+    }
+
+    #[test]
+    fn test_region_bake_writes_selection_only() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        // 4x3 checker: every cell is its own island
+        let mesh = generate(MeshKind::Checker, 4, 3, 0.0, 0);
+        let selected = [0u32, 1, 5];
+        let mut colors = vec![-1.0f32; mesh.num_loops() * 4];
+
+        bake_color_id_region(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.loop_vert_indices,
+            &mesh.uv_coords,
+            &selected,
+            &mut colors,
+        );
+
+        for f_idx in 0..mesh.num_faces() {
+            let (r, _, _) = get_face_color(&colors, f_idx, &mesh.poly_loop_starts);
+            if selected.contains(&(f_idx as u32)) {
+                assert!(r >= 0.0, "selected face {} not written", f_idx);
+            } else {
+                assert_eq!(r, -1.0, "unselected face {} was written", f_idx);
+            }
+        }
+        // Faces 0 and 1 and faces 1 and 5 are adjacent islands
+        let c0 = get_face_color(&colors, 0, &mesh.poly_loop_starts);
+        let c1 = get_face_color(&colors, 1, &mesh.poly_loop_starts);
+        let c5 = get_face_color(&colors, 5, &mesh.poly_loop_starts);
+        assert_ne!(c0, c1);
+        assert_ne!(c1, c5);
+    }
+
+    #[test]
+    fn test_region_faces_adds_one_ring() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        let mesh = generate(MeshKind::Grid, 5, 5, 0.0, 0);
+        // Center cell of a 5x5 grid
+        let region = region_faces(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.loop_vert_indices,
+            &[12],
+        );
+        assert_eq!(region[0], 12);
+        let mut ring = region[1..].to_vec();
+        ring.sort_unstable();
+        assert_eq!(ring, vec![6, 7, 8, 11, 13, 16, 17, 18]);
+    }
+
+    #[test]
+    fn test_bake_color_id_layers_matches_single_bakes() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        // Same topology, different seams per layer
+        let mesh_a = generate(MeshKind::Grid, 12, 8, 0.0, 0);
+        let mesh_b = generate(MeshKind::Grid, 12, 8, 0.3, 7);
+        assert_eq!(mesh_a.loop_vert_indices, mesh_b.loop_vert_indices);
+
+        let num_faces = mesh_a.num_faces();
+        let mut colors_a = vec![0.0f32; mesh_a.num_loops() * 4];
+        let mut colors_b = vec![0.0f32; mesh_a.num_loops() * 4];
+        bake_color_id_layers(
+            num_faces,
+            &mesh_a.poly_loop_starts,
+            &mesh_a.poly_loop_totals,
+            &mesh_a.loop_vert_indices,
+            &[&mesh_a.uv_coords, &mesh_b.uv_coords],
+            &mut [&mut colors_a, &mut colors_b],
+        );
+
+        // Layer A has no seams: one island, one color
+        let first = get_face_color(&colors_a, 0, &mesh_a.poly_loop_starts);
+        for f_idx in 0..num_faces {
+            assert_eq!(
+                get_face_color(&colors_a, f_idx, &mesh_a.poly_loop_starts),
+                first
+            );
+        }
+        // Layer B is split into islands, so more than one color shows up
+        assert!((0..num_faces).any(|f_idx| get_face_color(
+            &colors_b,
+            f_idx,
+            &mesh_a.poly_loop_starts
+        ) != first));
+    }
+
+    #[test]
+    fn test_selected_island_mask() {
+        let face_islands = vec![0, 0, 1, 2, 2, 3];
+        let face_select = vec![0, 1, 0, 1, 1, 0];
+        let mut island_mask = vec![0; 4];
+
+        let num_selected = selected_island_mask(&face_islands, &face_select, &mut island_mask);
+
+        assert_eq!(num_selected, 2);
+        assert_eq!(island_mask, vec![1, 0, 1, 0]);
+    }
+
     #[test]
     fn test_edge_key_order() {
         // Confirm internal structure logic
@@ -0,0 +1,340 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! UV stretch (distortion) analysis
+//!
+//! Every face is fan-triangulated and the Jacobian of the map from UV to 3D is
+//! taken per triangle. Its singular values s1 >= s2 give:
+//! - angle distortion: 1 - s2 / s1 (0 for a conformal map)
+//! - area distortion: 1 - min(q, 1 / q) with q = s1 * s2 relative to the
+//!   3D / UV area ratio of the island (so uniform island scale is not distortion)
+//!
+//! Both are in [0, 1] and area-weighted per face; faces are processed on all cores.
+
+use crate::algorithm::color_id::hsv_to_rgb;
+use crate::algorithm::raster::worker_count;
+use std::thread;
+
+/// UV triangles below this area are degenerate and count as fully distorted
+const MIN_UV_AREA: f32 = 1e-12;
+
+/// Per-face measures
+#[derive(Debug, Clone, Copy, Default)]
+pub struct FaceMeasure {
+    pub area_3d: f32,
+    pub area_uv: f32,
+    /// Angle distortion, area-weighted over the triangles of the face
+    pub angle: f32,
+}
+
+/// Summary of an island; means are weighted by 3D area
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct IslandDistortion {
+    pub area_3d: f32,
+    pub area_uv: f32,
+    pub mean_area: f32,
+    pub mean_angle: f32,
+    pub max_area: f32,
+    pub max_angle: f32,
+}
+
+pub struct Distortion {
+    /// Area distortion of each face
+    pub face_area: Vec<f32>,
+    /// Angle distortion of each face
+    pub face_angle: Vec<f32>,
+    pub islands: Vec<IslandDistortion>,
+}
+
+/// Computes area and angle distortion of every face and their island summaries
+/// `positions` are flat vertex coordinates (x, y, z); `face_islands` are the compact
+/// island indices of `color_id::compute_island_coloring`.
+#[allow(clippy::too_many_arguments)]
+pub fn compute_distortion(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> Distortion {
+    let num_faces = poly_loop_starts.len();
+    let measures = measure_faces(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+    );
+
+    let mut islands = vec![IslandDistortion::default(); num_islands];
+    for (measure, &island) in measures.iter().zip(face_islands) {
+        let island = &mut islands[island as usize];
+        island.area_3d += measure.area_3d;
+        island.area_uv += measure.area_uv;
+    }
+
+    let mut face_area = Vec::with_capacity(num_faces);
+    let mut face_angle = Vec::with_capacity(num_faces);
+    for (measure, &island) in measures.iter().zip(face_islands) {
+        let island = &mut islands[island as usize];
+        let area = area_distortion(measure, island.area_3d, island.area_uv);
+
+        let weight = measure.area_3d;
+        island.mean_area += area * weight;
+        island.mean_angle += measure.angle * weight;
+        island.max_area = island.max_area.max(area);
+        island.max_angle = island.max_angle.max(measure.angle);
+
+        face_area.push(area);
+        face_angle.push(measure.angle);
+    }
+    for island in &mut islands {
+        if island.area_3d > 0.0 {
+            island.mean_area /= island.area_3d;
+            island.mean_angle /= island.area_3d;
+        }
+    }
+
+    Distortion {
+        face_area,
+        face_angle,
+        islands,
+    }
+}
+
+/// 3D area, UV area and angle distortion of every face, computed on all cores
+pub fn measure_faces(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+) -> Vec<FaceMeasure> {
+    let num_faces = poly_loop_starts.len();
+    let mut measures = vec![FaceMeasure::default(); num_faces];
+    if num_faces == 0 {
+        return measures;
+    }
+    let chunk_len = num_faces.div_ceil(worker_count());
+
+    thread::scope(|scope| {
+        for (c_idx, chunk) in measures.chunks_mut(chunk_len).enumerate() {
+            scope.spawn(move || {
+                let first_face = c_idx * chunk_len;
+                for (i, measure) in chunk.iter_mut().enumerate() {
+                    let f_idx = first_face + i;
+                    *measure = measure_face(
+                        poly_loop_starts[f_idx] as usize,
+                        poly_loop_totals[f_idx] as usize,
+                        loop_vert_indices,
+                        positions,
+                        uv_coords,
+                    );
+                }
+            });
+        }
+    });
+    measures
+}
+
+fn measure_face(
+    start: usize,
+    total: usize,
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+) -> FaceMeasure {
+    let position = |loop_idx: usize| {
+        let v = loop_vert_indices[loop_idx] as usize * 3;
+        [positions[v], positions[v + 1], positions[v + 2]]
+    };
+    let uv = |loop_idx: usize| (uv_coords[loop_idx * 2], uv_coords[loop_idx * 2 + 1]);
+
+    let mut measure = FaceMeasure::default();
+    let (p0, uv0) = (position(start), uv(start));
+    for i in 1..total.saturating_sub(1) {
+        let (p1, p2) = (position(start + i), position(start + i + 1));
+        let (uv1, uv2) = (uv(start + i), uv(start + i + 1));
+
+        let e1 = sub(p1, p0);
+        let e2 = sub(p2, p0);
+        let area_3d = 0.5 * length(cross(e1, e2));
+        let (du1, dv1) = (uv1.0 - uv0.0, uv1.1 - uv0.1);
+        let (du2, dv2) = (uv2.0 - uv0.0, uv2.1 - uv0.1);
+        let det_uv = du1 * dv2 - du2 * dv1;
+
+        measure.area_3d += area_3d;
+        measure.area_uv += 0.5 * det_uv.abs();
+        let angle = if 0.5 * det_uv.abs() < MIN_UV_AREA {
+            1.0
+        } else {
+            let (s1, s2) = jacobian_singular_values(e1, e2, du1, dv1, du2, dv2, det_uv);
+            if s1 > 0.0 { 1.0 - s2 / s1 } else { 1.0 }
+        };
+        measure.angle += angle * area_3d;
+    }
+    if measure.area_3d > 0.0 {
+        measure.angle /= measure.area_3d;
+    }
+    measure
+}
+
+/// Singular values (s1 >= s2) of the 3x2 Jacobian of the UV -> 3D map of a triangle
+/// with 3D edges e1, e2 and UV edges (du1, dv1), (du2, dv2)
+#[inline]
+fn jacobian_singular_values(
+    e1: [f32; 3],
+    e2: [f32; 3],
+    du1: f32,
+    dv1: f32,
+    du2: f32,
+    dv2: f32,
+    det_uv: f32,
+) -> (f32, f32) {
+    // J = [e1 e2] * inverse([[du1, du2], [dv1, dv2]])
+    let inv = 1.0 / det_uv;
+    let ju = scale(sub(scale(e1, dv2), scale(e2, dv1)), inv);
+    let jv = scale(sub(scale(e2, du1), scale(e1, du2)), inv);
+
+    // Eigenvalues of J^T J are the squared singular values
+    let (a, b, c) = (dot(ju, ju), dot(ju, jv), dot(jv, jv));
+    let mean = 0.5 * (a + c);
+    let radius = (0.25 * (a - c) * (a - c) + b * b).sqrt();
+    ((mean + radius).sqrt(), (mean - radius).max(0.0).sqrt())
+}
+
+#[inline]
+fn area_distortion(measure: &FaceMeasure, island_area_3d: f32, island_area_uv: f32) -> f32 {
+    if measure.area_3d <= 0.0 {
+        return 0.0;
+    }
+    if measure.area_uv < MIN_UV_AREA || island_area_uv <= 0.0 || island_area_3d <= 0.0 {
+        return 1.0;
+    }
+    let ratio = (measure.area_3d / measure.area_uv) / (island_area_3d / island_area_uv);
+    1.0 - ratio.min(1.0 / ratio)
+}
+
+/// Writes corner colors (total loops * 4) of a blue (0) to red (1) heatmap of `face_values`
+pub fn heatmap_colors(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    face_values: &[f32],
+    result_colors: &mut [f32],
+) {
+    for (f_idx, &value) in face_values.iter().enumerate() {
+        let (r, g, b) = heatmap_color(value);
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for out in result_colors[start * 4..end * 4].chunks_exact_mut(4) {
+            out.copy_from_slice(&[r, g, b, 1.0]);
+        }
+    }
+}
+
+/// Same hue ramp as Blender's UV stretch overlay: blue (0) over green to red (1)
+#[inline]
+fn heatmap_color(value: f32) -> (f32, f32, f32) {
+    let value = if value.is_nan() {
+        1.0
+    } else {
+        value.clamp(0.0, 1.0)
+    };
+    hsv_to_rgb((1.0 - value) * 2.0 / 3.0, 1.0, 1.0)
+}
+
+#[inline]
+pub(crate) fn sub(a: [f32; 3], b: [f32; 3]) -> [f32; 3] {
+    [a[0] - b[0], a[1] - b[1], a[2] - b[2]]
+}
+
+#[inline]
+pub(crate) fn scale(a: [f32; 3], s: f32) -> [f32; 3] {
+    [a[0] * s, a[1] * s, a[2] * s]
+}
+
+#[inline]
+pub(crate) fn dot(a: [f32; 3], b: [f32; 3]) -> f32 {
+    a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+}
+
+#[inline]
+pub(crate) fn cross(a: [f32; 3], b: [f32; 3]) -> [f32; 3] {
+    [
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ]
+}
+
+#[inline]
+pub(crate) fn length(a: [f32; 3]) -> f32 {
+    dot(a, a).sqrt()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Unit square in 3D (z = 0), one quad
+    const POSITIONS: [f32; 12] = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0];
+
+    fn distortion_of(uvs: &[f32]) -> Distortion {
+        compute_distortion(&[0], &[4], &[0, 1, 2, 3], &POSITIONS, uvs, &[0], 1)
+    }
+
+    #[test]
+    fn uniform_scale_is_not_distortion() {
+        let result = distortion_of(&[0.0, 0.0, 0.5, 0.0, 0.5, 0.5, 0.0, 0.5]);
+
+        assert!(result.face_area[0].abs() < 1e-6);
+        assert!(result.face_angle[0].abs() < 1e-6);
+        assert!((result.islands[0].area_3d - 1.0).abs() < 1e-6);
+        assert!((result.islands[0].area_uv - 0.25).abs() < 1e-6);
+    }
+
+    #[test]
+    fn non_uniform_scale_is_angle_distortion() {
+        // Squashed to half height: s1 / s2 = 2
+        let result = distortion_of(&[0.0, 0.0, 1.0, 0.0, 1.0, 0.5, 0.0, 0.5]);
+
+        assert!((result.face_angle[0] - 0.5).abs() < 1e-5);
+        assert!(result.face_area[0].abs() < 1e-6);
+    }
+
+    #[test]
+    fn area_distortion_is_relative_to_the_island() {
+        // Two unit quads side by side in 3D; the second is 4x smaller in UV
+        let positions = [
+            0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 2.0, 0.0, 0.0, 2.0, 1.0,
+            0.0,
+        ];
+        let verts = [0, 1, 2, 3, 1, 4, 5, 2];
+        let uvs = [
+            0.0, 0.0, 0.4, 0.0, 0.4, 0.4, 0.0, 0.4, // first quad
+            0.4, 0.0, 0.6, 0.0, 0.6, 0.2, 0.4, 0.2, // second quad
+        ];
+        let result = compute_distortion(&[0, 4], &[4, 4], &verts, &positions, &uvs, &[0, 0], 1);
+
+        assert!(result.face_area[0] > 0.0 && result.face_area[1] > 0.0);
+        assert!(result.face_area[1] > result.face_area[0]);
+        assert!(result.islands[0].max_area >= result.face_area[1]);
+        // Uniform per-face scale: no angle distortion
+        assert!(result.face_angle.iter().all(|a| a.abs() < 1e-5));
+    }
+
+    #[test]
+    fn degenerate_uvs_are_fully_distorted() {
+        let result = distortion_of(&[0.5; 8]);
+
+        assert_eq!(result.face_angle[0], 1.0);
+        assert_eq!(result.face_area[0], 1.0);
+    }
+
+    #[test]
+    fn heatmap_ends() {
+        assert_eq!(heatmap_color(0.0), (0.0, 0.0, 1.0));
+        assert_eq!(heatmap_color(1.0), (1.0, 0.0, 0.0));
+    }
+}
@@ -2,6 +2,9 @@
 
 //! A Disjoint set union (DSU) with union by size and path compression.
 //! Original source: https://github.com/rust-lang-ja/ac-library-rs/blob/master/src/dsu.rs
+//!
+//! Modified: the recursive find is replaced by an iterative path-halving find,
+//! so long parent chains on huge meshes cannot overflow the stack.
 
 /// A Disjoint set union (DSU) with union by size and path compression.
 ///
@@ -176,12 +179,18 @@ impl Dsu {
             .collect::<Vec<Vec<usize>>>()
     }
 
-    fn _leader(&mut self, a: usize) -> usize {
-        if self.parent_or_size[a] < 0 {
-            return a;
+    /// Path halving: every visited node is re-linked to its grandparent.
+    fn _leader(&mut self, mut a: usize) -> usize {
+        while self.parent_or_size[a] >= 0 {
+            let parent = self.parent_or_size[a] as usize;
+            let grandparent = self.parent_or_size[parent];
+            if grandparent < 0 {
+                return parent;
+            }
+            self.parent_or_size[a] = grandparent;
+            a = grandparent as usize;
         }
-        self.parent_or_size[a] = self._leader(self.parent_or_size[a] as usize) as i32;
-        self.parent_or_size[a] as usize
+        a
     }
 }
 
@@ -200,4 +209,20 @@ mod tests {
         assert!(!d.same(0, 3));
         assert_eq!(d.groups(), vec![vec![0, 1, 2], vec![3]]);
     }
+
+    #[test]
+    fn dsu_long_chain_does_not_overflow() {
+        // Build a degenerate parent chain directly; union by size never produces one,
+        // but a recursive find would need one stack frame per link.
+        let n = 1_000_000;
+        let mut d = Dsu::new(n);
+        for i in 0..n - 1 {
+            d.parent_or_size[i] = (i + 1) as i32;
+        }
+        d.parent_or_size[n - 1] = -(n as i32);
+
+        assert_eq!(d.leader(0), n - 1);
+        assert_eq!(d.size(0), n);
+        assert!(d.same(0, n / 2));
+    }
 }
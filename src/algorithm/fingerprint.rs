@@ -0,0 +1,182 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Fast non-cryptographic 64-bit fingerprint of mesh buffers
+//!
+//! Uses the xxHash64 round and avalanche functions over four independent lanes,
+//! so a single pass streams several GB/s. Buffers are fed one after another with
+//! `write_u32s` / `write_f32s`; each write is delimited by its length.
+
+const PRIME_1: u64 = 0x9E37_79B1_85EB_CA87;
+const PRIME_2: u64 = 0xC2B2_AE3D_27D4_EB4F;
+const PRIME_3: u64 = 0x1656_67B1_9E37_79F9;
+const PRIME_4: u64 = 0x85EB_CA77_C2B2_AE63;
+const PRIME_5: u64 = 0x27D4_EB2F_1656_67C5;
+
+#[inline(always)]
+fn round(acc: u64, input: u64) -> u64 {
+    acc.wrapping_add(input.wrapping_mul(PRIME_2))
+        .rotate_left(31)
+        .wrapping_mul(PRIME_1)
+}
+
+#[inline(always)]
+fn merge_round(acc: u64, lane: u64) -> u64 {
+    (acc ^ round(0, lane))
+        .wrapping_mul(PRIME_1)
+        .wrapping_add(PRIME_4)
+}
+
+#[inline(always)]
+fn pack(lo: u32, hi: u32) -> u64 {
+    lo as u64 | (hi as u64) << 32
+}
+
+/// Streaming hasher for 32-bit mesh buffers
+#[derive(Debug, Clone)]
+pub struct Fingerprint {
+    lanes: [u64; 4],
+    total_len: u64,
+}
+
+impl Default for Fingerprint {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl Fingerprint {
+    pub fn new() -> Self {
+        Self {
+            lanes: [
+                PRIME_1.wrapping_add(PRIME_2),
+                PRIME_2,
+                0,
+                0u64.wrapping_sub(PRIME_1),
+            ],
+            total_len: 0,
+        }
+    }
+
+    /// Feeds an index buffer
+    pub fn write_u32s(&mut self, words: &[u32]) {
+        let mut chunks = words.chunks_exact(8);
+        for c in &mut chunks {
+            self.lanes[0] = round(self.lanes[0], pack(c[0], c[1]));
+            self.lanes[1] = round(self.lanes[1], pack(c[2], c[3]));
+            self.lanes[2] = round(self.lanes[2], pack(c[4], c[5]));
+            self.lanes[3] = round(self.lanes[3], pack(c[6], c[7]));
+        }
+        // Tail words are tagged with their position so that [a, 0] != [a]
+        for (i, &w) in chunks.remainder().iter().enumerate() {
+            self.lanes[i % 4] = round(self.lanes[i % 4], pack(w, i as u32 + 1));
+        }
+        // Delimit buffers: ([a, b], [c]) and ([a], [b, c]) hash differently
+        self.lanes[0] = round(self.lanes[0], words.len() as u64);
+        self.total_len += words.len() as u64;
+    }
+
+    /// Feeds a float buffer by its bit patterns (0.0 and -0.0 differ)
+    pub fn write_f32s(&mut self, values: &[f32]) {
+        // SAFETY: f32 and u32 share size and alignment, and every bit pattern is a valid u32.
+        let words =
+            unsafe { std::slice::from_raw_parts(values.as_ptr() as *const u32, values.len()) };
+        self.write_u32s(words);
+    }
+
+    pub fn finish(&self) -> u64 {
+        let [v1, v2, v3, v4] = self.lanes;
+        let mut h = v1
+            .rotate_left(1)
+            .wrapping_add(v2.rotate_left(7))
+            .wrapping_add(v3.rotate_left(12))
+            .wrapping_add(v4.rotate_left(18));
+        for lane in self.lanes {
+            h = merge_round(h, lane);
+        }
+        h = h.wrapping_add(self.total_len).wrapping_add(PRIME_5);
+
+        // Avalanche
+        h ^= h >> 33;
+        h = h.wrapping_mul(PRIME_2);
+        h ^= h >> 29;
+        h = h.wrapping_mul(PRIME_3);
+        h ^= h >> 32;
+        h
+    }
+}
+
+/// Fingerprint of the topology and UV buffers consumed by the Color ID bake
+pub fn fingerprint_mesh(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+) -> u64 {
+    let mut hasher = Fingerprint::new();
+    hasher.write_u32s(poly_loop_starts);
+    hasher.write_u32s(poly_loop_totals);
+    hasher.write_u32s(loop_vert_indices);
+    hasher.write_f32s(uv_coords);
+    hasher.finish()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn hash_u32s(words: &[u32]) -> u64 {
+        let mut hasher = Fingerprint::new();
+        hasher.write_u32s(words);
+        hasher.finish()
+    }
+
+    #[test]
+    fn fingerprint_is_deterministic() {
+        let data: Vec<u32> = (0..1000).collect();
+        assert_eq!(hash_u32s(&data), hash_u32s(&data));
+    }
+
+    #[test]
+    fn fingerprint_detects_single_changes() {
+        let data: Vec<u32> = (0..1003).collect();
+        let base = hash_u32s(&data);
+        // Changes in the vectorized body and in the tail
+        for pos in [0, 5, 500, 1001, 1002] {
+            let mut changed = data.clone();
+            changed[pos] ^= 1;
+            assert_ne!(base, hash_u32s(&changed), "change at {} not detected", pos);
+        }
+    }
+
+    #[test]
+    fn fingerprint_respects_buffer_boundaries() {
+        let mut a = Fingerprint::new();
+        a.write_u32s(&[1, 2]);
+        a.write_u32s(&[3]);
+        let mut b = Fingerprint::new();
+        b.write_u32s(&[1]);
+        b.write_u32s(&[2, 3]);
+        assert_ne!(a.finish(), b.finish());
+
+        assert_ne!(hash_u32s(&[7]), hash_u32s(&[7, 0]));
+        assert_ne!(hash_u32s(&[]), hash_u32s(&[0]));
+    }
+
+    #[test]
+    fn fingerprint_mesh_covers_uvs() {
+        use crate::mesh_gen::{MeshKind, generate};
+
+        let mut mesh = generate(MeshKind::Grid, 16, 16, 0.1, 2);
+        let fingerprint = |m: &crate::mesh_gen::SyntheticMesh| {
+            fingerprint_mesh(
+                &m.poly_loop_starts,
+                &m.poly_loop_totals,
+                &m.loop_vert_indices,
+                &m.uv_coords,
+            )
+        };
+        let base = fingerprint(&mesh);
+        mesh.uv_coords[10] += 1e-6;
+        assert_ne!(base, fingerprint(&mesh));
+    }
+}
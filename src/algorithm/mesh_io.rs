@@ -0,0 +1,928 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! OBJ and PLY readers
+//!
+//! Both parse the whole file as one byte slice, which the caller memory-maps. OBJ files
+//! and ASCII PLY bodies are cut at line breaks into one chunk per core and the chunks
+//! are parsed in parallel; OBJ indices counting back from the end (negative) are
+//! resolved once the vertex counts of the earlier chunks are known. Binary PLY vertices
+//! have a fixed size and are decoded in parallel, too. The result has Blender's
+//! `foreach_get` layout, so it feeds the same island functions as a Blender mesh.
+
+use crate::algorithm::raster::worker_count;
+use std::thread;
+
+/// Chunks smaller than this are not worth a thread
+const MIN_CHUNK_BYTES: usize = 1 << 16;
+
+/// Flat mesh buffers in Blender's foreach_get layout
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct MeshData {
+    pub positions: Vec<f32>,
+    pub poly_loop_starts: Vec<u32>,
+    pub poly_loop_totals: Vec<u32>,
+    pub loop_vert_indices: Vec<u32>,
+    pub uv_coords: Vec<f32>,
+}
+
+impl MeshData {
+    pub fn num_verts(&self) -> usize {
+        self.positions.len() / 3
+    }
+
+    pub fn num_faces(&self) -> usize {
+        self.poly_loop_starts.len()
+    }
+
+    pub fn num_loops(&self) -> usize {
+        self.loop_vert_indices.len()
+    }
+
+    /// Fills the loop starts from the totals
+    fn with_starts(mut self) -> Self {
+        let mut start = 0;
+        self.poly_loop_starts = self
+            .poly_loop_totals
+            .iter()
+            .map(|&total| {
+                let current = start;
+                start += total;
+                current
+            })
+            .collect();
+        self
+    }
+}
+
+/// Parses `bytes` as the format of the file extension ("obj" or "ply", any case)
+pub fn parse_mesh(bytes: &[u8], extension: &str) -> Result<MeshData, String> {
+    match extension.to_ascii_lowercase().as_str() {
+        "obj" => parse_obj(bytes),
+        "ply" => parse_ply(bytes),
+        _ => Err(format!(
+            "Unsupported mesh file extension '{}', expected obj or ply",
+            extension
+        )),
+    }
+}
+
+/// Cuts `bytes` after line breaks into about one chunk per core
+fn line_chunks(bytes: &[u8]) -> Vec<&[u8]> {
+    split_lines(
+        bytes,
+        bytes.len().div_ceil(worker_count()).max(MIN_CHUNK_BYTES),
+    )
+}
+
+/// Cuts `bytes` into chunks of at least `target` bytes that end after a line break
+fn split_lines(bytes: &[u8], target: usize) -> Vec<&[u8]> {
+    let mut chunks = Vec::new();
+    let mut rest = bytes;
+    while !rest.is_empty() {
+        let end = if rest.len() <= target {
+            rest.len()
+        } else {
+            rest[target..]
+                .iter()
+                .position(|&b| b == b'\n')
+                .map_or(rest.len(), |pos| target + pos + 1)
+        };
+        let (chunk, tail) = rest.split_at(end);
+        chunks.push(chunk);
+        rest = tail;
+    }
+    chunks
+}
+
+/// Runs `f` on every chunk on its own thread, keeping the chunk order
+fn parse_chunks<'a, T: Send>(
+    chunks: &[&'a [u8]],
+    f: impl Fn(&'a [u8]) -> Result<T, String> + Sync,
+) -> Result<Vec<T>, String> {
+    if chunks.len() < 2 {
+        return chunks.iter().map(|&chunk| f(chunk)).collect();
+    }
+    let f = &f;
+    thread::scope(|scope| {
+        let handles: Vec<_> = chunks
+            .iter()
+            .map(|&chunk| scope.spawn(move || f(chunk)))
+            .collect();
+        handles.into_iter().map(|h| h.join().unwrap()).collect()
+    })
+}
+
+fn tokens(line: &[u8]) -> impl Iterator<Item = &[u8]> {
+    line.split(|b| b.is_ascii_whitespace())
+        .filter(|token| !token.is_empty())
+}
+
+fn parse_number<T: std::str::FromStr>(token: &[u8]) -> Result<T, String> {
+    std::str::from_utf8(token)
+        .ok()
+        .and_then(|text| text.parse().ok())
+        .ok_or_else(|| format!("Invalid number '{}'", String::from_utf8_lossy(token)))
+}
+
+// ---------------------------------------------------------------------------------------
+// OBJ
+
+/// Offset that keeps encoded chunk-relative indices negative, see `ObjChunk`
+const RELATIVE_BIAS: i64 = 1 << 40;
+
+/// What one chunk of an OBJ file defines
+/// Corner indices are 0-based and absolute (>= 0), or relative to the first vertex of
+/// the chunk, encoded as `-1 - (index + RELATIVE_BIAS)`, for negative OBJ indices.
+#[derive(Default)]
+struct ObjChunk {
+    positions: Vec<f32>,
+    uvs: Vec<f32>,
+    totals: Vec<u32>,
+    corner_verts: Vec<i64>,
+    corner_uvs: Vec<i64>,
+}
+
+impl ObjChunk {
+    fn parse(bytes: &[u8]) -> Result<Self, String> {
+        let mut chunk = Self::default();
+        for line in bytes.split(|&b| b == b'\n') {
+            let mut fields = tokens(line);
+            match fields.next() {
+                Some(b"v") => {
+                    for _ in 0..3 {
+                        let value = fields.next().ok_or("Vertex with less than 3 coordinates")?;
+                        chunk.positions.push(parse_number(value)?);
+                    }
+                }
+                Some(b"vt") => {
+                    let u = fields.next().ok_or("UV without coordinates")?;
+                    chunk.uvs.push(parse_number(u)?);
+                    chunk.uvs.push(fields.next().map_or(Ok(0.0), parse_number)?);
+                }
+                Some(b"f") => {
+                    let num_verts = chunk.positions.len() as i64 / 3;
+                    let num_uvs = chunk.uvs.len() as i64 / 2;
+                    let mut total = 0;
+                    for corner in fields {
+                        let mut parts = corner.split(|&b| b == b'/');
+                        let vert = parts.next().unwrap_or_default();
+                        let uv = parts.next().unwrap_or_default();
+                        if uv.is_empty() {
+                            return Err(format!(
+                                "Face corner '{}' has no UV index (vt)",
+                                String::from_utf8_lossy(corner)
+                            ));
+                        }
+                        chunk
+                            .corner_verts
+                            .push(obj_index(parse_index(vert)?, num_verts)?);
+                        chunk.corner_uvs.push(obj_index(parse_index(uv)?, num_uvs)?);
+                        total += 1;
+                    }
+                    if total < 3 {
+                        return Err("Face with less than 3 corners".to_string());
+                    }
+                    chunk.totals.push(total);
+                }
+                _ => {}
+            }
+        }
+        Ok(chunk)
+    }
+}
+
+/// Parses a signed decimal OBJ index without going through `str`
+fn parse_index(token: &[u8]) -> Result<i64, String> {
+    let (negative, digits) = match token.split_first() {
+        Some((b'-', digits)) => (true, digits),
+        _ => (false, token),
+    };
+    if digits.is_empty() || digits.len() > 18 {
+        return parse_number(token);
+    }
+    let mut value = 0i64;
+    for &b in digits {
+        if !b.is_ascii_digit() {
+            return parse_number(token);
+        }
+        value = value * 10 + (b - b'0') as i64;
+    }
+    Ok(if negative { -value } else { value })
+}
+
+/// Encodes a 1-based OBJ index, see `ObjChunk`
+fn obj_index(index: i64, local_count: i64) -> Result<i64, String> {
+    match index {
+        0 => Err("OBJ indices start at 1, found 0".to_string()),
+        i if i > 0 => Ok(i - 1),
+        i => Ok(-1 - (local_count + i + RELATIVE_BIAS)),
+    }
+}
+
+/// Decodes an index of `ObjChunk` given the number of elements before the chunk
+fn resolve_obj_index(encoded: i64, offset: usize, count: usize, kind: &str) -> Result<u32, String> {
+    let index = if encoded >= 0 {
+        encoded
+    } else {
+        offset as i64 + (-1 - encoded - RELATIVE_BIAS)
+    };
+    if index < 0 || index as usize >= count {
+        return Err(format!(
+            "Face refers to a {} that does not exist ({} defined)",
+            kind, count
+        ));
+    }
+    Ok(index as u32)
+}
+
+/// Parses vertices, UVs (`vt`) and faces of a Wavefront OBJ file
+/// Every face corner needs a UV index; other statements are ignored.
+pub fn parse_obj(bytes: &[u8]) -> Result<MeshData, String> {
+    parse_obj_chunks(&line_chunks(bytes))
+}
+
+fn parse_obj_chunks(chunks: &[&[u8]]) -> Result<MeshData, String> {
+    let chunks = parse_chunks(chunks, ObjChunk::parse)?;
+
+    // Vertices and UVs before every chunk, and where its loops start
+    let mut offsets = Vec::with_capacity(chunks.len());
+    let (mut num_verts, mut num_uvs, mut num_loops) = (0, 0, 0);
+    for chunk in &chunks {
+        offsets.push((num_verts, num_uvs, num_loops));
+        num_verts += chunk.positions.len() / 3;
+        num_uvs += chunk.uvs.len() / 2;
+        num_loops += chunk.corner_verts.len();
+    }
+
+    let mut mesh = MeshData {
+        positions: Vec::with_capacity(num_verts * 3),
+        loop_vert_indices: vec![0; num_loops],
+        uv_coords: vec![0.0; num_loops * 2],
+        ..Default::default()
+    };
+    let mut uvs = Vec::with_capacity(num_uvs * 2);
+    for chunk in &chunks {
+        mesh.positions.extend_from_slice(&chunk.positions);
+        uvs.extend_from_slice(&chunk.uvs);
+        mesh.poly_loop_totals.extend_from_slice(&chunk.totals);
+    }
+
+    // Resolve the corners of every chunk into its own range of the loop buffers
+    let mut verts_rest = mesh.loop_vert_indices.as_mut_slice();
+    let mut uvs_rest = mesh.uv_coords.as_mut_slice();
+    let uvs = &uvs;
+    thread::scope(|scope| {
+        let mut handles = Vec::with_capacity(chunks.len());
+        for (chunk, &(vert_offset, uv_offset, _)) in chunks.iter().zip(&offsets) {
+            let corners = chunk.corner_verts.len();
+            let (loop_verts, verts_tail) = std::mem::take(&mut verts_rest).split_at_mut(corners);
+            let (loop_uvs, uvs_tail) = std::mem::take(&mut uvs_rest).split_at_mut(corners * 2);
+            verts_rest = verts_tail;
+            uvs_rest = uvs_tail;
+            handles.push(scope.spawn(move || -> Result<(), String> {
+                for (c, (&vert, &uv)) in
+                    chunk.corner_verts.iter().zip(&chunk.corner_uvs).enumerate()
+                {
+                    loop_verts[c] = resolve_obj_index(vert, vert_offset, num_verts, "vertex")?;
+                    let uv = resolve_obj_index(uv, uv_offset, num_uvs, "UV")? as usize;
+                    loop_uvs[c * 2] = uvs[uv * 2];
+                    loop_uvs[c * 2 + 1] = uvs[uv * 2 + 1];
+                }
+                Ok(())
+            }));
+        }
+        handles.into_iter().try_for_each(|h| h.join().unwrap())
+    })?;
+
+    Ok(mesh.with_starts())
+}
+
+// ---------------------------------------------------------------------------------------
+// PLY
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum PlyFormat {
+    Ascii,
+    BinaryLittleEndian,
+    BinaryBigEndian,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Scalar {
+    I8,
+    U8,
+    I16,
+    U16,
+    I32,
+    U32,
+    F32,
+    F64,
+}
+
+impl Scalar {
+    fn from_name(name: &str) -> Option<Self> {
+        match name {
+            "char" | "int8" => Some(Self::I8),
+            "uchar" | "uint8" => Some(Self::U8),
+            "short" | "int16" => Some(Self::I16),
+            "ushort" | "uint16" => Some(Self::U16),
+            "int" | "int32" => Some(Self::I32),
+            "uint" | "uint32" => Some(Self::U32),
+            "float" | "float32" => Some(Self::F32),
+            "double" | "float64" => Some(Self::F64),
+            _ => None,
+        }
+    }
+
+    fn size(self) -> usize {
+        match self {
+            Self::I8 | Self::U8 => 1,
+            Self::I16 | Self::U16 => 2,
+            Self::I32 | Self::U32 | Self::F32 => 4,
+            Self::F64 => 8,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum PropertyType {
+    Scalar(Scalar),
+    /// Count type and item type
+    List(Scalar, Scalar),
+}
+
+/// What a property is used for
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Role {
+    /// Position (0..3) or UV (3..5) component of a vertex
+    Vertex(usize),
+    FaceVerts,
+    /// Per-corner UVs of a face, as u, v pairs
+    FaceUvs,
+    Ignored,
+}
+
+#[derive(Debug, Clone)]
+struct Property {
+    ty: PropertyType,
+    role: Role,
+}
+
+#[derive(Debug, Clone)]
+struct Element {
+    name: String,
+    count: usize,
+    properties: Vec<Property>,
+}
+
+impl Element {
+    /// Size of every record, if no property is a list
+    fn record_size(&self) -> Option<usize> {
+        self.properties.iter().try_fold(0, |size, p| match p.ty {
+            PropertyType::Scalar(scalar) => Some(size + scalar.size()),
+            PropertyType::List(..) => None,
+        })
+    }
+
+    fn has_role(&self, role: Role) -> bool {
+        self.properties.iter().any(|p| p.role == role)
+    }
+}
+
+fn vertex_role(name: &str) -> Role {
+    match name {
+        "x" => Role::Vertex(0),
+        "y" => Role::Vertex(1),
+        "z" => Role::Vertex(2),
+        "s" | "u" | "texture_u" | "texture_s" => Role::Vertex(3),
+        "t" | "v" | "texture_v" | "texture_t" => Role::Vertex(4),
+        _ => Role::Ignored,
+    }
+}
+
+/// Returns the format, the elements and the size of the header
+fn parse_ply_header(bytes: &[u8]) -> Result<(PlyFormat, Vec<Element>, usize), String> {
+    if !bytes.starts_with(b"ply") {
+        return Err("Not a PLY file".to_string());
+    }
+    let mut format = None;
+    let mut elements: Vec<Element> = Vec::new();
+    let mut pos = 0;
+    loop {
+        let line_end = bytes[pos..]
+            .iter()
+            .position(|&b| b == b'\n')
+            .ok_or("PLY header has no end_header")?;
+        let line = std::str::from_utf8(&bytes[pos..pos + line_end])
+            .map_err(|_| "PLY header is not ASCII")?;
+        pos += line_end + 1;
+
+        let fields: Vec<&str> = line.split_ascii_whitespace().collect();
+        match fields.as_slice() {
+            ["end_header"] => break,
+            ["format", name, _] => {
+                format = Some(match *name {
+                    "ascii" => PlyFormat::Ascii,
+                    "binary_little_endian" => PlyFormat::BinaryLittleEndian,
+                    "binary_big_endian" => PlyFormat::BinaryBigEndian,
+                    _ => return Err(format!("Unknown PLY format '{}'", name)),
+                });
+            }
+            ["element", name, count] => elements.push(Element {
+                name: name.to_string(),
+                count: parse_number(count.as_bytes())?,
+                properties: Vec::new(),
+            }),
+            ["property", "list", count_ty, item_ty, name] => {
+                let element = elements
+                    .last_mut()
+                    .ok_or("PLY property before any element")?;
+                let ty = PropertyType::List(scalar_type(count_ty)?, scalar_type(item_ty)?);
+                let role = match (element.name.as_str(), *name) {
+                    ("face", "vertex_indices" | "vertex_index") => Role::FaceVerts,
+                    ("face", "texcoord") => Role::FaceUvs,
+                    _ => Role::Ignored,
+                };
+                element.properties.push(Property { ty, role });
+            }
+            ["property", ty, name] => {
+                let element = elements
+                    .last_mut()
+                    .ok_or("PLY property before any element")?;
+                let role = match element.name.as_str() {
+                    "vertex" => vertex_role(name),
+                    _ => Role::Ignored,
+                };
+                let ty = PropertyType::Scalar(scalar_type(ty)?);
+                element.properties.push(Property { ty, role });
+            }
+            _ => {}
+        }
+    }
+    Ok((format.ok_or("PLY header has no format")?, elements, pos))
+}
+
+fn scalar_type(name: &str) -> Result<Scalar, String> {
+    Scalar::from_name(name).ok_or_else(|| format!("Unknown PLY property type '{}'", name))
+}
+
+/// Values of one element body, ASCII tokens or binary fields
+trait ValueSource {
+    fn value(&mut self, scalar: Scalar) -> Result<f64, String>;
+}
+
+struct AsciiSource<'a, I: Iterator<Item = &'a [u8]>>(I);
+
+impl<'a, I: Iterator<Item = &'a [u8]>> ValueSource for AsciiSource<'a, I> {
+    fn value(&mut self, _scalar: Scalar) -> Result<f64, String> {
+        parse_number(self.0.next().ok_or("PLY record has too few values")?)
+    }
+}
+
+struct BinarySource<'a> {
+    bytes: &'a [u8],
+    pos: usize,
+    big_endian: bool,
+}
+
+impl BinarySource<'_> {
+    fn take<const N: usize>(&mut self) -> Result<[u8; N], String> {
+        let field = self
+            .bytes
+            .get(self.pos..self.pos + N)
+            .ok_or("PLY file ends within its data")?;
+        self.pos += N;
+        let mut array: [u8; N] = field.try_into().unwrap();
+        if self.big_endian {
+            array.reverse();
+        }
+        Ok(array)
+    }
+}
+
+impl ValueSource for BinarySource<'_> {
+    fn value(&mut self, scalar: Scalar) -> Result<f64, String> {
+        Ok(match scalar {
+            Scalar::I8 => i8::from_le_bytes(self.take()?) as f64,
+            Scalar::U8 => u8::from_le_bytes(self.take()?) as f64,
+            Scalar::I16 => i16::from_le_bytes(self.take()?) as f64,
+            Scalar::U16 => u16::from_le_bytes(self.take()?) as f64,
+            Scalar::I32 => i32::from_le_bytes(self.take()?) as f64,
+            Scalar::U32 => u32::from_le_bytes(self.take()?) as f64,
+            Scalar::F32 => f32::from_le_bytes(self.take()?) as f64,
+            Scalar::F64 => f64::from_le_bytes(self.take()?),
+        })
+    }
+}
+
+/// Records of one element, read one after the other
+trait PlyRecords: Default + Send {
+    fn read(&mut self, source: &mut impl ValueSource, element: &Element) -> Result<(), String>;
+}
+
+/// Vertices of a PLY chunk: 3 position values and, if present, 2 UV values each
+#[derive(Default)]
+struct PlyVertices {
+    positions: Vec<f32>,
+    uvs: Vec<f32>,
+}
+
+impl PlyRecords for PlyVertices {
+    fn read(&mut self, source: &mut impl ValueSource, element: &Element) -> Result<(), String> {
+        let mut values = [0.0f32; 5];
+        for property in &element.properties {
+            match (property.ty, property.role) {
+                (PropertyType::Scalar(scalar), Role::Vertex(i)) => {
+                    values[i] = source.value(scalar)? as f32
+                }
+                (PropertyType::Scalar(scalar), _) => {
+                    source.value(scalar)?;
+                }
+                (PropertyType::List(count, item), _) => {
+                    for _ in 0..source.value(count)? as usize {
+                        source.value(item)?;
+                    }
+                }
+            }
+        }
+        self.positions.extend_from_slice(&values[..3]);
+        if element.has_role(Role::Vertex(3)) {
+            self.uvs.extend_from_slice(&values[3..]);
+        }
+        Ok(())
+    }
+}
+
+/// Faces of a PLY chunk, with their per-corner UVs if present
+#[derive(Default)]
+struct PlyFaces {
+    totals: Vec<u32>,
+    verts: Vec<u32>,
+    uvs: Vec<f32>,
+}
+
+impl PlyRecords for PlyFaces {
+    fn read(&mut self, source: &mut impl ValueSource, element: &Element) -> Result<(), String> {
+        for property in &element.properties {
+            match property.ty {
+                PropertyType::Scalar(scalar) => {
+                    source.value(scalar)?;
+                }
+                PropertyType::List(count, item) => {
+                    let count = source.value(count)? as usize;
+                    match property.role {
+                        Role::FaceVerts => {
+                            if count < 3 {
+                                return Err("Face with less than 3 corners".to_string());
+                            }
+                            for _ in 0..count {
+                                let vert = source.value(item)?;
+                                if vert < 0.0 {
+                                    return Err(format!("Negative vertex index {}", vert));
+                                }
+                                self.verts.push(vert as u32);
+                            }
+                            self.totals.push(count as u32);
+                        }
+                        Role::FaceUvs => {
+                            for _ in 0..count {
+                                self.uvs.push(source.value(item)? as f32);
+                            }
+                        }
+                        _ => {
+                            for _ in 0..count {
+                                source.value(item)?;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        Ok(())
+    }
+}
+
+/// Size of the first `count` non-empty lines of `bytes`
+fn lines_len(bytes: &[u8], count: usize) -> Result<usize, String> {
+    let mut pos = 0;
+    let mut found = 0;
+    while found < count {
+        if pos >= bytes.len() {
+            return Err("PLY file ends within its data".to_string());
+        }
+        let end = bytes[pos..]
+            .iter()
+            .position(|&b| b == b'\n')
+            .map_or(bytes.len(), |i| pos + i + 1);
+        if tokens(&bytes[pos..end]).next().is_some() {
+            found += 1;
+        }
+        pos = end;
+    }
+    Ok(pos)
+}
+
+/// Reads the records of one ASCII element body on all cores
+fn read_ascii<T: PlyRecords>(body: &[u8], element: &Element) -> Result<Vec<T>, String> {
+    parse_chunks(&line_chunks(body), |chunk| {
+        let mut records = T::default();
+        for line in chunk.split(|&b| b == b'\n') {
+            let mut fields = tokens(line).peekable();
+            if fields.peek().is_some() {
+                records.read(&mut AsciiSource(fields), element)?;
+            }
+        }
+        Ok(records)
+    })
+}
+
+/// Parses vertices and faces of an ASCII or binary PLY file
+/// UVs are read per face corner (`texcoord` list) or per vertex (s/t, u/v,
+/// texture_u/texture_v); other elements and properties are skipped.
+pub fn parse_ply(bytes: &[u8]) -> Result<MeshData, String> {
+    let (format, elements, header_len) = parse_ply_header(bytes)?;
+    let big_endian = format == PlyFormat::BinaryBigEndian;
+
+    let mut vertices: Vec<PlyVertices> = Vec::new();
+    let mut faces: Vec<PlyFaces> = Vec::new();
+    let (mut vertex_element, mut face_element) = (None, None);
+    let mut pos = header_len;
+    for element in &elements {
+        let body = &bytes[pos..];
+        let is_vertex = element.name == "vertex";
+        let is_face = element.name == "face";
+        if is_vertex {
+            vertex_element = Some(element);
+        } else if is_face {
+            face_element = Some(element);
+        }
+
+        if format == PlyFormat::Ascii {
+            let len = lines_len(body, element.count)?;
+            let body = &body[..len];
+            if is_vertex {
+                vertices = read_ascii(body, element)?;
+            } else if is_face {
+                faces = read_ascii(body, element)?;
+            }
+            pos += len;
+        } else if let (true, Some(size)) = (is_vertex, element.record_size()) {
+            // Fixed-size records: every core decodes its own range of vertices
+            let len = size * element.count;
+            let body = body.get(..len).ok_or("PLY file ends within its data")?;
+            let records_per_chunk = element.count.div_ceil(worker_count()).max(1);
+            let chunks: Vec<&[u8]> = body.chunks(records_per_chunk * size).collect();
+            vertices = parse_chunks(&chunks, |chunk| {
+                let mut records = PlyVertices::default();
+                let mut source = BinarySource {
+                    bytes: chunk,
+                    pos: 0,
+                    big_endian,
+                };
+                for _ in 0..chunk.len() / size {
+                    records.read(&mut source, element)?;
+                }
+                Ok(records)
+            })?;
+            pos += len;
+        } else {
+            let mut source = BinarySource {
+                bytes: body,
+                pos: 0,
+                big_endian,
+            };
+            let (mut vertex_records, mut face_records) =
+                (PlyVertices::default(), PlyFaces::default());
+            for _ in 0..element.count {
+                if is_vertex {
+                    vertex_records.read(&mut source, element)?;
+                } else if is_face {
+                    face_records.read(&mut source, element)?;
+                } else {
+                    PlyFaces::default().read(&mut source, element)?;
+                }
+            }
+            if is_vertex {
+                vertices = vec![vertex_records];
+            } else if is_face {
+                faces = vec![face_records];
+            }
+            pos += source.pos;
+        }
+    }
+
+    let vertex_element = vertex_element.ok_or("PLY file has no vertex element")?;
+    let face_element = face_element.ok_or("PLY file has no face element")?;
+    if !face_element.has_role(Role::FaceVerts) {
+        return Err("PLY faces have no vertex_indices".to_string());
+    }
+    let corner_uvs = face_element.has_role(Role::FaceUvs);
+    if !corner_uvs && !vertex_element.has_role(Role::Vertex(3)) {
+        return Err("PLY file has no UVs".to_string());
+    }
+
+    let mut mesh = MeshData::default();
+    let mut vertex_uvs = Vec::new();
+    for chunk in vertices {
+        mesh.positions.extend_from_slice(&chunk.positions);
+        vertex_uvs.extend_from_slice(&chunk.uvs);
+    }
+    for chunk in faces {
+        mesh.poly_loop_totals.extend_from_slice(&chunk.totals);
+        mesh.loop_vert_indices.extend_from_slice(&chunk.verts);
+        mesh.uv_coords.extend_from_slice(&chunk.uvs);
+    }
+
+    let num_verts = mesh.num_verts();
+    if let Some(&vert) = mesh
+        .loop_vert_indices
+        .iter()
+        .find(|&&v| v as usize >= num_verts)
+    {
+        return Err(format!("Face refers to vertex {} of {}", vert, num_verts));
+    }
+    if corner_uvs {
+        if mesh.uv_coords.len() != mesh.num_loops() * 2 {
+            return Err("PLY texcoord lists do not match the face corners".to_string());
+        }
+    } else {
+        mesh.uv_coords = mesh
+            .loop_vert_indices
+            .iter()
+            .flat_map(|&v| [vertex_uvs[v as usize * 2], vertex_uvs[v as usize * 2 + 1]])
+            .collect();
+    }
+    Ok(mesh.with_starts())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const OBJ: &str = "# two quads, split in UV
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 2 0 0
+v 2 1 0
+vt 0 0
+vt 0.5 0
+vt 0.5 1
+vt 0 1
+vt 0.6 0
+vt 1 0
+vt 1 1
+vt 0.6 1
+f 1/1 2/2 3/3 4/4
+f 2/5/1 5/6/1 6/7/1 3/8/1
+";
+
+    #[test]
+    fn obj_faces_get_corner_uvs() {
+        let mesh = parse_obj(OBJ.as_bytes()).unwrap();
+
+        assert_eq!(mesh.num_verts(), 6);
+        assert_eq!(mesh.poly_loop_starts, vec![0, 4]);
+        assert_eq!(mesh.poly_loop_totals, vec![4, 4]);
+        assert_eq!(mesh.loop_vert_indices, vec![0, 1, 2, 3, 1, 4, 5, 2]);
+        assert_eq!(mesh.uv_coords[8..10], [0.6, 0.0]);
+    }
+
+    #[test]
+    fn obj_negative_indices_count_back() {
+        let relative = OBJ.replace("f 2/5/1 5/6/1 6/7/1 3/8/1", "f -5/-4 -2/-3 -1/-2 -4/-1");
+
+        assert_eq!(
+            parse_obj(relative.as_bytes()).unwrap(),
+            parse_obj(OBJ.as_bytes()).unwrap()
+        );
+    }
+
+    #[test]
+    fn obj_chunks_resolve_across_boundaries() {
+        // Enough lines for several chunks, with faces referring back over them
+        let mut text = String::new();
+        let n = 2_000;
+        for i in 0..n {
+            text.push_str(&format!(
+                "v {} 0 0\nv {} 1 0\nvt {} 0\nvt {} 1\n",
+                i, i, i, i
+            ));
+        }
+        for i in 1..n {
+            let (a, b) = (2 * i - 1, 2 * i + 1);
+            text.push_str(&format!("f {a}/{a} {b}/{b} -1/-1 {}/{}\n", a + 1, a + 1));
+        }
+        let chunks = split_lines(text.as_bytes(), text.len() / 7);
+        assert!(chunks.len() > 4);
+
+        let mesh = parse_obj_chunks(&chunks).unwrap();
+        assert_eq!(mesh, parse_obj(text.as_bytes()).unwrap());
+
+        assert_eq!(mesh.num_faces(), n - 1);
+        assert!(
+            mesh.loop_vert_indices
+                .chunks(4)
+                .all(|f| f[2] == 2 * n as u32 - 1)
+        );
+        assert_eq!(mesh.uv_coords[2..4], [1.0, 0.0]);
+    }
+
+    #[test]
+    fn obj_without_uv_indices_is_rejected() {
+        let error = parse_obj(b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n").unwrap_err();
+
+        assert!(error.contains("no UV index"), "{}", error);
+        assert!(parse_obj(b"v 0 0 0\nvt 0 0\nf 1/1 2/1 3/1\n").is_err());
+    }
+
+    fn ply_header(format: &str, face_uvs: bool) -> String {
+        let mut header = format!(
+            "ply\nformat {} 1.0\nelement vertex 4\nproperty float x\nproperty float y\n\
+             property float z\n",
+            format
+        );
+        if !face_uvs {
+            header.push_str("property float s\nproperty float t\n");
+        }
+        header.push_str("element face 2\nproperty list uchar int vertex_indices\n");
+        if face_uvs {
+            header.push_str("property list uchar float texcoord\n");
+        }
+        header + "end_header\n"
+    }
+
+    #[test]
+    fn ascii_ply_with_vertex_uvs() {
+        let text = ply_header("ascii", false)
+            + "0 0 0 0 0\n1 0 0 1 0\n1 1 0 1 1\n0 1 0 0 1\n3 0 1 2\n3 0 2 3\n";
+
+        let mesh = parse_ply(text.as_bytes()).unwrap();
+
+        assert_eq!(mesh.poly_loop_totals, vec![3, 3]);
+        assert_eq!(mesh.loop_vert_indices, vec![0, 1, 2, 0, 2, 3]);
+        assert_eq!(mesh.uv_coords[4..6], [1.0, 1.0]);
+    }
+
+    #[test]
+    fn binary_ply_matches_ascii() {
+        let ascii = ply_header("ascii", true)
+            + "0 0 0\n1 0 0\n1 1 0\n0 1 0\n\
+               3 0 1 2 6 0 0 1 0 1 1\n3 0 2 3 6 0 0 1 1 0 1\n";
+        let expected = parse_ply(ascii.as_bytes()).unwrap();
+
+        for (format, big_endian) in [("binary_little_endian", false), ("binary_big_endian", true)] {
+            let mut bytes = ply_header(format, true).into_bytes();
+            let push_f32 = |bytes: &mut Vec<u8>, value: f32| {
+                bytes.extend(if big_endian {
+                    value.to_be_bytes()
+                } else {
+                    value.to_le_bytes()
+                })
+            };
+            for value in [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0] {
+                push_f32(&mut bytes, value);
+            }
+            for (verts, uvs) in [
+                ([0i32, 1, 2], [0.0, 0.0, 1.0, 0.0, 1.0, 1.0]),
+                ([0, 2, 3], [0.0, 0.0, 1.0, 1.0, 0.0, 1.0]),
+            ] {
+                bytes.push(3);
+                for v in verts {
+                    bytes.extend(if big_endian {
+                        v.to_be_bytes()
+                    } else {
+                        v.to_le_bytes()
+                    });
+                }
+                bytes.push(6);
+                for value in uvs {
+                    push_f32(&mut bytes, value);
+                }
+            }
+
+            assert_eq!(parse_ply(&bytes).unwrap(), expected, "{}", format);
+        }
+    }
+
+    #[test]
+    fn ply_errors_are_reported() {
+        let without_uvs = "ply\nformat ascii 1.0\nelement vertex 3\nproperty float x\n\
+                           property float y\nproperty float z\nelement face 1\n\
+                           property list uchar int vertex_indices\nend_header\n\
+                           0 0 0\n1 0 0\n0 1 0\n3 0 1 2\n";
+        assert!(
+            parse_ply(without_uvs.as_bytes())
+                .unwrap_err()
+                .contains("no UVs")
+        );
+
+        let truncated = ply_header("ascii", false) + "0 0 0 0 0\n";
+        assert!(parse_ply(truncated.as_bytes()).is_err());
+
+        let out_of_range = ply_header("ascii", false)
+            + "0 0 0 0 0\n1 0 0 1 0\n1 1 0 1 1\n0 1 0 0 1\n3 0 1 2\n3 0 2 9\n";
+        assert!(parse_ply(out_of_range.as_bytes()).is_err());
+    }
+}
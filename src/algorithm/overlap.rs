@@ -0,0 +1,462 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! UV overlap detection
+//!
+//! Faces are fan-triangulated in UV space and inserted into a uniform grid of
+//! about one triangle per cell. Triangles sharing a cell are tested with the
+//! separating axis theorem. A pair is only tested in the first cell both bounding
+//! boxes share, so cells are processed in parallel without deduplicating pairs.
+//! Triangles that merely touch (shared edges and vertices) do not overlap.
+
+use crate::algorithm::color_id::get_golden_ratio_color;
+use crate::algorithm::dsu::Dsu;
+use crate::algorithm::raster::worker_count;
+use std::sync::Mutex;
+use std::thread;
+
+/// Group of faces and islands without overlaps
+pub const NO_GROUP: u32 = u32::MAX;
+
+/// Color of faces without overlaps in `overlap_colors`
+const NO_OVERLAP_COLOR: [f32; 4] = [0.05, 0.05, 0.05, 1.0];
+
+/// Overlap below this fraction of a UV unit counts as touching
+const TOUCH_EPSILON: f32 = 1e-6;
+
+/// Upper bound of grid cells per side, keeps the grid memory bounded
+const MAX_GRID_SIDE: usize = 4096;
+
+/// Cells handed to a worker at a time
+const CELLS_PER_TASK: usize = 1024;
+
+#[derive(Debug, Clone, Copy)]
+struct UvTriangle {
+    points: [(f32, f32); 3],
+    face: u32,
+    /// Covered grid cells, inclusive: [min_x, min_y, max_x, max_y]
+    cells: [u32; 4],
+}
+
+pub struct Overlaps {
+    /// Whether each face overlaps another face (of any island)
+    pub face_overlaps: Vec<bool>,
+    /// Overlapping island pairs (a <= b), sorted and unique;
+    /// a == b for islands that fold onto themselves
+    pub island_pairs: Vec<(u32, u32)>,
+}
+
+/// Finds overlapping faces and the island pairs they belong to
+/// `face_islands` are the compact island indices of `color_id::compute_island_coloring`.
+pub fn detect_overlaps(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+) -> Overlaps {
+    let num_faces = poly_loop_starts.len();
+    let triangles = triangulate(poly_loop_starts, poly_loop_totals, uv_coords);
+    let pairs = find_overlapping_pairs(&triangles);
+
+    let mut face_overlaps = vec![false; num_faces];
+    let mut island_pairs = Vec::with_capacity(pairs.len());
+    for (a, b) in pairs {
+        let (face_a, face_b) = (triangles[a as usize].face, triangles[b as usize].face);
+        face_overlaps[face_a as usize] = true;
+        face_overlaps[face_b as usize] = true;
+        let (island_a, island_b) = (face_islands[face_a as usize], face_islands[face_b as usize]);
+        island_pairs.push((island_a.min(island_b), island_a.max(island_b)));
+    }
+    island_pairs.sort_unstable();
+    island_pairs.dedup();
+
+    Overlaps {
+        face_overlaps,
+        island_pairs,
+    }
+}
+
+/// Groups islands connected by overlaps, e.g. islands stacked on purpose
+/// Returns the group of each island, numbered in order of their first island,
+/// and `NO_GROUP` for islands without overlaps.
+pub fn group_islands(num_islands: usize, island_pairs: &[(u32, u32)]) -> (Vec<u32>, usize) {
+    let mut dsu = Dsu::new(num_islands);
+    let mut overlapping = vec![false; num_islands];
+    for &(a, b) in island_pairs {
+        dsu.merge(a as usize, b as usize);
+        overlapping[a as usize] = true;
+        overlapping[b as usize] = true;
+    }
+
+    let mut leader_groups = vec![NO_GROUP; num_islands];
+    let mut island_groups = vec![NO_GROUP; num_islands];
+    let mut num_groups = 0u32;
+    for island in 0..num_islands {
+        if !overlapping[island] {
+            continue;
+        }
+        let leader = dsu.leader(island);
+        if leader_groups[leader] == NO_GROUP {
+            leader_groups[leader] = num_groups;
+            num_groups += 1;
+        }
+        island_groups[island] = leader_groups[leader];
+    }
+    (island_groups, num_groups as usize)
+}
+
+/// Writes corner colors (total loops * 4): overlapping faces get the color of
+/// their group, all other faces a dark neutral color
+pub fn overlap_colors(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    face_groups: &[u32],
+    result_colors: &mut [f32],
+) {
+    for (f_idx, &group) in face_groups.iter().enumerate() {
+        let color = if group == NO_GROUP {
+            NO_OVERLAP_COLOR
+        } else {
+            let (r, g, b, a) = get_golden_ratio_color(group as usize);
+            [r, g, b, a]
+        };
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for out in result_colors[start * 4..end * 4].chunks_exact_mut(4) {
+            out.copy_from_slice(&color);
+        }
+    }
+}
+
+/// Selection masks (0 or 1) of exactly the overlapping faces: every face with a group,
+/// the vertices of its corners and the edges of its sides. Returns the face count.
+#[allow(clippy::too_many_arguments)]
+pub fn overlap_selection(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    loop_edge_indices: &[u32],
+    face_groups: &[u32],
+    face_select: &mut [i32],
+    vert_select: &mut [i32],
+    edge_select: &mut [i32],
+) -> usize {
+    face_select.fill(0);
+    vert_select.fill(0);
+    edge_select.fill(0);
+
+    let mut num_selected = 0;
+    for (f_idx, &group) in face_groups.iter().enumerate() {
+        if group == NO_GROUP {
+            continue;
+        }
+        face_select[f_idx] = 1;
+        num_selected += 1;
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for l_idx in start..end {
+            vert_select[loop_vert_indices[l_idx] as usize] = 1;
+            edge_select[loop_edge_indices[l_idx] as usize] = 1;
+        }
+    }
+    num_selected
+}
+
+/// Fan-triangulates the faces, skipping degenerate triangles (they cover no area)
+fn triangulate(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+) -> Vec<UvTriangle> {
+    let mut triangles = Vec::with_capacity(poly_loop_starts.len() * 2);
+    for (f_idx, (&start, &total)) in poly_loop_starts.iter().zip(poly_loop_totals).enumerate() {
+        let start = start as usize;
+        let point = |loop_idx: usize| (uv_coords[loop_idx * 2], uv_coords[loop_idx * 2 + 1]);
+
+        for i in 1..(total as usize).saturating_sub(1) {
+            let points = [point(start), point(start + i), point(start + i + 1)];
+            let [a, b, c] = points;
+            let area = (b.0 - a.0) * (c.1 - a.1) - (b.1 - a.1) * (c.0 - a.0);
+            if area.abs() <= f32::EPSILON * f32::EPSILON || !area.is_finite() {
+                continue;
+            }
+            triangles.push(UvTriangle {
+                points,
+                face: f_idx as u32,
+                cells: [0; 4],
+            });
+        }
+    }
+    triangles
+}
+
+/// Returns the index pairs (a < b) of overlapping triangles of different faces
+fn find_overlapping_pairs(triangles: &[UvTriangle]) -> Vec<(u32, u32)> {
+    if triangles.len() < 2 {
+        return Vec::new();
+    }
+    let grid = Grid::build(triangles);
+    let num_cells = grid.side * grid.side;
+
+    let tasks = Mutex::new((0..num_cells).step_by(CELLS_PER_TASK));
+    thread::scope(|scope| {
+        let handles: Vec<_> = (0..worker_count())
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut pairs = Vec::new();
+                    loop {
+                        let next = tasks.lock().unwrap().next();
+                        let Some(first_cell) = next else {
+                            break;
+                        };
+                        for cell in first_cell..(first_cell + CELLS_PER_TASK).min(num_cells) {
+                            grid.test_cell(cell, &mut pairs);
+                        }
+                    }
+                    pairs
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|h| h.join().unwrap())
+            .collect()
+    })
+}
+
+/// Uniform grid over the bounding box of the triangles
+struct Grid {
+    /// Triangles with their covered cells
+    triangles: Vec<UvTriangle>,
+    /// Cell c holds cell_triangles[cell_offsets[c]..cell_offsets[c + 1]]
+    cell_offsets: Vec<u32>,
+    cell_triangles: Vec<u32>,
+    side: usize,
+}
+
+impl Grid {
+    /// Bins the triangles into a grid of about one triangle per cell
+    fn build(triangles: &[UvTriangle]) -> Self {
+        let (mut min, mut max) = (
+            (f32::INFINITY, f32::INFINITY),
+            (f32::NEG_INFINITY, f32::NEG_INFINITY),
+        );
+        for tri in triangles {
+            for p in tri.points {
+                min = (min.0.min(p.0), min.1.min(p.1));
+                max = (max.0.max(p.0), max.1.max(p.1));
+            }
+        }
+
+        let side = ((triangles.len() as f64).sqrt().ceil() as usize).clamp(1, MAX_GRID_SIDE);
+        let scale_x = side as f32 / (max.0 - min.0).max(f32::EPSILON);
+        let scale_y = side as f32 / (max.1 - min.1).max(f32::EPSILON);
+        let to_cell = |value: f32, origin: f32, scale: f32| {
+            (((value - origin) * scale) as usize).min(side - 1) as u32
+        };
+
+        let mut triangles = triangles.to_vec();
+        let mut cell_offsets = vec![0u32; side * side + 1];
+        for tri in &mut triangles {
+            let xs = tri.points.map(|p| p.0);
+            let ys = tri.points.map(|p| p.1);
+            tri.cells = [
+                to_cell(xs[0].min(xs[1]).min(xs[2]), min.0, scale_x),
+                to_cell(ys[0].min(ys[1]).min(ys[2]), min.1, scale_y),
+                to_cell(xs[0].max(xs[1]).max(xs[2]), min.0, scale_x),
+                to_cell(ys[0].max(ys[1]).max(ys[2]), min.1, scale_y),
+            ];
+            for_each_cell(tri.cells, side, |cell| cell_offsets[cell + 1] += 1);
+        }
+        // Counts to offsets
+        for cell in 0..side * side {
+            cell_offsets[cell + 1] += cell_offsets[cell];
+        }
+
+        let mut cursor = cell_offsets.clone();
+        let mut cell_triangles = vec![0u32; cell_offsets[side * side] as usize];
+        for (t_idx, tri) in triangles.iter().enumerate() {
+            for_each_cell(tri.cells, side, |cell| {
+                cell_triangles[cursor[cell] as usize] = t_idx as u32;
+                cursor[cell] += 1;
+            });
+        }
+
+        Grid {
+            triangles,
+            cell_offsets,
+            cell_triangles,
+            side,
+        }
+    }
+
+    fn test_cell(&self, cell: usize, pairs: &mut Vec<(u32, u32)>) {
+        let members = &self.cell_triangles
+            [self.cell_offsets[cell] as usize..self.cell_offsets[cell + 1] as usize];
+        let (cell_x, cell_y) = ((cell % self.side) as u32, (cell / self.side) as u32);
+
+        for (i, &a) in members.iter().enumerate() {
+            let tri_a = &self.triangles[a as usize];
+            for &b in &members[i + 1..] {
+                let tri_b = &self.triangles[b as usize];
+                if tri_a.face == tri_b.face {
+                    continue;
+                }
+                // Only the first shared cell tests the pair
+                let first_x = tri_a.cells[0].max(tri_b.cells[0]);
+                let first_y = tri_a.cells[1].max(tri_b.cells[1]);
+                if first_x != cell_x || first_y != cell_y {
+                    continue;
+                }
+                if triangles_overlap(&tri_a.points, &tri_b.points) {
+                    pairs.push((a.min(b), a.max(b)));
+                }
+            }
+        }
+    }
+}
+
+#[inline]
+fn for_each_cell(cells: [u32; 4], side: usize, mut f: impl FnMut(usize)) {
+    for y in cells[1]..=cells[3] {
+        for x in cells[0]..=cells[2] {
+            f(y as usize * side + x as usize);
+        }
+    }
+}
+
+/// Separating axis test of two triangles; touching triangles do not overlap
+fn triangles_overlap(a: &[(f32, f32); 3], b: &[(f32, f32); 3]) -> bool {
+    !(has_separating_edge(a, b) || has_separating_edge(b, a))
+}
+
+fn has_separating_edge(a: &[(f32, f32); 3], b: &[(f32, f32); 3]) -> bool {
+    (0..3).any(|i| {
+        let (p, q) = (a[i], a[(i + 1) % 3]);
+        let axis = (p.1 - q.1, q.0 - p.0);
+        let project = |t: &[(f32, f32); 3]| {
+            let d = t.map(|v| v.0 * axis.0 + v.1 * axis.1);
+            (d[0].min(d[1]).min(d[2]), d[0].max(d[1]).max(d[2]))
+        };
+        let ((min_a, max_a), (min_b, max_b)) = (project(a), project(b));
+        let tolerance = TOUCH_EPSILON * (axis.0 * axis.0 + axis.1 * axis.1).sqrt();
+        max_a <= min_b + tolerance || max_b <= min_a + tolerance
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::mesh_gen::{MeshKind, generate};
+
+    fn quad(u: f32, v: f32, size: f32) -> [f32; 8] {
+        [u, v, u + size, v, u + size, v + size, u, v + size]
+    }
+
+    #[test]
+    fn grid_has_no_overlaps() {
+        let mesh = generate(MeshKind::Grid, 30, 30, 0.0, 0);
+        let islands = vec![0; mesh.num_faces()];
+
+        let overlaps = detect_overlaps(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.uv_coords,
+            &islands,
+        );
+
+        assert!(overlaps.face_overlaps.iter().all(|&o| !o));
+        assert!(overlaps.island_pairs.is_empty());
+    }
+
+    #[test]
+    fn stacked_and_touching_quads() {
+        // Face 0 and 1 are stacked, face 2 only touches face 0, face 3 is apart
+        let uvs: Vec<f32> = [
+            quad(0.0, 0.0, 0.25),
+            quad(0.1, 0.1, 0.25),
+            quad(0.25, 0.0, 0.25),
+            quad(0.7, 0.7, 0.2),
+        ]
+        .concat();
+        let starts = [0, 4, 8, 12];
+        let totals = [4; 4];
+
+        let overlaps = detect_overlaps(&starts, &totals, &uvs, &[0, 1, 2, 3]);
+
+        assert_eq!(overlaps.face_overlaps, vec![true, true, true, false]);
+        assert_eq!(overlaps.island_pairs, vec![(0, 1), (1, 2)]);
+
+        let (groups, num_groups) = group_islands(4, &overlaps.island_pairs);
+        assert_eq!(groups, vec![0, 0, 0, NO_GROUP]);
+        assert_eq!(num_groups, 1);
+    }
+
+    #[test]
+    fn overlap_is_found_across_grid_cells() {
+        // A large triangle over many small ones spans many cells
+        let mesh = generate(MeshKind::Checker, 8, 8, 0.0, 0);
+        let mut starts = mesh.poly_loop_starts.clone();
+        let mut totals = mesh.poly_loop_totals.clone();
+        let mut uvs = mesh.uv_coords.clone();
+        starts.push((uvs.len() / 2) as u32);
+        totals.push(3);
+        uvs.extend_from_slice(&[0.05, 0.05, 0.95, 0.05, 0.05, 0.95]);
+
+        let islands: Vec<u32> = (0..starts.len() as u32).collect();
+        let overlaps = detect_overlaps(&starts, &totals, &uvs, &islands);
+
+        let last = starts.len() - 1;
+        assert!(overlaps.face_overlaps[last]);
+        let count = overlaps
+            .island_pairs
+            .iter()
+            .filter(|p| p.1 == last as u32)
+            .count();
+        // Every checker cell below the diagonal is covered by the triangle
+        assert!(count >= 28, "only {} pairs", count);
+        assert_eq!(
+            count,
+            overlaps.face_overlaps.iter().filter(|&&o| o).count() - 1
+        );
+    }
+
+    #[test]
+    fn overlap_colors_mark_groups() {
+        let starts = [0, 4];
+        let totals = [4, 4];
+        let mut colors = vec![0.0; 32];
+
+        overlap_colors(&starts, &totals, &[NO_GROUP, 0], &mut colors);
+
+        assert_eq!(&colors[0..4], &NO_OVERLAP_COLOR);
+        let (r, g, b, a) = get_golden_ratio_color(0);
+        assert_eq!(&colors[28..32], &[r, g, b, a]);
+    }
+
+    #[test]
+    fn overlap_selection_flushes_to_sides_and_corners() {
+        // Two quads sharing the edge 1-2 (edge 1); only the second overlaps
+        let starts = [0, 4];
+        let totals = [4, 4];
+        let verts = [0, 1, 2, 3, 1, 4, 5, 2];
+        let edges = [0, 1, 2, 3, 4, 5, 6, 1];
+        let (mut faces, mut vert_select, mut edge_select) = ([0; 2], [0; 6], [0; 7]);
+
+        let count = overlap_selection(
+            &starts,
+            &totals,
+            &verts,
+            &edges,
+            &[NO_GROUP, 0],
+            &mut faces,
+            &mut vert_select,
+            &mut edge_select,
+        );
+
+        assert_eq!(count, 1);
+        assert_eq!(faces, [0, 1]);
+        assert_eq!(vert_select, [0, 1, 1, 0, 1, 1]);
+        // The shared edge 1 is a side of the selected face, the others of the first are not
+        assert_eq!(edge_select, [0, 1, 0, 0, 1, 1, 1]);
+    }
+}
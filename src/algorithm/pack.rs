@@ -0,0 +1,504 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! UV island packing
+//!
+//! Islands are packed as their UV bounding rectangles with a skyline bottom-left
+//! packer, optionally rotated by 90 degrees. Several candidate orderings and strip
+//! widths are packed on worker threads and the layout with the smallest square
+//! extent is kept. The result is applied to all UVs in one pass.
+
+use crate::algorithm::raster::worker_count;
+use std::sync::Mutex;
+use std::thread;
+
+/// Strip widths tried per ordering, relative to the side of the target area
+const WIDTH_FACTORS: [f32; 4] = [0.9, 1.0, 1.1, 1.25];
+/// Repacks at most this often to match the padding to the final extent
+const MARGIN_ITERATIONS: usize = 6;
+/// Relative difference between the gap in the unit square and the margin that stops
+/// the repacking early
+const MARGIN_TOLERANCE: f32 = 0.01;
+
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub struct IslandBounds {
+    pub min: (f32, f32),
+    pub max: (f32, f32),
+}
+
+impl IslandBounds {
+    pub fn size(&self) -> (f32, f32) {
+        (self.max.0 - self.min.0, self.max.1 - self.min.1)
+    }
+}
+
+/// Position of an island's (padded) rectangle in the packed layout
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct Placement {
+    pub x: f32,
+    pub y: f32,
+    /// Rotated by 90 degrees counterclockwise
+    pub rotated: bool,
+}
+
+#[derive(Debug, Clone)]
+pub struct Packing {
+    pub placements: Vec<Placement>,
+    /// Padding added to each rectangle (half of it on every side)
+    pub padding: f32,
+    /// Side of the square the layout fits in
+    pub extent: f32,
+}
+
+impl Packing {
+    /// Uniform scale that maps the layout into the unit square
+    pub fn scale(&self) -> f32 {
+        if self.extent > 0.0 {
+            1.0 / self.extent
+        } else {
+            1.0
+        }
+    }
+}
+
+/// Per-island UV bounds; `face_islands` are the compact island indices of
+/// `color_id::compute_island_coloring`
+pub fn island_bounds(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> Vec<IslandBounds> {
+    let mut bounds = vec![
+        IslandBounds {
+            min: (f32::INFINITY, f32::INFINITY),
+            max: (f32::NEG_INFINITY, f32::NEG_INFINITY),
+        };
+        num_islands
+    ];
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        let b = &mut bounds[island as usize];
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for uv in uv_coords[start * 2..end * 2].chunks_exact(2) {
+            b.min = (b.min.0.min(uv[0]), b.min.1.min(uv[1]));
+            b.max = (b.max.0.max(uv[0]), b.max.1.max(uv[1]));
+        }
+    }
+    for b in &mut bounds {
+        if b.min.0 > b.max.0 {
+            // Island without loops
+            *b = IslandBounds {
+                min: (0.0, 0.0),
+                max: (0.0, 0.0),
+            };
+        }
+    }
+    bounds
+}
+
+/// Packs rectangles of the given sizes into a square layout
+///
+/// `margin` is the gap between islands relative to the final unit square, and
+/// `target_fill` the expected packing density (0..1] that sizes the strip widths.
+///
+/// The unit square is the final extent, which grows with the padding. The layout is
+/// therefore repacked with the padding solved for from the last extents, and the
+/// layout whose gap is closest to the margin is kept. The extent jumps when islands
+/// change rows, so large margins are only met to within a few percent.
+pub fn pack_rects(sizes: &[(f32, f32)], margin: f32, target_fill: f32, rotate: bool) -> Packing {
+    let target_fill = target_fill.clamp(0.05, 1.0);
+    let area: f32 = sizes.iter().map(|&(w, h)| w * h).sum();
+    let side = (area / target_fill).sqrt().max(f32::EPSILON);
+    let margin = margin.max(0.0);
+
+    // First guess: the unit square maps to about `side`
+    let gap_error = |packing: &Packing| (packing.padding * packing.scale() - margin).abs();
+    let mut packing = pack_padded(sizes, margin * side, side, rotate);
+    let mut best = packing.clone();
+    let mut previous: Option<(f32, f32)> = None;
+    for _ in 0..MARGIN_ITERATIONS {
+        if gap_error(&packing) < gap_error(&best) {
+            best = packing.clone();
+        }
+        if gap_error(&best) <= MARGIN_TOLERANCE * margin {
+            break;
+        }
+        // Secant step on padding = margin * extent(padding), where the extent grows about
+        // linearly with the padding; the first step uses the last extent
+        let (padding, extent) = (packing.padding, packing.extent);
+        let wanted = margin * extent;
+        let next = match previous {
+            Some((p0, e0)) if (padding - p0).abs() > f32::EPSILON => {
+                let slope = (extent - e0) / (padding - p0);
+                let denominator = 1.0 - margin * slope;
+                if denominator > 0.0 {
+                    margin * (extent - slope * padding) / denominator
+                } else {
+                    wanted
+                }
+            }
+            _ => wanted,
+        };
+        previous = Some((padding, extent));
+        packing = pack_padded(sizes, next.max(0.0), side, rotate);
+    }
+    if gap_error(&packing) < gap_error(&best) {
+        best = packing;
+    }
+    best
+}
+
+/// Packs rectangles grown by `padding` into strips of about `side`
+fn pack_padded(sizes: &[(f32, f32)], padding: f32, side: f32, rotate: bool) -> Packing {
+    let padded: Vec<(f32, f32)> = sizes
+        .iter()
+        .map(|&(w, h)| (w + padding, h + padding))
+        .collect();
+
+    // Every rectangle must fit the strip, rotated if allowed
+    let min_width = padded.iter().map(|&(w, h)| w.min(h)).fold(0.0f32, f32::max);
+    let max_width = padded.iter().map(|&(w, _)| w).fold(0.0f32, f32::max);
+
+    // Greedy rotation does not always win, so unrotated layouts compete as well
+    let rotations: &[bool] = if rotate { &[true, false] } else { &[false] };
+    let mut candidates = Vec::new();
+    for ordering in Ordering::ALL {
+        let order = ordering.sort(&padded);
+        for factor in WIDTH_FACTORS {
+            for &rotate in rotations {
+                let min_width = if rotate { min_width } else { max_width };
+                candidates.push((order.clone(), (side * factor).max(min_width), rotate));
+            }
+        }
+    }
+
+    let queue = Mutex::new(candidates.into_iter());
+    let best = thread::scope(|scope| {
+        let handles: Vec<_> = (0..worker_count())
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut best: Option<(f32, Vec<Placement>)> = None;
+                    loop {
+                        let next = queue.lock().unwrap().next();
+                        let Some((order, width, rotate)) = next else {
+                            break;
+                        };
+                        let (extent, placements) = pack_skyline(&padded, &order, width, rotate);
+                        if best.as_ref().is_none_or(|(e, _)| extent < *e) {
+                            best = Some((extent, placements));
+                        }
+                    }
+                    best
+                })
+            })
+            .collect();
+        handles
+            .into_iter()
+            .filter_map(|h| h.join().unwrap())
+            .min_by(|a, b| a.0.total_cmp(&b.0))
+    });
+
+    let (extent, placements) = best.unwrap_or((0.0, Vec::new()));
+    Packing {
+        placements,
+        padding,
+        extent,
+    }
+}
+
+/// Moves every island's UVs to its placement and scales the layout into the unit square
+pub fn apply_packing(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &mut [f32],
+    face_islands: &[u32],
+    bounds: &[IslandBounds],
+    packing: &Packing,
+) {
+    let scale = packing.scale();
+    let offset = 0.5 * packing.padding;
+
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        let b = bounds[island as usize];
+        let placement = packing.placements[island as usize];
+        let height = b.size().1;
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+
+        for uv in uv_coords[start * 2..end * 2].chunks_exact_mut(2) {
+            let (px, py) = (uv[0] - b.min.0, uv[1] - b.min.1);
+            let (px, py) = if placement.rotated {
+                (height - py, px)
+            } else {
+                (px, py)
+            };
+            uv[0] = (placement.x + offset + px) * scale;
+            uv[1] = (placement.y + offset + py) * scale;
+        }
+    }
+}
+
+#[derive(Debug, Clone, Copy)]
+enum Ordering {
+    Height,
+    Area,
+    MaxSide,
+    Width,
+    Perimeter,
+}
+
+impl Ordering {
+    const ALL: [Ordering; 5] = [
+        Ordering::Height,
+        Ordering::Area,
+        Ordering::MaxSide,
+        Ordering::Width,
+        Ordering::Perimeter,
+    ];
+
+    /// Rectangle indices, largest key first
+    fn sort(self, sizes: &[(f32, f32)]) -> Vec<u32> {
+        let key = |&(w, h): &(f32, f32)| match self {
+            Ordering::Height => h,
+            Ordering::Area => w * h,
+            Ordering::MaxSide => w.max(h),
+            Ordering::Width => w,
+            Ordering::Perimeter => w + h,
+        };
+        let mut order: Vec<u32> = (0..sizes.len() as u32).collect();
+        order.sort_by(|&a, &b| key(&sizes[b as usize]).total_cmp(&key(&sizes[a as usize])));
+        order
+    }
+}
+
+/// Skyline bottom-left packing into a strip of the given width
+/// Returns the square extent of the layout and the placement of every rectangle.
+fn pack_skyline(
+    sizes: &[(f32, f32)],
+    order: &[u32],
+    width: f32,
+    rotate: bool,
+) -> (f32, Vec<Placement>) {
+    let mut skyline = Skyline::new(width);
+    let mut placements = vec![Placement::default(); sizes.len()];
+    let (mut used_width, mut used_height) = (0.0f32, 0.0f32);
+
+    for &r_idx in order {
+        let (w, h) = sizes[r_idx as usize];
+        let mut best = skyline.find(w, h).map(|fit| (fit, false));
+        if rotate
+            && w != h
+            && let Some(fit) = skyline.find(h, w)
+            && best.is_none_or(|(b, _)| fit.top < b.top || (fit.top == b.top && fit.x < b.x))
+        {
+            best = Some((fit, true));
+        }
+        // The strip is at least as wide as every rectangle, so one orientation fits
+        let Some((fit, rotated)) = best else {
+            continue;
+        };
+        let (w, h) = if rotated { (h, w) } else { (w, h) };
+        skyline.place(fit.node, fit.x, fit.top - h, w, h);
+
+        placements[r_idx as usize] = Placement {
+            x: fit.x,
+            y: fit.top - h,
+            rotated,
+        };
+        used_width = used_width.max(fit.x + w);
+        used_height = used_height.max(fit.top);
+    }
+    (used_width.max(used_height), placements)
+}
+
+#[derive(Debug, Clone, Copy)]
+struct Fit {
+    node: usize,
+    x: f32,
+    /// Top edge of the placed rectangle
+    top: f32,
+}
+
+/// Upper contour of the placed rectangles: segments (x, y, width) sorted by x
+struct Skyline {
+    width: f32,
+    nodes: Vec<(f32, f32, f32)>,
+}
+
+impl Skyline {
+    fn new(width: f32) -> Self {
+        Skyline {
+            width,
+            nodes: vec![(0.0, 0.0, width)],
+        }
+    }
+
+    /// Lowest (then leftmost) position of a w x h rectangle on the skyline
+    fn find(&self, w: f32, h: f32) -> Option<Fit> {
+        let mut best: Option<Fit> = None;
+        for (i, &(x, _, _)) in self.nodes.iter().enumerate() {
+            if x + w > self.width * (1.0 + f32::EPSILON) {
+                break;
+            }
+            // Rest on the highest segment under the span
+            let mut y = 0.0f32;
+            let mut covered = 0.0f32;
+            for &(_, node_y, node_w) in &self.nodes[i..] {
+                y = y.max(node_y);
+                covered += node_w;
+                if covered >= w {
+                    break;
+                }
+            }
+            let top = y + h;
+            if best.is_none_or(|b| top < b.top) {
+                best = Some(Fit { node: i, x, top });
+            }
+        }
+        best
+    }
+
+    fn place(&mut self, node: usize, x: f32, y: f32, w: f32, h: f32) {
+        self.nodes.insert(node, (x, y + h, w));
+        let right = x + w;
+
+        // Cut the segments now covered by the new one
+        let i = node + 1;
+        while i < self.nodes.len() {
+            let (nx, ny, nw) = self.nodes[i];
+            if nx >= right {
+                break;
+            }
+            let overlap = right - nx;
+            if overlap >= nw {
+                self.nodes.remove(i);
+            } else {
+                self.nodes[i] = (right, ny, nw - overlap);
+                break;
+            }
+        }
+
+        // Merge neighbors of equal height
+        let mut i = node.saturating_sub(1);
+        while i + 1 < self.nodes.len() && i <= node + 1 {
+            if self.nodes[i].1 == self.nodes[i + 1].1 {
+                self.nodes[i].2 += self.nodes[i + 1].2;
+                self.nodes.remove(i + 1);
+            } else {
+                i += 1;
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn overlaps(a: (f32, f32, f32, f32), b: (f32, f32, f32, f32)) -> bool {
+        const EPS: f32 = 1e-5;
+        a.0 + EPS < b.0 + b.2
+            && b.0 + EPS < a.0 + a.2
+            && a.1 + EPS < b.1 + b.3
+            && b.1 + EPS < a.1 + a.3
+    }
+
+    fn placed_rects(sizes: &[(f32, f32)], packing: &Packing) -> Vec<(f32, f32, f32, f32)> {
+        sizes
+            .iter()
+            .zip(&packing.placements)
+            .map(|(&(w, h), p)| {
+                let (w, h) = if p.rotated { (h, w) } else { (w, h) };
+                (p.x, p.y, w + packing.padding, h + packing.padding)
+            })
+            .collect()
+    }
+
+    #[test]
+    fn packed_rects_do_not_overlap() {
+        // Deterministic mix of shapes
+        let sizes: Vec<(f32, f32)> = (0..200)
+            .map(|i| {
+                let a = ((i * 37) % 17) as f32 + 1.0;
+                let b = ((i * 53) % 11) as f32 + 1.0;
+                (a * 0.01, b * 0.01)
+            })
+            .collect();
+
+        let packing = pack_rects(&sizes, 0.002, 0.8, true);
+
+        let rects = placed_rects(&sizes, &packing);
+        for (i, a) in rects.iter().enumerate() {
+            assert!(a.0 >= 0.0 && a.1 >= 0.0);
+            assert!(a.0 + a.2 <= packing.extent * (1.0 + 1e-5));
+            assert!(a.1 + a.3 <= packing.extent * (1.0 + 1e-5));
+            for b in &rects[i + 1..] {
+                assert!(!overlaps(*a, *b), "{:?} overlaps {:?}", a, b);
+            }
+        }
+        let area: f32 = sizes.iter().map(|(w, h)| w * h).sum();
+        assert!(area / (packing.extent * packing.extent) > 0.5);
+    }
+
+    #[test]
+    fn equal_squares_fill_a_grid() {
+        let sizes = vec![(1.0, 1.0); 16];
+
+        let packing = pack_rects(&sizes, 0.0, 1.0, false);
+
+        assert!((packing.extent - 4.0).abs() < 1e-4);
+    }
+
+    #[test]
+    fn rotation_lays_long_islands_down() {
+        let sizes = vec![(0.1, 1.0); 4];
+
+        let with_rotation = pack_rects(&sizes, 0.0, 1.0, true);
+        let without = pack_rects(&sizes, 0.0, 1.0, false);
+
+        assert!(with_rotation.extent <= without.extent + 1e-5);
+    }
+
+    #[test]
+    fn margin_holds_in_the_unit_square() {
+        let sizes: Vec<(f32, f32)> = (0..40)
+            .map(|i| (0.05 + 0.01 * (i % 7) as f32, 0.04 + 0.02 * (i % 5) as f32))
+            .collect();
+        for margin in [0.002, 0.01, 0.05] {
+            let packing = pack_rects(&sizes, margin, 0.8, true);
+            let gap = packing.padding * packing.scale();
+            assert!(
+                (gap - margin).abs() <= 0.03 * margin,
+                "gap {} for margin {}",
+                gap,
+                margin
+            );
+        }
+    }
+
+    #[test]
+    fn apply_moves_islands_into_unit_square() {
+        // Two unit quads stacked at the same spot
+        let starts = [0, 4];
+        let totals = [4, 4];
+        let mut uvs = vec![
+            0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0,
+        ];
+        let islands = [0, 1];
+        let bounds = island_bounds(&starts, &totals, &uvs, &islands, 2);
+        let sizes: Vec<_> = bounds.iter().map(|b| b.size()).collect();
+        let packing = pack_rects(&sizes, 0.01, 0.5, true);
+
+        apply_packing(&starts, &totals, &mut uvs, &islands, &bounds, &packing);
+
+        assert!(uvs.iter().all(|&c| (0.0..=1.0 + 1e-5).contains(&c)));
+        let after = island_bounds(&starts, &totals, &uvs, &islands, 2);
+        let (a, b) = (after[0], after[1]);
+        let apart = a.max.0 <= b.min.0 + 1e-5
+            || b.max.0 <= a.min.0 + 1e-5
+            || a.max.1 <= b.min.1 + 1e-5
+            || b.max.1 <= a.min.1 + 1e-5;
+        assert!(apart);
+    }
+}
@@ -0,0 +1,415 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Tiled UV-space rasterizer for per-face values (e.g. Color ID maps)
+//!
+//! Faces are fan-triangulated in UV space and binned into horizontal bands of
+//! `BAND_ROWS` pixel rows. Worker threads pull bands from a shared queue, so
+//! every pixel row is written by exactly one thread without locking.
+//! Pixel rows follow Blender's image layout: row 0 is v = 0.
+
+use crate::algorithm::color_id::get_golden_ratio_color;
+use std::sync::Mutex;
+use std::thread;
+
+/// Pixel value of uncovered pixels
+pub const EMPTY: u32 = u32::MAX;
+
+const BAND_ROWS: usize = 32;
+
+/// UV triangle with the value of its face
+#[derive(Debug, Clone, Copy)]
+struct Triangle {
+    points: [(f32, f32); 3],
+    value: u32,
+}
+
+pub(crate) fn worker_count() -> usize {
+    thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+}
+
+/// Runs `f(first_row, band)` for every band of `BAND_ROWS` rows on all cores
+fn for_each_band<T: Send>(data: &mut [T], row_len: usize, f: impl Fn(usize, &mut [T]) + Sync) {
+    let bands = Mutex::new(data.chunks_mut(BAND_ROWS * row_len).enumerate());
+    thread::scope(|scope| {
+        for _ in 0..worker_count() {
+            scope.spawn(|| {
+                loop {
+                    // Take the lock only to pop the next band
+                    let next = bands.lock().unwrap().next();
+                    let Some((band_idx, band)) = next else {
+                        break;
+                    };
+                    f(band_idx * BAND_ROWS, band);
+                }
+            });
+        }
+    });
+}
+
+/// Fan-triangulates the faces in pixel space and bins the triangles into bands
+fn bin_triangles(
+    width: usize,
+    height: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_values: &[u32],
+) -> Vec<Vec<Triangle>> {
+    let num_bands = height.div_ceil(BAND_ROWS);
+    let (w, h) = (width as f32, height as f32);
+
+    let mut bins: Vec<Vec<Triangle>> = vec![Vec::new(); num_bands];
+    for f_idx in 0..poly_loop_starts.len() {
+        let start = poly_loop_starts[f_idx] as usize;
+        let total = poly_loop_totals[f_idx] as usize;
+        let point =
+            |loop_idx: usize| (uv_coords[loop_idx * 2] * w, uv_coords[loop_idx * 2 + 1] * h);
+
+        for i in 1..total.saturating_sub(1) {
+            let tri = Triangle {
+                points: [point(start), point(start + i), point(start + i + 1)],
+                value: face_values[f_idx],
+            };
+            let min_y = tri.points.iter().map(|p| p.1).fold(f32::INFINITY, f32::min);
+            let max_y = tri
+                .points
+                .iter()
+                .map(|p| p.1)
+                .fold(f32::NEG_INFINITY, f32::max);
+            if max_y < 0.0 || min_y >= h {
+                continue;
+            }
+            let first_band = (min_y.max(0.0) as usize / BAND_ROWS).min(num_bands - 1);
+            let last_band = (max_y.min(h - 1.0) as usize / BAND_ROWS).min(num_bands - 1);
+            for bin in &mut bins[first_band..=last_band] {
+                bin.push(tri);
+            }
+        }
+    }
+    bins
+}
+
+/// Rasterizes `face_values` into `pixels` (width * height); uncovered pixels are left as is
+pub fn rasterize_face_values(
+    width: usize,
+    height: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_values: &[u32],
+    pixels: &mut [u32],
+) {
+    if width == 0 || height == 0 {
+        return;
+    }
+    let bins = bin_triangles(
+        width,
+        height,
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_values,
+    );
+    for_each_band(pixels, width, |first_row, band| {
+        let rows = band.len() / width;
+        for tri in &bins[first_row / BAND_ROWS] {
+            fill_triangle(tri, width, first_row, rows, band, |pixel, value| {
+                *pixel = value
+            });
+        }
+    });
+}
+
+/// Number of pixels of a width * height raster of the 0-1 UV tile covered by any face,
+/// and covered by faces of more than one island. `face_islands` are island indices as
+/// produced by `color_id::compute_island_coloring`; faces of one island never overlap
+/// each other here, so shared edges are not counted.
+pub fn island_coverage(
+    width: usize,
+    height: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+) -> (usize, usize) {
+    /// Pixel value of pixels covered by several islands
+    const OVERLAP: u32 = EMPTY - 1;
+
+    if width == 0 || height == 0 {
+        return (0, 0);
+    }
+    let bins = bin_triangles(
+        width,
+        height,
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+    );
+    let mut pixels = vec![EMPTY; width * height];
+    for_each_band(&mut pixels, width, |first_row, band| {
+        let rows = band.len() / width;
+        for tri in &bins[first_row / BAND_ROWS] {
+            fill_triangle(tri, width, first_row, rows, band, |pixel, island| {
+                if *pixel == EMPTY || *pixel == island {
+                    *pixel = island;
+                } else {
+                    *pixel = OVERLAP;
+                }
+            });
+        }
+    });
+
+    let covered = pixels.iter().filter(|&&p| p != EMPTY).count();
+    let overlapped = pixels.iter().filter(|&&p| p == OVERLAP).count();
+    (covered, overlapped)
+}
+
+/// Calls `write(pixel, value)` for the pixels of `band` (rows first_row..first_row + rows)
+/// whose centers lie in `tri`
+fn fill_triangle<T>(
+    tri: &Triangle,
+    width: usize,
+    first_row: usize,
+    rows: usize,
+    band: &mut [T],
+    mut write: impl FnMut(&mut T, u32),
+) {
+    let [a, b, c] = tri.points;
+    let area = (b.0 - a.0) * (c.1 - a.1) - (b.1 - a.1) * (c.0 - a.0);
+    if area == 0.0 || !area.is_finite() {
+        return;
+    }
+    // Edge functions are made positive inside regardless of the winding
+    let sign = area.signum();
+    let edge = |p: (f32, f32), q: (f32, f32), x: f32, y: f32| {
+        sign * ((q.0 - p.0) * (y - p.1) - (q.1 - p.1) * (x - p.0))
+    };
+
+    let min_x = a.0.min(b.0).min(c.0).floor().max(0.0) as usize;
+    let max_x = (a.0.max(b.0).max(c.0).ceil().max(0.0) as usize).min(width);
+    let min_y = (a.1.min(b.1).min(c.1).floor().max(0.0) as usize).max(first_row);
+    let max_y = (a.1.max(b.1).max(c.1).ceil().max(0.0) as usize).min(first_row + rows);
+
+    for y in min_y..max_y {
+        let py = y as f32 + 0.5;
+        let row = &mut band[(y - first_row) * width..(y - first_row + 1) * width];
+        for (x, pixel) in row.iter_mut().enumerate().take(max_x).skip(min_x) {
+            let px = x as f32 + 0.5;
+            if edge(a, b, px, py) >= 0.0 && edge(b, c, px, py) >= 0.0 && edge(c, a, px, py) >= 0.0 {
+                write(pixel, tri.value);
+            }
+        }
+    }
+}
+
+/// Grows covered areas into `EMPTY` pixels by `passes` pixels (8-neighborhood),
+/// so that texture filtering does not bleed the background into islands.
+///
+/// Only the empty pixels are visited, so the cost scales with the uncovered area
+/// rather than with the image size.
+pub fn dilate(width: usize, height: usize, pixels: &mut [u32], passes: usize) {
+    if width == 0 || height == 0 || passes == 0 {
+        return;
+    }
+    let mut empty: Vec<u32> = (0..pixels.len() as u32)
+        .filter(|&i| pixels[i as usize] == EMPTY)
+        .collect();
+
+    for _ in 0..passes {
+        if empty.is_empty() {
+            break;
+        }
+        // Every pass reads the previous state and applies all fills at once
+        let source: &[u32] = pixels;
+        let chunk_len = empty.len().div_ceil(worker_count());
+        let fills: Vec<Vec<(u32, u32)>> = thread::scope(|scope| {
+            let handles: Vec<_> = empty
+                .chunks(chunk_len)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .filter_map(|&i| {
+                                let value = neighbor_value_at(source, width, height, i as usize);
+                                (value != EMPTY).then_some((i, value))
+                            })
+                            .collect::<Vec<_>>()
+                    })
+                })
+                .collect();
+            handles.into_iter().map(|h| h.join().unwrap()).collect()
+        });
+
+        for (i, value) in fills.into_iter().flatten() {
+            pixels[i as usize] = value;
+        }
+        empty.retain(|&i| pixels[i as usize] == EMPTY);
+    }
+}
+
+fn neighbor_value_at(pixels: &[u32], width: usize, height: usize, index: usize) -> u32 {
+    let (x, y) = (index % width, index / width);
+    let row_of = |y: usize| &pixels[y * width..(y + 1) * width];
+    let above = (y > 0).then(|| row_of(y - 1));
+    let below = (y + 1 < height).then(|| row_of(y + 1));
+    neighbor_value(row_of(y), above, below, x)
+}
+
+/// First covered pixel among the 8 neighbors of column `x`, straight neighbors first
+#[inline]
+fn neighbor_value(row: &[u32], above: Option<&[u32]>, below: Option<&[u32]>, x: usize) -> u32 {
+    let left = x.checked_sub(1);
+    let right = (x + 1 < row.len()).then_some(x + 1);
+
+    let straight = [
+        left.map(|l| row[l]),
+        right.map(|r| row[r]),
+        above.map(|a| a[x]),
+        below.map(|b| b[x]),
+    ];
+    let diagonal = [
+        above.zip(left).map(|(a, l)| a[l]),
+        above.zip(right).map(|(a, r)| a[r]),
+        below.zip(left).map(|(b, l)| b[l]),
+        below.zip(right).map(|(b, r)| b[r]),
+    ];
+    straight
+        .into_iter()
+        .chain(diagonal)
+        .flatten()
+        .find(|&value| value != EMPTY)
+        .unwrap_or(EMPTY)
+}
+
+/// Rasterizes the Color ID of every face into `rgba` (width * height * 4, float)
+/// `face_colors` are color indices as produced by `color_id::compute_island_coloring`.
+/// Uncovered pixels become transparent black.
+#[allow(clippy::too_many_arguments)]
+pub fn rasterize_color_id(
+    width: usize,
+    height: usize,
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_colors: &[u32],
+    padding: usize,
+    rgba: &mut [f32],
+) {
+    if width == 0 || height == 0 {
+        return;
+    }
+    let mut pixels = vec![EMPTY; width * height];
+    rasterize_face_values(
+        width,
+        height,
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_colors,
+        &mut pixels,
+    );
+    dilate(width, height, &mut pixels, padding);
+
+    // Color indices are small, so the colors are computed once per index
+    let max_color = face_colors.iter().copied().max().unwrap_or(0) as usize;
+    let palette: Vec<[f32; 4]> = (0..=max_color)
+        .map(|i| {
+            let (r, g, b, a) = get_golden_ratio_color(i);
+            [r, g, b, a]
+        })
+        .collect();
+
+    for_each_band(rgba, width * 4, |first_row, band| {
+        let first_pixel = first_row * width;
+        for (out, &value) in band.chunks_exact_mut(4).zip(&pixels[first_pixel..]) {
+            let color = palette.get(value as usize).unwrap_or(&[0.0; 4]);
+            out.copy_from_slice(color);
+        }
+    });
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::mesh_gen::{MeshKind, generate};
+
+    #[test]
+    fn grid_covers_every_pixel() {
+        // 40x40 cells over the whole UV square, one pixel per cell, spanning several bands
+        let mesh = generate(MeshKind::Grid, 40, 40, 0.0, 0);
+        let values: Vec<u32> = (0..mesh.num_faces() as u32).collect();
+        let mut pixels = vec![EMPTY; 40 * 40];
+
+        rasterize_face_values(
+            40,
+            40,
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.uv_coords,
+            &values,
+            &mut pixels,
+        );
+
+        assert!(pixels.iter().all(|&p| p != EMPTY));
+        // Each pixel center lies in exactly one cell, so all values are distinct
+        let mut sorted = pixels.clone();
+        sorted.sort_unstable();
+        sorted.dedup();
+        assert_eq!(sorted.len(), 40 * 40);
+    }
+
+    #[test]
+    fn triangle_winding_does_not_matter() {
+        let ccw_uvs = [0.0, 0.0, 1.0, 0.0, 0.0, 1.0];
+        let cw_uvs = [0.0, 0.0, 0.0, 1.0, 1.0, 0.0];
+        let mut ccw = vec![EMPTY; 64];
+        let mut cw = vec![EMPTY; 64];
+
+        rasterize_face_values(8, 8, &[0], &[3], &ccw_uvs, &[1], &mut ccw);
+        rasterize_face_values(8, 8, &[0], &[3], &cw_uvs, &[1], &mut cw);
+
+        assert_eq!(ccw, cw);
+        assert_eq!(ccw.iter().filter(|&&p| p == 1).count(), 36);
+    }
+
+    #[test]
+    fn dilate_grows_by_passes() {
+        let mut pixels = vec![EMPTY; 9 * 9];
+        pixels[4 * 9 + 4] = 7;
+
+        dilate(9, 9, &mut pixels, 2);
+
+        for y in 0..9usize {
+            for x in 0..9usize {
+                let inside = x.abs_diff(4) <= 2 && y.abs_diff(4) <= 2;
+                assert_eq!(pixels[y * 9 + x] == 7, inside, "pixel ({}, {})", x, y);
+            }
+        }
+    }
+
+    #[test]
+    fn rasterize_color_id_alpha() {
+        let mesh = generate(MeshKind::Checker, 2, 2, 0.0, 0);
+        let colors = vec![0u32; mesh.num_faces()];
+        let mut rgba = vec![0.5f32; 64 * 64 * 4];
+
+        rasterize_color_id(
+            64,
+            64,
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.uv_coords,
+            &colors,
+            0,
+            &mut rgba,
+        );
+
+        let alphas: Vec<f32> = rgba.chunks_exact(4).map(|p| p[3]).collect();
+        assert!(alphas.contains(&1.0));
+        assert!(alphas.contains(&0.0), "checker gaps must stay transparent");
+        assert!(alphas.iter().all(|&a| a == 0.0 || a == 1.0));
+    }
+}
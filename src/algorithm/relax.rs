@@ -0,0 +1,708 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Iterative UV relax
+//!
+//! Loops are welded into UV vertices where faces share an edge with matching UVs,
+//! like the island detection of `color_id`. Every iteration is a Jacobi step: each free
+//! UV vertex moves towards a target computed from the previous positions only, so the
+//! vertices of an iteration are independent and processed on all cores.
+//! - Laplacian: the target is the mean of the neighboring UV vertices.
+//! - ARAP: every face fits a rotation of its flattened 3D shape onto its current UVs
+//!   (local step); the target is the mean of the fitted corners (global step).
+//!
+//! UV vertices on island boundaries, pinned or outside the selected faces stay fixed.
+
+use crate::algorithm::color_id::is_uv_equal;
+use crate::algorithm::distortion::{cross, dot, length, measure_faces, scale, sub};
+use crate::algorithm::dsu::Dsu;
+use crate::algorithm::raster::worker_count;
+use std::ops::Range;
+use std::thread;
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum RelaxMethod {
+    Laplacian,
+    Arap,
+}
+
+impl RelaxMethod {
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name.to_ascii_uppercase().as_str() {
+            "LAPLACIAN" => Some(Self::Laplacian),
+            "ARAP" => Some(Self::Arap),
+            _ => None,
+        }
+    }
+}
+
+/// Welded UV vertices of a selection, ready to iterate
+/// Free vertices are numbered first, so one iteration writes `positions[..num_free]`.
+pub struct RelaxMesh {
+    method: RelaxMethod,
+    /// UV vertex of every loop, `u32::MAX` for loops outside the selected faces
+    loop_vertices: Vec<u32>,
+    positions: Vec<[f32; 2]>,
+    num_free: usize,
+    /// Per free vertex (CSR): neighbor vertices (Laplacian) or corners (ARAP)
+    link_offsets: Vec<u32>,
+    links: Vec<u32>,
+    /// ARAP: corner range of every relaxed face, the UV vertex and the rest
+    /// shape (centered, in UV scale) of every corner
+    face_corners: Vec<u32>,
+    corner_vertices: Vec<u32>,
+    corner_rest: Vec<[f32; 2]>,
+}
+
+impl RelaxMesh {
+    /// `face_select` marks the faces to relax, `loop_pins` the pinned loops.
+    #[allow(clippy::too_many_arguments)]
+    pub fn new(
+        poly_loop_starts: &[u32],
+        poly_loop_totals: &[u32],
+        loop_vert_indices: &[u32],
+        positions: &[f32],
+        uv_coords: &[f32],
+        face_select: &[bool],
+        loop_pins: &[bool],
+        method: RelaxMethod,
+    ) -> Self {
+        let num_loops = loop_vert_indices.len();
+        let mut loop_faces = vec![u32::MAX; num_loops];
+        for (f_idx, (&start, &total)) in poly_loop_starts.iter().zip(poly_loop_totals).enumerate() {
+            if face_select[f_idx] {
+                loop_faces[start as usize..(start + total) as usize].fill(f_idx as u32);
+            }
+        }
+
+        let welds = weld_loops(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+            &loop_faces,
+        );
+        let mut dsu = welds.loops;
+
+        // A UV vertex is free unless one of its loops is fixed
+        let mut fixed = vec![false; num_loops];
+        let leaders: Vec<u32> = (0..num_loops)
+            .map(|l_idx| {
+                let leader = dsu.leader(l_idx);
+                if loop_faces[l_idx] == u32::MAX || welds.boundary[l_idx] || loop_pins[l_idx] {
+                    fixed[leader] = true;
+                }
+                leader as u32
+            })
+            .collect();
+
+        // Number free vertices first, then the fixed ones of the selection
+        let mut vertex_of_leader = vec![u32::MAX; num_loops];
+        let mut uvs = Vec::new();
+        let mut num_free = 0;
+        for free_pass in [true, false] {
+            for l_idx in 0..num_loops {
+                let leader = leaders[l_idx] as usize;
+                if loop_faces[l_idx] == u32::MAX
+                    || fixed[leader] == free_pass
+                    || vertex_of_leader[leader] != u32::MAX
+                {
+                    continue;
+                }
+                vertex_of_leader[leader] = uvs.len() as u32;
+                uvs.push([uv_coords[l_idx * 2], uv_coords[l_idx * 2 + 1]]);
+            }
+            if free_pass {
+                num_free = uvs.len();
+            }
+        }
+        let loop_vertices: Vec<u32> = (0..num_loops)
+            .map(|l_idx| {
+                if loop_faces[l_idx] == u32::MAX {
+                    u32::MAX
+                } else {
+                    vertex_of_leader[leaders[l_idx] as usize]
+                }
+            })
+            .collect();
+
+        let mut mesh = Self {
+            method,
+            loop_vertices,
+            positions: uvs,
+            num_free,
+            link_offsets: Vec::new(),
+            links: Vec::new(),
+            face_corners: vec![0],
+            corner_vertices: Vec::new(),
+            corner_rest: Vec::new(),
+        };
+        let selected_faces = (0..poly_loop_starts.len()).filter(|&f| face_select[f]);
+        let mut pairs = Vec::new();
+        match method {
+            RelaxMethod::Laplacian => {
+                for f_idx in selected_faces {
+                    let start = poly_loop_starts[f_idx] as usize;
+                    let total = poly_loop_totals[f_idx] as usize;
+                    for i in 0..total {
+                        let a = mesh.loop_vertices[start + i];
+                        let b = mesh.loop_vertices[start + (i + 1) % total];
+                        if a != b {
+                            pairs.push((a, b));
+                            pairs.push((b, a));
+                        }
+                    }
+                }
+            }
+            RelaxMethod::Arap => {
+                let scales = component_scales(
+                    poly_loop_starts,
+                    poly_loop_totals,
+                    loop_vert_indices,
+                    positions,
+                    uv_coords,
+                    face_select,
+                    welds.faces,
+                );
+                for f_idx in selected_faces {
+                    let start = poly_loop_starts[f_idx] as usize;
+                    let end = start + poly_loop_totals[f_idx] as usize;
+                    let vertices = &mesh.loop_vertices[start..end];
+                    if vertices.iter().all(|&v| v as usize >= num_free) {
+                        continue;
+                    }
+                    for &v in vertices {
+                        pairs.push((v, mesh.corner_vertices.len() as u32));
+                        mesh.corner_vertices.push(v);
+                    }
+                    mesh.corner_rest.extend(rest_shape(
+                        start..end,
+                        loop_vert_indices,
+                        positions,
+                        uv_coords,
+                        scales[f_idx],
+                    ));
+                    mesh.face_corners.push(mesh.corner_vertices.len() as u32);
+                }
+            }
+        }
+        (mesh.link_offsets, mesh.links) =
+            free_links(num_free, &pairs, method == RelaxMethod::Laplacian);
+        mesh
+    }
+
+    pub fn num_free(&self) -> usize {
+        self.num_free
+    }
+
+    /// Runs `iterations` Jacobi steps; `strength` in (0, 1] is the fraction of the way
+    /// every vertex moves towards its target per step.
+    pub fn relax(&mut self, iterations: usize, strength: f32) {
+        if self.num_free == 0 {
+            return;
+        }
+        let mut next = self.positions.clone();
+        let mut targets = vec![[0.0f32; 2]; self.corner_vertices.len()];
+        for _ in 0..iterations {
+            if self.method == RelaxMethod::Arap {
+                self.fit_faces(&mut targets);
+            }
+            let sources: &[[f32; 2]] = match self.method {
+                RelaxMethod::Laplacian => &self.positions,
+                RelaxMethod::Arap => &targets,
+            };
+            let (positions, offsets, links) = (&self.positions, &self.link_offsets, &self.links);
+            for_each_chunk(&mut next[..self.num_free], |first, chunk| {
+                for (i, out) in chunk.iter_mut().enumerate() {
+                    let v = first + i;
+                    let linked = &links[offsets[v] as usize..offsets[v + 1] as usize];
+                    if linked.is_empty() {
+                        continue;
+                    }
+                    let (mut su, mut sv) = (0.0f32, 0.0f32);
+                    for &s in linked {
+                        su += sources[s as usize][0];
+                        sv += sources[s as usize][1];
+                    }
+                    let n = linked.len() as f32;
+                    let [u, v] = positions[v];
+                    *out = [u + (su / n - u) * strength, v + (sv / n - v) * strength];
+                }
+            });
+            // Fixed vertices are equal in both buffers
+            std::mem::swap(&mut self.positions, &mut next);
+        }
+    }
+
+    /// Local ARAP step: the rest shape of every face rotated onto its current UVs
+    fn fit_faces(&self, targets: &mut [[f32; 2]]) {
+        let num_faces = self.face_corners.len() - 1;
+        if num_faces == 0 {
+            return;
+        }
+        let chunk_len = num_faces.div_ceil(worker_count());
+        thread::scope(|scope| {
+            let mut rest = targets;
+            let mut first_face = 0;
+            while first_face < num_faces {
+                let last_face = (first_face + chunk_len).min(num_faces);
+                let first_corner = self.face_corners[first_face] as usize;
+                let last_corner = self.face_corners[last_face] as usize;
+                let (chunk, tail) = rest.split_at_mut(last_corner - first_corner);
+                rest = tail;
+                scope.spawn(move || {
+                    for f in first_face..last_face {
+                        let start = self.face_corners[f] as usize;
+                        let end = self.face_corners[f + 1] as usize;
+                        self.fit_face(
+                            start..end,
+                            &mut chunk[start - first_corner..end - first_corner],
+                        );
+                    }
+                });
+                first_face = last_face;
+            }
+        });
+    }
+
+    fn fit_face(&self, corners: Range<usize>, out: &mut [[f32; 2]]) {
+        let rest = &self.corner_rest[corners.clone()];
+        let uvs = self.corner_vertices[corners]
+            .iter()
+            .map(|&v| self.positions[v as usize]);
+
+        // Best rotation of the rest shape onto the UVs (2D Procrustes). The rest shape
+        // is centered, so the UVs need no centering for the correlation sums.
+        let (mut su, mut sv, mut a, mut b) = (0.0f32, 0.0f32, 0.0f32, 0.0f32);
+        for (r, [u, v]) in rest.iter().zip(uvs) {
+            su += u;
+            sv += v;
+            a += r[0] * u + r[1] * v;
+            b += r[0] * v - r[1] * u;
+        }
+        let n = rest.len() as f32;
+        let (cu, cv) = (su / n, sv / n);
+        let norm = a.hypot(b);
+        let (cos, sin) = if norm > 0.0 {
+            (a / norm, b / norm)
+        } else {
+            (1.0, 0.0)
+        };
+        for (target, r) in out.iter_mut().zip(rest) {
+            *target = [cu + cos * r[0] - sin * r[1], cv + sin * r[0] + cos * r[1]];
+        }
+    }
+
+    /// Writes the free vertices back into their loops
+    pub fn write_uvs(&self, uv_coords: &mut [f32]) {
+        for (l_idx, &v) in self.loop_vertices.iter().enumerate() {
+            if (v as usize) < self.num_free {
+                let [u, v] = self.positions[v as usize];
+                uv_coords[l_idx * 2] = u;
+                uv_coords[l_idx * 2 + 1] = v;
+            }
+        }
+    }
+}
+
+/// Relaxes the selected faces in place and returns the number of moved UV vertices
+#[allow(clippy::too_many_arguments)]
+pub fn relax_uvs(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &mut [f32],
+    face_select: &[bool],
+    loop_pins: &[bool],
+    method: RelaxMethod,
+    iterations: usize,
+    strength: f32,
+) -> usize {
+    let mut mesh = RelaxMesh::new(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_select,
+        loop_pins,
+        method,
+    );
+    mesh.relax(iterations, strength);
+    mesh.write_uvs(uv_coords);
+    mesh.num_free()
+}
+
+struct Welds {
+    /// Loops of one UV vertex
+    loops: Dsu,
+    /// Faces of one UV-connected component
+    faces: Dsu,
+    /// Loops on an edge without a UV-connected neighbor face
+    boundary: Vec<bool>,
+}
+
+/// Welds the loops of the selected faces (`loop_faces` not `u32::MAX`) across edges
+/// with matching UVs
+fn weld_loops(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+    loop_faces: &[u32],
+) -> Welds {
+    let next_loop = |l: u32| {
+        let face = loop_faces[l as usize] as usize;
+        if l + 1 < poly_loop_starts[face] + poly_loop_totals[face] {
+            l + 1
+        } else {
+            poly_loop_starts[face]
+        }
+    };
+    // (min vert << 32 | max vert, loop), sorted so shared edges are adjacent
+    let mut edges: Vec<(u64, u32)> = Vec::with_capacity(loop_vert_indices.len());
+    for l_curr in 0..loop_vert_indices.len() as u32 {
+        if loop_faces[l_curr as usize] == u32::MAX {
+            continue;
+        }
+        let v1 = loop_vert_indices[l_curr as usize];
+        let v2 = loop_vert_indices[next_loop(l_curr) as usize];
+        if v1 != v2 {
+            edges.push(((v1.min(v2) as u64) << 32 | v1.max(v2) as u64, l_curr));
+        }
+    }
+    edges.sort_unstable();
+
+    let uv = |l: u32| (uv_coords[l as usize * 2], uv_coords[l as usize * 2 + 1]);
+    let same_uv = |a: u32, b: u32| {
+        let ((u1, v1), (u2, v2)) = (uv(a), uv(b));
+        is_uv_equal(u1, v1, u2, v2)
+    };
+
+    let mut welds = Welds {
+        loops: Dsu::new(loop_vert_indices.len()),
+        faces: Dsu::new(poly_loop_starts.len()),
+        boundary: vec![false; loop_vert_indices.len()],
+    };
+    for shared in edges.chunk_by(|a, b| a.0 == b.0) {
+        for (i, &(_, a_curr)) in shared.iter().enumerate() {
+            let a_next = next_loop(a_curr);
+            let mut connected = false;
+            for (j, &(_, b_curr)) in shared.iter().enumerate() {
+                if i == j {
+                    continue;
+                }
+                // Pair up the loops of the same vertex
+                let b_next = next_loop(b_curr);
+                let (b_curr, b_next) =
+                    if loop_vert_indices[a_curr as usize] == loop_vert_indices[b_curr as usize] {
+                        (b_curr, b_next)
+                    } else {
+                        (b_next, b_curr)
+                    };
+                if same_uv(a_curr, b_curr) && same_uv(a_next, b_next) {
+                    connected = true;
+                    welds.loops.merge(a_curr as usize, b_curr as usize);
+                    welds.loops.merge(a_next as usize, b_next as usize);
+                    welds.faces.merge(
+                        loop_faces[a_curr as usize] as usize,
+                        loop_faces[b_curr as usize] as usize,
+                    );
+                }
+            }
+            if !connected {
+                welds.boundary[a_curr as usize] = true;
+                welds.boundary[a_next as usize] = true;
+            }
+        }
+    }
+    welds
+}
+
+/// UV units per 3D unit of the selected faces of every UV-connected component,
+/// so the ARAP rest shapes keep the current overall scale of each island
+fn component_scales(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+    face_select: &[bool],
+    mut components: Dsu,
+) -> Vec<f32> {
+    let measures = measure_faces(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+    );
+    let num_faces = measures.len();
+    let mut areas = vec![(0.0f64, 0.0f64); num_faces];
+    for f_idx in (0..num_faces).filter(|&f| face_select[f]) {
+        let entry = &mut areas[components.leader(f_idx)];
+        entry.0 += measures[f_idx].area_3d as f64;
+        entry.1 += measures[f_idx].area_uv as f64;
+    }
+    (0..num_faces)
+        .map(|f_idx| {
+            let (area_3d, area_uv) = areas[components.leader(f_idx)];
+            if area_3d > 0.0 {
+                (area_uv / area_3d).sqrt() as f32
+            } else {
+                0.0
+            }
+        })
+        .collect()
+}
+
+/// The 3D polygon of `loops` flattened into its plane, centered and scaled to UV units.
+/// Mirrored when the UVs wind the other way, so a rotation can fit it.
+fn rest_shape(
+    loops: Range<usize>,
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+    uv_scale: f32,
+) -> Vec<[f32; 2]> {
+    let points: Vec<[f32; 3]> = loops
+        .clone()
+        .map(|l| {
+            let v = loop_vert_indices[l] as usize * 3;
+            [positions[v], positions[v + 1], positions[v + 2]]
+        })
+        .collect();
+    let n = points.len();
+    let centroid = scale(
+        points.iter().fold([0.0; 3], |acc, p| {
+            [acc[0] + p[0], acc[1] + p[1], acc[2] + p[2]]
+        }),
+        1.0 / n as f32,
+    );
+
+    // Newell normal and the first non-degenerate edge span the plane
+    let mut normal = [0.0f32; 3];
+    for i in 0..n {
+        let (p, q) = (points[i], points[(i + 1) % n]);
+        normal[0] += (p[1] - q[1]) * (p[2] + q[2]);
+        normal[1] += (p[2] - q[2]) * (p[0] + q[0]);
+        normal[2] += (p[0] - q[0]) * (p[1] + q[1]);
+    }
+    let axis = (1..n)
+        .map(|i| sub(points[i], points[0]))
+        .find(|e| length(*e) > 0.0);
+    let (Some(axis), true) = (axis, length(normal) > 0.0 && uv_scale > 0.0) else {
+        // Degenerate face: its current UV shape is the rest shape
+        let uvs: Vec<[f32; 2]> = loops
+            .map(|l| [uv_coords[l * 2], uv_coords[l * 2 + 1]])
+            .collect();
+        let cu = uvs.iter().map(|uv| uv[0]).sum::<f32>() / n as f32;
+        let cv = uvs.iter().map(|uv| uv[1]).sum::<f32>() / n as f32;
+        return uvs.iter().map(|uv| [uv[0] - cu, uv[1] - cv]).collect();
+    };
+    let e1 = scale(axis, 1.0 / length(axis));
+    let e2 = cross(scale(normal, 1.0 / length(normal)), e1);
+
+    let mirror = uv_signed_area(loops, uv_coords) < 0.0;
+    points
+        .iter()
+        .map(|&p| {
+            let d = sub(p, centroid);
+            let (x, y) = (dot(d, e1) * uv_scale, dot(d, e2) * uv_scale);
+            if mirror { [x, -y] } else { [x, y] }
+        })
+        .collect()
+}
+
+fn uv_signed_area(loops: Range<usize>, uv_coords: &[f32]) -> f32 {
+    let n = loops.len();
+    (0..n)
+        .map(|i| {
+            let (a, b) = (loops.start + i, loops.start + (i + 1) % n);
+            uv_coords[a * 2] * uv_coords[b * 2 + 1] - uv_coords[b * 2] * uv_coords[a * 2 + 1]
+        })
+        .sum::<f32>()
+        * 0.5
+}
+
+/// CSR of the links of the free vertices in `(vertex, link)` pairs,
+/// optionally without duplicate links per vertex
+fn free_links(num_free: usize, pairs: &[(u32, u32)], dedup: bool) -> (Vec<u32>, Vec<u32>) {
+    let mut offsets = vec![0u32; num_free + 1];
+    for &(v, _) in pairs.iter().filter(|&&(v, _)| (v as usize) < num_free) {
+        offsets[v as usize + 1] += 1;
+    }
+    for i in 0..num_free {
+        offsets[i + 1] += offsets[i];
+    }
+    let mut links = vec![0u32; offsets[num_free] as usize];
+    let mut cursors = offsets.clone();
+    for &(v, link) in pairs.iter().filter(|&&(v, _)| (v as usize) < num_free) {
+        links[cursors[v as usize] as usize] = link;
+        cursors[v as usize] += 1;
+    }
+    if !dedup {
+        return (offsets, links);
+    }
+
+    // Compact in place; the write position never passes the read position
+    let mut write = 0;
+    for v in 0..num_free {
+        let (start, end) = (offsets[v] as usize, offsets[v + 1] as usize);
+        offsets[v] = write as u32;
+        links[start..end].sort_unstable();
+        for i in start..end {
+            if write == offsets[v] as usize || links[write - 1] != links[i] {
+                links[write] = links[i];
+                write += 1;
+            }
+        }
+    }
+    offsets[num_free] = write as u32;
+    links.truncate(write);
+    (offsets, links)
+}
+
+/// Runs `f(first_index, chunk)` for one chunk of `data` per core
+fn for_each_chunk<T: Send>(data: &mut [T], f: impl Fn(usize, &mut [T]) + Sync) {
+    if data.is_empty() {
+        return;
+    }
+    let chunk_len = data.len().div_ceil(worker_count());
+    let f = &f;
+    thread::scope(|scope| {
+        for (c_idx, chunk) in data.chunks_mut(chunk_len).enumerate() {
+            scope.spawn(move || f(c_idx * chunk_len, chunk));
+        }
+    });
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::mesh_gen::{MeshKind, SyntheticMesh, generate};
+
+    const CENTER: u32 = 12; // vertex (2, 2) of a 4x4 grid
+
+    /// 4x4 grid in one island with the center vertex dragged off
+    fn dragged_grid() -> SyntheticMesh {
+        let mut mesh = generate(MeshKind::Grid, 4, 4, 0.0, 0);
+        set_vertex_uv(&mut mesh, CENTER, [0.7, 0.65]);
+        mesh
+    }
+
+    fn set_vertex_uv(mesh: &mut SyntheticMesh, vert: u32, uv: [f32; 2]) {
+        for (l_idx, &v) in mesh.loop_vert_indices.iter().enumerate() {
+            if v == vert {
+                mesh.uv_coords[l_idx * 2..l_idx * 2 + 2].copy_from_slice(&uv);
+            }
+        }
+    }
+
+    fn vertex_uv(mesh: &SyntheticMesh, vert: u32) -> [f32; 2] {
+        let l_idx = mesh
+            .loop_vert_indices
+            .iter()
+            .position(|&v| v == vert)
+            .unwrap();
+        [mesh.uv_coords[l_idx * 2], mesh.uv_coords[l_idx * 2 + 1]]
+    }
+
+    fn relax(
+        mesh: &mut SyntheticMesh,
+        face_select: &[bool],
+        loop_pins: &[bool],
+        method: RelaxMethod,
+    ) -> usize {
+        relax_uvs(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.loop_vert_indices,
+            &mesh.positions,
+            &mut mesh.uv_coords,
+            face_select,
+            loop_pins,
+            method,
+            200,
+            1.0,
+        )
+    }
+
+    fn assert_near(actual: [f32; 2], expected: [f32; 2]) {
+        assert!(
+            (actual[0] - expected[0]).abs() < 1e-3 && (actual[1] - expected[1]).abs() < 1e-3,
+            "{:?} != {:?}",
+            actual,
+            expected
+        );
+    }
+
+    #[test]
+    fn relax_restores_a_regular_grid() {
+        for method in [RelaxMethod::Laplacian, RelaxMethod::Arap] {
+            let mut mesh = dragged_grid();
+            let original = generate(MeshKind::Grid, 4, 4, 0.0, 0);
+            let num_loops = mesh.loop_vert_indices.len();
+
+            let moved = relax(&mut mesh, &[true; 16], &vec![false; num_loops], method);
+
+            // 3x3 interior vertices move, the island boundary stays
+            assert_eq!(moved, 9);
+            assert_near(vertex_uv(&mesh, CENTER), [0.5, 0.5]);
+            assert_eq!(vertex_uv(&mesh, 0), vertex_uv(&original, 0));
+            assert_eq!(vertex_uv(&mesh, 24), vertex_uv(&original, 24));
+        }
+    }
+
+    #[test]
+    fn pinned_loops_stay_fixed() {
+        let mut mesh = dragged_grid();
+        let pins: Vec<bool> = mesh
+            .loop_vert_indices
+            .iter()
+            .map(|&v| v == CENTER)
+            .collect();
+
+        let moved = relax(&mut mesh, &[true; 16], &pins, RelaxMethod::Laplacian);
+
+        assert_eq!(moved, 8);
+        assert_eq!(vertex_uv(&mesh, CENTER), [0.7, 0.65]);
+    }
+
+    #[test]
+    fn unselected_faces_are_untouched() {
+        let mut mesh = dragged_grid();
+        let before = mesh.uv_coords.clone();
+        let num_loops = mesh.loop_vert_indices.len();
+        // Only the bottom row: all its vertices are on the selection border
+        let select: Vec<bool> = (0..16).map(|f| f < 4).collect();
+
+        let moved = relax(
+            &mut mesh,
+            &select,
+            &vec![false; num_loops],
+            RelaxMethod::Arap,
+        );
+
+        assert_eq!(moved, 0);
+        assert_eq!(mesh.uv_coords, before);
+    }
+
+    #[test]
+    fn seams_are_boundaries() {
+        // Every checker cell is its own island: nothing is interior
+        let mut mesh = generate(MeshKind::Checker, 3, 3, 0.0, 0);
+        let before = mesh.uv_coords.clone();
+        let num_loops = mesh.loop_vert_indices.len();
+
+        let moved = relax(
+            &mut mesh,
+            &[true; 9],
+            &vec![false; num_loops],
+            RelaxMethod::Laplacian,
+        );
+
+        assert_eq!(moved, 0);
+        assert_eq!(mesh.uv_coords, before);
+    }
+}
@@ -0,0 +1,356 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Seams from UV islands
+//!
+//! Every loop starts one side of its face's edge (Blender's `MeshLoop.edge_index`).
+//! A side is open when no other side of the same edge has matching UVs, with the same
+//! test `color_id::detect_uv_islands` uses to merge faces into islands. Edges with two or
+//! more sides and an open one are seams; open sides of one island chain into its
+//! boundary polylines.
+
+use crate::algorithm::color_id::{get_sorted_uvs, is_uv_equal};
+use crate::algorithm::raster::worker_count;
+use std::collections::HashMap;
+use std::thread;
+
+/// Boundary polylines of all islands, as chains of loops
+/// Each loop stands for the side from its vertex to the next loop's vertex.
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct Polylines {
+    /// Start of every polyline in `loops`, plus the end
+    pub offsets: Vec<u32>,
+    pub loops: Vec<u32>,
+    pub islands: Vec<u32>,
+    /// The polyline ends where it starts
+    pub closed: Vec<bool>,
+}
+
+/// Next loop of every loop in its face
+pub fn next_loops(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    num_loops: usize,
+) -> Vec<u32> {
+    let mut next = vec![0u32; num_loops];
+    for (&start, &total) in poly_loop_starts.iter().zip(poly_loop_totals) {
+        for i in 0..total {
+            next[(start + i) as usize] = start + (i + 1) % total;
+        }
+    }
+    next
+}
+
+/// Sides of every edge (CSR by edge index), by counting sort
+pub fn edge_sides(loop_edge_indices: &[u32], num_edges: usize) -> (Vec<u32>, Vec<u32>) {
+    let mut offsets = vec![0u32; num_edges + 1];
+    for &e in loop_edge_indices {
+        offsets[e as usize + 1] += 1;
+    }
+    for e in 0..num_edges {
+        offsets[e + 1] += offsets[e];
+    }
+    let mut cursors = offsets.clone();
+    let mut sides = vec![0u32; loop_edge_indices.len()];
+    for (l, &e) in loop_edge_indices.iter().enumerate() {
+        sides[cursors[e as usize] as usize] = l as u32;
+        cursors[e as usize] += 1;
+    }
+    (offsets, sides)
+}
+
+/// Edge of every loop for meshes that come without edges, such as mesh files: one edge
+/// per vertex pair joined by a face side, numbered in order of their first loop.
+/// Returns the loop edges and the number of edges.
+pub fn loop_edges(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+) -> (Vec<u32>, usize) {
+    let next = next_loops(poly_loop_starts, poly_loop_totals, loop_vert_indices.len());
+    let mut edges = HashMap::with_capacity(loop_vert_indices.len() / 2);
+    let loop_edges = (0..loop_vert_indices.len())
+        .map(|l| {
+            let (a, b) = (loop_vert_indices[l], loop_vert_indices[next[l] as usize]);
+            let num_edges = edges.len() as u32;
+            *edges.entry((a.min(b), a.max(b))).or_insert(num_edges)
+        })
+        .collect();
+    (loop_edges, edges.len())
+}
+
+/// Edge sides with their open state, shared by the seam mask and the polylines
+pub struct SideTable {
+    pub next: Vec<u32>,
+    pub offsets: Vec<u32>,
+    pub sides: Vec<u32>,
+    /// Per loop: no other side of its edge has matching UVs
+    pub open: Vec<bool>,
+}
+
+impl SideTable {
+    /// Classifies the side of every loop; loops are processed on all cores
+    pub fn new(
+        poly_loop_starts: &[u32],
+        poly_loop_totals: &[u32],
+        loop_vert_indices: &[u32],
+        loop_edge_indices: &[u32],
+        uv_coords: &[f32],
+        num_edges: usize,
+    ) -> Self {
+        let num_loops = loop_vert_indices.len();
+        let next = next_loops(poly_loop_starts, poly_loop_totals, num_loops);
+        let (offsets, sides) = edge_sides(loop_edge_indices, num_edges);
+
+        let mut open = vec![true; num_loops];
+        if num_loops > 0 {
+            let chunk_len = num_loops.div_ceil(worker_count());
+            thread::scope(|scope| {
+                for (c_idx, chunk) in open.chunks_mut(chunk_len).enumerate() {
+                    let (next, offsets, sides) = (&next, &offsets, &sides);
+                    scope.spawn(move || {
+                        let side_uvs = |l: u32| {
+                            get_sorted_uvs(l, next[l as usize], loop_vert_indices, uv_coords)
+                        };
+                        for (i, open) in chunk.iter_mut().enumerate() {
+                            let l = (c_idx * chunk_len + i) as u32;
+                            let e = loop_edge_indices[l as usize] as usize;
+                            let (a_min, a_max) = side_uvs(l);
+                            *open = !sides[offsets[e] as usize..offsets[e + 1] as usize]
+                                .iter()
+                                .filter(|&&other| other != l)
+                                .any(|&other| {
+                                    let (b_min, b_max) = side_uvs(other);
+                                    is_uv_equal(a_min.0, a_min.1, b_min.0, b_min.1)
+                                        && is_uv_equal(a_max.0, a_max.1, b_max.0, b_max.1)
+                                });
+                        }
+                    });
+                }
+            });
+        }
+
+        Self {
+            next,
+            offsets,
+            sides,
+            open,
+        }
+    }
+
+    /// Per edge: it has two or more sides and at least one of them is open.
+    /// Boundary edges of the mesh (one side) are not seams.
+    pub fn seam_mask(&self) -> Vec<bool> {
+        (0..self.offsets.len() - 1)
+            .map(|e| {
+                let sides = &self.sides[self.offsets[e] as usize..self.offsets[e + 1] as usize];
+                sides.len() > 1 && sides.iter().any(|&l| self.open[l as usize])
+            })
+            .collect()
+    }
+
+    /// Per island: the seam edges (`seam_mask`) with a side in one of its faces
+    pub fn island_seam_counts(
+        &self,
+        seam_mask: &[bool],
+        poly_loop_starts: &[u32],
+        poly_loop_totals: &[u32],
+        face_islands: &[u32],
+        num_islands: usize,
+    ) -> Vec<u32> {
+        let mut loop_islands = vec![0u32; self.next.len()];
+        for ((&start, &total), &island) in poly_loop_starts
+            .iter()
+            .zip(poly_loop_totals)
+            .zip(face_islands)
+        {
+            loop_islands[start as usize..(start + total) as usize].fill(island);
+        }
+
+        let mut counts = vec![0u32; num_islands];
+        // Edge last counted per island, so an edge with two sides in one island counts once
+        let mut counted = vec![u32::MAX; num_islands];
+        for (e, _) in seam_mask.iter().enumerate().filter(|&(_, &seam)| seam) {
+            for &l in &self.sides[self.offsets[e] as usize..self.offsets[e + 1] as usize] {
+                let island = loop_islands[l as usize] as usize;
+                if counted[island] != e as u32 {
+                    counted[island] = e as u32;
+                    counts[island] += 1;
+                }
+            }
+        }
+        counts
+    }
+
+    /// Chains the open sides of every island into polylines
+    /// At vertices with several open sides, the one continuing the UV is followed.
+    pub fn polylines(
+        &self,
+        poly_loop_starts: &[u32],
+        poly_loop_totals: &[u32],
+        loop_vert_indices: &[u32],
+        uv_coords: &[f32],
+        face_islands: &[u32],
+    ) -> Polylines {
+        // (island, start vertex, loop) of the open sides
+        let mut keyed: Vec<(u32, u32, u32)> = Vec::new();
+        for (f_idx, (&start, &total)) in poly_loop_starts.iter().zip(poly_loop_totals).enumerate() {
+            for l in start..start + total {
+                if self.open[l as usize] {
+                    keyed.push((face_islands[f_idx], loop_vert_indices[l as usize], l));
+                }
+            }
+        }
+        keyed.sort_unstable();
+
+        let uv = |l: u32| (uv_coords[l as usize * 2], uv_coords[l as usize * 2 + 1]);
+        let same_uv = |a: u32, b: u32| {
+            let ((ua, va), (ub, vb)) = (uv(a), uv(b));
+            is_uv_equal(ua, va, ub, vb)
+        };
+        let mut used = vec![false; keyed.len()];
+        let mut polylines = Polylines {
+            offsets: vec![0],
+            ..Default::default()
+        };
+        for first in 0..keyed.len() {
+            if used[first] {
+                continue;
+            }
+            let (island, start_vert, start_loop) = keyed[first];
+            let mut current = first;
+            let closed = loop {
+                used[current] = true;
+                let l = keyed[current].2;
+                polylines.loops.push(l);
+
+                let end = self.next[l as usize];
+                let end_vert = loop_vert_indices[end as usize];
+                if end_vert == start_vert && same_uv(end, start_loop) {
+                    break true;
+                }
+                let from = keyed.partition_point(|k| (k.0, k.1) < (island, end_vert));
+                let candidates = (from..keyed.len())
+                    .take_while(|&k| keyed[k].0 == island && keyed[k].1 == end_vert)
+                    .filter(|&k| !used[k]);
+                let mut fallback = None;
+                let mut found = None;
+                for k in candidates {
+                    if same_uv(keyed[k].2, end) {
+                        found = Some(k);
+                        break;
+                    }
+                    fallback = fallback.or(Some(k));
+                }
+                match found.or(fallback) {
+                    Some(k) => current = k,
+                    None => break false,
+                }
+            };
+            polylines.offsets.push(polylines.loops.len() as u32);
+            polylines.islands.push(island);
+            polylines.closed.push(closed);
+        }
+        polylines
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Two quads sharing vertices 1 and 2 (edge 1), split in UV unless `welded`
+    ///
+    /// Edges: 0 (0-1), 1 (1-2), 2 (2-3), 3 (3-0), 4 (1-4), 5 (4-5), 6 (5-2)
+    const STARTS: [u32; 2] = [0, 4];
+    const TOTALS: [u32; 2] = [4, 4];
+    const VERTS: [u32; 8] = [0, 1, 2, 3, 1, 4, 5, 2];
+    const EDGES: [u32; 8] = [0, 1, 2, 3, 4, 5, 6, 1];
+
+    fn uvs(welded: bool) -> Vec<f32> {
+        let offset = if welded { 0.0 } else { 0.1 };
+        vec![
+            0.0,
+            0.0,
+            0.5,
+            0.0,
+            0.5,
+            0.5,
+            0.0,
+            0.5, // face 0
+            0.5 + offset,
+            0.0,
+            1.0,
+            0.0,
+            1.0,
+            0.5,
+            0.5 + offset,
+            0.5, // face 1
+        ]
+    }
+
+    fn table(uvs: &[f32]) -> SideTable {
+        SideTable::new(&STARTS, &TOTALS, &VERTS, &EDGES, uvs, 7)
+    }
+
+    #[test]
+    fn split_shared_edge_is_a_seam() {
+        let mask = table(&uvs(false)).seam_mask();
+
+        assert_eq!(mask, vec![false, true, false, false, false, false, false]);
+    }
+
+    #[test]
+    fn continuous_uvs_have_no_seams() {
+        let table = table(&uvs(true));
+
+        assert!(table.seam_mask().iter().all(|&seam| !seam));
+        assert!(!table.open[1] && !table.open[7]);
+    }
+
+    #[test]
+    fn loop_edges_match_the_mesh_edges() {
+        let (loop_edges, num_edges) = loop_edges(&STARTS, &TOTALS, &VERTS);
+
+        assert_eq!(loop_edges, EDGES);
+        assert_eq!(num_edges, 7);
+    }
+
+    #[test]
+    fn seams_are_counted_per_island() {
+        let table = table(&uvs(false));
+        let mask = table.seam_mask();
+
+        assert_eq!(
+            table.island_seam_counts(&mask, &STARTS, &TOTALS, &[0, 1], 2),
+            vec![1, 1]
+        );
+        // A seam inside one island counts once for it
+        assert_eq!(
+            table.island_seam_counts(&mask, &STARTS, &TOTALS, &[0, 0], 1),
+            vec![1]
+        );
+    }
+
+    #[test]
+    fn island_boundaries_are_closed_loops() {
+        let uvs = uvs(false);
+        let polylines = table(&uvs).polylines(&STARTS, &TOTALS, &VERTS, &uvs, &[0, 1]);
+
+        assert_eq!(polylines.offsets, vec![0, 4, 8]);
+        assert_eq!(polylines.islands, vec![0, 1]);
+        assert_eq!(polylines.closed, vec![true, true]);
+        assert_eq!(polylines.loops[..4], [0, 1, 2, 3]);
+    }
+
+    #[test]
+    fn welded_boundary_goes_around_both_faces() {
+        let uvs = uvs(true);
+        let polylines = table(&uvs).polylines(&STARTS, &TOTALS, &VERTS, &uvs, &[0, 0]);
+
+        assert_eq!(polylines.offsets, vec![0, 6]);
+        assert_eq!(polylines.closed, vec![true]);
+        let mut loops = polylines.loops.clone();
+        loops.sort_unstable();
+        assert_eq!(loops, vec![0, 2, 3, 4, 5, 6]);
+    }
+}
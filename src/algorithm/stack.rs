@@ -0,0 +1,451 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Duplicate island detection and UV stacking
+//!
+//! Every island gets a signature that does not change under rotation or translation:
+//! its sorted face sizes and vertex valences (topology) and its sorted 3D edge lengths.
+//! Islands are bucketed by the hash of their topology. Inside a bucket they are sorted
+//! by total edge length, so only islands with a close total are verified edge by edge;
+//! lengths are never quantized, so rounding cannot split true duplicates.
+//!
+//! Stacking moves every island of a group onto the UV transform of its first island:
+//! UV centroid, principal axis (PCA, oriented by the third moment) and spread.
+//! Mirrored islands are flipped to the winding of the first island.
+
+use crate::algorithm::dsu::Dsu;
+use crate::algorithm::fingerprint::Fingerprint;
+use crate::algorithm::raster::worker_count;
+use std::collections::HashMap;
+use std::thread;
+
+/// Rotation- and translation-invariant description of an island
+#[derive(Debug, Clone, Default, PartialEq)]
+pub struct IslandSignature {
+    pub topology_hash: u64,
+    /// Sorted 3D lengths of the face edges (shared edges once per face)
+    pub edge_lengths: Vec<f32>,
+    pub total_length: f32,
+}
+
+/// Faces of every island (CSR), in face order
+pub fn island_faces(face_islands: &[u32], num_islands: usize) -> (Vec<u32>, Vec<u32>) {
+    let mut offsets = vec![0u32; num_islands + 1];
+    for &island in face_islands {
+        offsets[island as usize + 1] += 1;
+    }
+    for i in 0..num_islands {
+        offsets[i + 1] += offsets[i];
+    }
+    let mut cursors = offsets.clone();
+    let mut faces = vec![0u32; face_islands.len()];
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        faces[cursors[island as usize] as usize] = f_idx as u32;
+        cursors[island as usize] += 1;
+    }
+    (offsets, faces)
+}
+
+/// Signature of every island; islands are processed on all cores
+pub fn island_signatures(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> Vec<IslandSignature> {
+    let (offsets, faces) = island_faces(face_islands, num_islands);
+    let mut signatures = vec![IslandSignature::default(); num_islands];
+    if num_islands == 0 {
+        return signatures;
+    }
+    let chunk_len = num_islands.div_ceil(worker_count());
+
+    thread::scope(|scope| {
+        for (c_idx, chunk) in signatures.chunks_mut(chunk_len).enumerate() {
+            let (offsets, faces) = (&offsets, &faces);
+            scope.spawn(move || {
+                for (i, signature) in chunk.iter_mut().enumerate() {
+                    let island = c_idx * chunk_len + i;
+                    let island_faces =
+                        &faces[offsets[island] as usize..offsets[island + 1] as usize];
+                    *signature = signature_of(
+                        island_faces,
+                        poly_loop_starts,
+                        poly_loop_totals,
+                        loop_vert_indices,
+                        positions,
+                    );
+                }
+            });
+        }
+    });
+    signatures
+}
+
+fn signature_of(
+    faces: &[u32],
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+) -> IslandSignature {
+    let position = |v: u32| {
+        let v = v as usize * 3;
+        [positions[v], positions[v + 1], positions[v + 2]]
+    };
+
+    let mut face_sizes = Vec::with_capacity(faces.len());
+    let mut verts = Vec::new();
+    let mut edge_lengths = Vec::new();
+    for &f in faces {
+        let start = poly_loop_starts[f as usize] as usize;
+        let total = poly_loop_totals[f as usize] as usize;
+        face_sizes.push(total as u32);
+        for i in 0..total {
+            let (a, b) = (
+                loop_vert_indices[start + i],
+                loop_vert_indices[start + (i + 1) % total],
+            );
+            verts.push(a);
+            let (pa, pb) = (position(a), position(b));
+            let d = [pa[0] - pb[0], pa[1] - pb[1], pa[2] - pb[2]];
+            edge_lengths.push((d[0] * d[0] + d[1] * d[1] + d[2] * d[2]).sqrt());
+        }
+    }
+    face_sizes.sort_unstable();
+    // Valences: loops per vertex, independent of the vertex numbering
+    verts.sort_unstable();
+    let mut valences: Vec<u32> = verts
+        .chunk_by(|a, b| a == b)
+        .map(|run| run.len() as u32)
+        .collect();
+    valences.sort_unstable();
+    edge_lengths.sort_unstable_by(f32::total_cmp);
+
+    let mut hasher = Fingerprint::new();
+    hasher.write_u32s(&face_sizes);
+    hasher.write_u32s(&valences);
+    IslandSignature {
+        topology_hash: hasher.finish(),
+        total_length: edge_lengths.iter().sum(),
+        edge_lengths,
+    }
+}
+
+/// Groups of identical islands (edge lengths within `tolerance`), each sorted by island
+/// and the groups by their first island. Islands without a duplicate are left out.
+pub fn group_duplicates(signatures: &[IslandSignature], tolerance: f32) -> Vec<Vec<u32>> {
+    let mut buckets: HashMap<u64, Vec<u32>> = HashMap::new();
+    for (island, signature) in signatures.iter().enumerate() {
+        buckets
+            .entry(signature.topology_hash)
+            .or_default()
+            .push(island as u32);
+    }
+
+    let mut dsu = Dsu::new(signatures.len());
+    for bucket in buckets.values_mut().filter(|bucket| bucket.len() > 1) {
+        bucket.sort_unstable_by(|&a, &b| {
+            signatures[a as usize]
+                .total_length
+                .total_cmp(&signatures[b as usize].total_length)
+        });
+        for (i, &a) in bucket.iter().enumerate() {
+            let sig_a = &signatures[a as usize];
+            // Totals of duplicates differ by at most tolerance per edge
+            let window = tolerance * sig_a.edge_lengths.len() as f32;
+            for &b in &bucket[i + 1..] {
+                let sig_b = &signatures[b as usize];
+                if sig_b.total_length - sig_a.total_length > window {
+                    break;
+                }
+                if same_lengths(sig_a, sig_b, tolerance) {
+                    dsu.merge(a as usize, b as usize);
+                }
+            }
+        }
+    }
+
+    let mut groups: Vec<Vec<u32>> = dsu
+        .groups()
+        .into_iter()
+        .filter(|group| group.len() > 1)
+        .map(|group| {
+            let mut group: Vec<u32> = group.into_iter().map(|i| i as u32).collect();
+            group.sort_unstable();
+            group
+        })
+        .collect();
+    groups.sort_unstable_by_key(|group| group[0]);
+    groups
+}
+
+fn same_lengths(a: &IslandSignature, b: &IslandSignature, tolerance: f32) -> bool {
+    a.edge_lengths.len() == b.edge_lengths.len()
+        && a.edge_lengths
+            .iter()
+            .zip(&b.edge_lengths)
+            .all(|(x, y)| (x - y).abs() <= tolerance)
+}
+
+/// UV placement of an island, from its loop UVs
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct UvFrame {
+    pub centroid: (f32, f32),
+    /// Angle of the principal axis
+    pub angle: f32,
+    /// RMS distance of the UVs from the centroid
+    pub spread: f32,
+    /// The UVs wind clockwise
+    pub mirrored: bool,
+}
+
+/// Relative size below which the principal axis or its direction counts as undefined
+pub(crate) const FRAME_EPSILON: f64 = 1e-4;
+
+/// UV frame of every island
+pub fn island_frames(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> Vec<UvFrame> {
+    let (offsets, faces) = island_faces(face_islands, num_islands);
+    (0..num_islands)
+        .map(|island| {
+            let island_faces = &faces[offsets[island] as usize..offsets[island + 1] as usize];
+            frame_of(island_faces, poly_loop_starts, poly_loop_totals, uv_coords)
+        })
+        .collect()
+}
+
+fn frame_of(
+    faces: &[u32],
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &[f32],
+) -> UvFrame {
+    let loops = || {
+        faces.iter().flat_map(|&f| {
+            let start = poly_loop_starts[f as usize] as usize;
+            start..start + poly_loop_totals[f as usize] as usize
+        })
+    };
+    let uv = |l: usize| (uv_coords[l * 2] as f64, uv_coords[l * 2 + 1] as f64);
+
+    let (mut su, mut sv, mut n) = (0.0f64, 0.0f64, 0.0f64);
+    for l in loops() {
+        let (u, v) = uv(l);
+        su += u;
+        sv += v;
+        n += 1.0;
+    }
+    if n == 0.0 {
+        return UvFrame::default();
+    }
+    let (cu, cv) = (su / n, sv / n);
+
+    let (mut cuu, mut cvv, mut cuv) = (0.0f64, 0.0f64, 0.0f64);
+    for l in loops() {
+        let (u, v) = uv(l);
+        let (du, dv) = (u - cu, v - cv);
+        cuu += du * du;
+        cvv += dv * dv;
+        cuv += du * dv;
+    }
+    // Isotropic islands (squares, discs) have no principal axis: keep the UV axes
+    let spread_sq = cuu + cvv;
+    let anisotropy = ((cuu - cvv).powi(2) + 4.0 * cuv * cuv).sqrt();
+    let mut angle = if anisotropy > FRAME_EPSILON * spread_sq {
+        0.5 * (2.0 * cuv).atan2(cuu - cvv)
+    } else {
+        0.0
+    };
+    // The axis points to the side with the larger third moment
+    let (cos, sin) = (angle.cos(), angle.sin());
+    let skew: f64 = loops()
+        .map(|l| {
+            let (u, v) = uv(l);
+            ((u - cu) * cos + (v - cv) * sin).powi(3)
+        })
+        .sum();
+    if skew < -FRAME_EPSILON * n * (spread_sq / n).powf(1.5) {
+        angle += std::f64::consts::PI;
+    }
+
+    let signed_area: f64 = faces
+        .iter()
+        .map(|&f| {
+            let start = poly_loop_starts[f as usize] as usize;
+            let total = poly_loop_totals[f as usize] as usize;
+            (0..total)
+                .map(|i| {
+                    let (a, b) = (uv(start + i), uv(start + (i + 1) % total));
+                    a.0 * b.1 - b.0 * a.1
+                })
+                .sum::<f64>()
+        })
+        .sum();
+
+    UvFrame {
+        centroid: (cu as f32, cv as f32),
+        angle: angle as f32,
+        spread: (spread_sq / n).sqrt() as f32,
+        mirrored: signed_area < 0.0,
+    }
+}
+
+/// Moves the UVs of every island of a group onto the frame of the group's first island
+pub fn stack_groups(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &mut [f32],
+    face_islands: &[u32],
+    num_islands: usize,
+    groups: &[Vec<u32>],
+) {
+    let frames = island_frames(
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        face_islands,
+        num_islands,
+    );
+    // Transform per island: None for islands that stay
+    let mut targets: Vec<Option<UvFrame>> = vec![None; num_islands];
+    for group in groups {
+        let reference = frames[group[0] as usize];
+        for &island in &group[1..] {
+            targets[island as usize] = Some(reference);
+        }
+    }
+
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        let Some(target) = targets[island as usize] else {
+            continue;
+        };
+        let source = frames[island as usize];
+        let scale = if source.spread > 0.0 {
+            target.spread / source.spread
+        } else {
+            1.0
+        };
+        let (sin_s, cos_s) = source.angle.sin_cos();
+        let (sin_t, cos_t) = target.angle.sin_cos();
+        let flip = if source.mirrored != target.mirrored {
+            -1.0
+        } else {
+            1.0
+        };
+
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for uv in uv_coords[start * 2..end * 2].chunks_exact_mut(2) {
+            // Into the source frame, flipped and scaled, out of the target frame
+            let (du, dv) = (uv[0] - source.centroid.0, uv[1] - source.centroid.1);
+            let x = (du * cos_s + dv * sin_s) * scale;
+            let y = (-du * sin_s + dv * cos_s) * scale * flip;
+            uv[0] = target.centroid.0 + x * cos_t - y * sin_t;
+            uv[1] = target.centroid.1 + x * sin_t + y * cos_t;
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Three unit quads (islands 0, 1, 2) and one 2x1 quad (island 3), each a separate
+    /// island with its own vertices; island 1 is translated, island 2 rotated in 3D.
+    fn quads() -> (Vec<u32>, Vec<u32>, Vec<u32>, Vec<f32>) {
+        let positions = vec![
+            0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, // island 0
+            5.0, 0.0, 0.0, 6.0, 0.0, 0.0, 6.0, 1.0, 0.0, 5.0, 1.0, 0.0, // island 1
+            0.0, 0.0, 3.0, 0.0, 1.0, 3.0, 0.0, 1.0, 4.0, 0.0, 0.0, 4.0, // island 2
+            0.0, 5.0, 0.0, 2.0, 5.0, 0.0, 2.0, 6.0, 0.0, 0.0, 6.0, 0.0, // island 3
+        ];
+        let starts = vec![0, 4, 8, 12];
+        let totals = vec![4; 4];
+        let verts = (0..16).collect();
+        (starts, totals, verts, positions)
+    }
+
+    #[test]
+    fn identical_islands_are_grouped() {
+        let (starts, totals, verts, positions) = quads();
+        let signatures = island_signatures(&starts, &totals, &verts, &positions, &[0, 1, 2, 3], 4);
+
+        assert_eq!(signatures[0], signatures[1]);
+        assert_eq!(signatures[0].topology_hash, signatures[3].topology_hash);
+        assert_eq!(group_duplicates(&signatures, 1e-4), vec![vec![0, 1, 2]]);
+    }
+
+    #[test]
+    fn tolerance_limits_matches() {
+        let (starts, totals, verts, mut positions) = quads();
+        positions[4 * 3 + 3] += 0.01; // stretch island 1
+
+        let signatures = island_signatures(&starts, &totals, &verts, &positions, &[0, 1, 2, 3], 4);
+
+        assert_eq!(group_duplicates(&signatures, 1e-4), vec![vec![0, 2]]);
+        assert_eq!(group_duplicates(&signatures, 0.02), vec![vec![0, 1, 2]]);
+    }
+
+    #[test]
+    fn square_islands_keep_their_axes() {
+        let (starts, totals, _, _) = quads();
+        let mut uvs = vec![
+            0.0, 0.0, 0.2, 0.0, 0.2, 0.2, 0.0, 0.2, // island 0
+            0.5, 0.5, 0.9, 0.5, 0.9, 0.9, 0.5, 0.9, // island 1: twice the size
+        ];
+        uvs.extend(vec![0.0; 16]);
+
+        stack_groups(&starts, &totals, &mut uvs, &[0, 1, 2, 3], 4, &[vec![0, 1]]);
+
+        for (a, b) in uvs[..8].iter().zip(&uvs[8..16]) {
+            assert!((a - b).abs() < 1e-6);
+        }
+    }
+
+    #[test]
+    fn stacking_matches_the_first_island() {
+        let (starts, totals, _, _) = quads();
+        let mut uvs = vec![
+            0.0, 0.0, 0.2, 0.0, 0.2, 0.1, 0.0, 0.1, // island 0
+            0.5, 0.5, 0.5, 0.7, 0.4, 0.7, 0.4, 0.5, // island 1: rotated 90 degrees
+            0.8, 0.8, 0.6, 0.8, 0.6, 0.9, 0.8, 0.9, // island 2: mirrored
+            0.0, 0.5, 0.1, 0.5, 0.1, 0.6, 0.0, 0.6, // island 3: not in a group
+        ];
+        let original = uvs.clone();
+
+        stack_groups(
+            &starts,
+            &totals,
+            &mut uvs,
+            &[0, 1, 2, 3],
+            4,
+            &[vec![0, 1, 2]],
+        );
+
+        let bounds = |island: usize| {
+            let chunk = &uvs[island * 8..island * 8 + 8];
+            let us = chunk.iter().step_by(2);
+            let vs = chunk.iter().skip(1).step_by(2);
+            (
+                us.clone().fold(f32::MAX, |a, &b| a.min(b)),
+                us.fold(f32::MIN, |a, &b| a.max(b)),
+                vs.clone().fold(f32::MAX, |a, &b| a.min(b)),
+                vs.fold(f32::MIN, |a, &b| a.max(b)),
+            )
+        };
+        for island in [1, 2] {
+            let (min_u, max_u, min_v, max_v) = bounds(island);
+            assert!((min_u - 0.0).abs() < 1e-5 && (max_u - 0.2).abs() < 1e-5);
+            assert!((min_v - 0.0).abs() < 1e-5 && (max_v - 0.1).abs() < 1e-5);
+        }
+        assert_eq!(uvs[..8], original[..8]);
+        assert_eq!(uvs[24..], original[24..]);
+    }
+}
@@ -0,0 +1,226 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Texel density per island and its normalization
+//!
+//! The density of an island is sqrt(UV area / 3D area), i.e. UV units per 3D unit;
+//! multiplied by the texture size it gives pixels per unit. Normalizing scales every
+//! island about its UV centroid, so all islands end up at the same density.
+
+use crate::algorithm::distortion::measure_faces;
+
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct IslandDensity {
+    pub area_3d: f32,
+    pub area_uv: f32,
+    /// Area-weighted UV centroid
+    pub centroid: (f32, f32),
+}
+
+impl IslandDensity {
+    /// UV units per 3D unit, 0 for islands without 3D area
+    pub fn density(&self) -> f32 {
+        if self.area_3d > 0.0 {
+            (self.area_uv / self.area_3d).sqrt()
+        } else {
+            0.0
+        }
+    }
+}
+
+/// Areas and UV centroid of every island
+/// `face_islands` are the compact island indices of `color_id::compute_island_coloring`.
+#[allow(clippy::too_many_arguments)]
+pub fn island_densities(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> Vec<IslandDensity> {
+    let measures = measure_faces(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+    );
+
+    let mut islands = vec![IslandDensity::default(); num_islands];
+    // Centroid sums in f64: large islands add up millions of small terms
+    let mut centroid_sums = vec![(0.0f64, 0.0f64, 0.0f64); num_islands];
+    for (f_idx, (measure, &island)) in measures.iter().zip(face_islands).enumerate() {
+        let entry = &mut islands[island as usize];
+        entry.area_3d += measure.area_3d;
+        entry.area_uv += measure.area_uv;
+
+        let start = poly_loop_starts[f_idx] as usize;
+        let total = poly_loop_totals[f_idx] as usize;
+        let (u, v, weight) = face_uv_centroid(&uv_coords[start * 2..(start + total) * 2]);
+        let sums = &mut centroid_sums[island as usize];
+        sums.0 += u as f64 * weight as f64;
+        sums.1 += v as f64 * weight as f64;
+        sums.2 += weight as f64;
+    }
+    for (island, (su, sv, sw)) in islands.iter_mut().zip(centroid_sums) {
+        if sw > 0.0 {
+            island.centroid = ((su / sw) as f32, (sv / sw) as f32);
+        }
+    }
+    islands
+}
+
+/// Area-weighted centroid of a face's UV polygon (flat u, v pairs) and its UV area.
+/// Faces without UV area use the mean of their corners with a tiny weight.
+fn face_uv_centroid(uvs: &[f32]) -> (f32, f32, f32) {
+    let total = uvs.len() / 2;
+    let point = |i: usize| (uvs[i * 2], uvs[i * 2 + 1]);
+    let (u0, v0) = point(0);
+
+    let (mut su, mut sv, mut area) = (0.0f32, 0.0f32, 0.0f32);
+    for i in 1..total.saturating_sub(1) {
+        let ((u1, v1), (u2, v2)) = (point(i), point(i + 1));
+        let tri_area = 0.5 * ((u1 - u0) * (v2 - v0) - (u2 - u0) * (v1 - v0)).abs();
+        su += (u0 + u1 + u2) / 3.0 * tri_area;
+        sv += (v0 + v1 + v2) / 3.0 * tri_area;
+        area += tri_area;
+    }
+    if area > 0.0 {
+        return (su / area, sv / area, area);
+    }
+    let n = total.max(1) as f32;
+    let (mu, mv) = (0..total).fold((0.0, 0.0), |(a, b), i| (a + point(i).0, b + point(i).1));
+    (mu / n, mv / n, f32::MIN_POSITIVE)
+}
+
+/// Scales every island about its UV centroid by `scales[island]`
+/// Islands with a scale of 1 (or not finite) are left untouched.
+pub fn scale_islands(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    uv_coords: &mut [f32],
+    face_islands: &[u32],
+    islands: &[IslandDensity],
+    scales: &[f32],
+) {
+    for (f_idx, &island) in face_islands.iter().enumerate() {
+        let scale = scales[island as usize];
+        if scale == 1.0 || !scale.is_finite() {
+            continue;
+        }
+        let (cu, cv) = islands[island as usize].centroid;
+        let start = poly_loop_starts[f_idx] as usize;
+        let end = start + poly_loop_totals[f_idx] as usize;
+        for uv in uv_coords[start * 2..end * 2].chunks_exact_mut(2) {
+            uv[0] = cu + (uv[0] - cu) * scale;
+            uv[1] = cv + (uv[1] - cv) * scale;
+        }
+    }
+}
+
+/// Scale per island that brings the selected islands (`island_mask`) to `target`
+/// density; 1 for unselected islands and islands without area
+pub fn density_scales(islands: &[IslandDensity], island_mask: &[bool], target: f32) -> Vec<f32> {
+    islands
+        .iter()
+        .zip(island_mask)
+        .map(|(island, &selected)| {
+            let density = island.density();
+            if selected && density > 0.0 && target > 0.0 {
+                target / density
+            } else {
+                1.0
+            }
+        })
+        .collect()
+}
+
+/// Mean density of the selected islands, weighted by 3D area
+pub fn mean_density(islands: &[IslandDensity], island_mask: &[bool]) -> f32 {
+    let (area_3d, area_uv) = islands
+        .iter()
+        .zip(island_mask)
+        .filter(|(_, selected)| **selected)
+        .fold((0.0f64, 0.0f64), |(a3, auv), (island, _)| {
+            (a3 + island.area_3d as f64, auv + island.area_uv as f64)
+        });
+    if area_3d > 0.0 {
+        (area_uv / area_3d).sqrt() as f32
+    } else {
+        0.0
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Two unit quads in 3D; UV island 0 is 0.5 wide, island 1 is 0.25 wide
+    const POSITIONS: [f32; 18] = [
+        0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0, 2.0, 0.0, 0.0, 2.0, 1.0, 0.0,
+    ];
+    const STARTS: [u32; 2] = [0, 4];
+    const TOTALS: [u32; 2] = [4, 4];
+    const VERTS: [u32; 8] = [0, 1, 2, 3, 1, 4, 5, 2];
+    const ISLANDS: [u32; 2] = [0, 1];
+
+    fn uvs() -> Vec<f32> {
+        vec![
+            0.0, 0.0, 0.5, 0.0, 0.5, 0.5, 0.0, 0.5, // island 0
+            0.6, 0.6, 0.85, 0.6, 0.85, 0.85, 0.6, 0.85, // island 1
+        ]
+    }
+
+    fn densities(uvs: &[f32]) -> Vec<IslandDensity> {
+        island_densities(&STARTS, &TOTALS, &VERTS, &POSITIONS, uvs, &ISLANDS, 2)
+    }
+
+    #[test]
+    fn density_and_centroid() {
+        let islands = densities(&uvs());
+
+        assert!((islands[0].density() - 0.5).abs() < 1e-6);
+        assert!((islands[1].density() - 0.25).abs() < 1e-6);
+        assert_eq!(islands[0].centroid, (0.25, 0.25));
+        assert!((islands[1].centroid.0 - 0.725).abs() < 1e-6);
+    }
+
+    #[test]
+    fn normalize_to_target_keeps_centroids() {
+        let mut uvs = uvs();
+        let islands = densities(&uvs);
+        let scales = density_scales(&islands, &[true, true], 0.4);
+
+        scale_islands(&STARTS, &TOTALS, &mut uvs, &ISLANDS, &islands, &scales);
+
+        let after = densities(&uvs);
+        for (before, after) in islands.iter().zip(&after) {
+            assert!((after.density() - 0.4).abs() < 1e-5);
+            assert!((after.centroid.0 - before.centroid.0).abs() < 1e-5);
+            assert!((after.centroid.1 - before.centroid.1).abs() < 1e-5);
+        }
+    }
+
+    #[test]
+    fn unselected_islands_are_untouched() {
+        let mut uvs = uvs();
+        let original = uvs.clone();
+        let islands = densities(&uvs);
+        let scales = density_scales(&islands, &[false, true], 0.5);
+
+        scale_islands(&STARTS, &TOTALS, &mut uvs, &ISLANDS, &islands, &scales);
+
+        assert_eq!(uvs[..8], original[..8]);
+        assert!((densities(&uvs)[1].density() - 0.5).abs() < 1e-5);
+    }
+
+    #[test]
+    fn mean_density_is_area_weighted() {
+        let islands = densities(&uvs());
+
+        // sqrt((0.25 + 0.0625) / 2)
+        assert!((mean_density(&islands, &[true, true]) - 0.395_284_7).abs() < 1e-5);
+        assert!((mean_density(&islands, &[true, false]) - 0.5).abs() < 1e-6);
+    }
+}
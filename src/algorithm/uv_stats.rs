@@ -0,0 +1,224 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Summary statistics of a UV map for the live stats panel
+//!
+//! Islands, their coloring and the seams come from one pass over the sides of Blender's
+//! edges (`MeshLoop.edge_index`), with the UV test of the Color ID bake, so no edge map
+//! has to be hashed. Coverage and overlap are measured on a coarse island raster of the
+//! 0-1 tile, so their cost is bounded by its size rather than by the number of face pairs.
+
+use crate::algorithm::color_id::{
+    build_adjacency_graph, color_graph, get_sorted_uvs, index_islands, is_uv_equal,
+};
+use crate::algorithm::dsu::Dsu;
+use crate::algorithm::raster::island_coverage;
+use crate::algorithm::seams::{edge_sides, next_loops};
+
+#[derive(Debug, Clone, Copy, Default, PartialEq)]
+pub struct UvStats {
+    pub num_islands: usize,
+    /// Distinct Color ID colors
+    pub num_colors: usize,
+    pub num_seams: usize,
+    /// Fraction of the 0-1 tile covered by faces
+    pub coverage: f32,
+    /// Fraction of the covered area covered by more than one island
+    pub overlap: f32,
+}
+
+/// Stats of the UV map; coverage and overlap are sampled on a `raster_size`² raster
+pub fn uv_stats(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    loop_edge_indices: &[u32],
+    uv_coords: &[f32],
+    num_edges: usize,
+    raster_size: usize,
+) -> UvStats {
+    let num_faces = poly_loop_starts.len();
+    let num_loops = loop_vert_indices.len();
+    let next = next_loops(poly_loop_starts, poly_loop_totals, num_loops);
+    let (offsets, sides) = edge_sides(loop_edge_indices, num_edges);
+    let mut loop_faces = vec![0u32; num_loops];
+    for (f_idx, (&start, &total)) in poly_loop_starts.iter().zip(poly_loop_totals).enumerate() {
+        loop_faces[start as usize..(start + total) as usize].fill(f_idx as u32);
+    }
+
+    // Sides with matching UVs join their faces into one island; the others connect
+    // neighboring islands. Edges with an unmatched side are seams.
+    let mut dsu = Dsu::new(num_faces);
+    let mut island_connections = Vec::new();
+    let mut num_seams = 0;
+    let mut matched = Vec::new();
+    for e in 0..num_edges {
+        let sides = &sides[offsets[e] as usize..offsets[e + 1] as usize];
+        if sides.len() < 2 {
+            continue;
+        }
+        matched.clear();
+        matched.resize(sides.len(), false);
+        for i in 0..sides.len() {
+            let (a, b) = (sides[i], next[sides[i] as usize]);
+            let (a_min, a_max) = get_sorted_uvs(a, b, loop_vert_indices, uv_coords);
+            for j in i + 1..sides.len() {
+                let (c, d) = (sides[j], next[sides[j] as usize]);
+                let (b_min, b_max) = get_sorted_uvs(c, d, loop_vert_indices, uv_coords);
+                let (face_a, face_b) = (loop_faces[a as usize], loop_faces[c as usize]);
+                if is_uv_equal(a_min.0, a_min.1, b_min.0, b_min.1)
+                    && is_uv_equal(a_max.0, a_max.1, b_max.0, b_max.1)
+                {
+                    dsu.merge(face_a as usize, face_b as usize);
+                    matched[i] = true;
+                    matched[j] = true;
+                } else {
+                    island_connections.push((face_a, face_b));
+                }
+            }
+        }
+        num_seams += matched.contains(&false) as usize;
+    }
+
+    let (adjacency, all_islands) = build_adjacency_graph(num_faces, &mut dsu, island_connections);
+    let coloring = index_islands(num_faces, &mut dsu, &color_graph(&adjacency, all_islands));
+    let num_colors = coloring
+        .face_colors
+        .iter()
+        .max()
+        .map_or(0, |&c| c as usize + 1);
+
+    let (covered, overlapped) = island_coverage(
+        raster_size,
+        raster_size,
+        poly_loop_starts,
+        poly_loop_totals,
+        uv_coords,
+        &coloring.face_islands,
+    );
+    let fraction = |part: usize, whole: usize| {
+        if whole > 0 {
+            part as f32 / whole as f32
+        } else {
+            0.0
+        }
+    };
+
+    UvStats {
+        num_islands: coloring.num_islands,
+        num_colors,
+        num_seams,
+        coverage: fraction(covered, raster_size * raster_size),
+        overlap: fraction(overlapped, covered),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Two quads sharing vertices 1 and 2 (edge 1)
+    ///
+    /// Edges: 0 (0-1), 1 (1-2), 2 (2-3), 3 (3-0), 4 (1-4), 5 (4-5), 6 (5-2)
+    const STARTS: [u32; 2] = [0, 4];
+    const TOTALS: [u32; 2] = [4, 4];
+    const VERTS: [u32; 8] = [0, 1, 2, 3, 1, 4, 5, 2];
+    const EDGES: [u32; 8] = [0, 1, 2, 3, 4, 5, 6, 1];
+
+    fn stats(uvs: &[f32]) -> UvStats {
+        uv_stats(&STARTS, &TOTALS, &VERTS, &EDGES, uvs, 7, 64)
+    }
+
+    #[test]
+    fn split_halves_cover_the_tile() {
+        // Left half and right half of the tile, cut along the shared edge
+        let uvs = [
+            0.0, 0.0, 0.5, 0.0, 0.5, 1.0, 0.0, 1.0, // face 0
+            0.5001, 0.0, 1.0, 0.0, 1.0, 1.0, 0.5001, 1.0, // face 1
+        ];
+
+        let stats = stats(&uvs);
+
+        assert_eq!(stats.num_islands, 2);
+        assert_eq!(stats.num_colors, 2);
+        assert_eq!(stats.num_seams, 1);
+        assert!((stats.coverage - 1.0).abs() < 1e-6);
+        assert_eq!(stats.overlap, 0.0);
+    }
+
+    #[test]
+    fn stacked_islands_overlap() {
+        // Both faces on the lower left quarter of the tile
+        let uvs = [
+            0.0, 0.0, 0.5, 0.0, 0.5, 0.5, 0.0, 0.5, // face 0
+            0.0, 0.0, 0.5, 0.0, 0.5, 0.5, 0.0, 0.5, // face 1
+        ];
+
+        let stats = stats(&uvs);
+
+        assert_eq!(stats.num_islands, 2);
+        assert!((stats.coverage - 0.25).abs() < 1e-6);
+        assert!((stats.overlap - 1.0).abs() < 1e-6);
+    }
+
+    #[test]
+    fn one_island_has_no_seams_or_overlap() {
+        let uvs = [
+            0.0, 0.0, 0.25, 0.0, 0.25, 0.5, 0.0, 0.5, // face 0
+            0.25, 0.0, 0.5, 0.0, 0.5, 0.5, 0.25, 0.5, // face 1
+        ];
+
+        let stats = stats(&uvs);
+
+        assert_eq!(
+            (stats.num_islands, stats.num_colors, stats.num_seams),
+            (1, 1, 0)
+        );
+        assert!((stats.coverage - 0.25).abs() < 1e-6);
+        assert_eq!(stats.overlap, 0.0);
+    }
+
+    #[test]
+    fn matches_the_color_id_islands_and_seam_mask() {
+        use crate::algorithm::color_id::compute_island_coloring;
+        use crate::algorithm::seams::{SideTable, loop_edges};
+        use crate::mesh_gen::{MeshKind, generate};
+
+        let mesh = generate(MeshKind::Torus, 24, 12, 0.3, 4);
+        let verts = &mesh.loop_vert_indices;
+        let (loop_edges, num_edges) =
+            loop_edges(&mesh.poly_loop_starts, &mesh.poly_loop_totals, verts);
+
+        let stats = uv_stats(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            verts,
+            &loop_edges,
+            &mesh.uv_coords,
+            num_edges,
+            64,
+        );
+
+        let coloring = compute_island_coloring(
+            mesh.num_faces(),
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            verts,
+            &mesh.uv_coords,
+        );
+        let table = SideTable::new(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            verts,
+            &loop_edges,
+            &mesh.uv_coords,
+            num_edges,
+        );
+        assert_eq!(stats.num_islands, coloring.num_islands);
+        assert_eq!(stats.num_islands, mesh.num_islands);
+        assert_eq!(
+            stats.num_seams,
+            table.seam_mask().iter().filter(|&&seam| seam).count()
+        );
+        assert!(stats.num_seams > 0);
+    }
+}
@@ -0,0 +1,335 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! UV weld
+//!
+//! Loops of one mesh vertex whose UVs lie within a tolerance of each other are merged
+//! to their mean position. The loops of every vertex are sorted into grid cells of the
+//! tolerance's size, so close UVs are found in the same or a neighboring cell instead
+//! of comparing all pairs.
+
+use crate::algorithm::color_id::{build_edge_map, detect_uv_islands};
+use crate::algorithm::raster::worker_count;
+use std::thread;
+
+/// Outcome of a weld
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct WeldReport {
+    /// Loops whose UV moved
+    pub welded_loops: usize,
+    pub islands_before: usize,
+    pub islands_after: usize,
+}
+
+/// Returns the welded copy of `uv_coords` and the number of loops that moved.
+/// Loops with a `loop_mask` entry of false are neither moved nor merged with.
+/// Vertices are independent, so ranges of vertices are welded on all cores.
+pub fn weld_uv_coords(
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+    loop_mask: Option<&[bool]>,
+    tolerance: f32,
+) -> (Vec<f32>, usize) {
+    let (offsets, vertex_loops) = loops_by_vertex(loop_vert_indices, loop_mask);
+    let num_verts = offsets.len() - 1;
+    let mut welded = uv_coords.to_vec();
+    if num_verts == 0 {
+        return (welded, 0);
+    }
+
+    let chunk_len = num_verts.div_ceil(worker_count());
+    let moves: Vec<Vec<(u32, f32, f32)>> = thread::scope(|scope| {
+        let handles: Vec<_> = (0..num_verts)
+            .step_by(chunk_len)
+            .map(|first| {
+                let (offsets, vertex_loops) = (&offsets, &vertex_loops);
+                scope.spawn(move || {
+                    let mut moves = Vec::new();
+                    let mut group = VertexGroup::default();
+                    for v in first..(first + chunk_len).min(num_verts) {
+                        let loops = &vertex_loops[offsets[v] as usize..offsets[v + 1] as usize];
+                        if loops.len() > 1 {
+                            group.weld(loops, uv_coords, tolerance, &mut moves);
+                        }
+                    }
+                    moves
+                })
+            })
+            .collect();
+        handles.into_iter().map(|h| h.join().unwrap()).collect()
+    });
+
+    let mut moved = 0;
+    for (l, u, v) in moves.into_iter().flatten() {
+        welded[l as usize * 2] = u;
+        welded[l as usize * 2 + 1] = v;
+        moved += 1;
+    }
+    (welded, moved)
+}
+
+/// CSR of the (masked) loops of every vertex, by counting sort
+fn loops_by_vertex(loop_vert_indices: &[u32], loop_mask: Option<&[bool]>) -> (Vec<u32>, Vec<u32>) {
+    let num_verts = loop_vert_indices
+        .iter()
+        .max()
+        .map_or(0, |&v| v as usize + 1);
+    let included = |l: usize| loop_mask.is_none_or(|mask| mask[l]);
+
+    let mut offsets = vec![0u32; num_verts + 1];
+    for (l, &v) in loop_vert_indices.iter().enumerate() {
+        if included(l) {
+            offsets[v as usize + 1] += 1;
+        }
+    }
+    for v in 0..num_verts {
+        offsets[v + 1] += offsets[v];
+    }
+    let mut cursors = offsets.clone();
+    let mut loops = vec![0u32; offsets[num_verts] as usize];
+    for (l, &v) in loop_vert_indices.iter().enumerate() {
+        if included(l) {
+            loops[cursors[v as usize] as usize] = l as u32;
+            cursors[v as usize] += 1;
+        }
+    }
+    (offsets, loops)
+}
+
+/// Scratch buffers to weld the loops of one vertex, reused across vertices
+#[derive(Default)]
+struct VertexGroup {
+    /// (cell x, cell y, loop), sorted by cell
+    cells: Vec<(i64, i64, u32)>,
+    /// Union-find over the positions in `cells`
+    parents: Vec<usize>,
+    sums: Vec<(f64, f64, u32)>,
+}
+
+impl VertexGroup {
+    /// Pushes `(loop, u, v)` for every loop of the vertex that moves
+    fn weld(
+        &mut self,
+        loops: &[u32],
+        uv_coords: &[f32],
+        tolerance: f32,
+        moves: &mut Vec<(u32, f32, f32)>,
+    ) {
+        let uv = |l: u32| (uv_coords[l as usize * 2], uv_coords[l as usize * 2 + 1]);
+        let cell = |value: f32| (value / tolerance).floor() as i64;
+
+        self.cells.clear();
+        self.cells.extend(loops.iter().map(|&l| {
+            let (u, v) = uv(l);
+            (cell(u), cell(v), l)
+        }));
+        self.cells.sort_unstable();
+        let n = self.cells.len();
+        self.parents.clear();
+        self.parents.extend(0..n);
+
+        for i in 0..n {
+            let (cx, cy, a) = self.cells[i];
+            // Later loops in this or the next cell column; earlier ones already looked here
+            for j in i + 1..n {
+                let (bx, by, b) = self.cells[j];
+                if bx > cx + 1 {
+                    break;
+                }
+                let ((ua, va), (ub, vb)) = (uv(a), uv(b));
+                if (by - cy).abs() <= 1
+                    && (ua - ub).abs() <= tolerance
+                    && (va - vb).abs() <= tolerance
+                {
+                    let (ra, rb) = (self.root(i), self.root(j));
+                    self.parents[ra.max(rb)] = ra.min(rb);
+                }
+            }
+        }
+
+        // Mean UV of every merged group
+        self.sums.clear();
+        self.sums.resize(n, (0.0, 0.0, 0));
+        for i in 0..n {
+            let root = self.root(i);
+            let (u, v) = uv(self.cells[i].2);
+            let entry = &mut self.sums[root];
+            entry.0 += u as f64;
+            entry.1 += v as f64;
+            entry.2 += 1;
+        }
+        for i in 0..n {
+            let root = self.root(i);
+            let (su, sv, count) = self.sums[root];
+            if count < 2 {
+                continue;
+            }
+            let l = self.cells[i].2;
+            let mean = ((su / count as f64) as f32, (sv / count as f64) as f32);
+            if mean != uv(l) {
+                moves.push((l, mean.0, mean.1));
+            }
+        }
+    }
+
+    fn root(&mut self, mut i: usize) -> usize {
+        while self.parents[i] != i {
+            self.parents[i] = self.parents[self.parents[i]];
+            i = self.parents[i];
+        }
+        i
+    }
+}
+
+/// Number of UV islands, as detected by the Color ID bake
+pub fn count_islands(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &[f32],
+) -> usize {
+    let num_faces = poly_loop_starts.len();
+    let edge_map = build_edge_map(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+    );
+    let (mut dsu, _) = detect_uv_islands(num_faces, &edge_map, loop_vert_indices, uv_coords);
+    (0..num_faces).filter(|&f| dsu.leader(f) == f).count()
+}
+
+/// Welds `uv_coords` in place unless `dry_run`, and reports the island counts
+/// before and after. `face_select` limits the weld to the loops of selected faces.
+pub fn weld_uvs(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    uv_coords: &mut [f32],
+    face_select: Option<&[bool]>,
+    tolerance: f32,
+    dry_run: bool,
+) -> WeldReport {
+    let loop_mask = face_select.map(|select| {
+        let mut mask = vec![false; loop_vert_indices.len()];
+        for (f_idx, (&start, &total)) in poly_loop_starts.iter().zip(poly_loop_totals).enumerate() {
+            if select[f_idx] {
+                mask[start as usize..(start + total) as usize].fill(true);
+            }
+        }
+        mask
+    });
+    let (welded, welded_loops) = weld_uv_coords(
+        loop_vert_indices,
+        uv_coords,
+        loop_mask.as_deref(),
+        tolerance,
+    );
+
+    let count =
+        |uvs: &[f32]| count_islands(poly_loop_starts, poly_loop_totals, loop_vert_indices, uvs);
+    let islands_before = count(uv_coords);
+    let islands_after = if welded_loops == 0 {
+        islands_before
+    } else {
+        count(&welded)
+    };
+    if !dry_run {
+        uv_coords.copy_from_slice(&welded);
+    }
+    WeldReport {
+        welded_loops,
+        islands_before,
+        islands_after,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::mesh_gen::{MeshKind, generate};
+
+    /// Two quads sharing the edge of vertices 1 and 2, with the UVs of the
+    /// second face off by 0.002
+    const STARTS: [u32; 2] = [0, 4];
+    const TOTALS: [u32; 2] = [4, 4];
+    const VERTS: [u32; 8] = [0, 1, 2, 3, 1, 4, 5, 2];
+
+    fn split_uvs() -> Vec<f32> {
+        vec![
+            0.0, 0.0, 0.5, 0.0, 0.5, 0.5, 0.0, 0.5, // face 0
+            0.502, 0.0, 1.0, 0.0, 1.0, 0.5, 0.502, 0.5, // face 1
+        ]
+    }
+
+    #[test]
+    fn weld_merges_close_loops_of_a_vertex() {
+        let mut uvs = split_uvs();
+
+        let report = weld_uvs(&STARTS, &TOTALS, &VERTS, &mut uvs, None, 0.005, false);
+
+        assert_eq!(report.islands_before, 2);
+        assert_eq!(report.islands_after, 1);
+        assert_eq!(report.welded_loops, 4);
+        assert_eq!(uvs[2], uvs[8]); // vertex 1 in both faces
+        assert!((uvs[2] - 0.501).abs() < 1e-6);
+    }
+
+    #[test]
+    fn dry_run_keeps_uvs() {
+        let mut uvs = split_uvs();
+
+        let report = weld_uvs(&STARTS, &TOTALS, &VERTS, &mut uvs, None, 0.005, true);
+
+        assert_eq!(report.islands_after, 1);
+        assert_eq!(uvs, split_uvs());
+    }
+
+    #[test]
+    fn tolerance_and_selection_limit_the_weld() {
+        let mut uvs = split_uvs();
+        let report = weld_uvs(&STARTS, &TOTALS, &VERTS, &mut uvs, None, 0.001, false);
+        assert_eq!(report.welded_loops, 0);
+        assert_eq!(report.islands_after, 2);
+
+        let report = weld_uvs(
+            &STARTS,
+            &TOTALS,
+            &VERTS,
+            &mut uvs,
+            Some(&[true, false]),
+            0.005,
+            false,
+        );
+        assert_eq!(report.welded_loops, 0);
+        assert_eq!(uvs, split_uvs());
+    }
+
+    #[test]
+    fn close_uvs_across_cell_borders_are_merged() {
+        // 0.0999 and 0.1001 fall into different 0.001 cells
+        let (welded, moved) = weld_uv_coords(&[0, 0], &[0.0999, 0.3, 0.1001, 0.3], None, 0.001);
+
+        assert_eq!(moved, 2);
+        assert_eq!(welded[0], welded[2]);
+    }
+
+    #[test]
+    fn seams_far_apart_are_kept() {
+        let mesh = generate(MeshKind::Grid, 20, 20, 0.2, 7);
+        let mut uvs = mesh.uv_coords.clone();
+
+        let report = weld_uvs(
+            &mesh.poly_loop_starts,
+            &mesh.poly_loop_totals,
+            &mesh.loop_vert_indices,
+            &mut uvs,
+            None,
+            1e-3,
+            false,
+        );
+
+        assert_eq!(report.islands_before, mesh.num_islands);
+        assert_eq!(report.islands_after, mesh.num_islands);
+        assert_eq!(uvs, mesh.uv_coords);
+    }
+}
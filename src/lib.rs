@@ -1,18 +1,71 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 
-mod algorithm;
+pub mod algorithm;
+pub mod mesh_gen;
 
+use pyo3::buffer::{Element, PyBuffer};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use std::path::PathBuf;
 
-#[pyfunction]
-fn bake_color_id_all(
+/// Borrows a C-contiguous Python buffer (array.array, numpy array, ...) as a slice
+/// without copying. The slice lives as long as the buffer view.
+fn buffer_slice<'a, T: Element>(buffer: &'a PyBuffer<T>, name: &str) -> PyResult<&'a [T]> {
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!(
+            "{} must be a C-contiguous buffer",
+            name
+        )));
+    }
+    if buffer.item_count() == 0 {
+        return Ok(&[]);
+    }
+    // SAFETY: the buffer is C-contiguous, holds item_count() elements of T
+    // and stays exported for as long as the PyBuffer view is alive.
+    Ok(unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const T, buffer.item_count()) })
+}
+
+/// Mutable counterpart of `buffer_slice` for output buffers
+fn buffer_slice_mut<'a, T: Element>(
+    buffer: &'a mut PyBuffer<T>,
+    name: &str,
+) -> PyResult<&'a mut [T]> {
+    if buffer.readonly() {
+        return Err(PyValueError::new_err(format!("{} must be writable", name)));
+    }
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!(
+            "{} must be a C-contiguous buffer",
+            name
+        )));
+    }
+    if buffer.item_count() == 0 {
+        return Ok(&mut []);
+    }
+    // SAFETY: see `buffer_slice`; the buffer is writable and we hold the only view.
+    Ok(unsafe { std::slice::from_raw_parts_mut(buffer.buf_ptr() as *mut T, buffer.item_count()) })
+}
+
+/// Borrows an int32 index buffer as u32 (Blender uses 32-bit indices)
+fn index_slice<'a>(buffer: &'a PyBuffer<i32>, name: &str) -> PyResult<&'a [u32]> {
+    let indices = buffer_slice(buffer, name)?;
+    if let Some(pos) = indices.iter().position(|&i| i < 0) {
+        return Err(PyValueError::new_err(format!(
+            "{} contains a negative index {} at position {}",
+            name, indices[pos], pos
+        )));
+    }
+    // SAFETY: i32 and u32 share size and alignment, and all values are non-negative.
+    Ok(unsafe { std::slice::from_raw_parts(indices.as_ptr() as *const u32, indices.len()) })
+}
+
+fn validate_topology(
     num_faces: usize,
-    poly_loop_starts: Vec<usize>,
-    poly_loop_totals: Vec<usize>,
-    loop_vert_indices: Vec<usize>,
-    uv_coords: Vec<f32>,
-) -> PyResult<Vec<f32>> {
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    total_loops: usize,
+) -> PyResult<()> {
     if poly_loop_starts.len() != num_faces {
         return Err(PyValueError::new_err(format!(
             "Data mismatch: poly_loop_starts length {} != num_faces {}",
@@ -28,8 +81,6 @@ fn bake_color_id_all(
         )));
     }
 
-    let total_loops = loop_vert_indices.len();
-
     for (i, (&start, &total)) in poly_loop_starts
         .iter()
         .zip(poly_loop_totals.iter())
@@ -41,26 +92,1575 @@ fn bake_color_id_all(
                 i
             )));
         }
-        if start + total > total_loops {
+        if start as usize + total as usize > total_loops {
             return Err(PyValueError::new_err(format!(
                 "Face {} loops out of bounds: start {} + total {} > total loops {}",
                 i, start, total, total_loops
             )));
         }
     }
+    Ok(())
+}
 
-    let result = algorithm::color_id::bake_color_id_all(
-        num_faces,
+fn validate_length(name: &str, actual: usize, expected: usize) -> PyResult<()> {
+    if actual != expected {
+        return Err(PyValueError::new_err(format!(
+            "Data mismatch: {} length {} != expected {}",
+            name, actual, expected
+        )));
+    }
+    Ok(())
+}
+
+/// Bakes Color IDs into `out_colors` (float32, total loops * 4)
+/// Index buffers are int32, UVs are a flat float32 buffer.
+/// The GIL is released during the computation.
+#[pyfunction]
+fn bake_color_id_all(
+    py: Python<'_>,
+    num_faces: usize,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    mut out_colors: PyBuffer<f32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let out_colors = buffer_slice_mut(&mut out_colors, "out_colors")?;
+
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("out_colors", out_colors.len(), total_loops * 4)?;
+
+    py.detach(|| {
+        algorithm::color_id::bake_color_id_into(
+            num_faces,
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+            out_colors,
+        )
+    });
+    Ok(())
+}
+
+/// Bakes Color IDs for several UV layers at once. `uv_layers` and `out_colors` are
+/// lists of float32 buffers, one per layer; the topology is analyzed only once
+/// and the layers are processed in parallel with the GIL released.
+#[pyfunction]
+fn bake_color_id_layers(
+    py: Python<'_>,
+    num_faces: usize,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    uv_layers: Vec<PyBuffer<f32>>,
+    mut out_colors: Vec<PyBuffer<f32>>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("out_colors", out_colors.len(), uv_layers.len())?;
+
+    // Every output is borrowed mutably at the same time, so they must not overlap
+    let mut ranges: Vec<(usize, usize)> = out_colors
+        .iter()
+        .map(|b| (b.buf_ptr() as usize, b.buf_ptr() as usize + b.len_bytes()))
+        .collect();
+    ranges.sort_unstable();
+    if ranges.windows(2).any(|w| w[0].1 > w[1].0) {
+        return Err(PyValueError::new_err("out_colors buffers must not overlap"));
+    }
+
+    let uv_layers = uv_layers
+        .iter()
+        .map(|b| buffer_slice(b, "uv_layers"))
+        .collect::<PyResult<Vec<_>>>()?;
+    let mut out_colors = out_colors
+        .iter_mut()
+        .map(|b| buffer_slice_mut(b, "out_colors"))
+        .collect::<PyResult<Vec<_>>>()?;
+    for (uv_coords, colors) in uv_layers.iter().zip(&out_colors) {
+        validate_length("uv_layers", uv_coords.len(), total_loops * 2)?;
+        validate_length("out_colors", colors.len(), total_loops * 4)?;
+    }
+
+    py.detach(|| {
+        algorithm::color_id::bake_color_id_layers(
+            num_faces,
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            &uv_layers,
+            &mut out_colors,
+        )
+    });
+    Ok(())
+}
+
+/// Bakes Color IDs of the selected faces only (`face_select`: int32 per face, non-zero
+/// means selected). Only their loops in `out_colors` are written, the rest keeps its
+/// values. Returns the indices of the selected faces.
+#[pyfunction]
+fn bake_color_id_region(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    face_select: PyBuffer<i32>,
+    mut out_colors: PyBuffer<f32>,
+) -> PyResult<Vec<u32>> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let face_select = buffer_slice(&face_select, "face_select")?;
+    let out_colors = buffer_slice_mut(&mut out_colors, "out_colors")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("face_select", face_select.len(), num_faces)?;
+    validate_length("out_colors", out_colors.len(), total_loops * 4)?;
+
+    let selected_faces = py.detach(|| {
+        let selected_faces: Vec<u32> = face_select
+            .iter()
+            .enumerate()
+            .filter(|&(_, &select)| select != 0)
+            .map(|(f_idx, _)| f_idx as u32)
+            .collect();
+
+        algorithm::color_id::bake_color_id_region(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+            &selected_faces,
+            out_colors,
+        );
+        selected_faces
+    });
+    Ok(selected_faces)
+}
+
+/// Detects UV islands and colors them without writing corner colors.
+/// Fills `out_face_islands` and `out_face_colors` (int32, one per face)
+/// and returns the island count. The GIL is released during the computation,
+/// so this can run on a worker thread while Blender stays responsive.
+#[pyfunction]
+fn compute_island_coloring(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    mut out_face_islands: PyBuffer<i32>,
+    mut out_face_colors: PyBuffer<i32>,
+) -> PyResult<usize> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let out_face_islands = buffer_slice_mut(&mut out_face_islands, "out_face_islands")?;
+    let out_face_colors = buffer_slice_mut(&mut out_face_colors, "out_face_colors")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("out_face_islands", out_face_islands.len(), num_faces)?;
+    validate_length("out_face_colors", out_face_colors.len(), num_faces)?;
+
+    let num_islands = py.detach(|| {
+        let coloring = algorithm::color_id::compute_island_coloring(
+            num_faces,
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+        );
+        for (out, &island) in out_face_islands.iter_mut().zip(&coloring.face_islands) {
+            *out = island as i32;
+        }
+        for (out, &color) in out_face_colors.iter_mut().zip(&coloring.face_colors) {
+            *out = color as i32;
+        }
+        coloring.num_islands
+    });
+    Ok(num_islands)
+}
+
+/// Number of float32 values per island in `compute_uv_distortion`'s island stats:
+/// 3D area, UV area, mean area distortion, mean angle distortion, max area, max angle
+const ISLAND_DISTORTION_STATS: usize = 6;
+
+/// Computes per-face area and angle distortion (float32, one per face, 0..1) of the UV map
+/// against the 3D positions (float32, vertices * 3), and per-island stats into
+/// `out_island_stats` (float32, islands * 6, islands from `compute_island_coloring`).
+/// The GIL is released during the computation.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn compute_uv_distortion(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    positions: PyBuffer<f32>,
+    uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    mut out_face_area: PyBuffer<f32>,
+    mut out_face_angle: PyBuffer<f32>,
+    mut out_island_stats: PyBuffer<f32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let positions = buffer_slice(&positions, "positions")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let out_face_area = buffer_slice_mut(&mut out_face_area, "out_face_area")?;
+    let out_face_angle = buffer_slice_mut(&mut out_face_angle, "out_face_angle")?;
+    let out_island_stats = buffer_slice_mut(&mut out_island_stats, "out_island_stats")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    let num_verts = positions.len() / 3;
+    let num_islands = out_island_stats.len() / ISLAND_DISTORTION_STATS;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("positions", positions.len(), num_verts * 3)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    validate_length("out_face_area", out_face_area.len(), num_faces)?;
+    validate_length("out_face_angle", out_face_angle.len(), num_faces)?;
+    validate_length(
+        "out_island_stats",
+        out_island_stats.len(),
+        num_islands * ISLAND_DISTORTION_STATS,
+    )?;
+    if let Some(pos) = loop_vert_indices
+        .iter()
+        .position(|&v| v as usize >= num_verts)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_vert_indices contains vertex {} at position {}, but positions has {} vertices",
+            loop_vert_indices[pos], pos, num_verts
+        )));
+    }
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but out_island_stats has {} islands",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    py.detach(|| {
+        let distortion = algorithm::distortion::compute_distortion(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            positions,
+            uv_coords,
+            face_islands,
+            num_islands,
+        );
+        out_face_area.copy_from_slice(&distortion.face_area);
+        out_face_angle.copy_from_slice(&distortion.face_angle);
+        for (out, island) in out_island_stats
+            .chunks_exact_mut(ISLAND_DISTORTION_STATS)
+            .zip(&distortion.islands)
+        {
+            out.copy_from_slice(&[
+                island.area_3d,
+                island.area_uv,
+                island.mean_area,
+                island.mean_angle,
+                island.max_area,
+                island.max_angle,
+            ]);
+        }
+    });
+    Ok(())
+}
+
+/// Finds overlapping UV faces. Islands (`face_islands` of `compute_island_coloring`)
+/// connected by overlaps form a group, so islands stacked on purpose are reported together.
+/// Writes the group of each face (-1 for faces without overlaps) and of each island
+/// (`out_island_groups` has one entry per island), and optionally group colors into
+/// `out_colors` (float32, total loops * 4). Returns the number of groups.
+/// The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    uv_coords,
+    face_islands,
+    out_face_groups,
+    out_island_groups,
+    out_colors=None,
+))]
+#[allow(clippy::too_many_arguments)]
+fn detect_uv_overlaps(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    mut out_face_groups: PyBuffer<i32>,
+    mut out_island_groups: PyBuffer<i32>,
+    mut out_colors: Option<PyBuffer<f32>>,
+) -> PyResult<usize> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let out_face_groups = buffer_slice_mut(&mut out_face_groups, "out_face_groups")?;
+    let out_island_groups = buffer_slice_mut(&mut out_island_groups, "out_island_groups")?;
+    let out_colors = match out_colors.as_mut() {
+        Some(buffer) => Some(buffer_slice_mut(buffer, "out_colors")?),
+        None => None,
+    };
+
+    let num_faces = poly_loop_starts.len();
+    let num_islands = out_island_groups.len();
+    let total_loops = uv_coords.len() / 2;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    validate_length("out_face_groups", out_face_groups.len(), num_faces)?;
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but out_island_groups has {} entries",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+    if let Some(out_colors) = &out_colors {
+        validate_length("out_colors", out_colors.len(), total_loops * 4)?;
+    }
+
+    let num_groups = py.detach(|| {
+        let overlaps = algorithm::overlap::detect_overlaps(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+        );
+        let (island_groups, num_groups) =
+            algorithm::overlap::group_islands(num_islands, &overlaps.island_pairs);
+
+        let face_groups: Vec<u32> = face_islands
+            .iter()
+            .zip(&overlaps.face_overlaps)
+            .map(|(&island, &overlapping)| {
+                if overlapping {
+                    island_groups[island as usize]
+                } else {
+                    algorithm::overlap::NO_GROUP
+                }
+            })
+            .collect();
+
+        // NO_GROUP becomes -1
+        for (out, &group) in out_face_groups.iter_mut().zip(&face_groups) {
+            *out = group as i32;
+        }
+        for (out, &group) in out_island_groups.iter_mut().zip(&island_groups) {
+            *out = group as i32;
+        }
+        if let Some(out_colors) = out_colors {
+            algorithm::overlap::overlap_colors(
+                poly_loop_starts,
+                poly_loop_totals,
+                &face_groups,
+                out_colors,
+            );
+        }
+        num_groups
+    });
+    Ok(num_groups)
+}
+
+/// Fills selection masks (int32, 0 or 1) of exactly the faces with an overlap group
+/// (`face_groups` as filled by `detect_uv_overlaps`, -1 without), their vertices and
+/// their edges. Returns the number of selected faces.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn select_uv_overlaps(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    loop_edge_indices: PyBuffer<i32>,
+    face_groups: PyBuffer<i32>,
+    mut out_face_select: PyBuffer<i32>,
+    mut out_vert_select: PyBuffer<i32>,
+    mut out_edge_select: PyBuffer<i32>,
+) -> PyResult<usize> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let loop_edge_indices = index_slice(&loop_edge_indices, "loop_edge_indices")?;
+    let face_groups = buffer_slice(&face_groups, "face_groups")?;
+    let out_face_select = buffer_slice_mut(&mut out_face_select, "out_face_select")?;
+    let out_vert_select = buffer_slice_mut(&mut out_vert_select, "out_vert_select")?;
+    let out_edge_select = buffer_slice_mut(&mut out_edge_select, "out_edge_select")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("loop_edge_indices", loop_edge_indices.len(), total_loops)?;
+    validate_length("face_groups", face_groups.len(), num_faces)?;
+    validate_length("out_face_select", out_face_select.len(), num_faces)?;
+    for (name, indices, len) in [
+        (
+            "loop_vert_indices",
+            loop_vert_indices,
+            out_vert_select.len(),
+        ),
+        (
+            "loop_edge_indices",
+            loop_edge_indices,
+            out_edge_select.len(),
+        ),
+    ] {
+        if let Some(pos) = indices.iter().position(|&i| i as usize >= len) {
+            return Err(PyValueError::new_err(format!(
+                "{} contains {} at position {}, but the mask has {} entries",
+                name, indices[pos], pos, len
+            )));
+        }
+    }
+
+    Ok(py.detach(|| {
+        // -1 becomes NO_GROUP
+        let face_groups: Vec<u32> = face_groups
+            .iter()
+            .map(|&group| {
+                if group < 0 {
+                    algorithm::overlap::NO_GROUP
+                } else {
+                    group as u32
+                }
+            })
+            .collect();
+        algorithm::overlap::overlap_selection(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            loop_edge_indices,
+            &face_groups,
+            out_face_select,
+            out_vert_select,
+            out_edge_select,
+        )
+    }))
+}
+
+/// Writes corner colors (float32, total loops * 4) from per-face color indices
+/// computed by `compute_island_coloring`.
+#[pyfunction]
+fn fill_face_colors(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    face_colors: PyBuffer<i32>,
+    mut out_colors: PyBuffer<f32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let face_colors = index_slice(&face_colors, "face_colors")?;
+    let out_colors = buffer_slice_mut(&mut out_colors, "out_colors")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = out_colors.len() / 4;
+    validate_length("out_colors", out_colors.len(), total_loops * 4)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_colors", face_colors.len(), num_faces)?;
+
+    py.detach(|| {
+        algorithm::color_id::generate_result_colors(
+            num_faces,
+            poly_loop_starts,
+            poly_loop_totals,
+            face_colors,
+            out_colors,
+        )
+    });
+    Ok(())
+}
+
+/// Sets the `island_mask` entry (int32, one per island) of every island with a selected
+/// face to 1, from `face_islands` of `compute_island_coloring` and `face_select` (int32,
+/// 0 or 1 per face). Returns the number of entries set.
+/// The GIL is released during the computation.
+#[pyfunction]
+fn selected_island_mask(
+    py: Python<'_>,
+    face_islands: PyBuffer<i32>,
+    face_select: PyBuffer<i32>,
+    mut island_mask: PyBuffer<i32>,
+) -> PyResult<usize> {
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let face_select = buffer_slice(&face_select, "face_select")?;
+    let island_mask = buffer_slice_mut(&mut island_mask, "island_mask")?;
+
+    validate_length("face_select", face_select.len(), face_islands.len())?;
+    let num_islands = island_mask.len();
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but there are {} islands",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    Ok(py.detach(|| {
+        algorithm::color_id::selected_island_mask(face_islands, face_select, island_mask)
+    }))
+}
+
+/// Packs the islands (`face_islands` of `compute_island_coloring`) into the unit square,
+/// modifying `uv_coords` in place. `margin` is the gap between islands in UV units (met
+/// to within a few percent, see `pack_rects`) and `target_fill` the expected packing
+/// density (0..1]. Candidate layouts are packed on
+/// all cores. Returns the fraction of the unit square covered by island bounds.
+/// The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    uv_coords,
+    face_islands,
+    num_islands,
+    margin=0.005,
+    target_fill=0.8,
+    rotate=true,
+))]
+#[allow(clippy::too_many_arguments)]
+fn pack_uv_islands(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    mut uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    num_islands: usize,
+    margin: f32,
+    target_fill: f32,
+    rotate: bool,
+) -> PyResult<f32> {
+    if !(target_fill > 0.0 && target_fill <= 1.0) {
+        return Err(PyValueError::new_err(format!(
+            "target_fill must be in (0, 1], got {}",
+            target_fill
+        )));
+    }
+    if !(margin >= 0.0 && margin < 0.5) {
+        return Err(PyValueError::new_err(format!(
+            "margin must be in [0, 0.5), got {}",
+            margin
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = uv_coords.len() / 2;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but there are {} islands",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    let fill = py.detach(|| {
+        let bounds = algorithm::pack::island_bounds(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+            num_islands,
+        );
+        let sizes: Vec<(f32, f32)> = bounds.iter().map(|b| b.size()).collect();
+        let packing = algorithm::pack::pack_rects(&sizes, margin, target_fill, rotate);
+        algorithm::pack::apply_packing(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+            &bounds,
+            &packing,
+        );
+        let scale = packing.scale();
+        sizes.iter().map(|&(w, h)| w * h).sum::<f32>() * scale * scale
+    });
+    Ok(fill)
+}
+
+/// Rasterizes per-face color indices into an RGBA image (float32, width * height * 4)
+/// in Blender's pixel layout. Islands are grown by `padding` pixels; uncovered
+/// pixels become transparent black. The GIL is released during the computation.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn rasterize_color_id(
+    py: Python<'_>,
+    width: usize,
+    height: usize,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    face_colors: PyBuffer<i32>,
+    padding: usize,
+    mut out_pixels: PyBuffer<f32>,
+) -> PyResult<()> {
+    if width == 0 || height == 0 {
+        return Err(PyValueError::new_err(format!(
+            "Image size must be positive, got {}x{}",
+            width, height
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let face_colors = index_slice(&face_colors, "face_colors")?;
+    let out_pixels = buffer_slice_mut(&mut out_pixels, "out_pixels")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = uv_coords.len() / 2;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_colors", face_colors.len(), num_faces)?;
+    validate_length("out_pixels", out_pixels.len(), width * height * 4)?;
+
+    py.detach(|| {
+        algorithm::raster::rasterize_color_id(
+            width,
+            height,
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_colors,
+            padding,
+            out_pixels,
+        )
+    });
+    Ok(())
+}
+
+/// Writes corner colors (float32, total loops * 4) of a blue (0) to red (1) heatmap
+/// of per-face values (float32, one per face, clamped to 0..1).
+#[pyfunction]
+fn fill_heatmap_colors(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    face_values: PyBuffer<f32>,
+    mut out_colors: PyBuffer<f32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let face_values = buffer_slice(&face_values, "face_values")?;
+    let out_colors = buffer_slice_mut(&mut out_colors, "out_colors")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = out_colors.len() / 4;
+    validate_length("out_colors", out_colors.len(), total_loops * 4)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_values", face_values.len(), num_faces)?;
+
+    py.detach(|| {
+        algorithm::distortion::heatmap_colors(
+            poly_loop_starts,
+            poly_loop_totals,
+            face_values,
+            out_colors,
+        )
+    });
+    Ok(())
+}
+
+/// 64-bit fingerprint of the topology and UV buffers (see `fingerprint_mesh`).
+/// Cheap compared to a bake; used to skip work on unchanged meshes.
+#[pyfunction]
+fn fingerprint_mesh(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+) -> PyResult<u64> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+
+    Ok(py.detach(|| {
+        algorithm::fingerprint::fingerprint_mesh(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+        )
+    }))
+}
+
+type MeshBuffers = (Vec<f32>, Vec<u32>, Vec<u32>, Vec<u32>, Vec<f32>, usize);
+
+#[pyfunction]
+#[pyo3(signature = (kind, res_u, res_v, seam_density=0.0, seed=0))]
+fn generate_mesh(
+    kind: &str,
+    res_u: usize,
+    res_v: usize,
+    seam_density: f32,
+    seed: u64,
+) -> PyResult<MeshBuffers> {
+    let kind = mesh_gen::MeshKind::from_name(kind)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown mesh kind: {}", kind)))?;
+    if !(0.0..=1.0).contains(&seam_density) {
+        return Err(PyValueError::new_err(format!(
+            "seam_density must be within [0, 1], got {}",
+            seam_density
+        )));
+    }
+
+    let mesh = mesh_gen::generate(kind, res_u, res_v, seam_density, seed);
+    Ok((
+        mesh.positions,
+        mesh.poly_loop_starts,
+        mesh.poly_loop_totals,
+        mesh.loop_vert_indices,
+        mesh.uv_coords,
+        mesh.num_islands,
+    ))
+}
+
+/// Number of float32 values per island in `compute_texel_density`'s island stats:
+/// 3D area, UV area, density (UV units per 3D unit)
+const ISLAND_DENSITY_STATS: usize = 3;
+
+/// Validates the shared inputs of the texel density functions
+fn validate_density_inputs(
+    poly_loop_starts: &[u32],
+    poly_loop_totals: &[u32],
+    loop_vert_indices: &[u32],
+    positions: &[f32],
+    uv_coords: &[f32],
+    face_islands: &[u32],
+    num_islands: usize,
+) -> PyResult<()> {
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    let num_verts = positions.len() / 3;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("positions", positions.len(), num_verts * 3)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    if let Some(pos) = loop_vert_indices
+        .iter()
+        .position(|&v| v as usize >= num_verts)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_vert_indices contains vertex {} at position {}, but positions has {} vertices",
+            loop_vert_indices[pos], pos, num_verts
+        )));
+    }
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but there are {} islands",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+    Ok(())
+}
+
+/// Computes the texel density of every island (`face_islands` of `compute_island_coloring`)
+/// into `out_island_stats` (float32, islands * 3: 3D area, UV area, UV units per 3D unit).
+/// The GIL is released during the computation.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn compute_texel_density(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    positions: PyBuffer<f32>,
+    uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    mut out_island_stats: PyBuffer<f32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let positions = buffer_slice(&positions, "positions")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let out_island_stats = buffer_slice_mut(&mut out_island_stats, "out_island_stats")?;
+
+    let num_islands = out_island_stats.len() / ISLAND_DENSITY_STATS;
+    validate_length(
+        "out_island_stats",
+        out_island_stats.len(),
+        num_islands * ISLAND_DENSITY_STATS,
+    )?;
+    validate_density_inputs(
         poly_loop_starts,
         poly_loop_totals,
         loop_vert_indices,
+        positions,
         uv_coords,
-    );
-    Ok(result)
+        face_islands,
+        num_islands,
+    )?;
+
+    py.detach(|| {
+        let islands = algorithm::texel_density::island_densities(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            positions,
+            uv_coords,
+            face_islands,
+            num_islands,
+        );
+        for (out, island) in out_island_stats
+            .chunks_exact_mut(ISLAND_DENSITY_STATS)
+            .zip(&islands)
+        {
+            out.copy_from_slice(&[island.area_3d, island.area_uv, island.density()]);
+        }
+    });
+    Ok(())
+}
+
+/// Scales the islands whose `island_mask` entry (int32, one per island) is non-zero
+/// about their UV centroid to `target` UV units per 3D unit, in place in `uv_coords`.
+/// The GIL is released during the computation.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn normalize_texel_density(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    positions: PyBuffer<f32>,
+    mut uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    island_mask: PyBuffer<i32>,
+    target: f32,
+) -> PyResult<()> {
+    if !(target > 0.0 && target.is_finite()) {
+        return Err(PyValueError::new_err(format!(
+            "Target density must be positive, got {}",
+            target
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let positions = buffer_slice(&positions, "positions")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let island_mask = buffer_slice(&island_mask, "island_mask")?;
+
+    let num_islands = island_mask.len();
+    validate_density_inputs(
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices,
+        positions,
+        uv_coords,
+        face_islands,
+        num_islands,
+    )?;
+
+    py.detach(|| {
+        let islands = algorithm::texel_density::island_densities(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            positions,
+            uv_coords,
+            face_islands,
+            num_islands,
+        );
+        let mask: Vec<bool> = island_mask.iter().map(|&m| m != 0).collect();
+        let scales = algorithm::texel_density::density_scales(&islands, &mask, target);
+        algorithm::texel_density::scale_islands(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+            &islands,
+            &scales,
+        );
+    });
+    Ok(())
+}
+
+/// Relaxes the UVs of the selected faces in place (`face_select`: int32 per face,
+/// `loop_pins`: int32 per loop, non-zero means selected / pinned) and returns the
+/// number of moved UV vertices. Island boundaries, pinned UVs and the selection
+/// border stay fixed. `method` is "LAPLACIAN" or "ARAP".
+/// The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    loop_vert_indices,
+    positions,
+    uv_coords,
+    face_select,
+    loop_pins,
+    method="LAPLACIAN",
+    iterations=100,
+    strength=0.5,
+))]
+#[allow(clippy::too_many_arguments)]
+fn relax_uvs(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    positions: PyBuffer<f32>,
+    mut uv_coords: PyBuffer<f32>,
+    face_select: PyBuffer<i32>,
+    loop_pins: PyBuffer<i32>,
+    method: &str,
+    iterations: usize,
+    strength: f32,
+) -> PyResult<usize> {
+    let method = algorithm::relax::RelaxMethod::from_name(method)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown relax method: {}", method)))?;
+    if !(strength > 0.0 && strength <= 1.0) {
+        return Err(PyValueError::new_err(format!(
+            "strength must be in (0, 1], got {}",
+            strength
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let positions = buffer_slice(&positions, "positions")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_select = buffer_slice(&face_select, "face_select")?;
+    let loop_pins = buffer_slice(&loop_pins, "loop_pins")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    let num_verts = positions.len() / 3;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("positions", positions.len(), num_verts * 3)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_length("face_select", face_select.len(), num_faces)?;
+    validate_length("loop_pins", loop_pins.len(), total_loops)?;
+    if let Some(pos) = loop_vert_indices
+        .iter()
+        .position(|&v| v as usize >= num_verts)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_vert_indices contains vertex {} at position {}, but positions has {} vertices",
+            loop_vert_indices[pos], pos, num_verts
+        )));
+    }
+
+    let moved = py.detach(|| {
+        let face_select: Vec<bool> = face_select.iter().map(|&s| s != 0).collect();
+        let loop_pins: Vec<bool> = loop_pins.iter().map(|&p| p != 0).collect();
+        algorithm::relax::relax_uvs(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            positions,
+            uv_coords,
+            &face_select,
+            &loop_pins,
+            method,
+            iterations,
+            strength,
+        )
+    });
+    Ok(moved)
+}
+
+/// Welds the loops of a vertex whose UVs are within `tolerance` to their mean, in place
+/// in `uv_coords` unless `dry_run`. `face_select` (int32 per face, non-zero means
+/// selected) limits the weld to the selected faces. Returns the number of moved loops
+/// and the island counts before and after. The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    loop_vert_indices,
+    uv_coords,
+    tolerance,
+    face_select=None,
+    dry_run=false,
+))]
+fn weld_uvs(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    mut uv_coords: PyBuffer<f32>,
+    tolerance: f32,
+    face_select: Option<PyBuffer<i32>>,
+    dry_run: bool,
+) -> PyResult<(usize, usize, usize)> {
+    if !(tolerance > 0.0 && tolerance.is_finite()) {
+        return Err(PyValueError::new_err(format!(
+            "tolerance must be positive, got {}",
+            tolerance
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_select = face_select
+        .as_ref()
+        .map(|buffer| buffer_slice(buffer, "face_select"))
+        .transpose()?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    if let Some(face_select) = face_select {
+        validate_length("face_select", face_select.len(), num_faces)?;
+    }
+
+    let report = py.detach(|| {
+        let face_select: Option<Vec<bool>> =
+            face_select.map(|select| select.iter().map(|&s| s != 0).collect());
+        algorithm::weld::weld_uvs(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            uv_coords,
+            face_select.as_deref(),
+            tolerance,
+            dry_run,
+        )
+    });
+    Ok((
+        report.welded_loops,
+        report.islands_before,
+        report.islands_after,
+    ))
+}
+
+/// Finds groups of identical islands (same topology, 3D edge lengths within `tolerance`)
+/// into `out_island_groups` (int32, one per island, -1 without a duplicate).
+/// `face_islands` are the islands of `compute_island_coloring`; returns the number of groups.
+/// The GIL is released during the computation.
+#[pyfunction]
+#[allow(clippy::too_many_arguments)]
+fn find_duplicate_islands(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    positions: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    tolerance: f32,
+    mut out_island_groups: PyBuffer<i32>,
+) -> PyResult<usize> {
+    if !(tolerance >= 0.0 && tolerance.is_finite()) {
+        return Err(PyValueError::new_err(format!(
+            "tolerance must not be negative, got {}",
+            tolerance
+        )));
+    }
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let positions = buffer_slice(&positions, "positions")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let out_island_groups = buffer_slice_mut(&mut out_island_groups, "out_island_groups")?;
+
+    let num_faces = poly_loop_starts.len();
+    let num_verts = positions.len() / 3;
+    let num_islands = out_island_groups.len();
+    validate_topology(
+        num_faces,
+        poly_loop_starts,
+        poly_loop_totals,
+        loop_vert_indices.len(),
+    )?;
+    validate_length("positions", positions.len(), num_verts * 3)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    if let Some(pos) = loop_vert_indices
+        .iter()
+        .position(|&v| v as usize >= num_verts)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_vert_indices contains vertex {} at position {}, but positions has {} vertices",
+            loop_vert_indices[pos], pos, num_verts
+        )));
+    }
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but out_island_groups has {} entries",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    let num_groups = py.detach(|| {
+        let signatures = algorithm::stack::island_signatures(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            positions,
+            face_islands,
+            num_islands,
+        );
+        let groups = algorithm::stack::group_duplicates(&signatures, tolerance);
+        out_island_groups.fill(-1);
+        for (g_idx, group) in groups.iter().enumerate() {
+            for &island in group {
+                out_island_groups[island as usize] = g_idx as i32;
+            }
+        }
+        groups.len()
+    });
+    Ok(num_groups)
+}
+
+/// Stacks the islands of every group of `island_groups` (int32, one per island, -1 for
+/// none) onto the UV centroid, orientation and size of the group's first island, in
+/// place in `uv_coords`. The GIL is released during the computation.
+#[pyfunction]
+fn stack_islands(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    mut uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    island_groups: PyBuffer<i32>,
+) -> PyResult<()> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let island_groups = buffer_slice(&island_groups, "island_groups")?;
+
+    let num_faces = poly_loop_starts.len();
+    let num_islands = island_groups.len();
+    let total_loops = uv_coords.len() / 2;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but island_groups has {} entries",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    py.detach(|| {
+        let num_groups = island_groups.iter().map(|&g| g + 1).max().unwrap_or(0) as usize;
+        let mut groups: Vec<Vec<u32>> = vec![Vec::new(); num_groups];
+        for (island, &group) in island_groups.iter().enumerate() {
+            if group >= 0 {
+                groups[group as usize].push(island as u32);
+            }
+        }
+        groups.retain(|group| group.len() > 1);
+        algorithm::stack::stack_groups(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+            num_islands,
+            &groups,
+        );
+    });
+    Ok(())
+}
+
+/// Rotates the islands whose `island_mask` entry (int32, one per island) is non-zero
+/// about their UV centroid so that their main axis lies on U, in place in `uv_coords`.
+/// `method` is "PCA" or "BOUNDING_BOX"; with `snap` islands turn onto the nearer of U
+/// and V. Returns the number of rotated islands. The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    uv_coords,
+    face_islands,
+    island_mask,
+    method="PCA",
+    snap=true,
+))]
+#[allow(clippy::too_many_arguments)]
+fn align_uv_islands(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    mut uv_coords: PyBuffer<f32>,
+    face_islands: PyBuffer<i32>,
+    island_mask: PyBuffer<i32>,
+    method: &str,
+    snap: bool,
+) -> PyResult<usize> {
+    let method = algorithm::align::AlignMethod::from_name(method)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown align method: {}", method)))?;
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let uv_coords = buffer_slice_mut(&mut uv_coords, "uv_coords")?;
+    let face_islands = index_slice(&face_islands, "face_islands")?;
+    let island_mask = buffer_slice(&island_mask, "island_mask")?;
+
+    let num_faces = poly_loop_starts.len();
+    let num_islands = island_mask.len();
+    let total_loops = uv_coords.len() / 2;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("face_islands", face_islands.len(), num_faces)?;
+    if let Some(pos) = face_islands.iter().position(|&i| i as usize >= num_islands) {
+        return Err(PyValueError::new_err(format!(
+            "face_islands contains island {} at position {}, but island_mask has {} entries",
+            face_islands[pos], pos, num_islands
+        )));
+    }
+
+    let rotated = py.detach(|| {
+        let mask: Vec<bool> = island_mask.iter().map(|&m| m != 0).collect();
+        algorithm::align::align_islands(
+            poly_loop_starts,
+            poly_loop_totals,
+            uv_coords,
+            face_islands,
+            num_islands,
+            Some(&mask),
+            method,
+            snap,
+        )
+    });
+    Ok(rotated)
+}
+
+type BoundaryPolylines = (Vec<u32>, Vec<u32>, Vec<u32>, Vec<bool>);
+
+/// Fills `out_seams` (int32, one per edge) with 1 for edges whose UVs are split and
+/// returns the number of such edges. With `keep_existing`, `out_seams` holds the current
+/// seams on input and non-zero entries stay 1. `loop_edge_indices` are the edges of the
+/// loops (`MeshLoop.edge_index`). If `face_islands` (`compute_island_coloring`) is given,
+/// also returns the boundary polylines of the islands as
+/// (offsets, loops, island per polyline, closed per polyline).
+/// The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    loop_vert_indices,
+    loop_edge_indices,
+    uv_coords,
+    out_seams,
+    face_islands=None,
+    keep_existing=false,
+))]
+#[allow(clippy::too_many_arguments)]
+fn seams_from_islands(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    loop_edge_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    mut out_seams: PyBuffer<i32>,
+    face_islands: Option<PyBuffer<i32>>,
+    keep_existing: bool,
+) -> PyResult<(usize, Option<BoundaryPolylines>)> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let loop_edge_indices = index_slice(&loop_edge_indices, "loop_edge_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+    let out_seams = buffer_slice_mut(&mut out_seams, "out_seams")?;
+    let face_islands = face_islands
+        .as_ref()
+        .map(|islands| index_slice(islands, "face_islands"))
+        .transpose()?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    let num_edges = out_seams.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("loop_edge_indices", loop_edge_indices.len(), total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    if let Some(pos) = loop_edge_indices
+        .iter()
+        .position(|&e| e as usize >= num_edges)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_edge_indices contains edge {} at position {}, but out_seams has {} entries",
+            loop_edge_indices[pos], pos, num_edges
+        )));
+    }
+    if let Some(face_islands) = face_islands {
+        validate_length("face_islands", face_islands.len(), num_faces)?;
+    }
+
+    Ok(py.detach(|| {
+        let table = algorithm::seams::SideTable::new(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            loop_edge_indices,
+            uv_coords,
+            num_edges,
+        );
+        let mut num_seams = 0;
+        for (out, seam) in out_seams.iter_mut().zip(table.seam_mask()) {
+            *out = (seam || (keep_existing && *out != 0)) as i32;
+            num_seams += seam as usize;
+        }
+        let polylines = face_islands.map(|face_islands| {
+            let polylines = table.polylines(
+                poly_loop_starts,
+                poly_loop_totals,
+                loop_vert_indices,
+                uv_coords,
+                face_islands,
+            );
+            (
+                polylines.offsets,
+                polylines.loops,
+                polylines.islands,
+                polylines.closed,
+            )
+        });
+        (num_seams, polylines)
+    }))
+}
+
+/// Vertices, faces, loops, islands, seams, then the bytes of face islands, face colors,
+/// faces per island, seams per island and island stats
+type MeshFileAnalysis<'py> = (
+    usize,
+    usize,
+    usize,
+    usize,
+    usize,
+    Bound<'py, PyBytes>,
+    Bound<'py, PyBytes>,
+    Bound<'py, PyBytes>,
+    Bound<'py, PyBytes>,
+    Bound<'py, PyBytes>,
+);
+
+/// Reads an OBJ (faces with `vt` indices) or PLY (ASCII or binary, with UVs) file and
+/// detects and colors its UV islands like the Color ID bake, without Blender.
+/// The file is memory-mapped and parsed on all cores. The arrays are returned as
+/// native-endian bytes for `array.array`: int32 island and color per face, int32 faces
+/// and seam edges per island and float32 island stats (islands * 3, as in
+/// `compute_texel_density`). Seams are detected like in `seams_from_islands`, on the
+/// edges implied by the faces.
+/// The GIL is released while reading and computing.
+#[pyfunction]
+fn analyze_mesh_file<'py>(py: Python<'py>, path: PathBuf) -> PyResult<MeshFileAnalysis<'py>> {
+    let extension = path
+        .extension()
+        .and_then(|extension| extension.to_str())
+        .unwrap_or_default()
+        .to_owned();
+    let file = std::fs::File::open(&path)?;
+    // SAFETY: the map is only read during this call. Like any memory-mapped reader, it
+    // relies on no other process truncating the file meanwhile.
+    let bytes = unsafe { memmap2::Mmap::map(&file)? };
+
+    let (mesh, coloring, island_faces, islands, num_seams, island_seams) = py
+        .detach(|| -> Result<_, String> {
+            let mesh = algorithm::mesh_io::parse_mesh(&bytes, &extension)?;
+            let coloring = algorithm::color_id::compute_island_coloring(
+                mesh.num_faces(),
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &mesh.loop_vert_indices,
+                &mesh.uv_coords,
+            );
+            let mut island_faces = vec![0u32; coloring.num_islands];
+            for &island in &coloring.face_islands {
+                island_faces[island as usize] += 1;
+            }
+            let islands = algorithm::texel_density::island_densities(
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &mesh.loop_vert_indices,
+                &mesh.positions,
+                &mesh.uv_coords,
+                &coloring.face_islands,
+                coloring.num_islands,
+            );
+            let (loop_edges, num_edges) = algorithm::seams::loop_edges(
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &mesh.loop_vert_indices,
+            );
+            let table = algorithm::seams::SideTable::new(
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &mesh.loop_vert_indices,
+                &loop_edges,
+                &mesh.uv_coords,
+                num_edges,
+            );
+            let seam_mask = table.seam_mask();
+            let num_seams = seam_mask.iter().filter(|&&seam| seam).count();
+            let island_seams = table.island_seam_counts(
+                &seam_mask,
+                &mesh.poly_loop_starts,
+                &mesh.poly_loop_totals,
+                &coloring.face_islands,
+                coloring.num_islands,
+            );
+            Ok((
+                mesh,
+                coloring,
+                island_faces,
+                islands,
+                num_seams,
+                island_seams,
+            ))
+        })
+        .map_err(|e| PyValueError::new_err(format!("{}: {}", path.display(), e)))?;
+
+    let int32_bytes = |values: &[u32]| {
+        let bytes: Vec<u8> = values
+            .iter()
+            .flat_map(|&value| (value as i32).to_ne_bytes())
+            .collect();
+        PyBytes::new(py, &bytes)
+    };
+    let island_stats: Vec<u8> = islands
+        .iter()
+        .flat_map(|island| [island.area_3d, island.area_uv, island.density()])
+        .flat_map(f32::to_ne_bytes)
+        .collect();
+    Ok((
+        mesh.num_verts(),
+        mesh.num_faces(),
+        mesh.num_loops(),
+        coloring.num_islands,
+        num_seams,
+        int32_bytes(&coloring.face_islands),
+        int32_bytes(&coloring.face_colors),
+        int32_bytes(&island_faces),
+        int32_bytes(&island_seams),
+        PyBytes::new(py, &island_stats),
+    ))
+}
+
+/// Islands, Color ID colors, seams, then the covered fraction of the 0-1 tile and the
+/// fraction of the covered area where islands overlap
+type UvStatsTuple = (usize, usize, usize, f32, f32);
+
+/// Summary stats of the UV map for the live stats panel. `loop_edge_indices` are the
+/// edges of the loops (`MeshLoop.edge_index`) and `num_edges` the edge count of the mesh.
+/// Coverage and overlap are sampled on a `raster_size`² raster of the 0-1 tile.
+/// The GIL is released during the computation.
+#[pyfunction]
+#[pyo3(signature = (
+    poly_loop_starts,
+    poly_loop_totals,
+    loop_vert_indices,
+    loop_edge_indices,
+    uv_coords,
+    num_edges,
+    raster_size=512,
+))]
+#[allow(clippy::too_many_arguments)]
+fn compute_uv_stats(
+    py: Python<'_>,
+    poly_loop_starts: PyBuffer<i32>,
+    poly_loop_totals: PyBuffer<i32>,
+    loop_vert_indices: PyBuffer<i32>,
+    loop_edge_indices: PyBuffer<i32>,
+    uv_coords: PyBuffer<f32>,
+    num_edges: usize,
+    raster_size: usize,
+) -> PyResult<UvStatsTuple> {
+    let poly_loop_starts = index_slice(&poly_loop_starts, "poly_loop_starts")?;
+    let poly_loop_totals = index_slice(&poly_loop_totals, "poly_loop_totals")?;
+    let loop_vert_indices = index_slice(&loop_vert_indices, "loop_vert_indices")?;
+    let loop_edge_indices = index_slice(&loop_edge_indices, "loop_edge_indices")?;
+    let uv_coords = buffer_slice(&uv_coords, "uv_coords")?;
+
+    let num_faces = poly_loop_starts.len();
+    let total_loops = loop_vert_indices.len();
+    validate_topology(num_faces, poly_loop_starts, poly_loop_totals, total_loops)?;
+    validate_length("loop_edge_indices", loop_edge_indices.len(), total_loops)?;
+    validate_length("uv_coords", uv_coords.len(), total_loops * 2)?;
+    if let Some(pos) = loop_edge_indices
+        .iter()
+        .position(|&e| e as usize >= num_edges)
+    {
+        return Err(PyValueError::new_err(format!(
+            "loop_edge_indices contains edge {} at position {}, but the mesh has {} edges",
+            loop_edge_indices[pos], pos, num_edges
+        )));
+    }
+
+    let stats = py.detach(|| {
+        algorithm::uv_stats::uv_stats(
+            poly_loop_starts,
+            poly_loop_totals,
+            loop_vert_indices,
+            loop_edge_indices,
+            uv_coords,
+            num_edges,
+            raster_size,
+        )
+    });
+    Ok((
+        stats.num_islands,
+        stats.num_colors,
+        stats.num_seams,
+        stats.coverage,
+        stats.overlap,
+    ))
 }
 
 #[pymodule]
 fn nt_rust_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(align_uv_islands, m)?)?;
+    m.add_function(wrap_pyfunction!(analyze_mesh_file, m)?)?;
     m.add_function(wrap_pyfunction!(bake_color_id_all, m)?)?;
+    m.add_function(wrap_pyfunction!(bake_color_id_layers, m)?)?;
+    m.add_function(wrap_pyfunction!(bake_color_id_region, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_island_coloring, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_texel_density, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_uv_distortion, m)?)?;
+    m.add_function(wrap_pyfunction!(compute_uv_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(detect_uv_overlaps, m)?)?;
+    m.add_function(wrap_pyfunction!(fill_face_colors, m)?)?;
+    m.add_function(wrap_pyfunction!(fill_heatmap_colors, m)?)?;
+    m.add_function(wrap_pyfunction!(find_duplicate_islands, m)?)?;
+    m.add_function(wrap_pyfunction!(fingerprint_mesh, m)?)?;
+    m.add_function(wrap_pyfunction!(generate_mesh, m)?)?;
+    m.add_function(wrap_pyfunction!(normalize_texel_density, m)?)?;
+    m.add_function(wrap_pyfunction!(pack_uv_islands, m)?)?;
+    m.add_function(wrap_pyfunction!(rasterize_color_id, m)?)?;
+    m.add_function(wrap_pyfunction!(relax_uvs, m)?)?;
+    m.add_function(wrap_pyfunction!(seams_from_islands, m)?)?;
+    m.add_function(wrap_pyfunction!(select_uv_overlaps, m)?)?;
+    m.add_function(wrap_pyfunction!(selected_island_mask, m)?)?;
+    m.add_function(wrap_pyfunction!(stack_islands, m)?)?;
+    m.add_function(wrap_pyfunction!(weld_uvs, m)?)?;
     Ok(())
 }
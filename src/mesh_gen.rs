@@ -0,0 +1,420 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+
+//! Deterministic synthetic meshes for benchmarks and tests.
+//!
+//! Every generator returns flat buffers laid out exactly like Blender's
+//! `foreach_get` output, so the same mesh can be fed to the Rust core directly
+//! or turned into a Blender mesh with `foreach_set`.
+//! Island counts are known up front, which lets tests assert on them.
+
+/// Flat mesh buffers (Blender layout)
+#[derive(Debug, Clone, Default)]
+pub struct SyntheticMesh {
+    /// Flat array of vertex positions [x, y, z, x, y, z, ...]
+    pub positions: Vec<f32>,
+    pub poly_loop_starts: Vec<u32>,
+    pub poly_loop_totals: Vec<u32>,
+    pub loop_vert_indices: Vec<u32>,
+    /// Flat array of UV coordinates [u, v, u, v, ...] (one pair per loop)
+    pub uv_coords: Vec<f32>,
+    /// Number of UV islands the generator produced
+    pub num_islands: usize,
+}
+
+impl SyntheticMesh {
+    pub fn num_verts(&self) -> usize {
+        self.positions.len() / 3
+    }
+
+    pub fn num_faces(&self) -> usize {
+        self.poly_loop_starts.len()
+    }
+
+    pub fn num_loops(&self) -> usize {
+        self.loop_vert_indices.len()
+    }
+
+    fn push_vert(&mut self, x: f32, y: f32, z: f32) -> u32 {
+        self.positions.extend_from_slice(&[x, y, z]);
+        (self.num_verts() - 1) as u32
+    }
+
+    fn push_face(&mut self, verts: &[u32], uvs: &[(f32, f32)]) {
+        debug_assert_eq!(verts.len(), uvs.len());
+        self.poly_loop_starts
+            .push(self.loop_vert_indices.len() as u32);
+        self.poly_loop_totals.push(verts.len() as u32);
+        self.loop_vert_indices.extend_from_slice(verts);
+        for &(u, v) in uvs {
+            self.uv_coords.extend_from_slice(&[u, v]);
+        }
+    }
+}
+
+/// Mesh families understood by [`generate`]
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum MeshKind {
+    Grid,
+    Checker,
+    Torus,
+    Fan,
+    Scatter,
+}
+
+impl MeshKind {
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name.to_ascii_uppercase().as_str() {
+            "GRID" => Some(Self::Grid),
+            "CHECKER" => Some(Self::Checker),
+            "TORUS" => Some(Self::Torus),
+            "FAN" => Some(Self::Fan),
+            "SCATTER" => Some(Self::Scatter),
+            _ => None,
+        }
+    }
+}
+
+/// Generates a mesh of the given kind
+///
+/// The meaning of `res_u` / `res_v` depends on the kind:
+/// - Grid, Checker: cells along X / Y
+/// - Torus: major / minor segments
+/// - Fan: number of fans / blades per fan
+/// - Scatter: number of islands / quads per island side
+pub fn generate(
+    kind: MeshKind,
+    res_u: usize,
+    res_v: usize,
+    seam_density: f32,
+    seed: u64,
+) -> SyntheticMesh {
+    match kind {
+        MeshKind::Grid => grid(res_u, res_v, seam_density, seed),
+        MeshKind::Checker => checker(res_u, res_v),
+        MeshKind::Torus => torus(res_u, res_v, seam_density, seed),
+        MeshKind::Fan => fan(res_u, res_v, seam_density, seed),
+        MeshKind::Scatter => scatter(res_u, res_v, seed),
+    }
+}
+
+/// SplitMix64: tiny, fast and good enough for reproducible test data
+struct Rng(u64);
+
+impl Rng {
+    fn new(seed: u64) -> Self {
+        Self(seed)
+    }
+
+    fn next_u64(&mut self) -> u64 {
+        self.0 = self.0.wrapping_add(0x9E37_79B9_7F4A_7C15);
+        let mut z = self.0;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+        z ^ (z >> 31)
+    }
+
+    /// Uniform float in [0, 1)
+    fn next_f32(&mut self) -> f32 {
+        (self.next_u64() >> 40) as f32 / (1u64 << 24) as f32
+    }
+
+    fn chance(&mut self, probability: f32) -> bool {
+        self.next_f32() < probability
+    }
+}
+
+/// Picks seam lines on a strip of `cells` cells
+/// Returns the segment (island column) index of every cell and the segment count
+fn cut_segments(cells: usize, seam_density: f32, rng: &mut Rng) -> (Vec<usize>, usize) {
+    let mut segments = Vec::with_capacity(cells);
+    let mut segment = 0;
+    for i in 0..cells {
+        if i > 0 && rng.chance(seam_density) {
+            segment += 1;
+        }
+        segments.push(segment);
+    }
+    (segments, segment + 1)
+}
+
+/// Flat grid of `nx * ny` quads on the XY plane
+/// Every interior grid line becomes a UV seam with probability `seam_density`,
+/// so the islands form a (cuts_x + 1) * (cuts_y + 1) lattice of rectangles.
+pub fn grid(nx: usize, ny: usize, seam_density: f32, seed: u64) -> SyntheticMesh {
+    build_grid(nx, ny, seam_density, seed, false)
+}
+
+/// Seam-heavy grid: every quad is its own island, with mirrored UVs on
+/// alternating cells so that no two neighbours share a UV edge.
+pub fn checker(nx: usize, ny: usize) -> SyntheticMesh {
+    build_grid(nx, ny, 1.0, 0, true)
+}
+
+fn build_grid(nx: usize, ny: usize, seam_density: f32, seed: u64, mirror: bool) -> SyntheticMesh {
+    let mut rng = Rng::new(seed);
+    let (seg_x, count_x) = cut_segments(nx, seam_density, &mut rng);
+    let (seg_y, count_y) = cut_segments(ny, seam_density, &mut rng);
+
+    let mut mesh = SyntheticMesh::default();
+    mesh.positions.reserve((nx + 1) * (ny + 1) * 3);
+    mesh.poly_loop_starts.reserve(nx * ny);
+    mesh.poly_loop_totals.reserve(nx * ny);
+    mesh.loop_vert_indices.reserve(nx * ny * 4);
+    mesh.uv_coords.reserve(nx * ny * 8);
+
+    for j in 0..=ny {
+        for i in 0..=nx {
+            let x = i as f32 / nx.max(1) as f32 * 2.0 - 1.0;
+            let y = j as f32 / ny.max(1) as f32 * 2.0 - 1.0;
+            mesh.push_vert(x, y, 0.0);
+        }
+    }
+
+    // Each seam opens a one-cell gap in UV space
+    let width = (nx + count_x - 1).max(1) as f32;
+    let height = (ny + count_y - 1).max(1) as f32;
+    let vert = |i: usize, j: usize| (j * (nx + 1) + i) as u32;
+
+    for (j, &sy) in seg_y.iter().enumerate() {
+        for (i, &sx) in seg_x.iter().enumerate() {
+            let u0 = (i + sx) as f32 / width;
+            let u1 = (i + 1 + sx) as f32 / width;
+            let v0 = (j + sy) as f32 / height;
+            let v1 = (j + 1 + sy) as f32 / height;
+            let (u0, u1) = if mirror && (i + j) % 2 == 1 {
+                (u1, u0)
+            } else {
+                (u0, u1)
+            };
+            mesh.push_face(
+                &[
+                    vert(i, j),
+                    vert(i + 1, j),
+                    vert(i + 1, j + 1),
+                    vert(i, j + 1),
+                ],
+                &[(u0, v0), (u1, v0), (u1, v1), (u0, v1)],
+            );
+        }
+    }
+
+    mesh.num_islands = if nx * ny == 0 { 0 } else { count_x * count_y };
+    mesh
+}
+
+/// Closed torus of `major * minor` quads
+/// Both wrap-around rings are always seams (one island for `seam_density == 0`),
+/// every other ring becomes a seam with probability `seam_density`.
+pub fn torus(major: usize, minor: usize, seam_density: f32, seed: u64) -> SyntheticMesh {
+    let major = major.max(3);
+    let minor = minor.max(3);
+    let mut rng = Rng::new(seed);
+    let (seg_a, count_a) = cut_segments(major, seam_density, &mut rng);
+    let (seg_b, count_b) = cut_segments(minor, seam_density, &mut rng);
+
+    let mut mesh = SyntheticMesh::default();
+    mesh.positions.reserve(major * minor * 3);
+    mesh.poly_loop_starts.reserve(major * minor);
+    mesh.poly_loop_totals.reserve(major * minor);
+    mesh.loop_vert_indices.reserve(major * minor * 4);
+    mesh.uv_coords.reserve(major * minor * 8);
+
+    let (major_radius, minor_radius) = (1.0f32, 0.25f32);
+    for i in 0..major {
+        let a = i as f32 / major as f32 * std::f32::consts::TAU;
+        for j in 0..minor {
+            let b = j as f32 / minor as f32 * std::f32::consts::TAU;
+            let r = major_radius + minor_radius * b.cos();
+            mesh.push_vert(r * a.cos(), r * a.sin(), minor_radius * b.sin());
+        }
+    }
+
+    // The wrap seam is closed by the last segment, so no extra gap is needed there
+    let width = (major + count_a - 1) as f32;
+    let height = (minor + count_b - 1) as f32;
+    let vert = |i: usize, j: usize| ((i % major) * minor + (j % minor)) as u32;
+
+    for (i, &sa) in seg_a.iter().enumerate() {
+        for (j, &sb) in seg_b.iter().enumerate() {
+            let u0 = (i + sa) as f32 / width;
+            let u1 = (i + 1 + sa) as f32 / width;
+            let v0 = (j + sb) as f32 / height;
+            let v1 = (j + 1 + sb) as f32 / height;
+            mesh.push_face(
+                &[
+                    vert(i, j),
+                    vert(i + 1, j),
+                    vert(i + 1, j + 1),
+                    vert(i, j + 1),
+                ],
+                &[(u0, v0), (u1, v0), (u1, v1), (u0, v1)],
+            );
+        }
+    }
+
+    mesh.num_islands = count_a * count_b;
+    mesh
+}
+
+/// Non-manifold fans: `blades` quads hinged on one shared edge, `num_fans` times
+/// Each blade starts a new island with probability `seam_density`,
+/// otherwise it shares the hinge UVs (and thus the island) of the previous blade.
+pub fn fan(num_fans: usize, blades: usize, seam_density: f32, seed: u64) -> SyntheticMesh {
+    let mut rng = Rng::new(seed);
+    let mut mesh = SyntheticMesh::default();
+    let slot = 1.0 / num_fans.max(1) as f32;
+
+    for f in 0..num_fans {
+        let x = f as f32 * 3.0;
+        let hinge_a = mesh.push_vert(x, 0.0, 0.0);
+        let hinge_b = mesh.push_vert(x, 0.0, 1.0);
+        let u_base = f as f32 * slot;
+
+        let mut group = 0;
+        for b in 0..blades {
+            if b > 0 && rng.chance(seam_density) {
+                group += 1;
+            }
+            let angle = b as f32 / blades.max(1) as f32 * std::f32::consts::TAU;
+            let (dx, dy) = (angle.cos(), angle.sin());
+            let tip_b = mesh.push_vert(x + dx, dy, 1.0);
+            let tip_a = mesh.push_vert(x + dx, dy, 0.0);
+
+            // Blades of the same group stack on the same hinge UVs
+            let u_hinge = u_base + slot * 0.5;
+            let v_hinge = group as f32 / blades.max(1) as f32;
+            let v_top = v_hinge + 0.5 / blades.max(1) as f32;
+            let u_tip = u_hinge + slot * 0.4 * (b % 2) as f32 - slot * 0.2;
+            mesh.push_face(
+                &[hinge_a, hinge_b, tip_b, tip_a],
+                &[
+                    (u_hinge, v_hinge),
+                    (u_hinge, v_top),
+                    (u_tip, v_top),
+                    (u_tip, v_hinge),
+                ],
+            );
+        }
+        if blades > 0 {
+            mesh.num_islands += group + 1;
+        }
+    }
+    mesh
+}
+
+/// Many disconnected `res * res` quad patches with shuffled UV placement
+/// Produces exactly `num_islands` islands and no seam adjacency.
+pub fn scatter(num_islands: usize, res: usize, seed: u64) -> SyntheticMesh {
+    let res = res.max(1);
+    let mut rng = Rng::new(seed);
+    let mut mesh = SyntheticMesh::default();
+    let side = (num_islands as f64).sqrt().ceil().max(1.0) as usize;
+    let slot = 1.0 / side as f32;
+
+    // Fisher-Yates shuffle of the UV slots
+    let mut slots: Vec<usize> = (0..side * side).collect();
+    for i in (1..slots.len()).rev() {
+        let j = (rng.next_u64() % (i as u64 + 1)) as usize;
+        slots.swap(i, j);
+    }
+
+    for &slot_idx in slots.iter().take(num_islands) {
+        let ox = rng.next_f32() * side as f32 * 2.0;
+        let oy = rng.next_f32() * side as f32 * 2.0;
+        let oz = rng.next_f32();
+        let base = mesh.num_verts();
+        for j in 0..=res {
+            for i in 0..=res {
+                let (x, y) = (i as f32 / res as f32, j as f32 / res as f32);
+                mesh.push_vert(ox + x, oy + y, oz);
+            }
+        }
+
+        let (sx, sy) = (slot_idx % side, slot_idx / side);
+        let scale = slot * (0.5 + 0.4 * rng.next_f32());
+        let (u_off, v_off) = (sx as f32 * slot, sy as f32 * slot);
+        let uv = |i: usize, j: usize| {
+            (
+                u_off + i as f32 / res as f32 * scale,
+                v_off + j as f32 / res as f32 * scale,
+            )
+        };
+        let vert = |i: usize, j: usize| (base + j * (res + 1) + i) as u32;
+
+        for j in 0..res {
+            for i in 0..res {
+                mesh.push_face(
+                    &[
+                        vert(i, j),
+                        vert(i + 1, j),
+                        vert(i + 1, j + 1),
+                        vert(i, j + 1),
+                    ],
+                    &[uv(i, j), uv(i + 1, j), uv(i + 1, j + 1), uv(i, j + 1)],
+                );
+            }
+        }
+    }
+    mesh.num_islands = num_islands;
+    mesh
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn assert_consistent(mesh: &SyntheticMesh) {
+        assert_eq!(mesh.poly_loop_starts.len(), mesh.poly_loop_totals.len());
+        assert_eq!(mesh.uv_coords.len(), mesh.num_loops() * 2);
+        let mut expected_start = 0;
+        for (&start, &total) in mesh.poly_loop_starts.iter().zip(&mesh.poly_loop_totals) {
+            assert_eq!(start as usize, expected_start, "loops must be contiguous");
+            expected_start += total as usize;
+        }
+        assert_eq!(expected_start, mesh.num_loops());
+        assert!(
+            mesh.loop_vert_indices
+                .iter()
+                .all(|&v| (v as usize) < mesh.num_verts())
+        );
+    }
+
+    #[test]
+    fn test_generators_are_consistent() {
+        for kind in [
+            MeshKind::Grid,
+            MeshKind::Checker,
+            MeshKind::Torus,
+            MeshKind::Fan,
+            MeshKind::Scatter,
+        ] {
+            assert_consistent(&generate(kind, 12, 7, 0.3, 42));
+        }
+    }
+
+    #[test]
+    fn test_generators_are_deterministic() {
+        let a = grid(32, 32, 0.2, 7);
+        let b = grid(32, 32, 0.2, 7);
+        assert_eq!(a.uv_coords, b.uv_coords);
+        assert_eq!(a.num_islands, b.num_islands);
+    }
+
+    #[test]
+    fn test_island_counts() {
+        assert_eq!(grid(10, 10, 0.0, 1).num_islands, 1);
+        assert_eq!(checker(5, 4).num_islands, 20);
+        assert_eq!(torus(12, 8, 0.0, 1).num_islands, 1);
+        assert_eq!(scatter(17, 3, 1).num_islands, 17);
+        assert_eq!(fan(3, 5, 0.0, 1).num_islands, 3);
+        assert_eq!(fan(3, 5, 1.0, 1).num_islands, 15);
+    }
+
+    #[test]
+    fn test_face_counts() {
+        assert_eq!(grid(10, 20, 0.5, 1).num_faces(), 200);
+        assert_eq!(torus(48, 12, 0.0, 1).num_faces(), 576);
+        assert_eq!(scatter(10, 4, 1).num_faces(), 160);
+        assert_eq!(fan(2, 6, 0.5, 1).num_faces(), 12);
+    }
+}
@@ -0,0 +1,98 @@
+import math
+import unittest
+import bpy
+from nextools.logic.align import align_uv_islands
+from nextools.utils import mesh_gen
+
+
+class TestUVAlign(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _tilted_object(self, degrees, v_scale=0.25):
+        """One island: the unit UV square squashed along V, then rotated."""
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4))
+        sin, cos = math.sin(math.radians(degrees)), math.cos(math.radians(degrees))
+        for loop in obj.data.uv_layers.active.data:
+            u, v = loop.uv.x - 0.5, (loop.uv.y - 0.5) * v_scale
+            loop.uv = (0.5 + u * cos - v * sin, 0.5 + u * sin + v * cos)
+        return obj
+
+    def _uv_extent(self, obj):
+        uvs = [loop.uv for loop in obj.data.uv_layers.active.data]
+        return (
+            max(uv.x for uv in uvs) - min(uv.x for uv in uvs),
+            max(uv.y for uv in uvs) - min(uv.y for uv in uvs),
+        )
+
+    def test_pca_aligns_long_side_to_u(self):
+        obj = self._tilted_object(30.0)
+
+        result = align_uv_islands([obj], method="PCA", snap=False)
+
+        self.assertEqual(result, (1, 1))
+        width, height = self._uv_extent(obj)
+        self.assertAlmostEqual(width, 1.0, places=4)
+        self.assertAlmostEqual(height, 0.25, places=4)
+
+    def test_snap_turns_onto_nearer_axis(self):
+        obj = self._tilted_object(80.0)
+
+        align_uv_islands([obj], method="PCA", snap=True)
+
+        width, height = self._uv_extent(obj)
+        self.assertAlmostEqual(width, 0.25, places=4)
+        self.assertAlmostEqual(height, 1.0, places=4)
+
+    def test_bounding_box_aligns_squares_of_all_objects(self):
+        objects = [self._tilted_object(angle, v_scale=1.0) for angle in (20.0, -35.0)]
+
+        result = align_uv_islands(objects, method="BOUNDING_BOX")
+
+        self.assertEqual(result.num_rotated, 2)
+        for obj in objects:
+            for extent in self._uv_extent(obj):
+                self.assertAlmostEqual(extent, 1.0, places=4)
+
+    def test_selected_only_in_edit_mode(self):
+        obj = self._tilted_object(30.0)
+        for poly in obj.data.polygons:
+            poly.select = False
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        result = align_uv_islands([obj], selected_only=True)
+
+        self.assertEqual(result, (0, 0))
+
+    def test_objects_in_edit_mode(self):
+        """Selected islands of objects in multi-object Edit Mode are aligned without leaving it."""
+        objects = [self._tilted_object(angle) for angle in (20.0, -35.0)]
+        for obj in objects:
+            obj.select_set(True)
+        bpy.context.view_layer.objects.active = objects[0]
+        bpy.ops.object.mode_set(mode="EDIT")
+        bpy.ops.mesh.select_all(action="SELECT")
+
+        result = align_uv_islands(objects, method="PCA", snap=False, selected_only=True)
+
+        self.assertEqual(result, (2, 2))
+        bpy.ops.object.mode_set(mode="OBJECT")
+        for obj in objects:
+            width, height = self._uv_extent(obj)
+            self.assertAlmostEqual(width, 1.0, places=4)
+            self.assertAlmostEqual(height, 0.25, places=4)
+
+    def test_invalid_method_raises(self):
+        obj = self._tilted_object(30.0)
+
+        with self.assertRaises(ValueError):
+            align_uv_islands([obj], method="UNKNOWN")
+
+
+if __name__ == "__main__":
+    unittest.main()
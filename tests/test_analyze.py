@@ -0,0 +1,107 @@
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from nextools.analyze import analyze, main
+from nextools.utils import mesh_gen
+
+
+def write_obj(path, data):
+    """One vt per loop, as Blender's OBJ exporter writes split UVs."""
+    lines = [f"v {x} {y} {z}" for x, y, z in zip(*[iter(data.positions)] * 3)]
+    lines += [f"vt {u} {v}" for u, v in zip(*[iter(data.uv_coords)] * 2)]
+    for start, total in zip(data.poly_loop_starts, data.poly_loop_totals):
+        corners = range(start, start + total)
+        lines.append("f " + " ".join(f"{data.loop_vert_indices[i] + 1}/{i + 1}" for i in corners))
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_binary_ply(path, data):
+    """Little-endian PLY with per-corner texcoord lists."""
+    header = (
+        "ply\nformat binary_little_endian 1.0\n"
+        f"element vertex {len(data.positions) // 3}\n"
+        "property float x\nproperty float y\nproperty float z\n"
+        f"element face {data.num_faces}\n"
+        "property list uchar int vertex_indices\nproperty list uchar float texcoord\n"
+        "end_header\n"
+    )
+    body = struct.pack(f"<{len(data.positions)}f", *data.positions)
+    for start, total in zip(data.poly_loop_starts, data.poly_loop_totals):
+        verts = data.loop_vert_indices[start : start + total]
+        uvs = data.uv_coords[start * 2 : (start + total) * 2]
+        body += struct.pack(f"<B{total}iB{total * 2}f", total, *verts, total * 2, *uvs)
+    path.write_bytes(header.encode() + body)
+
+
+class TestAnalyzeMeshFile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_obj_islands_match_the_generator(self):
+        data = mesh_gen.generate("CHECKER", 6, 4)
+        path = self.folder / "checker.obj"
+        write_obj(path, data)
+
+        stats = analyze(path)
+
+        self.assertEqual((stats.num_faces, stats.num_islands), (24, 24))
+        self.assertEqual(len(stats.face_islands), 24)
+        self.assertEqual(sum(stats.island_faces), 24)
+        self.assertEqual(stats.num_loops, len(data.loop_vert_indices))
+        # Neighboring cells get different colors
+        self.assertNotEqual(stats.face_colors[0], stats.face_colors[1])
+
+    def test_obj_seams_per_file_and_island(self):
+        """Every inner edge of the checker splits two cell islands."""
+        write_obj(self.folder / "checker.obj", mesh_gen.generate("CHECKER", 6, 4))
+
+        stats = analyze(self.folder / "checker.obj")
+
+        # 5 * 4 vertical and 6 * 3 horizontal inner edges
+        self.assertEqual(stats.num_seams, 38)
+        self.assertEqual(sum(stats.island_seams), 2 * 38)
+        self.assertEqual(sorted(set(stats.island_seams)), [2, 3, 4])
+        self.assertEqual(stats.summary()["seams"], 38)
+
+    def test_binary_ply_matches_obj(self):
+        data = mesh_gen.generate("GRID", 8, 8, seam_density=0.3, seed=3)
+        write_obj(self.folder / "grid.obj", data)
+        write_binary_ply(self.folder / "grid.ply", data)
+
+        obj_stats = analyze(self.folder / "grid.obj")
+        ply_stats = analyze(self.folder / "grid.ply")
+
+        self.assertEqual(obj_stats.num_islands, data.num_islands)
+        self.assertEqual(ply_stats.face_islands, obj_stats.face_islands)
+        self.assertEqual(ply_stats.island_seams, obj_stats.island_seams)
+        island = ply_stats.island(0)
+        self.assertGreater(island.area_3d, 0.0)
+        self.assertGreater(island.density, 0.0)
+
+    def test_invalid_files_are_rejected(self):
+        no_uvs = self.folder / "no_uvs.obj"
+        no_uvs.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+        with self.assertRaises(ValueError):
+            analyze(no_uvs)
+        with self.assertRaises(ValueError):
+            analyze(self.folder / "mesh.stl")
+        with self.assertRaises(OSError):
+            analyze(self.folder / "missing.ply")
+
+    def test_main_writes_stats_and_face_ids(self):
+        write_obj(self.folder / "fan.obj", mesh_gen.generate("FAN", 3, 4))
+        report = self.folder / "stats.json"
+
+        code = main(
+            [str(self.folder / "fan.obj"), "--json", str(report), "--face-ids", str(self.folder)]
+        )
+
+        self.assertEqual(code, 0)
+        self.assertIn('"island_stats"', report.read_text())
+        self.assertEqual((self.folder / "fan.obj.islands").stat().st_size, 12 * 4)
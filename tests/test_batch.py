@@ -0,0 +1,77 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import bpy
+from nextools.batch import Report, bake_file, find_blend_files, run_batch
+from nextools.logic.color_id import COLOR_LAYER_NAME
+from nextools.utils import mesh_gen
+
+
+class TestBatchColorID(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name)
+
+    def tearDown(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        self._tmp.cleanup()
+
+    def _save_blend(self, name, kinds=("CHECKER",)):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        for kind in kinds:
+            mesh_gen.create_mesh_object(mesh_gen.generate(kind, 4, 4))
+        path = self.folder / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=str(path))
+        return path
+
+    def test_bake_file_saves_color_ids(self):
+        path = self._save_blend("kit.blend", kinds=("CHECKER", "GRID"))
+
+        result = bake_file(str(path))
+
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(result["meshes"], 2)
+        self.assertEqual(result["faces"], 32)
+        bpy.ops.wm.open_mainfile(filepath=str(path))
+        for obj in bpy.data.objects:
+            self.assertIn(COLOR_LAYER_NAME, obj.data.color_attributes)
+
+        # Baked meshes are up to date on the next run
+        result = bake_file(str(path))
+        self.assertEqual((result["meshes"], result["skipped"]), (0, 2))
+
+    def test_bake_file_reports_failures(self):
+        path = self.folder / "broken.blend"
+        path.write_bytes(b"not a blend file")
+
+        result = bake_file(str(path))
+
+        self.assertEqual(result["status"], "failed")
+        self.assertIn("error", result)
+
+    def test_batch_report_and_resume(self):
+        self._save_blend("a.blend")
+        self._save_blend("sub/b.blend")
+        (self.folder / "broken.blend").write_bytes(b"not a blend file")
+        report_path = self.folder / "report.json"
+        files = find_blend_files(self.folder)
+        self.assertEqual(len(files), 3)
+
+        results = run_batch(files, Report(report_path), blender=bpy.app.binary_path, workers=2)
+
+        self.assertEqual(len(results), 3)
+        data = json.loads(report_path.read_text(encoding="utf-8"))
+        self.assertEqual(data["summary"]["ok"], 2)
+        self.assertEqual(data["summary"]["failed"], 1)
+
+        # Only the failed file is retried
+        results = run_batch(files, Report(report_path), blender=bpy.app.binary_path)
+        self.assertEqual([Path(r["file"]).name for r in results], ["broken.blend"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+import bpy
+from nextools.logic import color_id
+from nextools.logic.mesh_buffers import mesh_data
+from nextools.utils.cache import OperatorCache
+
+
+class TestOperatorCache(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        color_id._island_cache.clear()
+
+    def test_keyed_by_mesh_and_fingerprint(self):
+        cache = OperatorCache()
+        mesh_a = bpy.data.meshes.new("A")
+        mesh_b = bpy.data.meshes.new("B")
+
+        cache.set(mesh_a, "f1", 1)
+
+        self.assertEqual(cache.get(mesh_a, "f1"), 1)
+        self.assertIsNone(cache.get(mesh_a, "f2"))
+        self.assertIsNone(cache.get(mesh_b, "f1"))
+
+    def test_evicts_least_recently_used(self):
+        cache = OperatorCache(max_entries=2)
+        mesh = bpy.data.meshes.new("A")
+
+        cache.set(mesh, "f1", 1)
+        cache.set(mesh, "f2", 2)
+        cache.get(mesh, "f1")
+        cache.set(mesh, "f3", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(mesh, "f1"), 1)
+        self.assertIsNone(cache.get(mesh, "f2"))
+
+    def test_color_id_redo_reuses_islands(self):
+        """Re-running the bake on the same input in Edit Mode hits the island cache."""
+        bpy.ops.mesh.primitive_cube_add()
+        obj = bpy.context.active_object
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        color_id.apply_color_id_to_mesh(obj)
+        self.assertEqual(len(color_id._island_cache), 1)
+        colors = self._colors(obj)
+
+        compute = color_id.precompute.compute_island_result
+        with mock.patch.object(color_id.precompute, "compute_island_result", wraps=compute) as run:
+            color_id.apply_color_id_to_mesh(obj)
+        run.assert_not_called()
+        self.assertEqual(len(color_id._island_cache), 1)
+        self.assertEqual(colors, self._colors(obj))
+
+    def _colors(self, obj):
+        with mesh_data(obj) as data:
+            return [c for d in data.color_attributes["Color_ID"].data for c in d.color]
+
+
+if __name__ == "__main__":
+    unittest.main()
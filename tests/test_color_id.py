@@ -1,7 +1,13 @@
 import unittest
 import bpy
 import bmesh
-from nextools.logic.color_id import apply_color_id_to_mesh
+from nextools.logic.color_id import (
+    apply_color_id_to_layers,
+    apply_color_id_to_mesh,
+    apply_color_id_to_selection,
+    bake_color_id_image,
+)
+from nextools.logic.mesh_buffers import read_mesh_buffers, read_mesh_buffers_in_place
 
 
 class TestColorIDLogic(unittest.TestCase):
@@ -42,6 +48,145 @@ class TestColorIDLogic(unittest.TestCase):
         self.assertEqual(len(sample_color), 4)
         self.assertAlmostEqual(sample_color[3], 1.0)
 
+    def test_read_mesh_buffers(self):
+        """Buffers are int32 / float32 and sized by faces and loops."""
+        obj = self._setup_mesh("CUBE")
+        buffers = read_mesh_buffers(obj.data)
+
+        self.assertEqual(buffers.num_faces, 6)
+        self.assertEqual(buffers.num_loops, 24)
+        self.assertEqual(buffers.loop_vert_indices.typecode, "i")
+        self.assertEqual(buffers.uv_coords.typecode, "f")
+        self.assertEqual(len(buffers.uv_coords), 48)
+        self.assertEqual(list(buffers.poly_loop_totals), [4] * 6)
+
+    def test_read_mesh_buffers_in_place(self):
+        """In-place views hold the same data as the copied buffers and are read-only."""
+        obj = self._setup_mesh("CUBE")
+        copied = read_mesh_buffers(obj.data)
+        views = read_mesh_buffers_in_place(obj.data)
+
+        self.assertIsNotNone(views)
+        self.assertTrue(views.loop_vert_indices.readonly)
+        for copy, view in zip(copied, views):
+            self.assertEqual(list(copy), list(view))
+
+    def test_apply_color_id_in_edit_mode(self):
+        """Baking in Edit Mode stays in Edit Mode and writes the corner layer."""
+        obj = self._setup_mesh("CUBE")
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        count = apply_color_id_to_mesh(obj)
+
+        self.assertEqual(count, 6)
+        self.assertEqual(obj.mode, "EDIT")
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        layer = bm.loops.layers.color.get("Color_ID")
+        self.assertIsNotNone(layer)
+        face = next(iter(bm.faces))
+        self.assertAlmostEqual(face.loops[0][layer][3], 1.0)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        color_layer = obj.data.color_attributes["Color_ID"]
+        self.assertEqual(color_layer.domain, "CORNER")
+        self.assertEqual(len(color_layer.data), len(obj.data.loops))
+
+    def test_skip_unchanged_mesh(self):
+        """A second bake of an unchanged mesh is skipped unless forced."""
+        obj = self._setup_mesh("CUBE")
+        mesh = obj.data
+
+        self.assertEqual(apply_color_id_to_mesh(obj, force=False), 6)
+        self.assertIn("nt_color_id_fingerprint", mesh)
+        self.assertEqual(apply_color_id_to_mesh(obj, force=False), 0)
+        self.assertEqual(apply_color_id_to_mesh(obj, force=True), 6)
+
+        mesh.uv_layers.active.data[0].uv = (0.5, 0.25)
+        self.assertEqual(apply_color_id_to_mesh(obj, force=False), 6)
+
+        mesh.color_attributes.remove(mesh.color_attributes["Color_ID"])
+        self.assertEqual(apply_color_id_to_mesh(obj, force=False), 6)
+
+    def test_apply_color_id_to_selection(self):
+        """Only the loops of selected faces are rewritten."""
+        obj = self._setup_mesh("CUBE")
+        mesh = obj.data
+        apply_color_id_to_mesh(obj)
+
+        color_layer = mesh.color_attributes["Color_ID"]
+        color_layer.data.foreach_set("color", [0.0, 0.0, 0.0, 1.0] * len(mesh.loops))
+        for poly in mesh.polygons:
+            poly.select = poly.index == 2
+
+        self.assertEqual(apply_color_id_to_selection(obj), 1)
+
+        color_layer = mesh.color_attributes["Color_ID"]
+        for poly in mesh.polygons:
+            for loop_idx in poly.loop_indices:
+                rgb = tuple(color_layer.data[loop_idx].color)[:3]
+                if poly.select:
+                    self.assertNotEqual(rgb, (0.0, 0.0, 0.0))
+                else:
+                    self.assertEqual(rgb, (0.0, 0.0, 0.0))
+
+    def test_apply_color_id_to_selection_without_selection(self):
+        obj = self._setup_mesh("CUBE")
+        for poly in obj.data.polygons:
+            poly.select = False
+
+        with self.assertRaises(ValueError):
+            apply_color_id_to_selection(obj)
+
+    def test_apply_color_id_to_layers(self):
+        """One Color_ID_<uvname> attribute is written per UV layer."""
+        obj = self._setup_mesh("CUBE")
+        mesh = obj.data
+        mesh.uv_layers.new(name="Lightmap")
+
+        count = apply_color_id_to_layers(obj)
+
+        self.assertEqual(count, 6)
+        for uv_layer in mesh.uv_layers:
+            color_layer = mesh.color_attributes[f"Color_ID_{uv_layer.name}"]
+            self.assertEqual(color_layer.domain, "CORNER")
+            self.assertAlmostEqual(color_layer.data[0].color[3], 1.0)
+
+    def test_apply_color_id_to_layers_unknown_layer(self):
+        obj = self._setup_mesh("CUBE")
+
+        with self.assertRaises(ValueError):
+            apply_color_id_to_layers(obj, ["Missing"])
+
+    def test_bake_color_id_image(self):
+        """The image is covered inside the UV layout and reused on rebake."""
+        obj = self._setup_mesh("PLANE")
+
+        image = bake_color_id_image(obj, image_name="TestID", size=16, padding=0)
+
+        self.assertEqual(tuple(image.size), (16, 16))
+        alphas = list(image.pixels)[3::4]
+        self.assertTrue(all(a == 1.0 for a in alphas))
+
+        again = bake_color_id_image(obj, image_name="TestID", size=32, padding=0)
+        self.assertEqual(again.name, image.name)
+        self.assertEqual(tuple(again.size), (32, 32))
+
+    def test_bake_color_id_image_matches_attribute(self):
+        """The image holds the same linear colors as the Color_ID attribute."""
+        obj = self._setup_mesh("PLANE")
+        apply_color_id_to_mesh(obj)
+        bpy.data.images.new("TestID", 8, 8, alpha=True)
+
+        image = bake_color_id_image(obj, image_name="TestID", size=16, padding=0)
+
+        self.assertTrue(image.is_float)
+        self.assertEqual(image.name, "TestID")
+        center = (8 * 16 + 8) * 4
+        expected = obj.data.color_attributes["Color_ID"].data[0].color
+        for pixel, channel in zip(image.pixels[center : center + 3], expected, strict=False):
+            self.assertAlmostEqual(pixel, channel, places=2)
+
     def test_error_non_mesh_object(self):
         """Ensure ValueError is raised for non-mesh objects."""
         bpy.ops.object.camera_add()
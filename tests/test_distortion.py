@@ -0,0 +1,64 @@
+import unittest
+import bpy
+from nextools.logic.distortion import (
+    STRETCH_LAYER_NAME,
+    bake_uv_distortion,
+    compute_uv_distortion,
+)
+
+
+class TestUVDistortion(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        bpy.ops.mesh.primitive_plane_add(size=2, enter_editmode=False)
+        self.obj = bpy.context.active_object
+
+    def _set_uvs(self, uvs):
+        self.obj.data.uv_layers.active.data.foreach_set("uv", uvs)
+
+    def test_unwrapped_plane_is_undistorted(self):
+        result = compute_uv_distortion(self.obj)
+
+        self.assertEqual(len(result.islands), 1)
+        self.assertAlmostEqual(result.face_area[0], 0.0, places=5)
+        self.assertAlmostEqual(result.face_angle[0], 0.0, places=5)
+        self.assertAlmostEqual(result.islands[0].area_3d, 4.0, places=4)
+        self.assertAlmostEqual(result.islands[0].area_uv, 1.0, places=4)
+
+    def test_squashed_uvs_are_angle_distortion(self):
+        self._set_uvs([0.0, 0.0, 1.0, 0.0, 1.0, 0.5, 0.0, 0.5])
+
+        result = compute_uv_distortion(self.obj)
+
+        self.assertAlmostEqual(result.face_angle[0], 0.5, places=4)
+        self.assertAlmostEqual(result.mean("ANGLE"), 0.5, places=4)
+        self.assertEqual(result.worst_island("ANGLE").island, 0)
+
+    def test_bake_heatmap(self):
+        bake_uv_distortion(self.obj, mode="ANGLE")
+
+        color_layer = self.obj.data.color_attributes[STRETCH_LAYER_NAME]
+        self.assertEqual(color_layer.domain, "CORNER")
+        # Undistorted faces are blue
+        r, _, b, _ = color_layer.data[0].color
+        self.assertLess(r, 0.1)
+        self.assertGreater(b, 0.9)
+
+    def test_bake_heatmap_in_edit_mode(self):
+        self._set_uvs([0.0, 0.0, 1.0, 0.0, 1.0, 0.5, 0.0, 0.5])
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        result = bake_uv_distortion(self.obj, mode="ANGLE")
+
+        self.assertEqual(self.obj.mode, "EDIT")
+        self.assertAlmostEqual(result.face_angle[0], 0.5, places=4)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertIn(STRETCH_LAYER_NAME, self.obj.data.color_attributes)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            bake_uv_distortion(self.obj, mode="VOLUME")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import bpy
+from nextools.logic.color_id import apply_color_id_to_mesh
+from nextools.utils import mesh_gen
+
+
+class TestMeshGen(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def test_generate_is_deterministic(self):
+        """Same kind, resolution and seed must produce identical buffers."""
+        a = mesh_gen.generate("GRID", 16, 16, seam_density=0.3, seed=5)
+        b = mesh_gen.generate("GRID", 16, 16, seam_density=0.3, seed=5)
+
+        self.assertEqual(a, b)
+        self.assertEqual(a.num_faces, 256)
+
+    def test_checker_islands(self):
+        """Every checker cell is its own island."""
+        data = mesh_gen.generate("CHECKER", 6, 4)
+
+        self.assertEqual(data.num_islands, 24)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            mesh_gen.generate("SPHERE", 4, 4)
+
+    def test_create_mesh_object(self):
+        """Synthetic buffers become a valid Blender mesh with an active UV layer."""
+        data = mesh_gen.generate("TORUS", 24, 8, seam_density=0.2, seed=1)
+        obj = mesh_gen.create_mesh_object(data)
+        mesh = obj.data
+
+        self.assertEqual(bpy.context.active_object, obj)
+        self.assertEqual(len(mesh.polygons), data.num_faces)
+        self.assertEqual(len(mesh.loops), len(data.loop_vert_indices))
+        self.assertIsNotNone(mesh.uv_layers.active)
+        self.assertAlmostEqual(mesh.uv_layers.active.data[0].uv[0], data.uv_coords[0])
+
+        self.assertEqual(apply_color_id_to_mesh(obj), data.num_faces)
+
+    def test_generate_for_face_count(self):
+        for kind in mesh_gen.MESH_KINDS:
+            data = mesh_gen.generate_for_face_count(kind, 1_000, seam_density=0.1)
+            self.assertGreaterEqual(data.num_faces, 900, kind)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import bpy
+from nextools.logic.overlap import (
+    OVERLAP_LAYER_NAME,
+    bake_uv_overlaps,
+    find_uv_overlaps,
+    select_uv_overlaps,
+)
+from nextools.utils import mesh_gen
+
+
+class TestUVOverlaps(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _stacked_checker(self):
+        """Checker of 4x3 separate cells with cell 1 moved onto cell 0."""
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 4, 3))
+        mesh = obj.data
+        uv_data = mesh.uv_layers.active.data
+        face_0, face_1 = mesh.polygons[0], mesh.polygons[1]
+        for src, dst in zip(face_0.loop_indices, face_1.loop_indices):
+            uv_data[dst].uv = uv_data[src].uv
+        return obj
+
+    def test_no_overlaps(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 4, 3))
+
+        result = find_uv_overlaps(obj)
+
+        self.assertEqual(result.num_groups, 0)
+        self.assertEqual(result.num_faces, 0)
+        self.assertTrue(all(group == -1 for group in result.island_groups))
+
+    def test_stacked_islands_form_one_group(self):
+        obj = self._stacked_checker()
+
+        result = find_uv_overlaps(obj)
+
+        self.assertEqual(result.num_groups, 1)
+        self.assertEqual(list(result.face_groups[:2]), [0, 0])
+        self.assertTrue(all(group == -1 for group in result.face_groups[2:]))
+
+    def test_select_overlaps(self):
+        obj = self._stacked_checker()
+
+        select_uv_overlaps(obj)
+
+        selected = [poly.select for poly in obj.data.polygons]
+        self.assertEqual(selected, [True, True] + [False] * (len(selected) - 2))
+
+    def test_select_overlaps_in_edit_mode(self):
+        obj = self._stacked_checker()
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        select_uv_overlaps(obj)
+
+        self.assertEqual(obj.mode, "EDIT")
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(sum(poly.select for poly in obj.data.polygons), 2)
+
+    def test_bake_overlaps(self):
+        obj = self._stacked_checker()
+
+        bake_uv_overlaps(obj)
+
+        color_layer = obj.data.color_attributes[OVERLAP_LAYER_NAME]
+        self.assertEqual(color_layer.domain, "CORNER")
+        loop_0 = obj.data.polygons[0].loop_start
+        loop_1 = obj.data.polygons[1].loop_start
+        loop_2 = obj.data.polygons[2].loop_start
+        self.assertEqual(
+            tuple(color_layer.data[loop_0].color), tuple(color_layer.data[loop_1].color)
+        )
+        self.assertNotEqual(
+            tuple(color_layer.data[loop_0].color), tuple(color_layer.data[loop_2].color)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
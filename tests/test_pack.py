@@ -0,0 +1,56 @@
+import unittest
+import bpy
+from nextools.logic.overlap import find_uv_overlaps
+from nextools.logic.pack import pack_uv_islands
+from nextools.utils import mesh_gen
+
+
+class TestUVPack(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _uv_bounds(self, obj):
+        uvs = [loop.uv for loop in obj.data.uv_layers.active.data]
+        return (
+            min(uv.x for uv in uvs),
+            min(uv.y for uv in uvs),
+            max(uv.x for uv in uvs),
+            max(uv.y for uv in uvs),
+        )
+
+    def test_pack_fits_unit_square_without_overlaps(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("SCATTER", 50, 2, seed=3))
+
+        result = pack_uv_islands(obj, margin=0.01)
+
+        self.assertEqual(result.num_islands, 50)
+        self.assertGreater(result.fill, 0.3)
+        min_u, min_v, max_u, max_v = self._uv_bounds(obj)
+        self.assertGreaterEqual(min(min_u, min_v), -1e-5)
+        self.assertLessEqual(max(max_u, max_v), 1.0 + 1e-5)
+        self.assertEqual(find_uv_overlaps(obj).num_groups, 0)
+
+    def test_pack_in_edit_mode(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 4, 3))
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        pack_uv_islands(obj, rotate=False)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(find_uv_overlaps(obj).num_groups, 0)
+        self.assertLessEqual(max(self._uv_bounds(obj)), 1.0 + 1e-5)
+
+    def test_invalid_fill_raises(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 2, 2))
+
+        with self.assertRaises(ValueError):
+            pack_uv_islands(obj, target_fill=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest import mock
+import bpy
+import bmesh
+from nextools.logic import precompute
+from nextools.logic.color_id import apply_color_id_to_mesh
+from nextools.logic.mesh_buffers import fingerprint_buffers, mesh_data, read_mesh_buffers
+from nextools.utils import mesh_gen
+
+
+class TestPrecompute(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        precompute.clear()
+
+    def tearDown(self):
+        precompute.clear()
+
+    def _checker(self):
+        return mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 4, 3))
+
+    def _fingerprint(self, mesh):
+        return fingerprint_buffers(read_mesh_buffers(mesh))
+
+    def test_compute_island_result(self):
+        """Every checker cell is an island with a compact index."""
+        obj = self._checker()
+        buffers = read_mesh_buffers(obj.data)
+        result = precompute.compute_island_result(buffers, fingerprint_buffers(buffers))
+
+        self.assertEqual(result.num_islands, 12)
+        self.assertEqual(sorted(result.face_islands), list(range(12)))
+        self.assertEqual(len(result.face_colors), 12)
+
+    def test_submit_and_reuse(self):
+        """A finished background result is reused only for the same fingerprint."""
+        obj = self._checker()
+        mesh = obj.data
+
+        thread = precompute.submit(obj)
+        self.assertIsNotNone(thread)
+        thread.join()
+
+        # Same buffers again: nothing new to compute
+        self.assertIsNone(precompute.submit(obj))
+
+        result = precompute.get_island_result(mesh, self._fingerprint(mesh))
+        self.assertIsNotNone(result)
+        self.assertEqual(result.num_islands, 12)
+        self.assertEqual(apply_color_id_to_mesh(obj), 12)
+
+        mesh.uv_layers.active.data[0].uv = (5.0, 5.0)
+        self.assertIsNone(precompute.get_island_result(mesh, self._fingerprint(mesh)))
+
+    def test_submit_in_edit_mode(self):
+        """Edit Mode is snapshotted without leaving it, including unflushed UV edits."""
+        obj = self._checker()
+        mesh = obj.data
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+        bm = bmesh.from_edit_mesh(mesh)
+        bm.faces.ensure_lookup_table()
+        uv_layer = bm.loops.layers.uv.active
+        bm.faces[0].loops[0][uv_layer].uv = (5.0, 5.0)
+        bmesh.update_edit_mesh(mesh)
+
+        precompute.submit(obj).join()
+
+        self.assertEqual(obj.mode, "EDIT")
+        with mesh_data(obj) as data:
+            fingerprint = self._fingerprint(data)
+        result = precompute.get_island_result(mesh, fingerprint)
+        self.assertIsNotNone(result)
+        self.assertIsNone(precompute.get_error(mesh))
+
+    def test_failure_is_reported(self):
+        """A failed computation is kept for the panel until one succeeds."""
+        obj = self._checker()
+        mesh = obj.data
+        with mock.patch.object(
+            precompute, "compute_island_result", side_effect=ValueError("Invalid topology")
+        ):
+            precompute.submit(obj).join()
+
+        self.assertIn("Invalid topology", precompute.get_error(mesh))
+        self.assertIsNone(precompute.get_island_result(mesh, self._fingerprint(mesh)))
+
+        mesh.uv_layers.active.data[0].uv = (5.0, 5.0)
+        precompute.submit(obj).join()
+
+        self.assertIsNone(precompute.get_error(mesh))
+
+    def test_clear_drops_results(self):
+        obj = self._checker()
+        precompute.submit(obj).join()
+
+        precompute.clear()
+
+        self.assertIsNone(precompute.get_island_result(obj.data, self._fingerprint(obj.data)))
+
+    def test_deleted_meshes_are_evicted(self):
+        """Submitting drops the results of meshes that no longer exist."""
+        first = self._checker()
+        key = first.data.session_uid
+        precompute.submit(first).join()
+
+        bpy.data.meshes.remove(first.data)
+        precompute.submit(self._checker()).join()
+
+        self.assertNotIn(key, precompute._results)
+        self.assertNotIn(key, precompute._generations)
+
+
+if __name__ == "__main__":
+    unittest.main()
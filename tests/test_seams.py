@@ -0,0 +1,84 @@
+import unittest
+import bpy
+from nextools.logic.seams import find_seams, mark_seams_from_islands
+from nextools.utils import mesh_gen
+
+
+class TestSeamsFromIslands(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _seams(self, obj):
+        return [edge.use_seam for edge in obj.data.edges]
+
+    def test_inner_island_borders_become_seams(self):
+        # 2 x 2 cells, one island each: the 4 inner edges are seams, the outline is not
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 2, 2))
+
+        result = mark_seams_from_islands(obj)
+
+        self.assertEqual(result.num_seams, 4)
+        self.assertEqual(sum(self._seams(obj)), 4)
+        # Every inner edge touches the center vertex
+        for edge in obj.data.edges:
+            if edge.use_seam:
+                self.assertTrue(any(obj.data.vertices[v].co.length < 1e-6 for v in edge.vertices))
+
+    def test_continuous_uvs_clear_seams(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4))
+        obj.data.edges[0].use_seam = True
+
+        mark_seams_from_islands(obj)
+
+        self.assertFalse(any(self._seams(obj)))
+
+    def test_keep_existing_seams(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4))
+        obj.data.edges[0].use_seam = True
+
+        mark_seams_from_islands(obj, clear_existing=False)
+
+        self.assertEqual(sum(self._seams(obj)), 1)
+
+    def test_keep_existing_seams_in_edit_mode(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 2, 2))
+        obj.data.edges[0].use_seam = True
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        result = mark_seams_from_islands(obj, clear_existing=False)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(result.num_seams, 4)
+        self.assertTrue(obj.data.edges[0].use_seam)
+        self.assertEqual(sum(self._seams(obj)), sum(result.edge_seams))
+
+    def test_boundaries_are_closed_per_island(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 3, 2))
+
+        result = find_seams(obj, with_boundaries=True)
+
+        self.assertEqual(len(result.boundaries), 6)
+        self.assertEqual({boundary.island for boundary in result.boundaries}, set(range(6)))
+        for boundary in result.boundaries:
+            self.assertTrue(boundary.closed)
+            self.assertEqual(len(boundary.loops), 4)
+        self.assertIsNone(find_seams(obj).boundaries)
+
+    def test_mark_in_edit_mode(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 2, 2))
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        mark_seams_from_islands(obj)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(sum(self._seams(obj)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import bpy
+from nextools.logic.stack import find_duplicate_islands, stack_duplicate_islands
+from nextools.utils import mesh_gen
+
+
+class TestUVStack(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _face_bounds(self, obj):
+        """Rounded UV bounds of every face."""
+        uv_data = obj.data.uv_layers.active.data
+        bounds = []
+        for poly in obj.data.polygons:
+            uvs = [uv_data[i].uv for i in poly.loop_indices]
+            bounds.append(
+                tuple(
+                    round(value, 4)
+                    for value in (
+                        min(uv.x for uv in uvs),
+                        min(uv.y for uv in uvs),
+                        max(uv.x for uv in uvs),
+                        max(uv.y for uv in uvs),
+                    )
+                )
+            )
+        return bounds
+
+    def test_identical_islands_form_one_group(self):
+        # Scatter islands share their 3D shape but have different UV sizes
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("SCATTER", 6, 2, seed=5))
+
+        result = find_duplicate_islands(obj)
+
+        self.assertEqual(result.num_groups, 1)
+        self.assertEqual(result.num_islands, 6)
+        self.assertEqual(set(result.island_groups), {0})
+
+    def test_stack_moves_islands_onto_each_other(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 3, 1))
+
+        result = stack_duplicate_islands(obj)
+
+        self.assertEqual(result.num_groups, 1)
+        self.assertEqual(len(set(self._face_bounds(obj))), 1)
+
+    def test_stack_in_edit_mode(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("SCATTER", 4, 1, seed=2))
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        stack_duplicate_islands(obj)
+
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(len(set(self._face_bounds(obj))), 1)
+
+    def test_distinct_islands_are_not_grouped(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4, seam_density=0.0))
+
+        result = stack_duplicate_islands(obj)
+
+        self.assertEqual(result.num_groups, 0)
+        self.assertEqual(set(result.island_groups), {-1})
+
+    def test_negative_tolerance_raises(self):
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 2, 2))
+
+        with self.assertRaises(ValueError):
+            find_duplicate_islands(obj, tolerance=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import bpy
+from nextools.logic.texel_density import (
+    density_stats,
+    island_texel_densities,
+    normalize_texel_density,
+)
+from nextools.utils import mesh_gen
+
+
+class TestTexelDensity(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def _plane(self, size, location=(0.0, 0.0, 0.0)):
+        bpy.ops.mesh.primitive_plane_add(size=size, location=location)
+        return bpy.context.active_object
+
+    def test_plane_density(self):
+        """A 2x2 plane unwrapped to the full UV square has 0.5 UV units per unit."""
+        obj = self._plane(2.0)
+
+        islands = island_texel_densities(obj, texture_size=1024)
+
+        self.assertEqual(len(islands), 1)
+        self.assertAlmostEqual(islands[0].density, 512.0, places=2)
+        self.assertAlmostEqual(islands[0].area_3d, 4.0, places=4)
+
+    def test_object_scale_is_applied(self):
+        obj = self._plane(2.0)
+        obj.scale = (2.0, 2.0, 2.0)
+        bpy.context.view_layer.update()
+
+        islands = island_texel_densities(obj, texture_size=1024)
+
+        self.assertAlmostEqual(islands[0].density, 256.0, places=2)
+
+    def test_normalize_to_mean(self):
+        """Islands of different density end up at one density with a spread of 1."""
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 3, 2))
+        uv_data = obj.data.uv_layers.active.data
+        # Shrink the first cell's UVs to a quarter of its size about its first corner
+        first = obj.data.polygons[0]
+        origin = uv_data[first.loop_start].uv.copy()
+        for loop_idx in first.loop_indices:
+            uv_data[loop_idx].uv = origin + (uv_data[loop_idx].uv - origin) * 0.25
+
+        result = normalize_texel_density([obj])
+
+        self.assertGreater(result.before.spread, 3.0)
+        self.assertAlmostEqual(result.after.spread, 1.0, places=3)
+        for island in island_texel_densities(obj):
+            self.assertAlmostEqual(island.density, result.target, delta=result.target * 1e-3)
+
+    def test_normalize_across_objects(self):
+        small = self._plane(1.0)
+        large = self._plane(4.0, location=(5.0, 0.0, 0.0))
+
+        result = normalize_texel_density([small, large], target=256.0)
+
+        self.assertEqual(result.num_islands, 2)
+        for obj in (small, large):
+            self.assertAlmostEqual(island_texel_densities(obj)[0].density, 256.0, places=1)
+
+    def test_normalize_selected_only(self):
+        """Only islands with a selected face are scaled."""
+        obj = mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 3, 2))
+        for poly in obj.data.polygons:
+            poly.select = poly.index == 0
+        before = [island.density for island in island_texel_densities(obj)]
+
+        result = normalize_texel_density([obj], target=2048.0, selected_only=True)
+
+        self.assertEqual(result.num_islands, 1)
+        after = [island.density for island in island_texel_densities(obj)]
+        changed = [
+            i for i, (a, b) in enumerate(zip(before, after, strict=True)) if abs(a - b) > 1e-3
+        ]
+        self.assertEqual(len(changed), 1)
+        self.assertAlmostEqual(after[changed[0]], 2048.0, places=1)
+
+    def test_normalize_objects_in_edit_mode(self):
+        """Objects in multi-object Edit Mode are normalized without leaving it."""
+        small = self._plane(1.0)
+        large = self._plane(4.0, location=(5.0, 0.0, 0.0))
+        small.select_set(True)
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        result = normalize_texel_density([small, large], target=256.0, selected_only=True)
+
+        self.assertEqual(result.num_islands, 2)
+        for obj in (small, large):
+            self.assertEqual(obj.mode, "EDIT")
+            self.assertAlmostEqual(island_texel_densities(obj)[0].density, 256.0, places=1)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertAlmostEqual(island_texel_densities(small)[0].density, 256.0, places=1)
+
+    def test_density_stats_empty(self):
+        self.assertEqual(density_stats([]), (0.0, 0.0, 0.0))
+
+    def test_invalid_target(self):
+        obj = self._plane(2.0)
+
+        with self.assertRaises(ValueError):
+            normalize_texel_density([obj], target=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+import bpy
+import bmesh
+from nextools.logic import uv_stats
+from nextools.utils import mesh_gen
+
+
+class TestUVStats(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        uv_stats.clear()
+
+    def tearDown(self):
+        uv_stats.clear()
+
+    def _checker(self):
+        return mesh_gen.create_mesh_object(mesh_gen.generate("CHECKER", 4, 3))
+
+    def test_submit_and_reuse(self):
+        """Every checker cell is an island; unchanged buffers are not recomputed."""
+        obj = self._checker()
+        mesh = obj.data
+        self.assertTrue(uv_stats.is_outdated(mesh))
+
+        thread = uv_stats.submit(obj)
+        self.assertIsNotNone(thread)
+        thread.join()
+
+        stats = uv_stats.get_stats(mesh)
+        self.assertEqual((stats.num_faces, stats.num_islands), (12, 12))
+        self.assertGreater(stats.num_seams, 0)
+        self.assertGreater(stats.num_colors, 1)
+        self.assertGreater(stats.coverage, 0.0)
+        self.assertFalse(uv_stats.is_outdated(mesh))
+
+        # Same buffers again: nothing new to compute
+        self.assertIsNone(uv_stats.submit(obj))
+
+    def test_cheap_key_tracks_uv_layer(self):
+        """A new active UV layer marks the stats outdated; equal buffers are not recomputed."""
+        obj = self._checker()
+        mesh = obj.data
+        uv_stats.submit(obj).join()
+
+        mesh.uv_layers.active = mesh.uv_layers.new(name="Copy")
+        self.assertTrue(uv_stats.is_outdated(mesh))
+
+        self.assertIsNone(uv_stats.submit(obj))
+        self.assertFalse(uv_stats.is_outdated(mesh))
+
+    def test_edit_in_edit_mode(self):
+        """A UV edit made in Edit Mode is picked up without leaving it."""
+        obj = self._checker()
+        mesh = obj.data
+        uv_stats.submit(obj).join()
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        # Collapsing all UVs onto one point joins the cells into a single island
+        bm = bmesh.from_edit_mesh(mesh)
+        uv_layer = bm.loops.layers.uv.active
+        for face in bm.faces:
+            for loop in face.loops:
+                loop[uv_layer].uv = (0.5, 0.5)
+        bmesh.update_edit_mesh(mesh)
+        uv_stats.on_mesh_edit({mesh.session_uid})
+        self.assertTrue(uv_stats.is_outdated(mesh))
+
+        uv_stats.submit(obj).join()
+
+        self.assertEqual(obj.mode, "EDIT")
+        self.assertEqual(uv_stats.get_stats(mesh).num_islands, 1)
+        self.assertFalse(uv_stats.is_outdated(mesh))
+        bpy.ops.object.mode_set(mode="OBJECT")
+
+    def test_failure_is_reported(self):
+        """A failed computation is kept for the panel until one succeeds."""
+        obj = self._checker()
+        mesh = obj.data
+        with mock.patch.object(uv_stats, "compute_uv_stats", side_effect=ValueError("Bad mesh")):
+            uv_stats.submit(obj).join()
+
+        self.assertIn("Bad mesh", uv_stats.get_error(mesh))
+        self.assertIsNone(uv_stats.get_stats(mesh))
+
+        uv_stats.submit(obj).join()
+
+        self.assertIsNone(uv_stats.get_error(mesh))
+        self.assertEqual(uv_stats.get_stats(mesh).num_islands, 12)
+
+    def test_clear_drops_results(self):
+        obj = self._checker()
+        uv_stats.submit(obj).join()
+
+        uv_stats.clear()
+
+        self.assertIsNone(uv_stats.get_stats(obj.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+import bpy
+from nextools.logic.uv.relax import relax_uvs
+from nextools.utils import mesh_gen
+
+CENTER = 12  # vertex (2, 2) of a 4x4 grid
+
+
+class TestRelaxLogic(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _dragged_grid(self):
+        """4x4 grid in one island, all faces selected, with the center UV dragged off."""
+        self.obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4))
+        self.mesh = self.obj.data
+        for poly in self.mesh.polygons:
+            poly.select = True
+        self._set_center_uv((0.7, 0.65))
+
+    def _center_loops(self):
+        return [loop.index for loop in self.mesh.loops if loop.vertex_index == CENTER]
+
+    def _set_center_uv(self, uv):
+        uv_data = self.mesh.uv_layers.active.data
+        for l_idx in self._center_loops():
+            uv_data[l_idx].uv = uv
+
+    def _center_uv(self):
+        return tuple(self.mesh.uv_layers.active.data[self._center_loops()[0]].uv)
+
+    def test_relax_restores_grid(self):
+        for method in ("LAPLACIAN", "ARAP"):
+            with self.subTest(method=method):
+                self._dragged_grid()
+
+                moved = relax_uvs(self.obj, method=method, iterations=200, strength=1.0)
+
+                self.assertEqual(moved, 9)
+                u, v = self._center_uv()
+                self.assertAlmostEqual(u, 0.5, places=3)
+                self.assertAlmostEqual(v, 0.5, places=3)
+
+    def test_relax_in_edit_mode(self):
+        self._dragged_grid()
+        bpy.context.view_layer.objects.active = self.obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        relax_uvs(self.obj, iterations=200, strength=1.0)
+
+        self.assertEqual(self.obj.mode, "EDIT")
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertAlmostEqual(self._center_uv()[0], 0.5, places=3)
+
+    def test_pinned_uvs_stay_in_edit_mode(self):
+        """Pins are read in Edit Mode, where RNA exposes no UV arrays of obj.data."""
+        self._dragged_grid()
+        pins = self.mesh.uv_layers.active.pin
+        for l_idx in self._center_loops():
+            pins[l_idx].value = True
+        bpy.context.view_layer.objects.active = self.obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        moved = relax_uvs(self.obj)
+
+        self.assertEqual(moved, 8)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        u, v = self._center_uv()
+        self.assertAlmostEqual(u, 0.7, places=5)
+        self.assertAlmostEqual(v, 0.65, places=5)
+
+    def test_pinned_uvs_stay(self):
+        self._dragged_grid()
+        pins = self.mesh.uv_layers.active.pin
+        for l_idx in self._center_loops():
+            pins[l_idx].value = True
+
+        moved = relax_uvs(self.obj)
+
+        self.assertEqual(moved, 8)
+        u, v = self._center_uv()
+        self.assertAlmostEqual(u, 0.7, places=5)
+        self.assertAlmostEqual(v, 0.65, places=5)
+
+    def test_no_selection_raises(self):
+        self._dragged_grid()
+        for poly in self.mesh.polygons:
+            poly.select = False
+
+        with self.assertRaises(ValueError):
+            relax_uvs(self.obj)
+
+
+if __name__ == "__main__":
+    unittest.main()
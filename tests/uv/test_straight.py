@@ -1,7 +1,10 @@
 import unittest
+from unittest import mock
 
 import bmesh
 import bpy
+from mathutils import Vector
+from nextools.logic.uv import straight
 from nextools.logic.uv.straight import align_uv_straight
 
 
@@ -16,9 +19,11 @@ class TestStraightLogic(unittest.TestCase):
         if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
 
-    def _setup_mesh(self):
-        # 2x2 grid
-        bpy.ops.mesh.primitive_grid_add(x_subdivisions=2, y_subdivisions=2, size=2)
+    def _setup_mesh(self, subdivisions=2):
+        # 2x2 grid by default
+        bpy.ops.mesh.primitive_grid_add(
+            x_subdivisions=subdivisions, y_subdivisions=subdivisions, size=2
+        )
         self.obj = bpy.context.active_object
         bpy.ops.object.mode_set(mode="EDIT")
 
@@ -29,6 +34,23 @@ class TestStraightLogic(unittest.TestCase):
         self.bm.edges.ensure_lookup_table()
         self.uv_layer = self.bm.loops.layers.uv.verify()
 
+    def _select_edges(self, edges):
+        for e in edges:
+            for v in e.verts:
+                for loop in v.link_loops:
+                    loop.uv_select_vert = True
+            for loop in e.link_loops:
+                loop.uv_select_edge = True
+        bmesh.update_edit_mesh(self.me)
+
+    def _selected_uvs(self):
+        return [
+            loop[self.uv_layer].uv.copy()
+            for face in self.bm.faces
+            for loop in face.loops
+            if loop.uv_select_vert
+        ]
+
     def test_straight_horizontal_edges(self):
         """
         Select nearly horizontal edges and run Straight, then verify they become perfectly horizontal (V coordinates match).
@@ -109,6 +131,107 @@ class TestStraightLogic(unittest.TestCase):
         for x in x_coords:
             self.assertAlmostEqual(x, x_coords[0], places=5)
 
+    def test_branches_meet(self):
+        """A T of edges: the bar stays one horizontal line and the stem meets it vertically."""
+        self._setup_mesh()
+        bm = self.bm
+        uv_layer = self.uv_layer
+
+        # Bar 3-4-5 and stem 4-1
+        bar = {bm.verts[3], bm.verts[4], bm.verts[5]}
+        stem = {bm.verts[4], bm.verts[1]}
+        for v in stem:
+            for loop in v.link_loops:
+                loop[uv_layer].uv += Vector((0.03, 0.05))
+        self._select_edges(e for e in bm.edges if set(e.verts) <= bar or set(e.verts) == stem)
+
+        self.assertTrue(align_uv_straight(bm, uv_layer.name))
+
+        def uv_of(v):
+            return v.link_loops[0][uv_layer].uv
+
+        for v in bar:
+            self.assertAlmostEqual(uv_of(v).y, uv_of(bm.verts[4]).y, places=5)
+        self.assertAlmostEqual(uv_of(bm.verts[1]).x, uv_of(bm.verts[4]).x, places=5)
+
+    def test_grid_of_edge_rings(self):
+        """All edges of a 3x3 grid: every row and column is straightened in one solve."""
+        self._setup_mesh(subdivisions=3)
+        bm = self.bm
+        uv_layer = self.uv_layer
+
+        for v in bm.verts:
+            offset = Vector(((v.index % 3) * 0.02 - 0.02, (v.index % 2) * 0.03 - 0.015))
+            for loop in v.link_loops:
+                loop[uv_layer].uv += offset
+        self._select_edges(bm.edges)
+
+        self.assertTrue(align_uv_straight(bm, uv_layer.name))
+
+        uvs = self._selected_uvs()
+        self.assertEqual(len({round(uv.x, 5) for uv in uvs}), 4)
+        self.assertEqual(len({round(uv.y, 5) for uv in uvs}), 4)
+
+    def test_grid_with_object_cache(self):
+        """With the object given, the chains are cached and the result is the same."""
+        straight._chain_cache.clear()
+        self._setup_mesh(subdivisions=3)
+        bm = self.bm
+        uv_layer = self.uv_layer
+
+        for v in bm.verts:
+            offset = Vector(((v.index % 3) * 0.02 - 0.02, (v.index % 2) * 0.03 - 0.015))
+            for loop in v.link_loops:
+                loop[uv_layer].uv += offset
+        self._select_edges(bm.edges)
+        loops = [loop for face in bm.faces for loop in face.loops]
+        before = [loop[uv_layer].uv.copy() for loop in loops]
+
+        self.assertTrue(align_uv_straight(bm, uv_layer.name, obj=self.obj))
+        straightened = [loop[uv_layer].uv.copy() for loop in loops]
+
+        # Restoring the input, as an undo does, reuses the cached chains
+        for loop, uv in zip(loops, before, strict=True):
+            loop[uv_layer].uv = uv
+        bmesh.update_edit_mesh(self.me)
+        with mock.patch.object(
+            straight, "_build_uv_graph", wraps=straight._build_uv_graph
+        ) as build:
+            self.assertTrue(align_uv_straight(bm, uv_layer.name, obj=self.obj))
+        build.assert_not_called()
+
+        again = [loop[uv_layer].uv for loop in loops]
+        for a, b in zip(straightened, again, strict=True):
+            self.assertAlmostEqual((a - b).length, 0.0, places=6)
+
+    def test_closed_loop_shapes(self):
+        """The border loop of the grid is fitted to a circle or a rectangle."""
+        self._setup_mesh()
+        bm = self.bm
+        uv_layer = self.uv_layer
+
+        for v in bm.verts:
+            for loop in v.link_loops:
+                loop[uv_layer].uv.x += 0.04 if v.index in (0, 5) else 0.0
+        self._select_edges(e for e in bm.edges if e.is_boundary)
+
+        self.assertTrue(align_uv_straight(bm, uv_layer.name, loop_shape="CIRCLE"))
+
+        uvs = [Vector(uv) for uv in {uv.to_tuple(6) for uv in self._selected_uvs()}]
+        center = sum(uvs, Vector((0, 0))) / len(uvs)
+        radii = [(uv - center).length for uv in uvs]
+        for radius in radii:
+            self.assertAlmostEqual(radius, radii[0], places=5)
+
+        self.assertTrue(align_uv_straight(bm, uv_layer.name, loop_shape="RECTANGLE"))
+
+        uvs = self._selected_uvs()
+        lo_x, hi_x = min(uv.x for uv in uvs), max(uv.x for uv in uvs)
+        lo_y, hi_y = min(uv.y for uv in uvs), max(uv.y for uv in uvs)
+        for uv in uvs:
+            on_border = min(abs(uv.x - lo_x), abs(uv.x - hi_x), abs(uv.y - lo_y), abs(uv.y - hi_y))
+            self.assertAlmostEqual(on_border, 0.0, places=5)
+
 
 if __name__ == "__main__":
     unittest.main(argv=["ignored", "-v"])
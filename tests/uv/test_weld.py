@@ -0,0 +1,71 @@
+import unittest
+
+import bpy
+from nextools.logic.uv.weld import weld_uvs
+from nextools.utils import mesh_gen
+
+
+class TestWeldLogic(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def tearDown(self):
+        if bpy.context.active_object and bpy.context.active_object.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+    def _split_grid(self, offset=0.0005):
+        """4x4 grid in one island, with the UVs of the right half shifted by offset."""
+        self.obj = mesh_gen.create_mesh_object(mesh_gen.generate("GRID", 4, 4))
+        self.mesh = self.obj.data
+        uv_data = self.mesh.uv_layers.active.data
+        for poly in self.mesh.polygons:
+            if poly.index % 4 >= 2:
+                for l_idx in poly.loop_indices:
+                    uv_data[l_idx].uv.x += offset
+
+    def _uvs(self):
+        return [tuple(loop.uv) for loop in self.mesh.uv_layers.active.data]
+
+    def test_weld_merges_split_islands(self):
+        self._split_grid()
+
+        result = weld_uvs(self.obj, tolerance=1e-3)
+
+        self.assertEqual((result.islands_before, result.islands_after), (2, 1))
+        self.assertEqual(result.merged_islands, 1)
+        # 5 seam vertices: 1 loop per side at the ends, 2 per side in between
+        self.assertEqual(result.welded_loops, 16)
+
+    def test_dry_run_keeps_uvs(self):
+        self._split_grid()
+        before = self._uvs()
+
+        result = weld_uvs(self.obj, tolerance=1e-3, dry_run=True)
+
+        self.assertEqual(result.islands_after, 1)
+        self.assertEqual(self._uvs(), before)
+
+    def test_tolerance_below_gap_keeps_islands(self):
+        self._split_grid(offset=0.01)
+
+        result = weld_uvs(self.obj, tolerance=1e-3)
+
+        self.assertEqual(result.welded_loops, 0)
+        self.assertEqual(result.islands_after, 2)
+
+    def test_weld_in_edit_mode(self):
+        self._split_grid()
+        bpy.context.view_layer.objects.active = self.obj
+        bpy.ops.object.mode_set(mode="EDIT")
+
+        self.assertEqual(weld_uvs(self.obj, tolerance=1e-3, dry_run=True).islands_before, 2)
+        weld_uvs(self.obj, tolerance=1e-3)
+
+        self.assertEqual(self.obj.mode, "EDIT")
+        self.assertEqual(weld_uvs(self.obj, tolerance=1e-3, dry_run=True).islands_before, 1)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        self.assertEqual(weld_uvs(self.obj, tolerance=1e-3, dry_run=True).islands_before, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()